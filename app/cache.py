@@ -0,0 +1,473 @@
+import glob
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+
+from constants import (RESULT_CACHE_DIR, RESULT_CACHE_DISK_SIZE,
+                       RESULT_CACHE_SAMPLE, RESULT_CACHE_SAMPLE_SIZE,
+                       RESULT_CACHE_SIZE)
+
+Fingerprint = Tuple
+
+Entry = Tuple[str, Fingerprint, List[str]]
+
+
+def file_fingerprint(
+        filepath: str, sample: bool = RESULT_CACHE_SAMPLE
+) -> Fingerprint:
+    """
+    Возвращает дешёвый отпечаток файла: размер, время изменения
+    и номер inode, а при sample ещё и хэш трёх фрагментов файла
+    (начала, середины и конца). Хэш ловит перезапись файла тем же
+    объёмом в пределах точности времени изменения.
+
+    Аргументы:
+    filepath (str): Путь к файлу.
+    sample (bool): Добавить хэш фрагментов файла.
+
+    Возвращает:
+    Fingerprint: Отпечаток файла.
+
+    ************************************************
+
+    Returns a cheap fingerprint of the file: the size, the
+    modification time and the inode number, and with sample also
+    a hash of three pieces of the file (the start, the middle and
+    the end). The hash catches the file being rewritten with the
+    same size within the precision of the modification time.
+
+    Arguments:
+    filepath (str): The path to the file.
+    sample (bool): Add a hash of the file pieces.
+
+    Returns:
+    Fingerprint: The fingerprint of the file.
+    """
+
+    stat = os.stat(filepath)
+    fingerprint: Fingerprint = (stat.st_size, stat.st_mtime_ns, stat.st_ino)
+    if not sample:
+        return fingerprint
+    digest = hashlib.sha1()
+    size: int = RESULT_CACHE_SAMPLE_SIZE
+    offsets: List[int] = sorted({
+        0,
+        max((stat.st_size - size) // 2, 0),
+        max(stat.st_size - size, 0),
+    })
+    with open(filepath, "rb") as in_file:
+        for offset in offsets:
+            in_file.seek(offset)
+            digest.update(in_file.read(size))
+    return fingerprint + (digest.hexdigest(),)
+
+
+def pattern_key(pattern, flags: int = 0) -> str:
+    """
+    Возвращает строковый ключ шаблона с флагами. Для набора
+    шаблонов MultiPatternMatcher ключом служат сами шаблоны
+    и признак литеральных слов.
+
+    ************************************************
+
+    Returns the string key of a pattern with its flags. For
+    a MultiPatternMatcher set of patterns the key is made of the
+    patterns themselves and the literal words flag.
+    """
+
+    if isinstance(pattern, (str, bytes)):
+        if isinstance(pattern, bytes):
+            pattern = pattern.decode("latin-1")
+        return json.dumps(["re", pattern, flags])
+    return json.dumps(
+        ["multi", pattern.patterns, pattern.literal, flags]
+    )
+
+
+class ResultCache:
+    """
+    Кэш результатов поиска в файлах.
+
+    Ключ записи составляется из режима поиска, шаблона с флагами
+    и абсолютного пути файла, а вместе с результатами хранится
+    отпечаток файла. Если при обращении отпечаток не совпадает,
+    запись считается устаревшей и удаляется, поэтому изменённый
+    файл всегда ищется заново.
+
+    Чтение и запись файлов выполняются вне блокировки, поэтому
+    сброс большой записи не задерживает другие обращения к кэшу.
+
+    В памяти записи хранятся по принципу LRU в пределах maxsize
+    символов. Вытесненные и слишком большие записи сбрасываются
+    в JSON-файлы каталога directory, общий объём которого не
+    превышает disk_size байт. Без directory кэш работает только
+    в памяти.
+
+    Атрибуты:
+    maxsize (int): Объём записей в памяти в символах.
+    directory (str): Каталог для сброса записей или None.
+    disk_size (int): Объём каталога в байтах.
+    hits (int): Число попаданий.
+    misses (int): Число промахов.
+    nbytes (int): Объём записей в памяти в символах.
+
+    ************************************************
+
+    A cache of search results in files.
+
+    The key of an entry is made of the search mode, the pattern
+    with its flags and the absolute file path, and the fingerprint
+    of the file is stored together with the results. If the
+    fingerprint does not match on lookup, the entry is stale and
+    is removed, so a changed file is always searched again.
+
+    Files are read and written outside the lock, so spilling a large
+    entry does not hold up other lookups.
+
+    In memory the entries are kept on an LRU basis within maxsize
+    characters. Evicted and oversized entries are spilled to JSON
+    files in directory, whose total size does not exceed disk_size
+    bytes. Without directory the cache works in memory only.
+
+    Attributes:
+    maxsize (int): The size of the entries in memory in characters.
+    directory (str): The directory to spill entries to or None.
+    disk_size (int): The size of the directory in bytes.
+    hits (int): The number of hits.
+    misses (int): The number of misses.
+    nbytes (int): The size of the entries in memory in characters.
+    """
+
+    def __init__(
+            self, maxsize: int = RESULT_CACHE_SIZE,
+            directory: Optional[str] = RESULT_CACHE_DIR,
+            disk_size: int = RESULT_CACHE_DISK_SIZE
+    ) -> None:
+        """
+        Инициализация пустого кэша.
+
+        ************************************************
+
+        Initializing an empty cache.
+        """
+
+        self.maxsize = maxsize
+        self.directory = directory
+        self.disk_size = disk_size
+        self.hits = 0
+        self.misses = 0
+        self.nbytes = 0
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(filepath: str, pattern, flags: int = 0,
+            mode: str = "search") -> str:
+        """
+        Возвращает ключ записи для файла, шаблона и режима поиска.
+
+        ************************************************
+
+        Returns the entry key for a file, a pattern and a search
+        mode.
+        """
+
+        return json.dumps([
+            mode, pattern_key(pattern, flags), os.path.abspath(filepath)
+        ])
+
+    def __len__(self) -> int:
+        """
+        Возвращает число записей в памяти.
+
+        ************************************************
+
+        Returns the number of entries in memory.
+        """
+
+        return len(self._entries)
+
+    @property
+    def hit_rate(self) -> float:
+        """
+        Возвращает долю попаданий среди всех обращений.
+
+        ************************************************
+
+        Returns the share of hits among all lookups.
+        """
+
+        lookups: int = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def stats(self) -> str:
+        """
+        Возвращает строку с размером кэша и долей попаданий.
+
+        ************************************************
+
+        Returns a line with the cache size and the hit rate.
+        """
+
+        return (
+            f"cache: {len(self)} entries, "
+            f"{self.nbytes / 1048576:.1f} MB, "
+            f"hit rate {self.hit_rate:.0%}"
+        )
+
+    def get(self, key: str, fingerprint: Fingerprint) -> Optional[List[str]]:
+        """
+        Возвращает результаты для ключа, если они сохранены для
+        файла с тем же отпечатком, иначе None. Запись, найденная
+        на диске, поднимается в память.
+
+        ************************************************
+
+        Returns the results for the key if they were stored for
+        the file with the same fingerprint, otherwise None. An entry
+        found on disk is brought back into memory.
+        """
+
+        fingerprint = tuple(fingerprint)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == fingerprint:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self._drop(key)
+        lines: Optional[List[str]] = self._load(key, fingerprint)
+        with self._lock:
+            if lines is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            spilled: List[Entry] = self._store(key, fingerprint, lines)
+        for spill in spilled:
+            self._spill(*spill)
+        return lines
+
+    def put(
+            self, key: str, fingerprint: Fingerprint, lines: List[str]
+    ) -> None:
+        """
+        Сохраняет результаты для ключа, заменяя прежнюю запись.
+
+        ************************************************
+
+        Stores the results for the key, replacing the previous
+        entry.
+        """
+
+        with self._lock:
+            self._drop(key)
+            spilled: List[Entry] = self._store(
+                key, tuple(fingerprint), list(lines)
+            )
+        self._remove_files(key)
+        for spill in spilled:
+            self._spill(*spill)
+
+    def clear(self) -> None:
+        """
+        Удаляет все записи из памяти и с диска.
+
+        ************************************************
+
+        Removes all entries from memory and disk.
+        """
+
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = 0
+        if self.directory is not None:
+            for path in glob.glob(os.path.join(self.directory, "*.json")):
+                self._remove(path)
+
+    def _store(
+            self, key: str, fingerprint: Fingerprint, lines: List[str]
+    ) -> List[Entry]:
+        """
+        Помещает запись в память, вытесняя старые записи.
+        Вызывается под блокировкой.
+
+        Возвращает:
+        List[Entry]: Записи, которые нужно сбросить на диск уже
+        без блокировки: вытесненные и саму запись, если она
+        больше maxsize.
+
+        ************************************************
+
+        Puts an entry into memory, evicting old entries.
+        Called with the lock held.
+
+        Returns:
+        List[Entry]: The entries to spill to disk once the lock is
+        released: the evicted ones and the entry itself if it is
+        larger than maxsize.
+        """
+
+        self._drop(key)
+        size: int = sum(len(line) + 1 for line in lines)
+        if size > self.maxsize:
+            return [(key, fingerprint, lines)]
+        self._entries[key] = (fingerprint, lines, size)
+        self.nbytes += size
+        spilled: List[Entry] = []
+        while self.nbytes > self.maxsize:
+            old_key, (old_fingerprint, old_lines, old_size) = (
+                self._entries.popitem(last=False)
+            )
+            self.nbytes -= old_size
+            spilled.append((old_key, old_fingerprint, old_lines))
+        return spilled
+
+    def _drop(self, key: str) -> None:
+        """
+        Удаляет запись из памяти, если она там есть.
+        Вызывается под блокировкой.
+
+        ************************************************
+
+        Removes an entry from memory if it is there.
+        Called with the lock held.
+        """
+
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.nbytes -= entry[2]
+
+    def _path(self, key: str, fingerprint: Fingerprint) -> str:
+        """
+        Возвращает путь к файлу записи: хэш ключа и хэш отпечатка.
+
+        ************************************************
+
+        Returns the path to the entry file: the key hash and the
+        fingerprint hash.
+        """
+
+        return os.path.join(
+            self.directory,
+            f"{_digest(key)}-{_digest(json.dumps(list(fingerprint)))}.json"
+        )
+
+    def _load(
+            self, key: str, fingerprint: Fingerprint
+    ) -> Optional[List[str]]:
+        """
+        Читает запись с диска. Файлы той же записи с другим
+        отпечатком устарели и удаляются.
+
+        ************************************************
+
+        Reads an entry from disk. Files of the same entry with
+        another fingerprint are stale and are removed.
+        """
+
+        if self.directory is None:
+            return None
+        path: str = self._path(key, fingerprint)
+        self._remove_files(key, keep=path)
+        try:
+            with open(path, encoding="utf-8") as in_file:
+                data = json.load(in_file)
+        except (OSError, ValueError):
+            return None
+        if data.get("key") != key:
+            return None
+        os.utime(path)
+        return data.get("lines")
+
+    def _spill(
+            self, key: str, fingerprint: Fingerprint, lines: List[str]
+    ) -> None:
+        """
+        Сбрасывает запись на диск, если это разрешено, и удаляет
+        самые старые файлы сверх disk_size. Если файл записи с тем
+        же отпечатком уже есть, например запись только что прочитана
+        с диска, обновляется лишь время его изменения.
+
+        ************************************************
+
+        Spills an entry to disk if allowed and removes the oldest
+        files beyond disk_size. If an entry file with the same
+        fingerprint already exists, for example the entry has just
+        been read from disk, only its modification time is updated.
+        """
+
+        if self.directory is None:
+            return
+        path: str = self._path(key, fingerprint)
+        try:
+            os.utime(path)
+            return
+        except OSError:
+            pass
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(path, "w", encoding="utf-8") as in_file:
+                json.dump({"key": key, "lines": lines}, in_file)
+        except OSError:
+            self._remove(path)
+            return
+        files: List[Tuple[float, int, str]] = []
+        for name in glob.glob(os.path.join(self.directory, "*.json")):
+            try:
+                stat = os.stat(name)
+            except OSError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, name))
+        total: int = sum(size for _, size, _ in files)
+        for _, size, name in sorted(files):
+            if total <= self.disk_size:
+                break
+            self._remove(name)
+            total -= size
+
+    def _remove_files(self, key: str, keep: Optional[str] = None) -> None:
+        """
+        Удаляет с диска файлы записи, кроме keep.
+
+        ************************************************
+
+        Removes the files of an entry from disk except keep.
+        """
+
+        if self.directory is None:
+            return
+        for path in glob.glob(
+            os.path.join(self.directory, f"{_digest(key)}-*.json")
+        ):
+            if path != keep:
+                self._remove(path)
+
+    @staticmethod
+    def _remove(path: str) -> None:
+        """
+        Удаляет файл, не обращая внимания на его отсутствие.
+
+        ************************************************
+
+        Removes a file, ignoring its absence.
+        """
+
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+def _digest(text: str) -> str:
+    """
+    Возвращает хэш строки для имени файла.
+
+    ************************************************
+
+    Returns the hash of a string for a file name.
+    """
+
+    return hashlib.sha1(text.encode("utf-8", "surrogatepass")).hexdigest()
@@ -0,0 +1,523 @@
+import argparse
+import os
+import re
+import sqlite3
+import sys
+from collections import Counter
+from typing import Iterator, List, Optional, Tuple
+
+from constants import (CLI_NAME, COUNT_TOP_K, DECODE_ERRORS, MMAP_ENCODING,
+                       SEARCH_WORKERS)
+from guard import GuardedSearch, guarded_search_files
+from index import WordIndex
+from logic import (LineMatch, Match, MultiPatternMatcher, SourceReader,
+                   collect_files, count_file, find_words_in_files,
+                   find_words_mmap, find_words_parallel, find_words_stream,
+                   format_counts, format_lines, format_match, grep_lines,
+                   line_encoding, parallel_encoding, pattern_cache,
+                   read_text)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """
+    Создаёт разборщик аргументов командной строки.
+
+    Возвращает:
+    argparse.ArgumentParser: Разборщик аргументов.
+
+    ************************************************
+
+    Creates the command-line argument parser.
+
+    Returns:
+    argparse.ArgumentParser: The argument parser.
+    """
+
+    parser = argparse.ArgumentParser(
+        prog=CLI_NAME,
+        usage="%(prog)s --no-gui [options] [PATTERN] [FILE ...]",
+        description=(
+            "Search files or standard input for matches of a regular "
+            "expression and print every match on its own line."
+        ),
+    )
+    parser.add_argument(
+        "--no-gui", action="store_true",
+        help="run without the graphical interface (always on here)"
+    )
+    parser.add_argument(
+        "-e", "--regexp-file", metavar="FILE",
+        help="read the regular expression from FILE"
+    )
+    parser.add_argument(
+        "-m", "--multi", action="store_true",
+        help=(
+            "treat every line of the pattern as a separate pattern, "
+            "scan once and print the pattern before each match"
+        )
+    )
+    parser.add_argument(
+        "-F", "--literal", action="store_true",
+        help="treat the patterns as literal words (implies --multi)"
+    )
+    parser.add_argument(
+        "--encoding",
+        help=(
+            "encoding of the input files (default: detected from "
+            "the byte order mark or the first bytes of every file)"
+        )
+    )
+    parser.add_argument(
+        "--errors", default=DECODE_ERRORS,
+        choices=(
+            "strict", "replace", "ignore", "backslashreplace",
+            "surrogateescape"
+        ),
+        help=(
+            "how to handle bytes that cannot be decoded "
+            f"(default: {DECODE_ERRORS})"
+        )
+    )
+    parser.add_argument(
+        "--mmap", action="store_true",
+        help="search memory-mapped files with a bytes pattern"
+    )
+    parser.add_argument(
+        "--index", action="store_true",
+        help=(
+            "answer the search from a persistent word index of a single "
+            "file, building or refreshing it first when needed; "
+            "not allowed with several files or a directory"
+        )
+    )
+    parser.add_argument(
+        "-c", "--count", action="store_true",
+        help=(
+            "print only the total and distinct match counts followed "
+            "by the most frequent matches"
+        )
+    )
+    parser.add_argument(
+        "-v", "--verbose", action="store_true",
+        help="print the compiled pattern cache statistics to stderr"
+    )
+    parser.add_argument(
+        "--top", type=int, default=COUNT_TOP_K, metavar="N",
+        help=(
+            "number of the most frequent matches printed with --count "
+            f"(default: {COUNT_TOP_K})"
+        )
+    )
+    parser.add_argument(
+        "-n", "--lines", action="store_true",
+        help=(
+            "print the matching lines with their line numbers instead "
+            "of the matches, applying the pattern to every line"
+        )
+    )
+    parser.add_argument(
+        "-A", "--after-context", type=int, metavar="N", dest="after",
+        help="print N lines after every matching line (implies --lines)"
+    )
+    parser.add_argument(
+        "-B", "--before-context", type=int, metavar="N", dest="before",
+        help="print N lines before every matching line (implies --lines)"
+    )
+    parser.add_argument(
+        "-C", "--context", type=int, metavar="N",
+        help=(
+            "print N lines before and after every matching line "
+            "(implies --lines)"
+        )
+    )
+    parser.add_argument(
+        "--timeout", type=float, metavar="SECONDS",
+        help=(
+            "run every file in a separate process and stop it after "
+            "the given time, keeping the matches found so far"
+        )
+    )
+    parser.add_argument(
+        "--max-memory", type=int, metavar="MB",
+        help=(
+            "run every file in a separate process limited to the given "
+            "memory (where the system supports it)"
+        )
+    )
+    parser.add_argument(
+        "-j", "--jobs", type=int, default=SEARCH_WORKERS, metavar="N",
+        help=(
+            "number of worker processes when searching several files, "
+            "directories or a single large file with a line-local "
+            "pattern (default: all cores)"
+        )
+    )
+    parser.add_argument(
+        "args", nargs="*", metavar="ARG",
+        help=(
+            "the regular expression (unless -e is given) followed by "
+            "files or directories to search; '-' or no files means "
+            "standard input"
+        )
+    )
+    return parser
+
+
+def read_regexp_file(
+        path: str, encoding: Optional[str],
+        errors: str = DECODE_ERRORS
+) -> str:
+    """
+    Читает регулярное выражение из файла без завершающего
+    перевода строки.
+
+    ************************************************
+
+    Reads a regular expression from a file without the
+    trailing line break.
+    """
+
+    return read_text(path, encoding, errors).rstrip("\r\n")
+
+
+def search_source(
+        pattern, source: str,
+        encoding: Optional[str], use_mmap: bool,
+        use_index: bool = False,
+        errors: str = DECODE_ERRORS,
+        workers: Optional[int] = SEARCH_WORKERS
+) -> Iterator[Match]:
+    """
+    Возвращает поток совпадений для одного файла или stdin.
+    Большой файл с построчным шаблоном ищется параллельно
+    в workers процессах.
+
+    ************************************************
+
+    Returns the match stream for a single file or stdin.
+    A large file with a line-local pattern is searched in
+    parallel on workers processes.
+    """
+
+    if source == "-":
+        return _search_file(pattern, sys.stdin.buffer, encoding, errors)
+    if use_index and line_encoding(source, encoding) is not None:
+        index = WordIndex(source, encoding=encoding)
+        if index.can_answer(pattern):
+            if not index.is_fresh():
+                index.build()
+            return index.search(pattern)
+    if use_mmap:
+        return find_words_mmap(pattern, source, encoding or MMAP_ENCODING)
+    parallel: Optional[str] = parallel_encoding(pattern, source, encoding)
+    if parallel is not None:
+        return find_words_parallel(
+            pattern, source, parallel, errors, workers
+        )
+    return _search_file(pattern, source, encoding, errors)
+
+
+def _search_file(
+        pattern, source, encoding: Optional[str], errors: str
+) -> Iterator[Match]:
+    """
+    Потоково ищет совпадения в файле по пути или в открытом
+    двоичном потоке.
+
+    ************************************************
+
+    Streams the matches of a file given by path or of an open
+    binary stream.
+    """
+
+    with SourceReader(source, encoding, errors) as reader:
+        yield from find_words_stream(pattern, reader.chunks())
+
+
+def iter_matches(
+        pattern, sources: List[str],
+        options: argparse.Namespace
+) -> Iterator[Tuple[str, Match]]:
+    """
+    Возвращает совпадения вместе с именем источника.
+
+    Несколько файлов и каталоги обрабатываются в пуле процессов,
+    а stdin и одиночный файл читаются потоково.
+
+    ************************************************
+
+    Returns matches together with the source name.
+
+    Several files and directories are searched on a process pool,
+    while stdin and a single file are streamed.
+    """
+
+    if "-" in sources or (
+        len(sources) == 1 and not os.path.isdir(sources[0])
+    ):
+        for source in sources:
+            for match in search_source(
+                pattern, source, options.encoding, options.mmap,
+                options.index, options.errors, options.jobs
+            ):
+                yield source, match
+        return
+    for filepath, matches in find_words_in_files(
+        pattern, collect_files(sources), options.jobs,
+        options.encoding, options.mmap, errors=options.errors
+    ):
+        for match in matches:
+            yield filepath, match
+
+
+def iter_line_sources(sources: List[str]) -> Iterator[str]:
+    """
+    Раскрывает каталоги среди источников, сохраняя stdin
+    на своём месте.
+
+    ************************************************
+
+    Expands the directories among the sources, keeping stdin
+    in its place.
+    """
+
+    for source in sources:
+        if source == "-":
+            yield source
+        else:
+            yield from collect_files([source])
+
+
+def iter_source_lines(
+        pattern, source: str, options: argparse.Namespace,
+        before: int, after: int
+) -> Iterator[LineMatch]:
+    """
+    Потоково ищет совпавшие строки с контекстом в файле или stdin.
+
+    ************************************************
+
+    Streams the matching lines with context of a file or stdin.
+    """
+
+    with SourceReader(
+        sys.stdin.buffer if source == "-" else source,
+        options.encoding, options.errors
+    ) as reader:
+        yield from grep_lines(pattern, reader.chunks(), before, after)
+
+
+def iter_guarded_matches(
+        pattern, sources: List[str],
+        options: argparse.Namespace, reports: List[str],
+        count: bool = False
+) -> Iterator[Tuple[str, Match]]:
+    """
+    Возвращает совпадения, выполняя поиск по каждому источнику
+    в отдельном процессе с ограничением времени и памяти.
+    Сообщения об остановленных поисках добавляются в reports.
+    Стандартный ввод читается целиком и передаётся процессу.
+    Файлы каталогов ищутся от самого большого к самому маленькому.
+    С count вместо совпадений возвращаются счётчики Counter,
+    подсчитанные в процессах.
+
+    ************************************************
+
+    Returns matches, searching every source in a separate process
+    with a time and memory limit. Messages about stopped searches
+    are added to reports. Standard input is read as a whole
+    and passed to the process. The files of directories are
+    searched from the largest to the smallest. With count Counter
+    objects counted in the processes are returned instead of the
+    matches.
+    """
+
+    memory_limit: Optional[int] = None
+    if options.max_memory is not None:
+        memory_limit = options.max_memory * 1024 * 1024
+    if "-" in sources:
+        for source in sources:
+            if source == "-":
+                search = GuardedSearch(
+                    pattern, text=SourceReader(
+                        sys.stdin.buffer, options.encoding, options.errors
+                    ).read(),
+                    timeout=options.timeout, memory_limit=memory_limit,
+                    count=count
+                )
+            else:
+                search = GuardedSearch(
+                    pattern, source, encoding=options.encoding,
+                    timeout=options.timeout, memory_limit=memory_limit,
+                    errors=options.errors, count=count
+                )
+            for match in search.matches():
+                yield source, match
+            if search.stopped is not None:
+                reports.append(search.report())
+        return
+    for filepath, matches, search in guarded_search_files(
+        pattern, collect_files(sources), options.jobs,
+        options.encoding, options.timeout, memory_limit,
+        errors=options.errors, count=count
+    ):
+        for match in matches:
+            yield filepath, match
+        if search.stopped is not None:
+            reports.append(search.report())
+
+
+def count_matches(
+        pattern, sources: List[str],
+        options: argparse.Namespace
+) -> Counter:
+    """
+    Подсчитывает совпадения во всех источниках. Процессы пула
+    возвращают счётчики, а не списки совпадений.
+
+    ************************************************
+
+    Counts the matches of all sources. The pool processes return
+    counters rather than lists of matches.
+    """
+
+    counter: Counter = Counter()
+    if "-" in sources or (
+        len(sources) == 1 and not os.path.isdir(sources[0])
+    ):
+        for _, match in iter_matches(pattern, sources, options):
+            counter[match] += 1
+        return counter
+    for _, counts in find_words_in_files(
+        pattern, collect_files(sources), options.jobs,
+        options.encoding, options.mmap, task=count_file,
+        errors=options.errors
+    ):
+        counter.update(counts)
+    return counter
+
+
+def run_cli(argv: Optional[List[str]] = None) -> int:
+    """
+    Запускает поиск без графического интерфейса и выводит
+    совпадения в stdout по мере их нахождения.
+
+    Аргументы:
+    argv (List[str]): Аргументы командной строки.
+
+    Возвращает:
+    int: Код возврата: 0, если совпадения найдены, 1, если нет,
+    2 при ошибке или остановке поиска по ограничению.
+
+    ************************************************
+
+    Runs the search without the graphical interface and writes
+    matches to stdout as they are found.
+
+    Arguments:
+    argv (List[str]): The command-line arguments.
+
+    Returns:
+    int: The exit code: 0 if matches were found, 1 if not,
+    2 on error or when a search was stopped by a limit.
+    """
+
+    parser = build_parser()
+    options = parser.parse_args(argv)
+    sources: List[str] = list(options.args)
+    if options.regexp_file:
+        pattern = read_regexp_file(
+            options.regexp_file, options.encoding, options.errors
+        )
+    elif sources:
+        pattern = sources.pop(0)
+    else:
+        parser.error("the regular expression is not set")
+    if options.multi or options.literal:
+        try:
+            pattern = MultiPatternMatcher(
+                pattern.splitlines(), options.literal
+            )
+        except (ValueError, re.error) as error:
+            parser.error(str(error))
+    if not sources:
+        sources = ["-"]
+    with_names: bool = len(sources) > 1 or os.path.isdir(sources[0])
+    if options.index and with_names:
+        parser.error("--index can only be used with a single file")
+    guarded: bool = (
+        options.timeout is not None or options.max_memory is not None
+    )
+    before: int = next(
+        (lines for lines in (options.before, options.context)
+         if lines is not None), 0
+    )
+    after: int = next(
+        (lines for lines in (options.after, options.context)
+         if lines is not None), 0
+    )
+    line_mode: bool = options.lines or bool(before or after)
+    if line_mode and (options.count or guarded):
+        parser.error(
+            "line mode cannot be combined with --count, --timeout "
+            "or --max-memory"
+        )
+    reports: List[str] = []
+    found: bool = False
+    try:
+        if line_mode:
+            context: bool = bool(before or after)
+            for source in iter_line_sources(sources):
+                separate: bool = context and found
+                for line in format_lines(
+                    iter_source_lines(
+                        pattern, source, options, before, after
+                    ),
+                    context, f"{source}:" if with_names else ""
+                ):
+                    if separate:
+                        sys.stdout.write("--\n")
+                        separate = False
+                    sys.stdout.write(f"{line}\n")
+                    found = True
+            sys.stdout.flush()
+            return 0 if found else 1
+        if guarded:
+            matches = iter_guarded_matches(
+                pattern, sources, options, reports, options.count
+            )
+        elif not options.count:
+            matches = iter_matches(pattern, sources, options)
+        if options.count:
+            if guarded:
+                counter: Counter = Counter()
+                for _, counts in matches:
+                    counter.update(counts)
+            else:
+                counter = count_matches(pattern, sources, options)
+            for line in format_counts(counter, options.top):
+                sys.stdout.write(f"{line}\n")
+            found = bool(counter)
+        else:
+            for source, match in matches:
+                prefix: str = f"{source}:" if with_names else ""
+                sys.stdout.write(f"{prefix}{format_match(match)}\n")
+                found = True
+        sys.stdout.flush()
+    except BrokenPipeError:
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 0
+    except (
+        OSError, UnicodeDecodeError, LookupError, ValueError, re.error,
+        sqlite3.Error
+    ) as error:
+        print(f"{CLI_NAME}: {error}", file=sys.stderr)
+        return 2
+    finally:
+        if options.verbose:
+            print(f"{CLI_NAME}: {pattern_cache.report()}", file=sys.stderr)
+    for report in reports:
+        print(f"{CLI_NAME}: {report}", file=sys.stderr)
+    if reports:
+        return 2
+    return 0 if found else 1
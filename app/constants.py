@@ -1,5 +1,5 @@
 import os
-from typing import Dict, Tuple
+from typing import Dict, Optional, Tuple
 
 MENU_MOUSE_NAME: str = "mouse_menu"
 
@@ -8,11 +8,120 @@ FILETYPES: Tuple[Tuple[str, str], ...] = (
     ('All files', '.*')
 )
 
-TMP_DIR: str = os.path.join(os.path.dirname(
-    os.path.abspath(__file__)), 'tmp'
+TOOLTIP_DELAY: int = 1500
+
+CHUNK_SIZE: int = 1024 * 1024
+
+CHUNK_OVERLAP: int = 4096
+
+MMAP_ENCODING: str = "utf-8"
+
+DECODE_ERRORS: str = "replace"
+
+DETECT_SIZE: int = 64 * 1024
+
+FALLBACK_ENCODING: str = "cp1251"
+
+DECOMPRESS_THREADED: bool = True
+
+PREFETCH_DEPTH: int = 4
+
+PATTERN_CACHE_SIZE: int = 1024
+
+REGEX_ENGINES: Tuple[str, ...] = ("re2", "re", "regex")
+
+MULTI_GROUP_PREFIX: str = "_fw"
+
+SEARCH_WORKERS: Optional[int] = None
+
+PARALLEL_MIN_SIZE: int = 64 * 1024 * 1024
+
+PARALLEL_RANGE_SIZE: int = 32 * 1024 * 1024
+
+COUNT_TOP_K: int = 100
+
+LINE_CONTEXT: int = 2
+
+SEARCH_TIMEOUT: Optional[float] = None
+
+SEARCH_MEMORY_LIMIT: Optional[int] = 2 * 1024 * 1024 * 1024
+
+GUARD_CHUNK_SIZE: int = 64 * 1024
+
+GUARD_POLL_INTERVAL: float = 0.1
+
+GUARD_START_METHOD: str = "spawn"
+
+WORKER_BATCH_SIZE: int = 1000
+
+SEARCH_POLL_INTERVAL: int = 50
+
+STORE_BATCH_SIZE: int = 10000
+
+EXPORT_BUFFER_SIZE: int = 1024 * 1024
+
+EXPORT_PREVIEW_LINES: int = 1000
+
+EXPORT_ENCODING: str = "utf-8"
+
+VIEW_DIRECT_LIMIT: int = 10000
+
+VIEW_MARGIN: int = 200
+
+LINE_INDEX_STEP: int = 64 * 1024
+
+PREVIEW_LINE_LIMIT: int = 10000
+
+LIVE_SEARCH_DELAY: int = 300
+
+LIVE_PREVIEW_SIZE: int = 64 * 1024
+
+LIVE_CHUNK_SIZE: int = 8 * 1024
+
+LIVE_SAMPLE_SIZE: int = 5
+
+LIVE_TAG: str = "live_match"
+
+HIGHLIGHT_TAG: str = "match"
+
+HIGHLIGHT_CURRENT_TAG: str = "current_match"
+
+HIGHLIGHT_BATCH_SIZE: int = 2000
+
+HIGHLIGHT_BATCH_DELAY: int = 1
+
+WORD_PATTERN: str = r"\w+"
+
+INDEX_DIR: str = os.path.join(
+    os.path.expanduser("~"), ".cache", "findwords", "index"
 )
 
-TOOLTIP_DELAY: int = 1500
+INDEX_VERSION: int = 1
+
+INDEX_BATCH_TOKENS: int = 1000000
+
+INDEX_MAX_POSTINGS: int = 1000000
+
+INDEX_MAX_RANGE: int = 4096
+
+RESULT_CACHE_SIZE: int = 64 * 1024 * 1024
+
+RESULT_CACHE_DIR: Optional[str] = os.environ.get("FINDWORDS_RESULT_CACHE")
+
+RESULT_CACHE_DISK_SIZE: int = 512 * 1024 * 1024
+
+RESULT_CACHE_SAMPLE: bool = True
+
+RESULT_CACHE_SAMPLE_SIZE: int = 64 * 1024
+
+CLI_NAME: str = "findwords"
+
+NO_GUI_FLAG: str = "--no-gui"
+
+TIMINGS_FLAG: str = "--startup-timings"
+
+RUN_LOG_PATH: Optional[str] = os.environ.get("FINDWORDS_RUN_LOG")
+
 
 CHECK_OS: Dict[str, str] = {
     "win": "Windows",
@@ -25,14 +134,6 @@ THEMES_APP: Dict[str, str] = {
     "lin": "winxpblue",
 }
 
-ICON_NAMES: Dict[str, str] = {
-    "main_icon": "main_icon",
-}
-
-ICON_FORMAT: Dict[str, str] = {
-    "ico": ".ico",
-}
-
 ICONS: Dict[str, str] = {
     "main_icon": "eJwAGUDmv1JJRkamVAEAV0VCUFZQOCBUcAAA8EECnQEqAAQABD4xGItEIiGkIyFQaOCABgllbthGbru/vit+h8bhf/w8vbqxdnxoH/X9RXgv/t+Uz0XeG/9f0APSD/o/qf3qf7/oJz9+v3MdVyZO9qgK3p31afiN5rMr/b/un47f1n/s/5j63+TfRLw/3a/sX+s/3f3g6APUf9jyx/Jfy7+2f23/H/4//G///69fsv+Q30d/yv7L+4L+sn/J/o39h/3n7/99/zAf6L/Bf67+/e8L/xf9v/jfcj+tP/J/wP/j/8P0Afwv+M/eb+//3j/9/2fv57/tfYH/jP9r/4v59/M5/v//X/hP3//+H3B/3T/U/+//E/8z4RP8D/5fzo2V7376U/nH12/G3+h/vJ8U+eXzh7C/1v6DMs/x3gj/JPs39h/vn65/2H9vPwH3b/z/8h/zPUL/KP5B/VP6n/Uf3S47Ta/MI6svTZ7efkB7rfZL++flb/M/sA/h38Q/o39X/Y/+wf///8/g3kc/MP+t7A/8M/jX95/rv+K/8f9n////n/Jj+s/1/+C/wn6+/ED57/2f+G/In7Hf5r/ZP85/gf32/xX/////3teyz0WP2vC0ln8mgW16jM1aH2rHBa3+a6qah/gJ+9gLikIUpNTlkWBNkPD7VrLlaznuqeZJ63+xkFfVWsuXQrL4sCzdy975GZ/JZq6QUW4Dqy+qoCtFny76iSdgMPZEgqgeIasl1/YJASAlWQNOsPmM4jVyZUvMVNbX0df60ZquWYtsYCrv7lyXwgYev2b/lvnTiBvzefeltuAAyQJqcQN+NQ/Dy0yMtofnXwyS/1qH3h3RtMEntoZDMJo8e2/hrV1PIy2h94d0bV6bZujkwEbSZwHASUBfBUVwdtogGI0nc6xzRZAWIgVr/WI6bjJzUvFHiyDtRsiXTy0yM059q6HVYVsA6sBoALDTIy40me7bYEg+ZICSyklLhLX5YkHyrC4u9QqqSZi3Ljc5izpcsXpUeIFclNeHOqQq1yNlnfh5dJot61bXOsH7uJEoatp4NttqI5wbYfkG8X8Ut++A1khfYIGQS8AIyRmBGiYkDDzcfwu9aZgo6snptdT6kw4k2pHtj1MiohpkZbUrrzHXfaMeCJlRPLtWxqdZkdKbWjIfk2NS1PK67bQ5yxQKJx94dVh3LiHRRzI9nv6/KXAWiqR5GW0PvDAgAv1qNKcexIQc/GqPM0Rpfd1sX9WNFMguI53nkxljoKIkuEQlg44ze5ahbRlgGpbdi8IoRQxGCSps2V6CrlYHSh+kXX5AiquYVHIhEkEyx80Es6C+YnVZNUeldCGLbALCpsuYHhUGk1S0IxkTeSPGYh8dsm6tW16bB5FJxe1OHZZdKvz30Rwy6yOP2C/zK2raWu3IuKxgdez5GXH/0u017pYNDwmX28jjzis64IrvJ4cT6CC5uDIcnGQUJD902YwjlUssZUA7ALP3xFtZ54lujFcACia4q7GIEn1Ai/4pAqcQ9OV9I4cNJmvv+5MH942c215CkYH4QrrwJwC8zkMc7T2Dm+ZRp9U99qPM0VbwYYDSRPCBxCj60dMseL9Vjka/K2YAnXkLJPLggzBwMddCL+BNvIY/pgtGTtcvRhIb8Yr6mFPblIhlSqoW9CaApKbB3x58eeNTux3mOOrt8dk1aCeZI0JDMAdNtG/z0IYzqJbWQ5N1wFmFxDE09siiYtZOs6gyleNRc5EL1y/mZJHS+/WLQ+8OqxeGFxB1eDoZPLEeJZwrsSrIrj8z6ANEdrQ0esVYI2PIy2x/dpUwaijbAkBICP0m6DLHKs/EZ1N7sqo9r5JS0moVPc5CkdhMudQgTx8FjGI7e9Wb7IdNfliQEgI0TnIK9noNeUwpvll2PA5w/2bIJ9IfWyAmmDlOM4jcONQoXi0CynMrNT1MFRlyGcsN2JzKrbpYh7hfLcQAHnNDCufGUwyUpaYFyNRLDFFnQe+7qnFIrMt12k+w8m/DpkXv4PAViihX/WJ1uKLqbuoY1+HRAicONQ3aU/yvm5SQLe71abN/aFCAZ3sIW4YON0NF02Hz9hypMfaj16Y8NuldTPqS9/TvghvfdnyUssGRHyPJfb6WQVVVd3taRDua2+I06r1ovQRPRPVoCPAdMjo6hhveRTM//PPJM5Y5MQWG+m+Qu4Pu1Xcl66K/1CKISmzNndkJ2+TjwvsXQxW1dfTBFcbAQDqv2faRbh8u4x0w85nJ91xGHIVG4O00ANVc7pMhUXMzOPHlt7fVA7Y6SF+r6MbGxr0Tl20YyefIoLPXP/dNWI3nQacE6odOUJEMIOA/oOCf4OzZEVeMlP+ED/KIJN4ElEx9gPRYfFGMwAykqbSHyFHI7xcVCKPCfvvE5rGx0xM4DHu0Mk4NWR/v0cz4X/tUOIFEK3r5c49XkrfKqkI6co03OOBXAfyMRdKd+vdir+tCBQ0p2xo6ltS2bPzusaZiaTcr1EPLNls4WuUHV0DALJ2Vv9PVTi6VgaZ0i8aIL+Ew7zpuxI250lSL6+bRlFS+07ZpLQdiFS2S95GVPJ3eo8msVmMiIuwUMnLSnAQd7E8Cf4I1Wmce9QyPRvgrwuRKpYNUJJ+hogXPFx1UoFBtTJQXk3moNpox68rPbSA4ZgHkXPqt00la0RjY+8POif7bE2r6YR+lITNDuU9drUVpe4AkXG2OCDnkoK5SEYbXJmUfZAyElrHpPXVVnMskE0f0paDsG4Aq7YkTWSEfJ1KfRS/FbXCFAbWXq/BWzxk7Eb802rzFEM/AZJY+JFTIEqtYJsgX5Wr7SfC8avZLUh3QZRsB1L3Um0k/frhhoBHy93gLHh0XeBqrT0VQlk+FdiAE2/K1i+65KTgu/V/5ZgtlyBNhEYBUBtDegIg8mAqkoizhqAJ6gcuujrbD7ao7nWWX7ifvI6BmNTT8vWiX31YwI1DWU053gV19sMfD5o+09OxU1UMkxtgSCB5uFSv5S2SPekIP5daW0Ft4KzHLm60IM0LebcD2dy2aZBeoR1CftSNewoO+SI60kor72LcJVWGH9RVAcyKwnCYXtahVlX8KuBnPeWl6g7SNBYArQ1ie8e8YnPqsK1um1Gq8jZfvwy/U6HwV2Q5Q0wxeq0J2EvfSRoLKtoz2Jqmv7oNWmn/ZzkXSH03IhmGx5i4eLdXU3lz72dM8nseOZnwLl9JV8K6UnPLAVAsD2mBH6iVWiBArMb8uSQUXW4Z36Vj2hFbtlCpAYid8a+2Eu9643jIJz2aKcR+gHATE1THxb2gNLxMNvhQGc+Kg9LV0bbCWfvNCEumYGRyT80ISKyP79gc8abMab4MxeHWsIDgrpese0l5hxakmcqPsjWplCkjvoqkz5SnA6Xe3o13DOXFExZD9FRAq307GJWV1rLz+sh1TOgZJlmZdwLLx9tfu/FNA0WULJMGz/np5t437KUxFVmvpHhfsBkCtgSp4xgesEJ1R8oWxlLfI6Z+lAREiSEVXkZxYuqO6Tl4SNZh/82M4uRnC89sqGHkMswCuoo60lvWb8i2sdgQYJysIShtn5ZeXG1UjbIEXmp6g3gq4nOOD0tOExQtpnQsmNwAfAL4iXVtZg0vveHVVa/jiUFksTLoOfVfeBb2IB78LIlaLg4bb2Qx7+TBE+1Pm2xkp2vXqOqlpiIT9ihXWgnXh5mX6TJ1ud1Mr3O0Qds8ew0x6s/LQv+j/6AEUeJS2U6wJ9SrAkoUS0C2YxZceRtt0r/5OjHHNOd1VXVacpbVny6/h19UxvdcSScIZUc7yL6ZF3+ceOOyvsfHg7y0ue6woqR1nefTwstVn7Qt+HMVNBkm2HTh0K63vCcqfsNOX4amjVxJqK7HcmuWj3GLm3XaaIM3p1H1ju9xF6G19LIaEog7eQhvYh0+quzExGsfq3ryVYtPv3D8/ZVm+1AxwqrGE4rDcDh3W7Xs15euYSwVkTMiGmzKQEfQvbLi14Byhkz+IAb4mbeLD7p1lWDX6WKfoS1+V3fpLSwS0uFLFU0SrByhwmKihvxkqnXJUKkjoiEiEfEvPGzUQ82Q45F06K0ZUvuvGXaJP0b2FOfRFQMhNExrOVWW4cfYoZXpb/bQZN+2QEvuSc7flhpnzEjtGNUU4wtwfnSYI8US2h94WM2+NpWdcb0c2EB880oJCugobGnWnenYDBAfW7TfxU66k0CRl5dpw0P/SVJ5Y194IxCsQgs8E9pzurCtfR18xLFHbol7grU1xV5cEhyVpoCF+gyFc5s2Gv6Mcz/0a9PlDIjIb3QMhqZCSykQkAKJntgapV4Wa/2KSAj+DifnLfc8CDAu+8tY2W0YRWTqKybF4c4v6EqjWGXlDaWSLfvlLT7qPNqIJi3JjfIZRuHHRpS4fHrC/MYu1ZFT9/Fj1zE6L2MyOHFn/NHyHrshZ1s5B1uVaGhcJS2tzr1ICpNAkmJSq7FBflhp2qhKXisu+C0Zl1iskatxhSSutkQQuqzMK2Fc99tddetINd/5xm9wutC7PdxF0hhc44kMRVSNdLS+kl9DlaaFssCq9NPazIMolx2DVKHxkdXPfLOdlfWA8nQowtvQU6RQBKJQqflzqazb8L7kwEOpR77Ed7BHNHlOZQIRfZp/PiuFtQigZXfx+MSvdlAQK1+cnKMaVZDhnTFgaSnA7/SjR8RzsGWEvtJDNlfmYdFeWIT7Yy5g4wj642xjo7qCCORPX6E/KKgyd6vIXWgxseIj+10Lvx9hB4J5l/g4BvsZbQ9rd8pzPLP5ARL1GOhONy1jTVmQZmGmaGYt+Kaw5T+CtBfRzF5n8DoI8OJ50P4xRt1c0zcMVCkAprSi4ji4nMoz9UTtS4voUSLecds13DA6rA52AnpzILKLsxGbuAivXewtOMW9ZkPD7ZdwSJ6ZPSRj3riWLvRe1o5RtjyjSOWwgVZ1+WKU1MDaEKComRCBHaMZfTiZmeIHUW/CTLzgQYq4noYP1apMTSgPN01/mQ+SQAzw6hDCvECiIkdrGm1sQ+JVIYlSrjjtH56mAt7XHlhW1gnXj8ZOeq3DRbssh9aWvBgEXt78B79fAJt2Rpw5jEJIGtHwWdhzSWRToov1ltGWpcQJkUsfO9XSssdMQDc72aKXOlRA6I8dMJ2Jy6RFih+toceuByjMsrGxT83AlyiNkP2Y8B2OIt8DMoh4FHJcC/DWnVosCGbG86Xi8qbadVoj51+yvB6UrdILDNX4+K6dMr9KGo3nEtdkmTIIPXF47RaAg58DW6LiJDT2oTrhs66o+uE2mBqZY8FNMmXHlxp41RNcd3LRKVzeUcv21suhFV7axN/XWwKHhty3vGXKqOASqHTdNz0IS2bD7izEhs3dpfCQJjagHe0+OuCqQ6InDw2w0dOo6vrql2F+Oj4xVg02FGnvSYbSGqOiwjUPYozvCnx4tPOBYXI6APn3dBsLDIVmp6161NM3bXTbAdmShYCBTTxB8WWPpzVaD2k83brJrUT2he8ZjyAvZdJcEZ5ftD4GPUT2he85ABoraQ6W5djv6nJHnmm87+A78s8uLhScSsL8vIRCMi+i7qZA97vA1Tph5HgUSA/PLZ/T3itr/HrjhymSj7Cg3FZ7H/jNnc3LX5aqt5RpvYj6JmLtkAz3uWYpSSAGiQEBRp5L649Nb15YaEZ2lQHvDqsMovd9Y1XUy0wWB2jOk5bOU7WmX1fkB/fU06PdCfzNOsCVaL+DbvQ2Mg6sK2ZLUOwE3pQ7I9mOr9+mQROwai7MStsLdoajn0G/wDYEgJAadYEgGsEzXhfruzHysSh6zDOOMjLaKNsCbOLRxIDTsJAt/aYaePoEBMNMwGevvcsxICQVVjAVpqIFcEnIC87aYJPxvvDujaZLx6eD67AmYhLX5Y1Vn0zFnY1Pu7TvUXiQfP2a5jATkQFv5pYj9MSxLICQEgI/TEzMLz5k6U0qnU5WEm1ECkX7F4dVhWvyxH6vyw0uMwI/V+cp9WxoCC5BSqQovjEbMnuXokMdVhWvyw0zAj9X5YmSBfBLOs8xOrqqthiWuaU6wQhAtn0EO9OHdh5J2lHfsqE0cpiZZnfeLXnveJZaloqT2ALsa5gOJZEVGTOqhVXmMoCuwY7HbL22Kwd+w1Jp5hzD21O5IEOCjkzFQHeh58Ir+YxzK0hNM+0tNmwXCPlBA2ihFDISGJRtyg5fdtOac1Q6trbfs9OyYS7iYuhzRKp+5t2pexkVUFEuAAP7/+dwIsa+5yu/bGjvvCKIxUvkhAELukQqRWJAYMhYGMv8VmRz+k8LMx+COoZMKbtWu+BQyBWAFfaS+LKNFqAeNowGZqw7BX+5NEMsoRtoRdA1wIOWZchkHmiZTKH3cMdO1938E2LXgJQtZAli6UuRWc5KjuS9TBXNg3qhoRyfFOC/4QgnAZPjzSjcBL9RPJU4Y0w+TjUid9vr7d0I/isrYNT7Ihk5CjCRsnJdVp2g/jQGlCQ5doTiQzraurny/faQEHGqlEHqBJI2v5vKEu0BxYjK2JBjmE92x2HNvO3dAyos4kR1Ch2BOAjBT1O8F/YCLVDSSlIJiiQ5pu9hg5YanZ7ILxJ1djE9Nw1ruZawKnlVMaIydGb2lEl+/phyHCy6mObk0CX7vLXZwdbsKUe7WK7aI2rGe+CRCFUwDS5ACPqLB7ZSivOs0+9ClgJ0JhPIRgkPXfoijNF/VrpZHJ7D9Fz2VGuFUhLfiinfoLdmYn+kA5O8tkkTtw3Rsxda5Dl8f02a1CQuqqjS4VaIq68n1gC422WlENR+OUQRX7gJu16qszAXnEjdu+jA2n0KWfvIQIdATaxHoPFIB1wRYiSscIxy1OmQtYwbkeBznzPHyBKlVqYqYb7BbxZ8N8jWQUON0xBcd5gTb+xPYrepEDBKlMs9hUfZ18S+AOD85EtpYfvOAeA/FEv2LocYc9pvNVq72J9QWK2P9sjzlRX7DGJtBHP0uq+h5hzCM9cEdEPs1qgd1x+j86Aajf0wnlztygKL3g0GHBla8bFeW132Jn/N/1qdg3kD47tWbgMU9d/Qapr5yNc/zi1dobXsP+TZSLS6vFSucAEustEegz+bWxT6q3wQuxRd7BKK9qEPtaTxiW81gtZ5cx+SAslTe3twJ6g9UUB72qA4VbvXRb/mIW239TpB9RhJCMvV8/ae9jmiwDaoZQk+JkqNpdxr3IT2xMYtXT1bUSC1d6eYHNxKJJZJI9F9MvYwn1QB/5jPXunWkq5kmPZOtNkLPYPDrNNDtuFuM/qVGW4aCsAYBYMtUE3xsoBxNv1uPpxEvvmZfYVAcCWxMI1VLgxSjk6eqZQEgHCGPOWCNWd1lhXGaf9gZNma9nbCJz9YrShua8JjiZDyiw0WT2AA29a0rZLvakyIbRN0qRaz7PQACnQf+TYxT8k7R2glZT8GSJhgRg7y6yQPILMeWf6Fb5GXISVjDZrJyVrdM+YNxqSJwlHqum1nWyprWXEZ0n5w4OFKfzeSQ9RzRO1upVROyly0y2DgMUah9Xcp1cqvS+wKBXiC95r+lAbQ9LnHPJq7xN+ltaMWCpVBLZ4AD9QmzTMbH4jRca2IehgxzB22vZBvyHa4eK0U09wuq8wXhLB7vgAkjlVWiJl6vCbftTtMykbeROOEsWlyGs2P5VQz1hcfBxm6vsQFgRCab7mMugD1EmkrIQ+DaSmNZedBS26HIABtaq6dLZeYaHYt5evgoya4AEdiMr/mth48Gggj9IGAGl1uzIZMYAA6yj9Vwi2MuUmIkuG4fxlJdVP+WfPximNA9a1B7YN8h/qwKGdkUXMsPaSxKDwh1fhnNcjmd8UQRXWeiZh/kJo1uuMzHhRIl5RhjTla61g+8DAKIyAzwc2SkhT6aXFTZZ0E1Z0fkjNG8+dvpb122hxF5s3LlzcTtb1CLEb/MFdsCDHeAdfbNF0PlsAKnAS6LRNYas2gbUoAAhFEUjIClr4oFxu91PFzWLqHyAWxt+SJopIzWUhw2fpk6g4E8fzIq4ryFq4LhVAXRfU846xpRTur2AcKWvL5E01HEL9rOiXsVjtk49q7qLIK88hRpOOo3URkydq7acrskwtfRcHFe24uQ2iRLbjrFR/3If1hAWMfGNkTDNrzJJGikhuJ2iL4CrgCnXAWDZcYrcmrfDx+n0JnR2BSUR8YkcZBkNsAbKdrhgikaGWZ6HfbHWRf0yLKiwcduz0Qtij+0Gc3tAAuscm0SkwTO6BYMmPOgo+jWP+EAI5JaaaZQankMoF1VY8nP5nZeo6occs0VLD/6l3EmnU1NWxo9Ny0rSHkXPnvxFWEnpQ+jlJtUD7dRn89iiftphGTWmnP7Ruo+dNEs7gvMTT/IghXHTD2JHNT/eY7XiuCiMDB71x7vI4N/k5wAYX0+qAvJeDFexsDcklZssjgXnU2LfXX00LtbDAUdgY7DIxYf4kZiJEKqoyOO08BR7Vie02Y2BvIa22BcREJ5w1cQazqSHZJFIRvUHvzp2g9N3fBYidPKTHIAKYbGR6wnRxdssrF5QkZoJgceuhIxB5pD2KwK6MrNRQ6mgGRqjOUbDOp7LCQmvgHFBDRwhW8DOsly8NHUqi3U5VV0tXhiZjtkjaXqofOEHH78Tiv/wpPmmOJRW1sRTgSFp7wrSAcDxlruLK5O/f3XT/HL9aaCyNgL1qAkgEteeLBdJU+CQM70oPeDr0FFFzACFXm8QJZTgbs0bz6sWz8p3XzfrtSeo+OEmKJPXR+BvKWyg2rdz1rJ0wO3o6nSwlK+EwUULdcRBXOEI6uHBG7R5ZlWwJxbUraVKFxzcl0pXkSnekBxt1Dj7O2IIV+2wkIvsm10l65IWNkSCveSD2NaZpZnIseUpd0OME9fcNk65htTwmgg1uvNAxktDE1HYNg3p0t3e5Ihz9coTu211MAMOqeW5g4OKmT6MWKv3/vaaqKhSeK3dFyDirPWL3izxToHCleSmLevabvIrDbYHWq+YlwPtrQ8G54uH2Z7pz4zmrdH6El1gn9OuIc/qLfG5RPBctPM1zaIVypzrCxUz4p7wXrjS6vcHgWn5uaahnEbqDDLWJxa5b7SUde94TGNt+e/KMvoLxCDEk04eETEKMi5sR1StC49fBV1MxewqAGV1Fqt8kFNSE2w1cQltw7fpMlDJwUklIAE8AqTxY/Efm6OgaTwz9hrPDMFDSnxaZJfan8bFay6Mx0CwBs9CUzzpmZ1McqaMuRUcC9l2UNEnCP8LGq0kniBb3KKXgcLxTnimWW6g9GstXETv9T7gAqEucXLEh5rAdWP4bUH/tHEpMvNH693kG9p3B5zLG4Pc4zyfTESZm9/Ak15Q4j5urLOhj/mOLtriQ0CpaPrwh2LV9ZSmY8QJyOesYXTDZXTW1WxtHqE3EZgiajMmigCzjGjJXqL25Qcd8fj/gd22OklASWguI8VyUD6gOHq+rZFbjuZTMP+i23iNhcwT4+vAljvPw3AlGj1MiZm8W/9CyuqNSCvHAHIocgD50zKrnJ5wpm5xZYvvMjRCeIWJSCusvozh8wuLXEjqs6ol5PvxnfllaeCYJxZ9ASsBTVtePGe61OPoO4DZDl1dtsRg41iMY64HEO+l6aNuf1GbGPb6Xo+ZMu1qF7fgXlpka103pZnCOdMBxDJ9o7LJVyim/OmbbSReWB85L1uQu5kMZIV7iR1fq8YJqm4h4pxj8pm+FAuq0ODi2Isep0vBzlHW/02NW1W5i7g58NPqfp4f/DGJ/4jvbKd7jJwlAyqS7FdDA99ghaS/TpYXaipltRQ9b8y9h2eLTObaxL3Kro4Ttuax+aJc0zsoCHKvaPLoqHZr/NjUSF9uVexiTsqNg/O8Sb5evJ7IlIJMxu2/mnwBdd+yGCEKgVkt1r1YdfLkm5tv3ziTYQ3+iz9F4HeTrf3TpNhoOweuWNF7BTx1pPU9+cdnfAWm7Qgr2iFJqDQp/9Mzxen9GcHZw7YszhUhodnv6weZdQbDFyKZz5pkmSMR4xIJdsrDiKUfxSwaZOuVwIT5Zb57Ld3ykpWtW2517i4vi+rjGgzIAizImzImzGQOkqKrj83GGA1VqUVHINqxPVl5QlI/u3XmnX4YxP/Ed7NlLp2emgD75vFWj4I5Wvi9KGtrG7gaVnoRY4GDmHvQBQr9C16lpd+IipolcCiCox1Txsh6jFfwmJp7ikucslGySKgY8eC6T17i4vqE4+Iv3gM6efGoC2Ki5oFZaL+dBJz9HbmFwQWtyHl6eZrViwSwIAXz/8UhCfb7TDRd0xDDrKB+CjUcnfo1eWSOy7mlfPUf6eWwdMlc1Afd4MV1gLQQbGKx222cTEsyY3nmfpGJOCd1xb+E90bMifrAut76pa8TIb7lK5EcYp0i+xwd6VvRwdjKW7XYuiDN4BjTo0tGYMR9Fzn3mY9vE2sFLyb2TQhSgj3stz8MBf4ly6FjsXievJ1qmIk84bLQXs6LlMiJO2j3nJkMGMJzu8oQrBjpzwzd3iAsXNFFUINw/C6wzEdz8LBiA2905E6Sh3/g+KMAH1siPGdA4j4QATjVkbki3R1Gs4ggwXhhVf+JZjIESJMa1zbKn7iSoDfedFiIOMUhuq4K52qmOXuCWwFGV7hp5X4B6kEBROBE4eHwPie15Z+NgSwTyzvAfpcBj/3i2MyT8Y89oispIdrUzwF3e/GP4VEs+wMWw97t5igjz3KpNiROnitMsLWOQq4PhOvhykLY2NaRb2DJ8Kfqr671CsFKJYWOXDmMYISbycimYVkjfkt8lnlxiZZJGTVf5gKpAmMUb8IzJIlxq9rYIIvRhYdCKaxD/55GRX2SgMmsg4r+iJD4O7929e+VmnI+9a7byMjKUnDvDUFpHZwISoT7njLsbeppPr+2K4p7XlhuBMFoN5t8Jcf/Z/0/rP16G2KTIS8xS1wbCcS/AiPG4nGJXY8dwHeOVA59IOF+tXCr/2FN7mZFK9pDcCXjjrgUuDKZ+xr/HkF6HPI1jSFgf48SgABHCySC3aO0NxKzzgcuxMo85LeeT4Q9FM4enYrEZwxch02fgmpvwBX6VGoRwAAocy2raFZu6Esi2Cvjd92174rcDt5AVtA8RNFIS2R5kVMFrs0XYBqZvxTGi/70IP/SD/9UNh/MWU96aJMuebQjhTKT4/29Fe6aWfdFEE7t+FFXt0zohtLluOKgKE9hp/NjW6VbKpL/71kj52jvIgqZCDNQBX1ftS45WBwrwpZJM5GMaB8a/6v9WNnlwNa7llswvYSHxAkdvr4GxIRhiPwX8iVPqDYXYIukXPBtWMFrAy6BvRQBpiCrjJ3KisrKYEVrNeJ7P7JzA6mf9Y5CtMEA3oN6qHgLKP4l8x0lHzdCqYxkD6NtTDrxgHoMEt4YsJgm+ue+OlOSiMWnWBbb89DcsqepAGM9Hy00ZUgL7S1hHEdancHgACvbgS7lQ9mnHxpadRqC1FuPNuLWgIr9GVRsfP9LJ6/tunQxnzDx7UjGEbKPL3P9FS3Eet0z7MobAYaC1wK/huSFWCj1AcvMntNu922t+L/yxCkX4UjObhwVED65fq+1jhRwf526suI5bF1HugpaJcLzmVRRPEWv+V5CLiWyfgPrgkXqKBhEaJYfgdpHiWLwAD1R8yiQxxFHSnG2uDjbt4E3OvNSWrxpIkiK4r6Mnwci9uuj4CsjESEnLtsDtH3UpH/uoY4f1w0x6sLBuz/zl6AZUYIkXJgX7fzg0uCiR+B3vt0EVBSpatH+Nieuww1zlGayn7hFsKa899kQhZQIV58yxqyxBHbctD4dGOdNIp0Wr/d9A4Umnoq6ZW8ZFNwCs2EbtK5tD54HjFvzPgr8SD7qUVT29q4JhE+annyedLAamtQli9fcKbVUwNghBorZukmF8LrC/55/824EtbHvGWLeUQVtjtmwjH9ugErkcMRPfQiFIXpG9LCDk5M3PjlItybmr2hH2dgzsNxnRcXoodAw+3gxGmYB09CM3vVNsnph/n7BcCy3PkKKHiT8mTEgBa3mE0l9xyRjFfEN4POg9m8uRJZVlAaeYDyJ1pY4ehTC7a2AfQQnZjm0GjrL6UVYZWHQzN/5CoUJ3RLLAmDPsTwtPVkSS1H285ob21T2A9DjWz+w+gzh05g8A60X9qHuLBZshzQKk2YC/+diuQGm6aCdW6T0NmTCng3sexijWECqp7ppw1Z5qZKcPdKa1svfZRYC4hGKuqu35gpks7EBOk9hCH8g4xusT5UlRIyiyODt6krLIwX1AKjdVe72DnliEkZYMPgQvbitLoOmXRgdtVaXvgo87Jq4xiPn3OtWbRhI3BrUuzBtsm6dRS/6TwdkqIBBJhDTlylmTZiDK6355MD9BYVoDIsj1XVIrwKxXyF7637KPiMun+JQRyTYQC9cBn/kY+c5Wk7ZQXhlKAl5XmXKp/n0w8uep1vVq+C58UYkG6mCW49IGVnBBt57DPv67GUWF3hf8Ms42VvNIQw6FLcBE4T1QEAMIagQR1cJOp45kPk6FzuNJUcu4fMTEStzltN30EsudSObwILxRlWA8TB4PU9b4GyDV3kg3FOBWTfMv8LvQMaOBvZxu+z9fRpTmsfc+qK3vYEZcSq91iOFCREtTpMfbAl3BeBBwm1IjZqumczzY7V7l5SPuA1b5IwgjPpo87/NqqlE/LmjP82FpOF7KrtZ6MKW50VRMmSebAGtgxzGTmrUpyhfN7yIV/zcTeQkEhg2YceV2YZXCO2RkXG4GowWO2wj6Z7rro3pFVV5oTXuS6E+xkLc6CSZWTmRSYJJIxHFcSmAVv+9OvapvuVB0oX8j06rLgS4yeW9dp4JG0ierpIeu2BhUL0Z8ZSXCPk8ujRa66yrKtEQ7cig+Ac5apsOPDkld6xTHeed1jS2XJ3fyKnKFJg6XM9k34McQ2ycDW+wvZLNvskNpubFThZsqsh9AcWhYhHHkWYQ8sJ+CfA8A+/FYbWAMiPvSbsUnjDsJuVfLI/w+z0v03+GVjkoIdpLVN2u3UhOLyYk70cbdJYJJj7EShBpu/mwPpoDi3LVf5ivh2dV+TmPJ1zJirC/ICQbE/TcUl0l6eibbkJcjUWRjl16UdOxOq5jRBk1grRKXM4sdOIAJ1fP6eaamHIzL31cytXeDQiMgUniYpWVNwuk4xAUNy28TVe6DnBpjj2QdWWvlpvsaCY2nQ6OrP2zFrhAP1mXkGYOxCTLGzgcBzHverxFsi81wR4EOQ+hvL2h27dAnkvhD405HPAyUcELfCB1yadS4OnqmD72qNHGXpUpWXc37wJ2X8T9wutlBO59j3VA1HzPRFaJDEb/1/1g28ssipZs+YJeT8dNDql9L1yTRgmf0e4u3b2jwSsZ2VzAbEF1ib5ldWqrbnxCBqT9el+FTGKJHSup9o3Hvn0JNN93TGe1KhmMN7gPG1xEmpUtWZeWbtwzQX+od7/yG10pmPtQrea5TE0wOmRq5ERTp2ePMWugYiztNDqf55WCvlHHGlWtCcoq1idkMJtozxwyfED/S2MgYvkWEXo677ovuLMIqUezFNMHmsV1DUJ9ANYge2VwmATqQoRS1VoT9LiruUn7I7d3+zqESJSq283gn+B8/AvT1KRWHZfOjvvyLLM3RHhxqXL99UP/X41+DkZ67sBCCp45vBcru8j8RAGFtiW32MhS2LKfrGXkqBWTxaWk5enfo55JCBzcwfnKRKP9adwy/eHE+l9Qt8l5yRD++pJm2RuOTTm9slvplc03BrErLBCMwWteo4NZWUit8Jfw6l1sFYtt5fJG51UtH0bCijDUl/n26ce1QXEwuT3xsCsd3yEweTnC+z6IFsZzAG9I2eAx43HifUpTf2gfPcSilqUKh8cWt4fXG0vnsmf6auwjv5Q1uR4ytQdd5cXzQn+LEDY0UagqQDBPcHFWQc5qlUHZvsFy2Wx8luCTNOpJoQGNUIjgXCCQ6yPL2dubIF4FxQq4P3PdUCPC7Dg9j/uQ6aHSFcslZ4EoNQ+skeZ9IgKEWTR+9GaK5KLijqdmAsUt384VmwyiazhDTeO3sKfwS3Pm4HD5eDRjy0bIfSr4Oj0TOLZ9B/4SzLjsYa7f5dS73AJ4t9Orbvy6jo/y9d2LGRJMzB9Sq0ICvL0gJBI80pm/NsK/w3T8Rm01AWpygiGzHtb+rPGLLJoZhI+lOwRsXEiQph3H9DnFg6DvfIQB7j/4eolj1J4sHe9RqNLv8LBzMTGXpNiobib593eGWoqGt1OR+iy+hRmvkqRRzA7fsKajFuLw7XqPtK8l7LFaT64PuNlGLslUSdRvWfZqRpmd84YVMnwkz+pDbGKgYLA/4JszhVzcfh771xgNwpu28n/5K4ERLEsjJdGnBTdhzxSmS7sh28YkaP62bthnO9V5oQl7B/wyzos1MVyVOT9XcSo1dw7qL3XN3TnzgBBCaCM492X533ZsiA+9EU/gVm6QQooZY+Cs1gN4uzWbAARsL+B/qHSe5sxT/Dp/wRQkvWO7gqPf4I1We1dNZYAQLU64vohYVXkaNOPgGNkACRV2bCQZ6YQT94CVnyRoUEVsI2yPBsMWFPj6meBL25dM2IBFHaM9dFxjjr+xKvqqkK29yr1/Qe0zMddVygorQ/n/qRmBt0I4u2zOH+qkbHTASgu2NMru3TJ7O0Mct+a0lEXsIppot0+vrhYylp5eAnR+gEdwD82Dz/O7unq8+9qmVId/HhcGtJKAK9dwCyJv/eYDQPDzCMGOoGcYmrMShHrakqFpqnpd/aDieTQRqLqEoVlrsJDIMpfV8cZVV4n2eYMpKWjAcLIs3fMO5pCjQDM1GdnLlU/u1M715keTXaYpqSw/sJOHvINw7mDEpzZqKvMiMxoaSFBua+5RP1tkHaWIA7eC41kv5I1GqVRDDUzhvuFBP30T5IVfMhLeRZWShNHy1LgIvQ4IqhQWjyCTHjfYMrXOVKAOj3lfb6NnvtqK1riqfCS1T21Kb6EO18hA1gH5aOX+6QNYVBjXKYscCNXuM0i0OGmJoyCgB0zmc/dPCiV4cDZQKbqN6zePJtL1wYX0VgQqeA0VpyMRgkeQZTI6bK6gyYQFnyp9khda/Q6J4TT+n2NWZCdLCTJ6DeJyRgAxkbt5vQzlDLyzcwFFB792tEfqb6aFgAjNuRI0b2TiImBxTecymAP8bOkquq8+MhaJHZv6MuPERkyJYOvgkyq8OWN7DUqdGXuU4jPV/ruelvn0pXyPhPZCbH1EWixWsTif6rwidpuhl4ZwWWTOLYQhrEo5EKiNXB9BDMm7EhqpTyVBALSQrKUZm+LHrimvWtlQToqIfyaK8mGrIIvPo9nURsfBdBOZPfJef7j0MC935tbBGgcJCHioIoqD/dIqUHzmudU8GMXHq26gpYEV+jlBhnuTnflV0LPsoDsZwR62XkI4i0eBIpSTciTGw5WyX82wd4bsycBoly5/2K7MEBdznNhMqLwR/sWI7VsLbZhSg+ox4GNhGbEZzH/w9ooPhbHeBhigaFKDCTDCEQ2taiM3hHOJzmjLY10coFpszaZlMZn5YIeRs1xQLwy0zu3tk3rXDEA78Kir1LerSJfYEqYKTNWhvmXLf0SOuyHeKX2NEqE3p6y7eLwzb5b23sJQtKBnItBaqVtzdxWhRgLfLXLLp0unqCPTjiL0dLkaumrsae6Aw9d7JQf1ciezsy38tQLXQ0//gImHERPMwx7bMQadfzZus8BLnxbsWHkdF+xbEXfSjcnI8AgRY5F0h87HkgBeu8FQjrSsiZ4rpQcxhldn/tW1IfWRFrCAa+nBQQANNE5PJMwW2gf8Qfcect7phSrLa5w4+OE6UZ9ryyFNOK0XeUbgDjVwiun6VMsqR3HQKEKjmzy/CxRRsZ0YfdBYORgGbgRygJ0K8tGVuNQAXMVfqqbkwUs+0jmI5uERmOfkfGlfJo4HqKfVd2rdIo/EIChnkEv8eCgDOsNJWb8aEx+K75dQmwiWpqXY2X+LFlWVUx/WxuZfyTwSrbV4ODSZv/35JGFMdljCa0Sd3km1jslmyOBbf8IeoU0y/UrJs1a/zbNkPLAPQCOvFG2C0HueyWR+QeBSHxbWMwpWRduJhQOVPKRH4qxl5OscAbBLXvTTfh2yQgpUwM/WsWjWjuif4uR/RwGzvuVPhnOxOqktpc8W72s7h7WucRydOk1yYcDKNYx9zPrCtadA2KX9rrUEtuj2KdfSu3nWWD9fEt0oIPKM0PpAo4z/r8LitSc9zz6pGZfU1igPOlgtwY7M9HrCxWmeYr6Iu4UnDTYbMVVpdWKSAmryrrkwj/V35/T8IZgXGOSiZbAYuaxpdwLl8LPKYuylFhzEcxWuTHWNXimZjdJSimGNpMFRoXTbgk6plsqRcDFYU8MLWPFeXqsN8PtN2O/5ZO71BLdURz7mivtbKoo2MzFYJiFfFRFguOxXZ8lT62kn6un35sYRP8Xp3zElf+5dYSXq731baYdnhI4Mv2TY+SYY2PWx2aF4e4jSJqsIR++7EAr5abN/Xna2i4HRM2MSrtUOC9x5TfGX7D2gDyqSjEMi+ZItW/IP+SCLccqMKPsqO6ZXygmSRf54jbij+Vf6jAfUwx29T6TGBLjfIJu4FLOa+h0eo4GAud5X7sjaCx6MECtKVZtD4XbqWEEnoZhKIaNP1L95uQJXGKxF23fgelvGA5BKU4jtV3/zQTApMlhqa+Up7Rq7h5euD2KNaFz6YQGtc3Mm6R/MKY506ALfVSjHkPVR1PzpRgs4rBXYzjXCuM5iKuSUXvx694Po2wwT3qIDc9rvb0PTBPyCeFZQ5N271fvLxKXbGsMe3Mw9v+QOnD4liyK72zniEQoSZcGaZXyUaBw8BappONC3p8tQpI3vxF/V9liguaYal85DPp4SXSj7mCQcIJLFFVvHDk1fVMLalNJGQ2bkEKqzMf8+ijvespu0mlu0lcrrGeyu48DnvY/qlIUdk12x8Zo5hHZ9YEKlTN0Ht1EWhirffV67sGqIgw2Y4hXsEg+ZdjuxSTIYHpoEcYW7AQZ7R6Mq3zJTsM/i5WmE5MMZCmFTh6GNpuLCqLKMVRktrdDeLdc5MIo9ghI4g1luSTjbbX2RVnUjayATUwUZc+E1bIrSY1TPqCl/vmS58xcGWM8LOVRn8RK5+uXWCSml6+ZaOJvMtMyJ3X6uDBx5+maWPfJ+I4JxTK+gma14gdQDYa+zlvS0YbKeUd9Z4Bm3VfiAcwg38Cn0zbzqPKmAmbOsQ2ZTf2OYiSRgth+Om9oZbIm5RRwEMkjYHhKNTXawMifpzX456Cwd/k7zKRzv7FwgBNCR+3tP5Ft0LVFcMVOixjtOZ1AfPeNk6P6Bkkb4oxtiOVUeNzr+YZz7aqTg0egvS3kf2sImG1PRZmgtpZw4NiUDIEtcJDvLNIpDRJb3v5vj1Q2my9Hz8+Nl7mzT712n7wHw0q5cZ+9hWbJ/WcFUTWevEkMccXuujmD0ez47iPgCd2vusDFilqPvnXz/7M5K0DJsT4TlAy9CNJW3kYlFe1X161oM+tdJHVcoQLlIVCw/1lAtZbACP5vFkYArCiGlfCx6fHZfYWtDnjGhXf3QQR8MoHaIbEayUFyHSlL4dWe7s20cL9lBmSmN1BFAM6jE8RVDwDT9hhBR6ovM1vAURwwo/XXF9YznIn0fFLoHpcSF0tTuNxk4aEsdMpBhcZVghkFV0OvVtJrAANHztjD+aHtVnEo0Otp/1F8nki3Ji08YwdCszr8wwOAMc9TZExMOP/pBIYF9HhZ+48LngMVDxn7wzNU1T/T5XYzKbkshLQTTRH1LS2iVMiZb8XZADf2SX8/iXX9QW3tyhLrE4CIfD7pJntrwDYn+go+PA38ekLacnWAGr05n83HdX3wwo3UiUQhfDVsDj8V4z7iko0Y0KUHT4EiRwMO0K+3uqNwgWUJoAqU0nk0tepZiKtvwwXs74ajSeZ93xRZvz7djwhKGD29lS5ntdUv3gyMzyA7ECCQ6MtqsOFFBcimeIuAYWIEtN6UdfIy6xwSg8tf1irhxGLLCrTcWGOBVxYNciD6AOw7qggaewmMUFarlfX+ngVY/HEEZYT4Mmv5f6ont0D6yF04e6Nz6nmB3AMmzbyg7kLG4pJ04pdYxmE///yURpdOwFbkgMemGKIABoqt/s+R/DAPgQ7Q1FlxqeYfm91wSQOvVLG+UWMhziGtKCmjMJV4za69Bih5lBdtHh+/pKV4PXRtIl2r9LXm/xbUXC72P4pUwfEf/SmJtbOnPDsGQ08MZJqztyV96UqWwDbsPUBdVys9Wyr2rFlGHLBBPRCmkZ6P/m9p4uef0t3Qi7dzTxOdS21E6/c3hQYNUEOg4NL5mkt+XbTZjgU4OVi9inDJddOzrj8+ZKvA1vnZI24HWwiV+EZMMerPDzFRLUB73WW2M6OYfPArri8cewGDFujDPUB/J5zEUziqYE7D8Q0J/Hl3EEzfL4BkRzpnw49KYXJ7B8EXuHq+uTVvW1nqE75KiKSqwCEYrcuhsyarD3ResyVXLl4CHiNMmhE6bajsfnNH+HRWtqMXq1bNlzywjzGsbjKz4Qh6vxvsGW2R5wR5k1wOPzpZ/cb5LHiRIjzFqnHHB0S7guHl0xMWx/Fn9E/sJfcbl2YIU5ERc3FVODPc94bcQjXjhAQ/E9cSUqjC46cs1gztmL24QCuE+Ld+6c2Xwey/Xax0dPjVNwbh82mBnfbggwDjsQgO9R6mDNfcjSU4KTdCk/dMb2aSIupX8+W3bsUjd23jpjway4zSmQu+Lu2sw2Uyo0V9l83KxF/GC3XGlK8RKTsf7mCwi4RdgnL+uV/oMlzxEXxmCKd5dZfxiJMIQec1R+uSBdX3/k0P/hpuJGR1K1axsc9XxJsgLc+fwcGl2KdZM+U4PUIb1FocPVR9G4cDGmOKf9GikSMlC/B2wzOELuiLvo8DeNZWggyCb6fZqAy6AAEBs0tdmvgMzXhfM3EAMq02qCTnFx5rgSGd5UFJSsRplYl8QhzN2PTmtjN1DSZOibNryDtfQf4yeImjmAXvWPGwDhOLjANSKMqc1qkRjuvNQUBmmJq1/TTnoLVwJxUom0So10YfNDc1ebRUiZ/uaOTpCy/cBCp+79PFk5RKBkHm5BqlFs2RUSOLqGdRgndZYnpvSQXizBn7Omr6wpDaUfS/nZPkCqC8Dpic1GrMQlS86qU0V1yYXKkvQ+YLWDrNoAsS0Fjqi08S4dYb1g+aibG2LAJEucIYqB3FMSkPj1LhhsrtalHXCbmSCuY6JWOOvzFaa1Wlw5BTbAggwoE/5+eZTzJ/HzpDjNT5GgjhSDU1kokK2BH+WYxY0bEp4VvlrGZnYx8nlWT5EEbvKnD7mP581aoLv9LB1jO7XWQRpPaOSbcetjefTp8LRrbK4PTvPbbY/8gcCpPWM2tu0BCeRRldSRHkLGWHjYi5/ALIKzqhIQXCs8siA/+KN0hOpGQ1lh9+47iUN6cg5inkN86Y3bZAcZZviRlOkixGdZxWybqn8yczfAyWKcZ/0CXm0LKvn2NWC+ciNPyhhLMHYhZxGa7tcCluReLxuRbt70H5vAmEGVtRGXILUUPXlsYnre9Fb6oQ4QHFtLhjzequyq5azYggShbMXqterVMJXXdoN5ClJTXiaH2L8hkThOAy6gU5E0tGmmcJkd8bENY2D4FpmrFo1saV8ncjjCxg58VXxS3ZyDxn/R9jt++PE7bMveOf2XFH/tnFKLLY5gzw0uDekjyBF5HRGuaGz95ha1ZT39kRY0xnJmJQADj6H3SNzhSLFtq7yAbmTATDQrHGS4xkGqg8kemE0EWfHxkk/7DfkAAcBbaDw6usFo+nv68hAS/o9ev3GwUZg6Gw++MOR7ZMPAMy+seqRTS5iuKdA2NX6Nv8IvPh6nAV3/FZh9BiR/UKnjqlKrFeICJeI6wQY9IpM78bL3Vry7w0ZRssHIfvvU2mvklP0Y9ytgCzknlULBm3ktRxLyxb8HU+jB5vqPec7nQ7wTRNRgxYkFgCpEUzsBLl2s7JTR7l/mLcYH3A+n/z4+mWrwB3jS2syIeSkH1wxHL4fIhB/gsDwACWyOl/tK08+wO02ZrbNppA5ItbiVIG2giGSlj8l63v+V7doMw+OHPFzmVbraiENR4a2D/VBU500deuNApxXZvpv1UrHPgm3K9LQJCxWDs/Kzqz+VygC+ivVsojUQ4gGT7Rwbv2KhJAfAuzBw6uQlIsVDymz44x0tHEihmJX44BYgZr1f6piw9o5+QVBKy5GTi1TY4D+YMugBjutt7cHeH1muyqU0xyk9geFTv9IgOY9ALxKdoU9dngrR+Q2mB6UcDH4MMgYSI/uH2Gz4HfqO+KeQTWfZIffv8XhdY/rkgXXC64N/hmPCjKF15s5Gh2ufYM/aLiZ3vXL+pTIpYOzJf/AlsCjInBRx0uiAcYiVHXfXGF72jS0lwOO4Qq7sQQIgSw35NfMK7sDagEZ2Z75vCnZpW1yyn0qgeqgQqqL5Y92kGZcucbiE0KO2Ij5v4icvzzYXgIb5gx5CSMjSvExZoG98P3Sq4RPKHM+s+tcldOJ7NpF1b/Dv4ySj/M+q7FL4MfMHtXMb/5SZ1pzOLoNOiHtgwmn6Fg3jiJiBVBKqqRAKOv7ua8V8MrAs8ASSsW9fs6ojbhUXCOkvT0e0CvgoA997yXQQjjfmkmr6xZ7eAhXm2qxAn97hvjB+3c5BIxcvg6W5XqfX9DxteOLgErCen4HYo/I/oN9Yc90/QWz6ILJjA/g917lCHzrNn0veUcrPSRyx3r9ZH/L9ewSgx0p1242+8Au6RkE3t7sq7mKh3KEAX4TRvj7I9do/lozWLsAiyItTqVk6GiU3yDHZBoRhP667ajqFbiJZn8RAYEH+5vVYNjfVzZbIL4lR0/DadDzfL4qu5RADPvRtei6onNX99xLv/Of2luBhwK4XPTBYekVjjoBnqCnMdY82thkWib3i98acv+DyGHA05cjH7CG5wk2qHj9/tEkGChtVE/3zhWnNB9k04ZalnNgIQ0vu9BK96w2GwElOgg4ZgopSm/9jKfIc/0H8A0RFso5QqfZSz/DZdKXBdpXub0m0i+Udsj9qE9EMZ0mPqa3D5ee8nxfPxcqUB4R4Iea2QP8ECVRTRHxB6hg0AG7Bshf3KXQY8CDY7fXHS+ejl4lAnvG0oNi6ou0JWFT7eIWynO+V4is/wyWJoZ7kx9hm2iY/Cx1XhqJWnKZCwQbii6zp/vWmyIDObkE5itXl0Okn1vbtCvgnxX+2OY1UbxCS2zxsyZOAOIwnz2mu7FW/YKxXY5ity3OHNFwfBrVYn4nQsvUrJOvhzy1mVTcKf5ZaKtPgexMRlKy7m+mOnqdXFl80kGrEVGMDTJ9wIOdcD+j/qpcn+7MHzyK8Q15w5/5YF041jCsA+K4xby5iL0WmKhz5WRc5ABG7ypwo1cEP/flRT3fhVGzVimYkeb428zojPBT5L1rn8w5O9bMnIKL6FZQMU9rfdPa5jnitCH1i3U+brR2+oFbZcbQxzESlpghNOgSDcCXFm30Hq8hITFuZZtlfBQrBGV7jtg44R+KRut2fpJoFfKl8T+7Pgz9QGe3CaNz3/2oxKPFDOv0rp8LZuShYqQTfKasriaF7LViRIz/4eqM9Ov1JdSGfUz8/8qkWnTvnZdt1B5O2lqCmqc9lFnmG/jWps8v7D/nLV8IuAvvhhHqMSxV0AGq4rYpwUiaHu9nSCR+J9tHWLSxz21ZPYdkOteqOrxHBMDqe2wqjzpwN2YiTd6tqUsWn+2r/1+TQozwzYT3sz0V0xZMQmWqFs/KOIkGN+OeSnM8SyxhY/DMSjynSyZhqJGhCHved91Yl0wynEHMReqwi0/gumaBL7y8LrjnCcSE8sR9YiGNMexZzwKusB0lnuFsBv/U/syMVtp9EDG7VWNi+sVg+u8Hu/m3yK1/WE1vLp1UFzd1j7YuLu7BbfG3d3d3d3dJbgT3J3groHg7u4ECBZcAwQdkve997vyTf2qZqam/+g+e5/nrLX22etZz9pVXasdvwiYlSC7pgy8CF42z9asMHNbEorIMrSzkeWihuLSrkupCRezIEXTo5IKICXTkhEFUCFMmqW1lJMLY2lylDavPCQxdhr5K0ZGFr6uziIR46oz6fThD8z3aK++UAbUPH5AUOh81r5MqkDdsKvx0ldq8PYDUAl3Cy4jiWiMcaQqZngpITdn0RCHABLKRnYqemAW+VeZVCinXNLl15M+EW2h7iSgWSB5sOXxaXwtLootaFzEFsHuGJZiE3PQcUM1N089RezT5DOahsQafNHlvRqVBNx9KEJszqeuoLu7P4Nx5wzeQitb433TKN+ieGHtLkb3WX2QLcgz0D/wosBEDbB8ntFyDWRqsauvLj/CuBhPTiHWCtng6AQ79A+qtCjPvDLrIdLq8uCxIPPYoVwRch2MR6YrHYTttCLX0hekfQmlD8KFqXhZR0ZVPocMJ1M9Gc87HflBBD5kvoccLuHZ+CTNp3A4HuvRAFs7ryLTuy/QqL7hqcWA4lmmVIcTzOjOpvJxLZ1ZQLSv7f5J9i3W1krdYl4jDeENbwzubo7+eexwMZusZiYeOgJJmD3k9TgpygVqgypO+yNkGI698+F8TWkmKJqJLdpbu0K6mvBUUepylf+LV8e9fZTh0zdxDjQkbDEtKySSrr5zBfTwO67JC7/heqpG4T6xDCHD75W11akxyPepRUe4x9X5L7lUGSkb31C+vc4m1MXvJYfiOJDkH6zd57V9ZKCAtNjoyBdaDlIiywPpBbk9k2jz/TLihguwFWT2mV2VxySw9mVjnTU7MP8Aq/clGTV0TMSKbH6DiPiO+jgu3ufOtLw+7M7zkGELLMsj4/h+7WfE9dYHd/z5i25AEVcQTu5SzpoZO8fxeeymp98YB1RTbyLuvaZ/UPs2k2sOCzuFIhwowkb/WDcv8bLGr/Zec98U0nzbUfDQsnbmzwPaafa4OCTIv/yTCfhfj1ZaBIBZFaOF5A7k1XiaYTdmDkYBcVaKRCFZ2syEVRQ3G6z7HruN8lxZDWFed7/aUFlaMx+fVCkro9TP+h19Rs9u8nttgyaCAvUs4gfVIJgyBE/PA+2ESgURxCiIyeonbTp5Z0Xn7dDA0xPyNsQDuD8zBp5DEU/9KDjCaq8BGDLIvfZ+69QYQV+88GNdWfmUtOCsvWeBJuiOMVB2IUtf2xHm7BhydDcHA69iPFbR4+SsWfICw7GKbhbzMbhybMA4vx35buglclB/C82oBq1TYc7L9dIH5bTqHupiGL0immkFb8CgWI8R9O0ZiDVmXvvh6DpFug95+IEYXxBofMOib3Sx3vZZBt0DLxMTbwABhDsOMfeZAIoXQSJKy7eSIJoQJENch3GTXyKLv8e7QwNWsZSypUwpJ6rVkOuRv3Hhk1K2774NJiEln417CxAii0Vw+pbDsRiWrmyeid1sKNI4o/dGgTl2wM5Z3lxUpZdCYMbJAjt2OKqlPc/ZI6iy3+EpwchuGWbqmXbFSlPNEH0NDATRL3mg0iY2alTTGXNOiG83J6AWUuCZjOwip0H6ZA+2iGtwEOqhvCpzeIeIk+JknMNFQ6u0ij/nInMmKCfYtHCfPz4/hOPHUtPkdVcvRguxud6hyNaOrnURS5F0m0f5LYG6a0ABomdWHmwiFCnPsFHVfDPltsFrwzfzIrjLlQGeFL9Vn+BY0rJ8ag7ux4O0Pc7ZifY9PJLPCnn+MYZNoJlrvknuqgGYFBVDAvqR6ezfHoPUZEO/MEQlhXKqXKD5GA5N5vWHJn4HN+rIXhtYUHKMUJ2/uUCD58Be1z5+/mQSoN+iGv+1EyeXJ2BwLSFQ766WwdnJW7eYGYo91SBLAcXvmDjF5uS0A2LlrlF2Ms5LEqeJweML6o7xjgsnG6BljnBgiGL9lqxFemNp6nymLPOrhpscp7pNYp1VdZ6MHiHNw4Qg1loxoHekFfmjwhoMicFXrDQVj8ZShuR6WGUF68KGjzOG+aAr9wiRk4maToDTle99r32EsGJuUOlm9AS8M91gvN2wb44wD56z3ALODgWw2yvPdQU9DvUYeYiyZKTjIU+acAz3X7sMmla10IGeQTXMBxqsqzLj/A/zAwfpD4VUU9pVcCGCnhgy9VeDw+pf/TuDnTnIM38FXKIJi667zVDqTGsTUc/hhGb4Bluy8epoGx4kztU5c6BHUyXP1sQtOt1DaAp3q9owvJoOfADC6BYCj61k82a4aBm5CwxICdQLTiPM57bF5bvF+tOqQPdTPoVGkK0mHp1r7fI3SO0ggNu7T90IZ7OTPzvIRE/LTD93nBM3xJoG5u7EQQ7qnxca73Hoz77wwu6UotO+CVLyxGM0oLEJzMmo8QpOSDUcQM9MYLKRTRvru1dyS4dnsln1HR8oysMQZSwXzJo84Gu7n4+Xa9d80HPAb+zfxWpZvb91EvWE4ZT61SXLYtu8zstwMd3g+uOKZaPU1qb35Fljv6kDnIIYszTWg39h/G2bTP9DavVihdyU3aOlHT+gfD7DLsYXKtUXw+drUCCZDMvKWiN8AVaaNAtpwNpb3Bppn44fE+Sm0OAMpJQk/fzn4FmEp9SF3HOCot7nPerL0+ZTi34SiCPSho1bXrmfnIuz+BDHZ9IlXxs+eocPOjEroE/BWaJnKxfZRQyiV1kIsSEz1rEFwJthjoJkujuCkcgOEUFyb1W3FRuLkbL8NAE1b/GQAPAojtiat83QJvK5ywMlT2wiLASbZD8y+nymNztm+b5aVXjV3d/YHXCzlLfMzqK725TWKbmD/P0zDAOrNX5GhiHRg8UoBbys6S93pjTpI3agE/MUP4qTrrN9CgbdhPHYWog4AOuR07Ef9fxk1q+GL8aoinTK+7nBcK8ZJX217Nd0grOorujroCg1VEW83/C+89Zkm/Yu+Ih/CMV3yUJSYld0ADzzqjj8BUXv3e5InPgwz1aafSLnL0YrLcQHpxCKKNiM/AMeleA8jbWCLXph/GZWEEDnKPt4bgoH+TN7DtMBS/YUTqmLuqIczxYPc7nqQBL8ytdSqYDCnGTyGtJGWkFZkT0tAo/up/0fUV2g1eEtZw5nB3VdGvs0ARRtkBgJGJkm6AkqQiCcmsZhU7EyDnKja0aB9Z8mCuSO34q5srzJ/Nw+rBPjjH05OEogrol/qsULZoSckBFik59ESEbNc5d03JZmLMoatqxgfGyUfvKF1InDQkVN2wMaCamm9R6sNa5xbUNhiyX1mTbliJRApZRCFMI8tHJe+HFQUhY+I+/xw5vDt9zo1YifG2LeweO73ZVMGdA8mqvEIhj/tAtVsFibsZYyg57bc6P0QVAtZgOfBmGkyTRhI/XNa0jBbt3fj2+PrYHhI9oVEVKGBotJfsakwCHXuMLPqlA17RwYzzffGxbusT2C8b6ZRSeeve21i3rjsVu3cczBI2cVwIYVuzkhlJ1Zbm6ByFphFOPkFmxTlbzLKlV2jm4/QiAAdgPmUrjvMrkL6Z7xMzCyd7Cxdq3zhn6MkWoafV97CnEO03IVNjkQnZ7HCeRKCeLZzb/N3QE+fz0e0ZRuaXNqvKxSAeSxmoj3YjhAIt7wc0ZFkN9ZcNqmFFvGS31K8cZ14Pc8Hvf7Mg51YkEchda4iKRBCjwBxljnhcvuqkdQdPvKlRPtI51CjWCZXJ2p2PK8UJi4UbRuo+c4pa0uGjOtH+iYzJIyCz19sL9jgE9k3sCAz/F3Nd/c008ZDNdEPZQztICqW5wUpZhgj8Levorqn0ehJjJAeLaiBSmQEGGgvdv7EHZZe27w9IjDexwaExgAxojXDQAltKL6biCIkCxZkuL96EgglJRQgLt9dAENufyBVYAcmI7p/Al3PgPNH4ZPyFZriAZTplrQEuAIjbBeYeuUdrbtF1BUPNlQ1wYkP9DMs7fhmuE6zW+uW7PtnxPbvLUh5Z5C3tOczQ/vmfwMa91JMJq7HZnXV7/t1Rs5SrIlX52g1bOWDf+8T1ulOuMLP5cDHzj/Ypb+TMpM2F1BnCnyucvNjftGAT9ciP1Qbs6iA0zcnr3p55ThRUd3XQ/3MAauqan4i7dQ/1cTE1hXWYut8qVAS5mDCqchqI8UOvoY5oUD0XRlN6DfOZ/UuUg9ZfIp4KN9Dvqex6aukXuR5iU5HT8wx0myrXOtq91TiIQ+Hyv4BjLAMXJZWiNQkG8YKt3VdAufqhYiFI8LVDpnI+wVpoPMJExFmYjGfbhvtdrZ3MqY+SpeibjYNCnCDJ/lR+IKZlNpSFGy3HfpTKpOjuo4ElGeVh+CL64Wj/HTAZr/4Mr9M/mJccRgtLzVjvKLvneJ7UDm9MylYoHmQKKq97KplcUe81GZHokHg0ptPjqordlaso5JbD/b4M0DC2OnmtJ0Je4hXDLbZvqhEBjyQxXyYgEcrUsdGNJwighITcwwBEYOrldNcjcBnQQzzqUYJX1OfeWoFGo5q8+dyhBJ6JNaxNfh75wCJp6j+9CUuHhHvd6BEw4KpEd30Dc7nFsYQUU/ccuC92KlBR3jVXFEHbqsBZ4tPeNEI5qCHAzV2fpdlKvBldBBMQ/z8G83f7ZH0silMntYTqandRjjw0hFivzUSrANEtvuL24J5m9T4OHLVVi1QrPeZ12xj4f66LHlI35zItTLyBhEoTWCtgMYkcI4z9vezK7DqknfSPlmKcDCq41F1mdNeSIvt2Poy0ZvTNSPqR/cQhdWI30ZcLZfsO9XDzUl8EXCZLtvF/oEZhEB+WIi5MqCgVZI36K8LpZAGckoZpjx2eQ6274lXEQ4rwlO8nt7BWP2Wzig5FEw47Pa+HeGJg+5TVZSekFQk4f0ShbhoREZVL7WKZr0I4xZZG9n9qsdq41ZM13blu86bIFMAfTh2WOeHk2hp9w09d27PdG+WfXuAfyMvngt1zK10m5yrAxlSEgkvmv0aprd2t/2BNEA5Df9c+QSGuir4JzTUARyT59lPTVDazH4OkYRLSL43nIyRJBj42FgxGCf6s3pEO3ZX2ylnLxK4VXapZAH3BAnafxYHDwxND2vxpLfMmuurbaQLqXsTrCJ8anmAPqfayIT+fy//XhOnHdPUAYX1ifhWja7/FJT6oGpMfNI89W5FkyxTbPM1PMi1W2L2TPPMtWgnOsHXQgbTaFoRFSnOtnWsDu3oSFVWE3/AzttIcNscO63N01n/sgFG8VnpljExClM8i9S5lQAxAqro7CJRU2knl9bWUedYqNwB2upC52yMSuiJKdP6lKuXxFVlgUbg50mZPrPzzVZMIl4rRVmgp+co/JziObgJJyMI5uCmo0ackSxadFd1n06MbnLFK3p13Nnh7L2H7tr9I78D4jufdLxYK5FFwy/fyCbQ8jxsSyJQxoEbIti1Bnmlb0SJYZkXGvICQTOzchIT3+Fnd5HiZffGOctGMwhOJ0ZplpPYg4/J00U1xBb7RRVHfyM53Q8TlViYTmoAg0tevAlJfwiY21eQukuk+FsHN8kO12SPdeYl/famE/mU+24fS6aDFFGs4CUSbA7SDzRqIlWRYPT1AbUEPxe0pgRYWVR4t7Pu/NKxLQ+HkxPX1xWhox5hV5YywDiLBgSxykfi6yWzpDoOvQXpAxCUAPeqU/njw/tpihNC37rX/Dkj8/i6VE3eRgjhO7rSWa+D5frmA32yg6c2Y+SIYs+h/gE8RA547Taw3aEWKb+iI3PvdP2+sHDuNGyhDrWCOsR2c1se4lpQ3udxyPeRdoI+5NhZjvjMhwKLxc+R5recWR6Ju8iu1mcSwEJbj2SWNV+heqkdSz/VBchoeSZDgPvjYzQ275uCsoWWRXaSgFGHdYJmo5/F376mFi33yvH6cNQMUtttDLXzhazGPUnf8cf/VvK9dvfQZBWoV0e5B7odE+OL56ZQIaJ5Ge90OhVWn9JOynR218VnguFXfoZbAcrfoF2QZRIkcTlDrJlo7O3YiZKMxpm0jv4aTCcsVk8/ZUW/wQFImCRfo2JihUxLim9O7/f1xj10p4DFL1XNpfngq4Z7wZBjhEDdfbCyjESrpfYS3ITVh7V4UCxWa+otbG2xo+wbFuRg9WK39zTSdMTN3t7buk+SE7ilv6EmXnrsu0ZACyyIzI3jGdwN2kTl7gyj6qq1RC2d+aexb6hkmEdX/Wo/cmylJMKRPrczJDiXmfNpYvnIXdDzKMqN6Pk1jEBU8h/a+lGZjIDgPqKG3zmJLg4ZgTRcdF0lpAiYgd63Ywt8/gl72zEgdPE6Nhc1vmHOFkq8jbMhKENqpgbFnbeMIOivpchvDmGcgE4qXo35/Ou0zh19dG2JGNsm1F12vBrgLNWtyzsKXgp+vYuXcd1rC9nziz841LkNGxG/4mBvWQuOxrxdNWlBYK7Zp9BgdMGqFyO616keXPq1Ee5DPqhuoxt6FvEATVPBbQsNEEmUHYadtCCqyhKxtRkq2+FsgKMfE7uHj41M/gGCz35Dr0LP9mLBI8MPVMIMksEaJtF+59f66ODEfdMzFRxpCLXGd1HtWa9q+1r2aerRjiK2BPT7yCO8jU8fHPRSz4uvkpl0aEZxPFMD4by26zslgh88SVceXkbhORQS2lMULvxalj/2ADlkpeJeXKvjrtQY0TP/4NXPSS1uFlERtDdJlHo+cMdy2UhSI76x6ufH04oea0saclLzGC1W++XY8tIgdVKhb+y6+o9543q9xgP+uA0UpNvvob4wJbtEMy6bKIONFuLfU/Nhbr7Zgdqp51Y0WLOrnufFaSA2s53C+QYKvUklVfugi98826vy/Y3zjEYOXT6XnnmtmEnP6F58MwjdSox96Y/XLRjpWfLzzsLFpW9KBl1VqQWiXVtQmRScL8maufw4i/WxEkP4sZhjM/qHvQJPxAtkCpsTTWmJlve5jFZfvLIjA9d9WgmCSjLbFdH6VmS3CqQOsM2UnPENmWut5+lY37CS68YpI4xUfg9eA1ne+p5duPh+tAs0uQKyiy+RQJ3lYvWYnMRZdfSy6K4dvMzBi0mLrDoWCT92RZuHckQORMmpabVJS9U1nZwoY/I56vpPDrIxsX3GbNLGvfsFeR0hOFAiKurYUIhJMHMcK5e+6XWZBNwzqonMt+lzEAQ7TLK1XARYyz96zTWuIe0V+UvcgwOl0OfR8vrHhFMIgu7rgcrQxypFm+/Ye46TSj/0MLgls91YAlqMLXJB2qxj4XS7WdfGztS7IBN+i+efVU+Bd/gm8J0NX9xiAsa8h4EDVhETzMn6WaemW3PpWSkdywaI7d+oCYrar0q03wxaPFJSG5qveUyjjvklCnVQjd1imIIo8S87yySqyVqT1pKudp7roP/0Iw9DIIZCaYysWte48rJqsfr32/YchtSYfNjuKAAJyxcGzUq6zb5lRDOdTqtCk9pJqLAD8WkWr5hNdnSK1OD5AqsdZW0aMNTbM7cGxTWudpDu1VIg8sSKc4bqkdJlQd16SR58oDDXf5ZCjfweT/yzWwTkoaIol76RecnxFmG+ijWr0m+JQccBg8nYeU885uVDO7mj8hDDppnGClJecIMi3OkFZfG+5TFpCj7v3ZTcMXTofqJfwIOyy6pjPL4+jDNZWcKPEQQdDczI5pgPy3lMrxZp1XdqUARzDXXQCVderPh/boTZZDk/lAd0rOGZtmjCE9ug5llcjDasSv3apkBHe7yBa10kQj+uDmbTZmudZ+6TgVxedU1VeM07+axe496iVdA1CVQTym5h5byMZipGOc1W065muRklj63XmHjiY4njw9SsK+4s5u/5lP+9On0ztUcUTd3w8IzxFr4MrIePyrfYIFux5KBhCG2xrUKlC2Ku9KIWlGY9xhkwo7h6xN5dFqzQkTR6kYIfGPaBCobakWS2H2HPkVY3iWPZSWE4KQWSp7/DSqlREFVCNime5RuRMoNO2l/ocBg5WlM43n9UAv4og3MK4sVGllfcYyyGSw1ppnfHiDLIqKxrceN5VIKM8117gWOHO1KWBUQcTZacibt7ckXcQdyWVuwr1Lrt2SGifyZqp9GDGrHhbQdU3E5S+ZHDLKzjeQnA40dGYC2JIinRTT2INPyQAvpWJITG9Im7B1m3YiUwtds2YoiKg6aLcLyUt3gTyu4dz713JsijYr0pVh2fs6fEuFv+j2vUUvarCl7Pz0lA/JqE2zvoJtyVaYhBOVHtB0cGIVC0sOe5ghxiXLT1lAm4NzHNciitwqbdVfxqB9k4OHh6zYe9Wk+fb9X2qJwNon2D8aYUkvIjzgymxS5jjvfud9mrNdvpEYTGqgEN6IPTi1o5xfvVMXRuBD1/DAMfnr58MxOb7dXc/9cR+xpbqOMgfW0dZ0ye/H2HS3Jg3RndMR3KJxvP0P0+mmzd2Oc/4tPnMC6FBjgLblXBlpkGVfJwwVkJ+B8N1v5lZO8dqa+Qryn9HxDzLe6A2Zxbwyxc7iFC764mwkYopMNZTEq2m9PVx4apYwsjthPcCwZ9paHriSPcFuPJrIu1sBcf1fZ7O2gXzFgAF3to+WeG/dBhLfafrJUrgtvl1rZHwTthdPpOCCGTDab5FuM8mpssM/kmJAfz03rVX2SkEPVLaRVYk3CLvZXDPQw3GQPfa7zHgBv+tly/JLC4oGCWADGkWAfq5wPCIquty42iCcZS8PL2mSKxIWHdsUoANRG3EgYiu44M49O7dujOd4bnxosWJbskDOkIMvU6Wxgd+sRTcSOM41otQz/loDO4oPz2H2viZdYyEywfbRi8M0D61jyzaXUUWjMNjRub8dD3nQJEdJGgqCilV6uDdoy8FrJJAIEGB/iw5hhI93FZGG+6S4bhMgxXd/lrzDjH17WbsGLcSnOlTuhG4RVUdoaW9uhuJ2w94b3ts0v+X0nEAe8dI/Li9OZeQhAdfU8sUx0SxSpIbt8w4uL/dkwZMluDJqzMnSuuo/OTQbXnX6NT8hHc0IhcYOt61lD0XYqDy3GVg9mojGd4EtX1+inWy4sizwXTdESQqTF/vw1G1U/B3iPfDS5bXFtGpmtSb+BmtwWz9aMaIpW0EFozwT+13jlhQrNLTGE7tXS/K61TyMIQ15ZSinHHH4x+DWn5J6wQnDD4YP+XFUcP7C+eXm3sdOb2a5jBE2hnqMpVinqjPLomGnlpULaruUt+5TEEJidWD/k/f4//p10uwnFfSjV+Gj1/A11dFcfmbThAYtWj6qLpQu1JpmFaibO6GI+QhM++cHYiPiBnG5AW1vXlQ6Bs81zNY6LU2gwFbQ3uHfiT9ePFmn0pAeeeHJO4+VGUz8gVYUPt2GYe2F35DWJM+i7mwRtJLxIeI8XaidhegDjjy6fazucAdrh9vFUxqSTF7EJ4AzdOHWjlJslGufRQq6G7Qah5bayZWuF8QGB2W9nnUTUVtpDakF3H0plqFwOeedEMRq5fF3bC1DKk2pzGj73KvtGULrra1B7ysrZYpGw7R6rgRYuyYXo7ms9K29+9ju06gs900ltzHwRP8SN+DGAQqB0ivcSp9tDzS1Sagq28EnReuvMNOvBkkujNQORX4mitnpSHNCT7NWytdi+DBXCtNN+gvZTcGr2F/eTm24tVnu/yHMb/QPYJBFBx6eZA6+3L5h4Z8LTZlNuB9XSkQGJGgDWirSdXVti/GnpgGdA9Si3gbj+7qlZqoJhMAq4YTL+V84HJMwfmaRAxI/JSgsELvbgvG3Q3BmXJMKN9WeFsPcaH6GiJRWZG9XZKyBlECbr80wQNNnYoOCjcXsn1A1E3b3n3qaFfbta4rNU4YOUZAaaxSqLGXVqTT+Tyc9D+7piCMNP0RTFz1F4tJSEE7lMk7b2568IgULmrzLEidF8ceoT/ibIuxiOql9SMFH00bf+IkC8wLT5+IG51u85p2MzopED1ovxswwxl8Sd5znuRHHLz0iV9eJNxzrW0C+0btxFhPCl1nZ7LMxG3fP2bslyW1PCT1s2ux2aqr6P5f1VOoUNpUWsG/V+s8uXb5TWdIVawW4EhXalXR4Chx5fqGZGtoUdGEJQAguMlafl5NZanRyPljqNlz3N8sTiV7ttWcOdf+nCLKamnLfxr6x0wITgMcmQlH0UZmAm6VoOYJsTl/4armaqIzf2Blob3NMTV4DqfIQoajPWU4v2QnHj3aY9xnUv3yDURfJwB0Orz/Y1guCFeAGGS4/3+30H+b5TCJHnbad++8DjRJ3PRXeCPxrU5c2vStu5TfA1pA8P6G+PxJC8HC9z/HlfFZ8VpB20DG3ZLjPC2zfz33zoY0HWjCtF2W6Fq7QIrsbLFRm6TFxgJTtZT9xNQPKBzxo5irwhlwuUOU20C6uYv+Y/dKG4TU2ir1MyfMXrUyz0EGal00PdhHmkgJIglnn1UxCI5gQbfHA3n05qFQyv7YR1s3N5LlJLegqmd0z1xO3+XO86qrBLJvUiBQHCX2p/f2AQGiO4+7xDeKQLDn+Lw5SOyPIzS8ELp28mikgRzwyeOQdYoJ/GtNU30qY9kAzbIruRNygitqx3gpRA7Jk3OFFsfnDVuUeMk5ktoom98uFi2j3CbQGKLaorkpzjy/6NAKWHKYTmOn1gtXgMhXHTdDxsus/kNJ0jweuy8l0vVhVwY7ml+fTTtWDZ5YLRqbr9pEsc6QH6u79R17YXGQyJ11q777YoDwIXOegPL2KtpbnmBzYwzR4aBCIFqakckT0EtLC/kgZw2a00Ha5CY3TYto0PWhnsDpiMw2DMh/Hh0Glv3vR4c55fGlIW4zyBLhRtvd1yPS5v92ha366O1EXHxbOuY1/8APEW7i+vXL/UiWvIqAsY26xMupxmGWngztF3/biQGXRWTuIJcYxOmuRCq58Egz4NqIT/AoFVwYBGobEqErKL7lQ4x8WCHgsHS8HUsUdxxRuJVorUCqFuDNKGpzAvSai8ruS/uyxsIsCGncpax8R1nSi6VqRtL8687B5/LipDtOkbSwOgLDA4VmVi17JF9ivF+sU6ihJSS3sdbi3ilzk8DWc1z64Nx7mYkzrDuLwisivASbb/iOq/nQPDC9wSMxQikf7idHI7cG59zZMpqOwnjN7wQUTV9MY7kBMgRtfU4aSQQ1ILc0dJhnLTi9NgBkYqFXeyrZx1Z3QXNv+QlawQg/bMOMZE0o4MYLzuupQ+Bfl2fs441rzXCiqRTBFk8IESluXGjhbrsuokS2Jw2A/3/lscKrpBTN+xu1m+AiRxDTXBeljTNVdbqhOhTnU2/MRbIoFOBV2grtF5jsptYBM17cX6MTwsy+bHC6IfxkK7UMFD9c2I56Z4dmZw/QL6/ohUBU+DGoqM0AWJYXeMg84kakY760ulZ/diEexZiI8tXfsH10Vk7vgIiG8XrFNdHdkz/U5LrsxwG4S7r2hqxB5CQV0YyAnCsZr9/CzY5gLFpjchyox0SdjXARFVAmwf9i0Zo5bCcrtspo7sXIbVtb05oUCtPgVradFWWqDKdHzwpBdDkuTYSf+mVtTyGbA/Nb8ihsqGPEwXGPLFlfcUvWlurYH0x0aFmB2gQS1THiqZPZv0lSGZjIFznSJxcWKDIC/S+cjwxqmPm/P0GET2R9spD7aaHK6Qe5jOulCgEO8LBZX6T8nwbnOVW8mWs6rh28qxMrkvX9WLNSYbg1+nnhZTUZlOYA6al9BkKUa62iK/HG9rOrwVVHafqQEaBym+Lw2X3cVtuIIu+x32uC2raWCmjnCxfdw89D1JLpsT9cJIBx5cy0BoOjml4P8QBx65CUGzk9Fx0QehfMASTGjyvKGVyUTKVW041GlelAxrPvuVsjP1/RllGfnEgPpKaujptDJHPGXqi0YcC/rukuIn1VmZvUCmCnTlniizoAyFtKdvXTrLTxVkq/wXNIQCODp4GI+RZqEOZUi65jLnLr5Kud0+NueusyI0mJwucjGvkX2J+J/mrgA892RNrswfX8llW13ZmLDxbxMUftaqQI/YusNzEc1YGBzEJulaOQkZLJqWehRfO8z3hMFxq7xOjQ5d7Yhyqd1bXUdk+fD+0rxDAj5tQxymZ1fME0+QV5R2c2VPB9jDaMQm+rY5GQWnJYSihTFpZTL0hw91uUOI9ptkj7iABhAVpyx4Xuyuu9x8Yb6HYOXgIshCWvYP6ZqboWZIdSfH9468V/NziU02chxJ8un0W49vRIGql8hgaGRdzI450juwuKfS25JOZndC7v3aMhJ/61qQ+clXB48Xf/nSwOnVELIFhWhDxECvVkEJI98/ivN5f3lGzFYcW33q26eaDFCRDtRzWBMYpGqtwfrOsJ9pE2AfnXLWqe1n1J8Uisd9Zgp5XpRUSnZRsWA7DpEa5YjKnb5b/FA1gtqhIK68zVHxSs9hBMQ9zddWM1Pjll6Cr0beciVO62XMbOzHJlpV4sJxTmPEQ7gFhBBT4+Ai5liS7FkKIbKcZeRU7eKT1kd80StmfZZUpJQ3t+Q+NqMn0+BFZjwDzz8Do8TwIRkpx0SzTW4TRN6Qa8KVY8CQz2/2r0gGAxNBy5PO9Gcb5RZJLicMB/SAtMZS9ngaLt04DelDwTqS1VyqkGWdFfVOHZnqXS9ffp9Z8UVFvgni3nG1dZ102i/Rmpzls3PkT1QOu+Rcst7K7OmHNtSU89cXO/fjEf1g5VXG22nq6KHgk9brVu390ot7luGXNGJlsSCi7qjOBY7HA1o8ZDFdZanjyD6TQl431qkvHdzSBbZdZRDz9jk8EyhFnUz5vsO0ZkX0I0dDnnmiJTrz/vB7GVBSwqXqfmRQbiGE6bJlnXg+HBz3vSukkD+ezzz6Vn1NWE3Y7SBcE8DJZcIP7gYLTh2sxwmjYR+2v4+kMRUoHw43oDIdqpFiUPUQoOVTbV3dBSmhuBjpK8crEHDH9yG73WYmNQm5Q//a68lSDWMI99eWuqUTyThDR8WOviFAAj96Y7Zltcdyp/3MIQiTTtF9NxuMp6WMPUXl7iMptfl0Lxx5uZ4/NinhsTinF6Nr+Ioi8THvCBsMBVgZ/fXn1KUE2dw2oWWDcaNjNdckIgaNo5KRA4KqH4cnioCJ/R1Afm6IjV1om6FLuLSHAdUGbOniTDUrssCP8CAU59BbVoe+EipWr1wZo9DEXlecH+IDDAXeuLzG2rPA5UyOW7V08tjyOeeEwJcyhqTDO9PcTf914m8DIZnOkOmud3o+kn2UUFT8X+VleFr2JqDyBllmbnr1Kf0qWPnXZ36mvq6crcDAQHTzHHY+5rgzFPw66yU/v2+K9EL/teIqRFzXmgnWVaQMBZHNBu+otMOazOhO0C2dJAvj4ZW4MPcSA4tq/JjX9ii3LUc0ksIuk7qLqGyKir3GQE3Df3/3feJE3gl/y529j3ZDhXrcsh3cXvMw+uHbWGh9uB4jrpBGgybvSntqkTULh4z0z0A2gzBdMPrjIoUWiIn9njzv5F2O5Dw2WQtRfa7IQG05AIlyWfIln11ZJKEDTSJQjjsN7mG/FFoTqi/RYH1nAFRzIbHGVo8Yw90+NZJUMv1LznO1kA2+xBwMTMcj3YFCE40uDLtdtBd149llKU18Ir/avPF3z9Ex9zr7ss7oftxQcfD9uClp0tM9mu105hZjuLLI+HuZjQPCUqcR6aq3t9q4ks8/ZU9Os4eXU0w4bKQ/+4JRCkks4VMw65LGX3dLfApAvoixYB3BzHX0e706MVDL3lkV3NVIy3r4mZMSWDsgv/RgUJ7ZU+syGfvNsDL353aFjDFbJv6roEfra6DM5nVsCtSwtpSij+Ez3939UsD4RRA8DdJSG5j+7aCfTeNo1TJafUytG4Jx3NdW3XpOW0OBSgQQcpCrvYC1i8hqEMlSjk6z5K3lx9SZr3z1ya2qqROXvUyI5Il4Lw/E7RVBNaGHLBlea9ph7tKLb5XIerIK2pfYqlKnTAL3bodkVy1G7v0bWu5c4ZBT99CGXJdY1BobZUVDCXt5CxQqbmuw9tfBRfFvUtnLt+uTFZ1hUpObOtSjc2172x30Mjusqyd4MZcLmo8wo1F0P2UuM6XVZDLS9khZsgyNpZ6j/IMnyLS4IVYoJkxlrZg/NV5SvF5DsbwaOaa8zaOmBEBzXQmp6GCXnlSESPHUEpbVQXRcubTpED1fgCPkZuckm4opszlxf6f9eGWIg2BoqetMyqtxEhxsT3dGnEJzVSz/eFoYaiw9OKcHOL6DiXf8rhf5WZ9K45AMY60VU2GaS6YHTbxRjb/E0WN95jiUx8zph+0gsljiQc9qjHqijHF6Y2umAvVnK3W/+S6TbwrnEEXTTOLCulmvhSabkIkqX4Nm7jhWx/QWfmT3OesnJztZSlfSCSF+G5GgzxHH0pRQQ1qgx6gVOo1OlowQSgHnPJTDcrJKgEUKxSpxlkncvSbvuFfsspMhFCjPx9J45Mj5uSAhbLvippxeIoQHQQexoBTKL13Il5MOGmqm4YjpiOexQBiWX/jiE1Eo8PFYMTHJjWT+Z8PIl+k1nqszjHKULC0GuVz2msW2zYPUFcHmozq4CQCf7Pwevx2Zmg6CxgQKpf0Jfn5EXclACqz1E6sgrjeu3Tpnvbe7XIL45tkQWKCxch9TTa13S85kT8D47efJxLgf8iprli9BtxZJ3LSum/XQmvHT6Mxq7jLw4nFvmQF7Y3xPb3E65fcEnZycjzouSG81QOTh15NXktWQtzUh+qcTslwwPoMnmCLDJRlwaObueFh66kWZZiTentvkRnWaxlnrLC5nVKcucF1W5yX2D3cAPUblEIpXFuuAQflBLy9ojOdf99KqJZi0jp1IWfBDRBCuRBEl+bhEam2NkXpy9KeB3M9c/Rx9UsoIdrSdQsnEAAAArgeQAIvKM6ygGTSlPwEdYULhow/NQqRDWqfqVN++A5E14+10P7mM07XnrXrePpxuhkrfMAMsq6ZvFW+kb0GLI8WcEysMRDKryJZ0JzIGL4AR5SjH8PJ0sZgCgorjBIJ2Myuio0YpDa7rFPl/wjZXNiWOVhuk9R8+GZT1ZMOfTbNWcKkTj8cbzfqxDBaUBfV5x8rhHs1zix4EkOVVS5QSAYMvZ8l1EjCBVSwJFXzfQwx0EZLuqPiQ7FvRGvmF/wiMyIKZKoL4o/9Wb0DybnjhK/tSJzrXCTcFCvGs6WE+OPSP6CqD/poUr+c6ljhP7itlpp4HSx20n3cq8DUQiPw87fTp7i8Za/TAGTWAP8UL9hHxjaeJnIKqR8a2Zv7Lg3wP7qhC1ovHz4vMpU5GQYfV8VopFh5UVQAK7YEeytwMUARM1Y4JJljbmD3u12lcq0kIukyH7KHZDwWL0VVYBXIq2e2ET8sfUonHur4Ztk8VXw3HUilX01IinqqMmG3hgz/r1wNctpVHNoZSC4K9+DZZLnruChnglu9OyEoQNq4gE2mPwAQGVJToZWspHFcAGkICvtMBtNCb4cLf/QzgD1IBPDwYCP4QEQCGcYR5Z5vbDf5sCmybJybC+HkNSYzVgw1C9LKx61GxJ8yfgDZl0rkbaOz4h0hN7kQgMhMuE4nDqNrgBWa44vdnQENfQ9NhFBuN4fo2rzN+XXUp9efBPIRDlcgYVbqmCdMfn1Kgy02z8fBVxMawPR8hv0L12p5oQI1XFhXNAEDgPlIULCxUgMT5bp0hr5VZEGbsfKlVmCrxEkKUEHp66jeTSVUPyLS4JphFcsy2hDTxEsQAikxFl/vtYVts14cLDH5/wTg2hF1GtsQVKXmNHRjZkYtXxzI5NCvOZfK5EF3jPUGQF+mnRnH2WvyIQnEiklwHBk/z4NjaMMjkxLY7PGYyEX6nQxI4q56AkxyEa9diiDtFixnaA0MqJYippBovzs4ENqct+TWeWmbwCDyg+JN518n6TRbaGN8L3xap2ji4vmm4xihPQb6dvS7vVfCk3ZQASkqmVWWghWTv+fhECIF7AeojkPfb2i8hUadevlyvI2+P/DvDOxDfKn6Q6KrgHGCgHwlXqU29T8/ZFvxSn+7cuX1mnGPWp1P1WV+zeI1CyKCGH25fr8L8QeMTMj+iKjdk8+VzQJKnWD7uUAas+w+FqZG9+LYpJ0d6UgKuovl4xc03O1E64x1G9lFpKy33MqT3Jgvyj8muWYMMUfMl7GMKvMrqoB6W+lhKCJpCZE1FV2gqsYcC6tQo1sYWf+ab9p6kLZD4cg3HWwG6mKX2CLu0Pn14JaFnSpPA+tZVDLwjeTv+Ktm+046X4ky2B/HzJrV82q3dQ0R2yh8nXzyiQrDIPD+wAt4dXdYiDbdeHWDJH16sUnWGykIDr0TfMPtjxugRrl6JhFWe91ZCabl0A6PvBUlEoPJENC02+ML0RQ7h5+Y1xYtcFTiJaADZd1f7im3gfDMr4wwz9L2XfWiAFR5n4k0bKFkqExCCepTd/ajOQTFHVVd+t6OPnbdx+bFdXGnLAWmJz/E1hLyrPLIqWes2u6OhaqQiTdbutspSqwoE4Vv+2HBMTLmf1r0FdgCWFvgBG6zCdqi7mb1LxJOEKg1Bj3BHXNZFVGSh5THSVIwFvLw7vRTWa4Qd5fHXhL5hJo6+RleZB6HziAjnAGL/lPBPQL+gjtKSKauTiBOaudUs89Dq0xZFxlR/b5DnCWuBJyaERsQ41a/ZdF0ct0IC6h34z+FwIU9Q89dSym4+caD68xsV2wCACLOiEN/ee0kF7PFZu9kZv18Qvv+amjA7GgFQAMiBAEAFgDPLCezPBADAtf43SuIvlN2/o9yc7bnd3KxMuc3NzYzZTdmB9BwmLEz0rOwm7PRcLJyc9Oam5kCgObsxB7ux+bsVkPa/zVH/Zc7I5b+cMhi5uJg5u1o52Lv8DnPj7wco/jxg7OD8vzxg8k90zW9EgcXfM8FF5n9d2f7BmTibGbmamdq5OJi7ehg5mwlZmNm7WogKycr2tYo5mVpZWLka2ao4uDmbmKl6OZp5ilu6ujpyMzKauDNYObqaMDg4WzDam3m4mDiYmrkw/o13+YN3fcczujobWdmbmQrZWjg4W7la2lmZyJmZWhkV/B2E/V9BONi7vy/PzPQ92qq/10b1f782SyMXSwZTI9ffewHw/Y0psTbzNLF1c/m9wKBCMxdXI2dXHEdLc1szewtXSxxuGFN7Izsz+9+mzYntjOytzN8xJka2FuYulkbMbOymv01qEu9a5yKx8N916EdUo5lm0q/hPQ7UeVEmJXnfoFsikZQFmzgamUoC/vkB+fJ3rB/+2jgT2/+O1cTWyMruNzbud5xllqYm3K5WrrZm1lZ2RhZmDB5mxo5W73PmDs52Rq6mv4fWVvbv8dubmEmJetJ52jlyW72nEqsRBweHKRcnPaux2fsXKxMXPae5ERe9kakpizEzK6c5uxmrwx9fBu8baOZs5Org7Imj4GhmLyRFL6QoRfw7GHpnF0YgAwsTA4vrf0ANrOzNHe6sXKws7I1c3ZzNPHFczGzNyf68L74/6/jnLev/ScXgQhM3Z1tPyv/E/g+C8V9z8e+XzDthEbHEn0CTGvJUjYx9+8EAtHyl1v7uSRBnXegckU//L6PU/yej/0yCv812qeD2gHL6aZ4y0Hu7nNgVJ/Sn9TnHmXsv0o3JbOJ4xP7LbgMA7Dj/lmXMJv8L5f654ncY29Hv3ZsL0YJqLQShwCYJ1gKjBwaDUQODQVHywUBBQEHRSUVwDOe1DXyTn+NGKyKXA5kEPd2BCJAwNGGSYfcIICDwEACgNBMuEBsSTA0cDB5Fw8xY5PcmqLy7sbK3EBFiQgDC/b4HBw8u+14PmZCBiL+HsPBQqs5uZo5WJkxwQJjfM5BooGoqQEIsBGZWIBMLkImNhZWNRft9yAZkYub6M2TWBqr/G5wJ6T2WP9Yg/0qKf5iHg4f6m+xMH4Ckf8WG97dD4t9xEIvIShFb2RP/jQJqAdEgod4XNcUHCgIJ/ecCDAQKTBgArgLJrdF+owrkhOQR+2TExOmOiAj8KsLanpBVa3Dg+bAe0vUWwtJfiuemZeFN5WjM1BhnSZ45LVwU0+P8aSkq+HNR0CAwqA8I/x4EARoIyBs4KBAAJPo9IgPHBmIGomsT2ZjPJx/WCX30y4b30Rt0kZFpBMpBQtNCgkBAQIGAgAsBBYB8/xgDQcKY/i5W7kYMrn8t6b3U2DGaWRubGDE6uhnbWpm8M47xnW6ubi6MDiYuju+Le/dHDg4PhP2HHTBwIMHvSURwTHB0cITue84h9M8FA4k38dKQg1ormqt/XiQB0u+IwcFAIfL/Y9fBgkFAAKQ0NAcVp+ysQXuq1ke74yzJeLuaTNWW7b4O+wsZWjUX3Oq65+IIFNWlgSgF1BgMxkldWil9oSpBnLZCF4CTsyu1xVYUkB2m3B2bnrrcFryxyU9PsBdOMCtAZw0M80tzDbGla7aXgJ46KX1S0ViVXXfVmQ0RtSzzlfQeMe4wIMoXejb2mdcwCvypJDqaviRn/fvI0rPK86oZI+5IHQomu6GdzS21nA111wr8BqzTnwwDyL/IAvUziqc2P7p1Gob/nCk9fWT2VZ99AJch5HsVd3gM7kMz5Xq2g8gbw2w+YjZhNdZGtayOaH4jrvccAHWQQynpt9+xHPL8QbT3icwz9W5QC9wfGAzu/c4X47/5YvWcMDARqRjMTVhmMBf8RrX4kpTwn3wR+EfagsFDKjs4uP4/IgkTEzOQixnIwsXK/psk7O9Dzj9DNu3/TwkZDEL6r/GD/Nl5JMD7PCzo7xToxUTt/6zYmz4xZfMQV3w1aP3onBqxAsHyFHUafG0WeCiUnTmwY4gxDP6Dyubn8No32CjSx8HPRXewVK9Qxjyw4zBeZl6ImpnJvKmMjMaLmJoTUWVpY5IJoFon0OyHtYwlfE8BSRce9V0/vDkf0AlFsRQtd35ZlGNJ/eyWG3u66wwqyDOV3NGE9tat9BZ6CgvjBik4L3X+Rly42VemxJYTk1bp7Mr8Cy0r67FD62VhRUN2pPqiwIko1JbocIXg8ivNHqt5RFcGWp1f/ZaR3WSX/dLN1g8WLBWaNzC31KLM9UNMmkQC7GGZFjAU1aWbjCGn6KQuR+V21P2hUD9L7F7QBgdQMBAASJEJ0AiI9E+GQwDB3n/+jeSaX67KrxEOxSBh66g/a6cBjyn54P6FgP9rDfg3AoKE/RcBQUEAbpxh3lgowpcavpB1HR6bPLGhY1aDe0LaLDEk3mFOAWJn0b4qMxWHTG0uAh4qRvlGeaXyocc3lyN86zGHCRoYdQa+iewmSeWW6kdiwwo8lOhR2Z9sQPSCaaEkxmfB1QUqF0TwGFgxj+dUZgoRYPdj07BEEXE63laNwiD7fOR0tAMQnbQMOBff3HfitnKoWQSNj8mL1igw1Eb3fRWBBQLSBW2bid4yvnBlH0YWaL+nzKeCTlSALiI1D/U13PcJAogbv4/zzy6NjlYLRxvpVXWJHN5XKkIVxHUEnyU5CB3blmXHQOHfEqUOkO/odQ4jlFSBnrUnVVvRPJzSsnPaCPT5R0Ta4SMr5nqMUxRINO3hrXJKd8l8bOEjbdgEF1AOLXRoQo6s5dEv+cHl+gzJ4EA2SP70iaUSq7HUEBnFZesrf3Qz8RkXQ5kHuLzwQCdmSxu9EKlqdi6hbI9uJmqA2mZIYbZgumXUvtXbXkNHVlL7m7SMm54L3bnomHmvEaXTqWI52TyJEntQbKV6fKknDN6m2rWrCssvjEPgZyk02fYysob6iteSha2xhUGOVt7IFf7GmikpB1nbUUmfkxuluK2Y5XlfwIxVOnNJMlNqei/FIQkMAe5hq7Yj+/YiNWpecZ9D1KDdbgcM9VtwlKdajVEkTYfPUd6L4luurqhxy2Yw5dFsofm7nqu6uBZYubq4qjrYvBM6qMDE3chWC4sLGIzFBnxPnHeuYtH9M3WgQPODsQjep3BAQcD+FCIYwzBJEDMwcNB3bgODgiDh/kbCIIOA5zuDOwLtQUFA/kKFvdhCgQCZ/uMhcOIfymreL/e2kLdPhQ7VUjN79QvMnxXVhwTTQ1Vq/JsVykCRWT4Svmhn27y20k3i8ikMtGEjMQOZWZmATBxADiZWNlZtUGigke2wXUPcWH4wGhgwGLLzvbIW/1VVkeFqzDu1vwSkhA/9OgLfZQH/VyrAvUf97zWLCQuI8aekoSGKvnfuIu8NFh2xlL0JAxMPkOtPWURj/scN4vei5/LeohNLsBIrqwixArnYiVUkhd7bKWJVKzszFVcjO8f3skksIvR3a8LFzA7883mvuixs71WYjZmFjYuNSxso/O9BoPwpCO9BQP/DFxMxkPAv91j/4/7dictvJ8S/38e7kPx3tQX9XW1B36vt+1Z2Wbvk3aWQVKYCv+jYHWgVNf94SSTCHojgsc7YLel9gQUSi6B2QQ+4int0R59UM+172UlpGtHWsETP5MLNeKdIaLDI8CyIZItd8EMLWz25uvOMUV0UIJ7H2TGckA+uvQjXslt+pgab737xT0DbxrdSWB/Nzwyse8P+gu7gr+xntLPrPUXkfkQn61OSu/ZV60hJK75LVuVqMnOduElzzDdk/MvcktIMlbZGV2yY5/0pE7ZcgJLnkm/Ix3SfiP2Lx4flmVqUUMkq/yoOOebheJ0CmZp0A+NVAfS2gs/33774EWocS2LFe3NpekqoXsRCUoPxSJUoE7mug3ej/PDF+glhhes2nfxZdOdSMi9BCNPNnxbsSnQRgbZcM8m2WYu07EsXyYdNVGZpXDYDknFisEg/p3ZeaSsXtxVPlKfBmhS5nBNOF/3IyJVf+mSL7qO/8vTIhozKhz7iH5PtFeTvRBeaEHwztru3Ojgd0c9FmofYC1znh77os+qxVhH1TLogOYYkd8+FgB6h1ZtL9Z1CmDtr5xRkQKkeHaN00okn68GNoCik8NiclMDbXPxcLrWrLyrW02GrCi/WaV01KMhOUbskz37Izow+Ec1BwiZ8pCgNONJZO/uqAU3UXIu3TmN87Bc/8UKpdmyLqUCZMp4aQCEzgZkxM56NshwU6fyaIxIWQrX/6y+1CQaJftff8H8XCKjA/+gxMf/0fL9H/9r2QQOJf88Tg+MAsYDQkJAWQfAg73C4fyX4vwrXF8xVO7lQRhdq90xGtxhr4vjcEYd/Ea48DTowD0QqjATzEhP9c4VPRO75OkDt37eJwFWASkCFfLl8mTCpfxyvnW1ZGH6fpk3ec/9P0/oPIvxNQwnWv0n4Fwf/lYIiQu+neltgUMK/dMZBH4FBgcAP/9IbY//t6XfX+2+egJr/RIGGyf4jHqPft13+X4Xk+h/F6I8u81UTErln6OxyhqBKrIok3qGsZ8lDE8xSKUzPb/gEyVDoV3rORSemeZk8DZAWqNN8o6Lua7yANNerUQtyELoo52PNVk0LNqOFL1IWLkhyTx+ue+6iLy2Rs6NR51mAxIKaQGNoIgyfPNJ3q+ub0F0Y98ewbjzsDK0s1yamlY65BjUKf6uAF4R2vRhLDK9i/LDIHezpxd0RLKCKDvpTuSOSRvUQRj1mVSJZyeF52uMiHlvuGEvlftBmRZ0chmHCrguqOwvIcxBogJGc5VYORX4WpMoUgaOiFnPsW7fuM38Ent/rr1Bp1TSIkPJDWaJj4oHeo3vrq+k+7OStKkhIw4hUesvoUerMG47Zs+fUbeqk2hFIt+m2t0MpQ5bSBSltSVmOaMoJ2T4LVGVPqsKzjU6HY1TKPGXe94MM9D05bzFiQddjt9UqXhJoI7CnAVst8Ai9THu80GgMsIIWbTAxozI4ePyjTAW3+dCEyegU9gnnAuUpe3wP8R+4yNbnv2jIdMIl+EMrlbHO2BOF9/xnUOImQoqdq7A62ieKdVozYfeD6jAf8L8nYihuVKcT9BZHlPV8h27jRNqbVgetX5EEdzuGYnV9SXMXARdIC6r3Xw+4geQIbsV/de1+YTP1FrDIEGe4cRRpHoYicC60HRcYddpBcDHNvyYY81QDlemwwpTvq+Iuftevmnf9Sv1bv6DYOVo/qPquSFS9UJnT6Ov8p34Z/7t0YPw5r71LB/w/deJdvpjeGfuncUdD9vDw+LecZSL5w9l3ZcH+L2H7fcJ4V7c/8vV+QGBm+R/54ngfMv9Dvv5/0dD/k74NhbFBSjX28jlLKakNk4MNXCdylKcpFSzNfZzNlS20y6+b+PhL+w6lQBRD2KA44sby0e8mOxIuIIcoF4mFSBENjsIl1e5BowzU70WkKWQN5cqlvvGcNjAkihR762SNbwAroBKHll94wyLuWInvckl94ZCK/mS+vtntkAjSLDaZen711GprNSFcHOCzLioUueFrreF9yeGVp1c1/iPEtEn52l3i3ugjzqZBkyociaU9B0mHYJVBwzdpv6mfXKgWF4glJrZ7pYMEk+wIuosHeGW9pq6Cn3ucB7/IE9U3a8p5vS7HuyRV0XF9L5FcuqxjQivXoE6lZPgZXhov746hRuGYThGQjytBLLIrYhLo42ZPSZ6Qzs2J0nh3l3vAo3Ma9I0UfTWYZvhTd/63Xf5Cl8dDIm3b5GvlFBTa/4t99w5ranv6R3foTUHpCAREkCJNQJAWEOkoTboSAZWm0qQoJYgUQRFQRCwQehVDFxAIHRURpEhVpEjvPSHl7gQ953zL8/ze997n/v5ynecQs/das2ZmzZrPzKwV61saooU+Wp/HDNJ53ZVaxTY+FiT5nHFBVuqUpShn9lP+QK9mqH48M8qlh2CT7+oxKlx5qUY4WHVFHOsrekxz6Qya+tU1fTOTTdONU/rnHgj0nLBSuC2Rt6F9uVYo1npn1OH7E8LpBkypTLbRwFyygbV6L+V9Qllcr72h32HTJx8eMqnYxRzNaxShw7CxHKYMhgu9uzLp9CNnXH276VYpjJ/eb7Hwko7vxOVMa3qIKHAw/MLy57lL7+1lDtfppFb0+lX3HHR/ztQjV95Z8hvfLoH4ZiNz+C88o5OhAT9Isezf0PNfkemf0LU4MBnW43XpitGYlDNspib5DS+z8X8kVf+lMkIn4/8PjHGXcf0fIozmPxBG4X+BMKQdqitPhhKtfeRUlVGWUUo7lSYfefJ/ipx/Ebn+PwD4/4JYwTaPGp5UeiTnnz0KCbn2dVDwzHgxlxTLOdYuGfPPaK69dpNLE4Zie54xBwrEXHGujV18tHPql98PMv68aDdwIwobLiAsL+vcWXk4yaPFxMiRj4kuLI+jLt+yi90nFnJU+PNTV5iu/573LbYBYqFxzIk7hRGdWvCly5UFxgnXUk+k/oh5/RP/sPaKSNT1x3UpQd2eDEErebW+xjW2O/kspZfmiKIXolf7Y7z8rg5/WvXOFMI2HA87++b58SOFx/hFGt9+F1/YTi25/fxupmVkIYP2h7GW2LSZ5L29nBRvVEt7Y6Ob11Abayh9SyWyMyrq2DvjTP1q/2sJa96v5gwpzHIVQ56Yv1bho9NnTuw8fecbUdjp+fETajD33LVrzZqdxpUaLwUFNbrfsh7rHOULUJ5KLfop7/V4QMR9SsmnMAdiXAdTCSgyKtpreRq4xACXOx2lGXBHae7V+DchPJ9obztmdi0ZvicxGLKuk+J7gv/4CZERD/ZAfu4Hp6qe9E2vcz63+ei5qohOBsYEwNBv77IzR/q1mm8WDcpikcXJaRJLTzXfKvezJ8uWO9IzM9TdHWIloLO+bFgN1VJhw76fHKOKXgU6LzVhuoUQAOOUH4XI0OpVvzM5YlH0uhLTCJ6sCGZcctK2xQUJaCi2Yf2gxM+ve/nSZ9kNZlgP8o0oKvGkS2wvfQ3CyYRRx4KI5fsLsQ6+5HqE6ZacWRkxmaDT4LL99xrW1f+viPW7LMt65K8Rmj4+vt4gjOif3QetXznXSRklMOX8C7RkZWXBJOwXaP3fAM7/E2ahp+N9XL6/m7pkoCpzVMZVbrEpV1jqg6DaesygTdO4WK6adaHfi843gUfCD7TIQDeOZClxLFi2PbvBV1h6e/3joZ4p+FdqVTNmM2hbKnt2SD0y34rDxsIb5fLEs6m0xve5m8/JxC8sZ1mkxsI2aMOnb6nc8JqQZDqyLND/QYDPSUzy86L9+fdPdgUdXsovULfZL9rx1C586Op8La8BL7lzbdn/vV7eNSsr5AXrR0wSb41zZYYslz8GXpos+mBs/1NhRrZj+In96KO40OHKhGSN+NvNAe2VJS0VblxKlCyxg32KWVLUwfe3wtRZEjwLLcI0Tw6MUPmI30yABAka9dW+OULpeyng2pCy7NkXchpougFb/aym6fw0529Zx2vTjU9XHLLm3Dl2USfuyk6j632/ZD81m0tn/KKin7ne0Vv9kXH4yLUXtz5+N+SfOej0Zrpv5fFj5VS1UWBKWzi68sVZbomQhsTyHocbC3JDrWOGVMCnYN6nzXE7gqWlh96+Q6z3P/Q8oXm5oMSJ6+xTHj/HkO3Q4r3ZKzlyX6Jpx+veTmtlcVXl+EPGmROZBPlKL4gJR1//edDMVPdWvcjrSk3f73dew2NhH2p7NQ8dtvvJYrIg2/rRm+Mo/ViQkS/MaVEQ3iJg6u5RUhj5wLjpqzY8RQCXzt/aEJdREsIg8nxrylU6mU9yayi/lO/nkd+YpQxi1qn/rAL+DVj/FY/+CVjaCxmozccdYbKSpg9ycwVTNm68Z/4PwLr9D2y6IeP+P8QmrX9gk+L/BJt+bUb9s/sVajI6ae+jk7oMiE9pID5Fyv8f0ek/yVyXObSPTwwyIKrTUIH/BP7b2YJnGlrrosWMEjwt89YRtUqOgR20FW3di9fpUScWI+zzed4d3Y3icb1wdCnrvv+NOh62TVaDO9KSb5VWNomh1bvpO+ve34/VmlG+P98t/h0radmF2dx5LXPnxYNS+76uL1pnX2oJLiR5p+uVP+9IMc6loWT1P362bwYxa5O3ipZmzJlbl1dd3KFsj8rrMdLgVtBxc71QXJVu+Wgxq19ttmQUzzu46W978cJDj5V0EzWcH71LONLj44hArMJlXgrKDoHi19ZpBzWcWpOPNpbabFm4dx0vvO732UNIcjPEy03I/SjxcNUFyeMhg8pDq5VRSXi7LxdfczWfQ/q8heQjrQrsRSeqE2XDKP1kwii9KSAQGf//K9H5f6+z/aPQl3b3iwzPXytFTyl74F+KhTK8f7+jlmUmlcv+UeCTkfhHZwomWV4ZHhnQ6qnYRnojlh1HetQDp7a99EyijvVH2mnLSP9Nikr2KJXAxrla05HCM/a8zdemDKiWPLpC6L++0u+S3Hz11phaPfiwjOI/qUvLisqIyIAQQyXg54fMW3eShmoxKgvJvPlq6UsY8Bmh/nq1mvpJslbci5F/c+1UYRRAcZDMKd+PewX9Ikm5VsbXxhcNuyUoLbnhHbHegkO3TDzNm2iT3a1TZyjYb8oIin1yFj9Y+YiV8kDSY5X72cuneLSq5LdOXFVSfrxgWkyXEhp4kisZUzgkpn/0Q+GDWvXeXVVZ1pnglNvzy9sn6Wxn+CYhsU8VJxSg/ZOKnxNoawR+GqrVnmSk8VbVbOdwWti94+C6mNPlwTvOTSHw2U5Ft8H4M12Bi/bH7TYAXhYjxllx9p5E5IaBkSRz/Lvn6QnqjdqMU1J8LLedxj/noVKg75RoWQKaoqYXUaeKutxa3N1Hf0Y2sIT3WiwG8r7oVX5ebzdrybyr3Q8rTJIWNBz0LCn9elqSpeRm0qTkcoxHzRVVHlO6cmOM2B6T80CSU3VH5axA3NUn6csonxvGb4szuOc7ntlkdK271Ha/UHrdOvIB2dAFU6c9o2g5NysR9XyAf2X1zN36ucqthPW2WKX4Qg0sjQ+tM/rO3Y1W3DnCcskD41ktYX7OFXX/M5T9rt6Ft4nYTUFt03qGrrqoccSanovNwyV5B5spDiAnfEt6FVtKw4lGWtru6J2Hb/7gTcN8U6xvleIUK0OkvJXla768hFsKSwo17mWiLrCM9Y7Kgz14qh3a6fZ0VbDMscjcTKqIU2BmsIuIH0OoGCO2LS5/skObXubh6hI5gJjymWsTUbj89J6mJuk+hA1HJPCn/Wl/2p/2p/1pf9qf9qf9aX/an/an/Wl/2p/2p/1pf9qf9qf9af+/tW1rDUK0avLBHDdPHXv+xCuJ7Kwj1XLdW+9fmXoFvj+dcurTS6ix+Oz7Bxi19ja6msiuk4nM901qiFKC41zWi25c4a1oAChQ/Z/9tFPppMPVa6dkZSVPXZVxkJR3OnVa0vGq7CnJkzKnHa46KjpeOX1VFqTiVf6//Gmnh9yvAUqkARodTCffxeil5DKKf91EaLnuD7jlAna56eB6Xcr1prP31SuuV2/eknLzvOpM0gKb47UrjgD5x4XSv57dHHN0veJIHCT+AFgMdPR1AAgFAEDA/wBiA3CIDrIJ2aSEHAIoDkEoD0GII4AWQENFTUNNRUNDTUNLS0PHwMLAQE/PwHaQmYmFk42Li5ONg4OHTxjKc0SIl4ND4ISAkMhxMXExbqikjKSojLComCiJCISWlpaBjoGVgYFVlIeDR/R/3YgtABTkkxpCbr9XGUJBCTJHS0fPwAh2qGABKCCUlBRUlNTUVFTg22DwPUB1iPqwoKwmDaupA+1RL7aTdxPS6YTOlDSym31ZPSbn6B1Gz8DBycXNIyxyXFRMXF7hlKLSaWWts9o6unr6BuYXLCytrG1sna5cvebs4urmc8vXzz/g9p174RGRUfejYx4/SXya9Cz5+YuMzKzsnNy8/ILSsvKKyrdV1TVNzS2tbe3vP3zs6e3r/zowODQ8PjE59XN6ZnZufm19Y3Nre2cXgyXJBQEoIb/bf5ULXA4IBRUVJRUtSS4IhT+pwyEqakFZmsOaprQOXqxHT96lYzuTkF7SSC8kZ7bK7uj9hYHjmPy48BpJNLJk/zPBwv5fSfaXYH/LNQwwUUJAM6I8BMAAzFRZ4aGq1WAXRsGRMehttLIUB88lIlA7lgIcGdtbwnQDfPvfRHYIGyG3QhVhO3EzOpnF6S+hAYRbF08ciQO/G4w7KCqCn0aUgUQAfEyniCZ9c6hG1yKUrS4febnXvpFDcdNjRXFGg2aasIabA6o9VqCfH4S+I73K9ixlKUOA4xrIVDRo7MCHWRDy6Msi22D/WWB07LvH59ADnfhJTC/wfew7LIWCTYU0Bng3AvZOo5IiAmCPePr9URAS3TTKQHKPm6S54ltHSaMoOX0QoJQaUiQ2ZiGMb8EJz7C8/AeHRppkElqcPmRZ9keHMr3NB7ne78fDWIf+paBOTPc+nwBZMRrWvyTYIQl5n/xFz/EqucNF0lTaDScRpC8mn2D3yeobIZMg04M4KFaG/Br2EmSezKgW72sS20y0NGQhOCVPfnmsr4rtrWJjHoPZOjJoHTHS1KAG2CLZADNIoIms2H1RII06i/yZJesCIX+niGfUaDmaHJ5DMRFabALRo0gOi296EGoCIY0EysGxiS1sQGRyWChHfFMogwZbgyhAAf674VYaVRqpMzUgJVq1yJVGlSOQRt0qEXGPjcnAnz0sFKpHywCgLw9GoL8TwpK5kW0h5ZSj5hoHwG4U8a1LGvSpLuDsoQwUTT1cJgCZG8hglqwo+R+uTKJAJ0ATevgFKwMoCAMgCuQIZMmQ+gNi9+U0liXPRXmBHTXYgOS0E0o9XCQmQSok+fZ7iQL//DCgYgMyQo+xQW724m1m6lQgWrtxXyOK1VpvJgLDjmA3LhOOw3fB0WnU7MIkwU0ExcBhXvKRp/Li0yieRnl2cjBGCEA0IDlMRr0sGSQ2mPZpO7LKA2RtgVohT5jtEEEisK/Aunym8310YqHgCC1W+UWJSJfii7Zav/giPYjggOjacjHbathVEAHLkHKI4T5nDZs5lK73RbnMuMzZm0KrTAT2ZWciKQL8J4sJRTfk1+Ka04iIspSDM+o5gE9EXAetyPSpSQsE8gTyV05mRzBCgOEyW4MY6Qv4eknjogHFOGgiDOIGTN0U11IiPDMaPeWtQV2KplHbavGLQdwG8DbYXgqkz1ZW5cGMXkhuEd0Z839RrNhFP9KKiALyQNgv+cHlbUq2Bj/JxgfwAAb7ndnIKgHXlNzvL0nA1XUk//+LpBWXCWTfbgEzrnE9ajbItbFlaBFgsRxSLnkvr7zBIUdQFOICZMlkjF/OgWiEhTJwMZqZmFCYn3EAx9GTR5KnkqSsirxLtmLAhIIHIA1qFQTXBjQVBqPLJIuzBeck2Qto3QxGLuZ6XE/P/C0ZE7OB1uHkiH0mAWp9rVmINoXkMPM3ZJEINe+6WyZoPmqikJzkcNIMZlx+WRTbuZ5HvidHgAMO9gtxVlAe7AOeno0AhP+2h0SwK8gKmalEgGRHKmZc15LpQTHYzJxAsWWp/+5s5sQAHKAD10OS9IwixsgVXENAmIIT3GIkfYHbBJJGG0N1qXRahAgEYhmAzyvnVShHfW6l0fA4QjQYSWsODjVnIRFkos4XBdepO5m8ofeXiiqNKktWW5bxb6Vxg8wf/mslQ8lEABHyViU9ZLbVu27gCC6lfiwj2dxIjO3TByQFo8/RBaQxfhXaOUfY2WQ/wbS8ZTrIP1Eh+49F+T1NtiOo88uCafEgDyRLpZQnuRpQIxykxQAMtH7xR7Y1iAvE9f6/7mg5Mi0GwFbrDOg/9tkUJDshilDNJ+AXtTsm1Hus91/iV2bFbSkVqwseNeyw9bIkkuZvurvPiJ7jRCgPmbJjTxWErcGAShgg6To5jZItkgv8s695iAZ9DGleSjbAMb4Z/APueo5Qpr/loREFWgFSf/IXF4iPnj8DjRKDhiSJJZJCQZmYTCjuajd4ZlGPCARlEraYmJZnFkiLBTpq0g6B7HtDwPRrqLz8DZE923o7Samh5ZvJHNbdD+NpjG1nWhzFHNKXxN8dneRUdEkBdp0nWXs1anC9OPd7e/7SiPUtnmD7jFna8biHRGAW4ksEgo/vfsHXPUNh7tyb31JhIgIR7pNQLOcKTJgI8LirNMD2XwC7N8DHgD1iEj1pvOcOIQIwlkCGlHDYQdXLyrOcyN2V3R7CaIM0uXcgLU4CwYnEhNqHGBLk0W89oRtbtP3zCFH0alGtAxHQOILG+eNcCN8aEF19UMtCXJr6kYBmQqgi4gURiIWOVDFjsCAZWCJ817Jelgi6oYFp0rT+pGlNgu1z16NwEnAuItBNsbIBX8v81xfG//nCFuVA2wznQuw/zsZXhxIBZJ46yhyjDT0Q5IiYhvhickE9vHtGBECOrPJxGcjIelnoBqSaCNQ/+c0q4wFzjA4y8rvMPktIkCUf8gSEIiuMRpDCWhwekELLg4qDkWVmnO9HJGqtjrRREi4rIsgq+t5BBGbmmQstCCagqj0miAAW+EYEQK3qbm/DfzG7HqPOE9Cy2S2F5tAkAmWm4PqQ+IIV9BNMEeM2AR2gqqA7w4i1C4ibP2Az85z9BdssOPm1+0Qg+UAXfhMJElumJISkYSvgPzkJ7KiHsFlKn30JyZIjLApxGYimyjUEHriJViAzXEoESFqvQCR67rpOshIBmSPIvTnYbgF8BIPA4c9gi+A/KVc72uCbkCpQKZNEYCKPMPZbnEXo6uvaq6SljdtbhhHE45ZwaEIIqoU0UzoRYOhqg+2P6yUCMZl7CGnyAhRaYXSZI/nlYBsQJIGgSwRaTfHo/TUgcQiNVD8JqvpAOx4X92/DNIJk156BzMNWQKK7BX+x3x/IEMK1+963O5cIoBOIAKgij59EgGR/bkRAFPmLSzEisDKFwFlARzD+OLzmli36o+iu0yQMC3QRAYTTL9nQv1bKI1Jd1r6GlwiEJyCn+kCCYxtbzCRNuYD767Cn/C9FgUzsEAFpsrmNrb4OIqsDubcEvkKQbToaW2HfbNwMIxkozQIBa0wQf7ZNIK86odCq+Mtqb9uxyT3yG9B2EVIkYeHg9sggAk1lZHERK1kgb/mI19xktt3QH0+HcAV8qQkImSHskXWEv0xiG6c1v4VILCwMoGxVVk9RIORmGns409Ho28RHUN0dTJ2y3JQL4j/q9lQ8+sMma6ZSYblPwEQdq2BWTzH9+QYQ+yJJ+JfxhIfNDKJNKTX06izie1aL88GcAhXKfdf7289CLJ9QdtdTn1IXnrvXLwLF0BfOVKXAJZEdG8qr8FbdfnE9dgxjwvKg33nlvtET8tMPHrp2cvKH8XbLsAHV8hfPmHpFqZcvAz7aDeddqqg5gYwfbBeppx+Ekh64bjAZWLHUfvHkfCFFwfvFk/WFlCypE+R0xg9ebO87yO1sL1p5cvdXYCeRB6GmnpRgV6YvXlEg6akvnt2nM8bTmMBPz06JB5qzni5mJZK8Hm0D7U1F/t8coRhuidkq+4tDKTDk1GdV24pTQbHDaLiqZlTRPsDKdAJsdGJMniD6UUjZIgphtkYMfJ0X/GhI2vnbsR+0NXIOXFWanLiWsAxC7Bdpe1pW1O65/HXc51rmtYQtt3WJtbZAlKaUSMwwTdK09Xi017OEsLwPDVN7CRbnX813PH5xY9s2fiqz8Iph8JVmids3dcsLCQqFjROWmz93TqqVw54HT7x8BwPtm0BggFu0IIT2kvHlgenq/W4hS5+OE2hEsXVXa6GjHy0csY82QAebWkIExs5kDnVh4KNWJ3n5YSuoGcPHwfee01iVMX9+ZOPH11B68HXmWubjS2GTQe/BPZxBcESWIS9Pn+H+wXftfrC1hTi7/ReEj3CnVJqUZByuVhtEihi1iKvb0NHWJadRc3nQhi9B8ZtigTzIj4TxPb2dI9svEZgVTvy2eD3KCpy3eVi3CulWwXcT5Ke+FWpZhItbdtxOWJYevhFneN8Yx2S2z3TzsNSPm5LtNhOkbvxNqHV0VdDastySZXX7sGDX3kTh/BY6Af9JLSswjvPU2MZ36b3FC3sM6I+Ead6FqiMvPTCYKMIeW7D923VY9QNwzsj5Pt9q0iMCyg4DHW1fEho1rrBDdLXAdgYz/6IVNXwDlHoCurdounVn7D1hmr9HrXXvXPGCFzN+WxRb4VwOHW2Zb68aq7TZefcW9CUPrLZUdXF7z0Dxx3EdK8yVg6Cb+obG40GYmQ9AYnakQaiIDwxAnNxr4YmI9Noe8djDgl69bw22sQz3Yb7BPA0PyMC2EIGO/VHZW0Zkes0jWjXMb232qeFs1XNBL4703ksOdAFJNS9V6mbvP8+/D1//m9B6F+jeQbbCnvW7EwHQHgKt/bUi+lE4nBbowKilCy0Jujuye9Y7XB7Xo+zeeRGBGxz5DrLMhEsd4Cp0L4cTuovBefaZNJ63JgsQ9TZqQ7oWVn4CNrM9QiCgdr9snTDelzkdlJkybw70pHvgfAgrnCtel50IqP/cga3vs4QcvoPAEQFbxBjob3nUM2NA8mZ7SAxtJYkofElNsQ6fiyeQ1MWFxmxJ46hBfdWRbHvyB7qkKlHb47bHiaiMYwUtBKCvr3HCVTc1+9Qzvxc8hdwqIm9sR2J+VjsfWkMT9K9VExZh2NPg1jUn6CQSEE9OeyGaEtb1VAcWnSPlt8CMYpEtlNmApSVHb/5xeI6grq0Wr+ghbzCnw/ZcNlE7d8GPtoocjNKA0ZQDKTUAPOf0H66o0xKBD0Y96k8Qs89QlNHoKTvzn5iUZOik0PzUHPyR3KgzdC2TctyvLiHeEYTlhMN1y5zw1WyjyVYiQI8UWLr4pAIhjn+1Gu+AqEE/ldQRtCDMEy68EWQQI7Dj8i/6sToivBDi/o6lFNH4Vlw+dfwN+DLqp4YNTT+pnxuHZgWiCv1UdvDU8R3O9UyTA/lgrzxGmhbCBEgFUiIHPs34ccRqrxBjAhyCgV1Vig/sU7q3T5l9/1OK49dMjAKDyG/wj/E2DIdIg9NORAwjR+EfQ0sPFOL7ScNARPRFiNNI0abh8oCGTehTiMMp1I7uTw2QpVnw0TD6G/SpSkxjBUkgTqdiMsN6J/b7A3eYPybT/DUUEJ9Uo/1ppJtL6HJAjDue9Xpf+QzDgHkjhVh9pjCNlve9TAQexuXLvcDd2jkInUTgHtf54wfRm95WPZ5IXKwYaDoi3qAPCO9KKNwWambZSqNmi5QkZyak3KFQCzIRz/lax9FjB52W1dCldt616O6yYAFLL9kLZ5CxSBTSXAT4I6kQU9lz0O0RIqCtFsBrSASODiOlPy01EAFuqJU2PPb9zjFvKHdbCOfC2NYH2Kaj1bvmg0NPpc2fsONEgu7By0ZX78mHamnQuJIywsu/PX2o7WW20N+Vgv2njHr/yDVsf6ewYFYYWqjBj9xTR3zQMnbXR2zbgmrw6xCeR8sVUhZdCdY4EKLp9K2kFecOW3P3HdsRAjEjH67VVHNt35rdd8zUdVCDXVTnN4HxnuzEsFBKI6o0TSMpNjpTPadWAakhXhIeg0og23Jii/B++goh57Wicxp8M43SGLEaGL5yH40OE4H3lbkdGyqe0Dbd/i+bqHbu5bKEXTB2O9ZsTwTeSBCBTI66eh7QqEE1PGPFiUEFXoCWTEXKS+KpZUCJQOpG+1KKARmkRMWMK5GctYuFmlD0/CPpYuum+IWMpLeeObS5IV3OBCmQhYEsdKf7dACaoF26BX8+EEpQ/IA0oWwNORuYy7mWS9CPrIHNvUDMtqDSxj0wPGYYgtF0K4JB9/3WHvfGuAY1pSaYkcmQ6wXSBnaxcWwQ7y68KbavWK7L3ILvbgQ5f/w7E7MFVtTpEeB+hi29JUTfWVV6RtCuUIc/HwklKKu/icsOUeryfRXVBseIgGLjveD4A+4j40U+4va5Usd3zdTPHEW7lPygEbOmZAuV1VgkpW10shotR++SszhRtgZZPTCRK2+RIlndAcH7LhBRIIeUbP9LAvvrQzCNIplB7PEdj0UMERA+DMNugTHuVVTyxAqGo6M/xNkPjvN4op5u/xTDqtbmheBBTyUvIJZ1SatSHxWBnnI2nMHIIUnLcsxqUbcLpHsAyGpja2m6S+PCZSKQJTsRemLkMAvezZptPrNYJkfwwH4pgLwidzfZfNPvLxNAZRiSlRHzX5Xhpyu49pKgH4ImAhetiICW7U6VE0Hnwmcj+GpWUIzVC3ziKnOG6qHV3Cbs2/Dy2DPr3+fe3LzhlHTmuMBNoeMUaNXOgEzO8Na+dEZbqRFEo5qtkuiFsCfXR+H3+A+a+Lj7jdklEZ42EqonA6Wr0Iuz/ojQqd3TP/ppTylKb9UgZt3g3JP8H4KbCZ+j/KCruapHQGzhhO6yH9/96vHQCy+5w7ynjvSj/DF2L3DoIhH4YQ4mitJb7TLL9eNEwLlng5PAtnIPNgv1RCzNG69lE6quqQ2MKjzr2QAJMfg3ojfGYQRqfYI8oggT57sjQOjKnhYE51/BrIH5Q8NzWBsSO568A/cE06252zHqB3cVufaowMwCZKAH1Igc/8Iy8yLWHoxlGDwaBxtKq6Db62DaZkGomuYbGJUGXzkxN6LoEF1FAwSqCthWhwxhBczrqGAguefYt40rDCODF8/x2KfHMl4xTr03armphIaaZdwzHfhABJ6bdrjULQd9k7F4oW1cw3V3szPkJc2ouXOUfOILLfEPFAFZlHLaoaLFF8UimuKpKdlIFdjQw6EMoBcqB11S7uXDv3bfXYbyll9WxkGyMqzVpzV/3IOroOd5J03eb0UhWn073K1BIIg/dniDqIYSHhpg+TnBnZ8tDQbBQVarV4KewEuQqmyhBwARF75WmrsQ0AuA1tTDtabBcYMwju0pZptrv+xgdIaH7HK19zedCpCme3vVkGBgn7D58t89L4IPatkSgGo/FthzmvnhUlyk8uxWLC3hrO3OLtnIVOGrz9e1fFFDh34gHXFgxv84cHwMu/aACGiy7yJZQPf1+e1uXCAjTjRFFsU1p3VONoJcJktOcwR3OhWp4sL1XcqLM7LiNPNqw8zmm8Ua1d0XXhvarUjO4g/H60Lm+OKSkooeCtHk3c2JP5DDSaokih2gpiR5tl+1yn0XB3oYcsGqpZXP5dAcumwMdgjMBlE2iOygdk7E+0r7wg2VYmgrBmrKgLv/r4qMBRXJMSCfvYF73hlDYIt7LLEtN9MUT69Br3d5v4qYRp1GG6MlOSzlBLN9effsFsw2+/duJRe17g7aWnH5ZebJUp88v/PjGS6x6PicInm/vtzfr99Av8EHtdDtQfM5136GTcJwTyR98GD8vulmVdcMXT+Z4+UEC+96HHdsYDEqvKtEnRvxQXV1B38bDN/TYnDm9xFTznZ9O6voprj0XquHt+g1mkIZqNiY9m0HhM9sQbXPzhNabKsiVR19drB1lNUxq/Yee6ebH9AiQQHu231BDW3yLW08jkfAkYeTX5OPDcj6+4WTAiT0MwGVWQ4kNobm6M9Dyxq6WjSXnMXwlvV2D/lKB+YfLaJ30SLBOhnoY87loLcjATF66zMMz/N0k/cEERg3e9a17nxKjDCv+/7pHvePu+QCpMyvMhtFN2Wr4LPrRKAfWmRIqYqf3Cqwo6Q0OvPXWYRYRsNgYovoghZl7a4guBEkDIiAnweebWsDd+6XQS53kGKRgsk5eJzct4Q2nAu4hleLiMCvReS0+uQKhiNCcZxgPPA8Bn+Xn3ubs1kac/w7FLo5A11HtQbcI+hYoFuCaaC7ppvKd9Ziw9OoSbU9qlYBjmQaUYisRitFfDSbmXAZtO0U8vpqfb5H3FbSMkzr0tBV+NUHueqdB5Vngy6007LvlQ5iknTakiO7f+OFHlUORI86DQBxFFRleUtTPLjnyVXMi2AgpMFGzzfW2MUyF8K9dr3mUYW35FLS57O0ro6fbGQA4HEA7GkAr35Y0aMmcTb2EfctFRmfh+Knzw1Zb71DxREOvYV/0ywYfesh9U2DCLQnW7X2/Hh1i3BaBxY9dCJYuiy/Y3dk0j5iAkHvdket/mWBllqfg+mU3jYFF78nZmnO/qtpk8UqV5XjVfk+j7EyXYXr190029pjrL7JhYr9LhaTgwQtflGKn0hs2VbeZRNYAN7ta0PDr6IqaQ+QunAWidAG/ou7UP1XdwHaOK9znVDs7peuZsnriBLy0khx9crm4m8plSCanD9cQ1/WjQyOWO0lnGVmBsOLRDiWDtUqRwQwXF+JAKt6FDNOCSuUi+IdtMhq+SQNde8aR9CNLchqlH248XPi1I30t3r5AwRq+zeGz9plW1+rfntS3XW/YE7rOb9MCMztUrkhbA87Ng73IGSAEDOzsJcwg3DpKr43SciBTdNfBZMgHiQ2NmLBlADZwqbE527f7fdan32BmFhGFFlhE8IJtw+v9QdFEoFmjQW+zXNyG0+IQEwuIesHEXhxBrtkAis/iIrDULg+JwJ3jAnicVvHaXE90IGCh+CLihGdHvT6cSLAbozXb0TIMaMsWAjdttvql6B6uLNo3CXY1nFK3Cf4pQItxfYVlg7WtluxrO4UB52S10C+JKw9r9FI6ivmJp+4cWE5TigBN8S3XbB8bMn+3qDVgM4pS6WR+qwrvP3yAo2bCsI0sn3gDuYykQxLvicfQ6rqs5lephADXrpA/HqBVjojag4uE0ExJrKnl6WPoeHKoTIXCbQ4a/TGqdUkWvAiD5Wt/dOXPI49XOQDFEANtIK/8KJ+HNtXwvYOWWQ2eP1XEfvXWQspPlkmMIBRyRcisIQiubmAJ/8MSx6QwpI7utC1ZwT9VDC5vthLBHQkg2kPIN63PW9/QGBV11fYox+HOgSBa/4YMb6CXScBBrg77yKaYj3W5GZBNG+Ky1B2sJctHtePfqXYDkYNHIV2RKASilVXxt4EgSUhMRg65TWJAJ2mHLyYn+VafEun4K+jOSCN2RaPFOxRkPQ36fEtOtW2eY4uldKH4r1F4o+8Y/4HkLvUQWh2w0NaTCVct6uGhkY+LTSuG9xktVKbIbB4MCC632aCkQovYhyegrh5DbqBhd+eC7Z8th6FE+Rng25IuqB3qUEHgn+XjOiaCx7fMoB91FUMDRIWxdSezmbekXyKiGf36ioD82Tp5BPC7NvGzwkyu37QA7vz2z09wpGfLQwf3DINPRRJB9VhgjHgDQXaOsA42OZdh/N8nAT7OfO8nsEJ96HT1qSdSX00IkdEfN2FKlh/dWc8NYII0Ok8Hv787IZvoOrRaf1jxskemLCZwcvBPgvwpBkbgpiTSPGGm8Q51Ti7A2cOvpjW2cFJIOhQ0MFT8Jgn9rrYxmQi0PXV94Qk9CfzriUobl3acMiRqHX5gUOgpFvR42IIsQkENEjIYbzIzqjqy9Lj4Y/LHOaHbx0WnCIIDqyj6seNPueoMCvYfDdF3CM8n3ES03n1JKaiSwyVrxROyjrANRg30u1GUKqyZsF3Zbf4nM9V1D5eHq/NVNWszAiqdc7tRMM04ale5z3up8dc8NzwKv363Tk/LJNb64XBTLbWjzhG7aZdfz3Yiq0QQhYuvvGpkQh0zAXPePTnI8SuBh0ZdxpotoUSABAbW3pslp34Cg1XBMfBd3Zmq/CwG4tSHh61p7OE68pvyD+szKuyoHrSsElT41n92fV+EYNMkcSHbLQPQ6KYto/17sfpq1W1qb6RSlSl8qkXLlMbPfYLVYa8YsCnMiaJH49Ta7U10jtwNPzvLIkjvj1G41LZuS+sKwYazv44t8xiWdf7Wr+OyrrJB5HagD+cGj2VPUsEtgf2XaQ+yUWiyS6SlMqSwoA6ofjdTjCR6wCj4jeu5ESOwA3adSxsIb31ASkMORfSFBA1CD8Am0LuBhJqM4hAt3aIBBIMqtre7j7fVEKM637hk0Fx9Xku6Bn9IKjwBkl8rS9mxsXxBSvSoXbN4jJxj4w8Vm3WLULqAwRJLDKbkI5vQ3nF0vmsmvkM9yTah9m/4h9sZ0WPfIFPOWFkUSpK6VsPD9iGGK/2DYdXu4kEg1yw+8yyfJXv7qbU6GLE59563D07/FH627XyeHzILYIxZmAWxxyz4+bwcgP+BM8sLRPZo0o3MMZ/KbJbIEteEnI55yghIre+6PXg3Jd79csBS20qHper8e5M2nAnA18VkbYKV6hvuN6E9aRJXqj43cGDT3fVXKs/fNhyrtO3OWbp1OnoK2CuIdeBdlmSW6qH2LVA1SL6vJ8QOq7S4YYQ4nvqDC17qlfyYeVodhTmFdfud6Si008s/uxasoksKa0rbzmtK58MdcbBemGlQYfSh0qXApaEpNT4IqdJUDowUf1d0FG2wk3yTeCg9Xqv3vfjL9Y+Z5xVOJHkieTz1coJOtl/pnJI+pStdJXfkXb8Kn/9y3BPwojMw+9fwLAkofWBX+7NmfdOK6zwYqE2l0STFhrSTYrfiEoN6NWJMZFKdmZjKwhNc0Hu4K6v+QcekIPw3+fm9BoMaqKUdbsicmsSetsbiE3zgXst6HVJUiF6lHbty9bFYFIhukcJjH6IwLpRBZpceoiGazbD1n/jasK6DWrQdAJ6OUgeZIuymQhs/eQkhEmsgfZF0FFAt3RlgM8Y1O/PLbQpsJkdasT5g97X5jURqKMlxD2qR4Yjpq5CdTG8AWPjclM1+IDVs/IAA00E+cYFG+j0HXlff2xMiCl9FaZ8T8vA4BPzW1XZAqnq8W+K5kaOy99EBBCMLPTQu+9xEqsPu5hWq2oS4TpdmdlSASKxrBdF8qhlXzm3BUvvmY+/Kb3/Lvvtw0vH3yZpKRKUuax6PN+ImXwSSO2p2dvGnVe9eDtfburUAujVWQ/Ht5BubbC13MldnMx4k79GfzP7YmtOw47qI8VXR+M6o4lA6ECnl6XE/C697utyhfQjnVCzz54S6xyBiR9jvyZ0A9008AflqKUuhvlhF6Cuszwht2xJxfjHoMLc1CCyYNLVYrEff+oa+3gXLf9MSxVqlDnF0ZwxQoAjvik5Fk09mJM70cnRZvGNvXVRFlT/laoD2GtVGwzfmxktC+Y4iADFD9SxuMrsdqU5eMT5oOGyWbHCo9ULZtf1+QxFdGNC+mxf5CRkuDqUrn/eMVKjkPqCwcRirGYvHogsLbyEke5bXyvtP4sZ9EV9MZ0+qakfWh5Kvpbw66AGzDpQBlpSQ5WDg4gKUwG5dwQFF67yFuHfKEc6Wac9WA75jjsELuXT7GDSIcY5e1pWxH7VyBtMdDPnq7rYdxfU5nj920JCuH+VJw7X34uETTkZY2e9HEmlu8edIQ2gr4GCvkZjlQjgb7eDecfAxBARwD10R0QjtaIIbMGHehnWOqMOlod7ovnQU08XYNawzSDfzVEwWBcSxcLeT7SR6qnHBhbaw0EG5UkpBrmWwZKZbdGA9dn27qsf+HG8zLnD5pKqW/39BiW8DVoch4ot/t51hKdwSfr99knMhvlbp76RoiDXWUGxh4b3M6srk+gT5c3SdeAmOnRFnlt8PAn5fL1G0RKFcuOdlh/PKZrXlrzE33jdRYm3iEH+hNeZFRSax+ot9hM2pn/yW04O5tvSaWkwarw57UI5ix661vWxR1UT8fZ5TswodIetBIphsZp55WO7nq2DP6IiYzr9xLns05ACBrPYyNLtxgY5apKSGi43iYhRNt4+HrdVqHCpJDitk2vxsPEryKKi0ypqtPSh1dfiC/N1wwP9Ll1I1EGDWN6iOyIQjaZ4BlHKXrRzp2AFM7TZz0rWtbuumX/k/mDmRhARaHCfripjy7u6HmVTjoZ3jzHyuxW+x8Z2hpztCj7Ubf0TdOgY3cnPr32Nozlnj9yyFE9K2LvB7YELRq6jhpTcD2xdr3kxv4WA7dJ2TTh3mpZ10dpihZIDshpsNf66jiKa1UYT3phOKjExpWP79Bh0i2wHuery7xuAwZyBFqc86BpJ90HY73TTBq/qEgwsn+5H9CB/vy2olGxBeViryU87V7xh3LQ4u3MehOpcwkPbnV13go48/ryq1WpW0ON+UkAHx8mTAzowlj1viphV2K1EgKbBMzbh/MWBCERAz96aqPVxaC7Se8Q62djeVOeEX0DgoSS0Qrz/rB63rlSCBtMDX+zaeFqrDJMZ0ErJZAKJIaVPJpAL4XeIwOJAIf5ZqxXWrvLw9qheZv+kGmwlyWnXqt2rknP4x6SNBycmBXN9ybS9evMu6mOci4ETf7mIofq53Z85sSoT5/NL/Np9Sn8G74iOIlbS+vcUD0yo1V86V/cV6Rd190GcpKWnSF1vsgFgaqT1Nb6ruJ5xjj4r6OQXwkXDgMh1Y++Zn7CdBgNcVIyX+phMUo2u8TsC/dxlJ5eUi7nTqJdqLg+zTEwoE7v1N9BLitkY9aM9vgoXhfvLzgwSNm+kIuhpf8LzVu2PDzsIa69w7sq1tzf1mi0H1AUnNJCWbFwjLht27YaCwGpSbl4pYXt59gzz3qE8WOfIOqozYIzl5/1crVL0GBFguqNEZ7+u5tWlsNqOOpTIJipe8GmRne3Kk0GLnnv5ZvJfl7LO/vz4Juh00dip/Ndwt8OeOz51zcGXHiBs8cuxCgaHwv30paswOSuFoo8qqpkCshr3r/r8CnFoeR5HMThK2RCBQo+dAltKVVKazrl/yQfkM5KCfAGK3QWEK2EwST9ugAXTv4wXtQdB35Nww/jZtD+YYbXr9pvyS6xNB/achj4Mj4t8MYP3NsZzVax4DuAeumJfWaPG9TDChdvHAnTB+AY9pbm6gw9o3S91qIN0IkhJQPF+EmBqr1k8rmfUtoaM+rFmFSV1KzA/K4z7I0dAw+ipmqq2gPmMOqZCmSS7+9b3CysQLU0V0u78lrfRONFzTAd9bxiuxxGBaFQBEbCXAAPfci+Es9SPEMpZJ4JjzbOfUNDSdbGk6xdI9zXothvBIeqH+sM7bthQEFeO75oSaq1+v1qWx1H3BLorju0sif4mJr3YP0rbcElCdeFfHsMW+3HN6PEzs9+2grUIGOPVbEKtI2xmGKe1dwr2SRrkjG2zfwu69xPWhMSuwQnB6SBTM7RrPuN1cWHyL4+8U9l7+ayqSpb96QXglOz79m6r7lVCsPmpV5NKwh+fTXhPeH58aF63fDsAVaD06Ml4W448gt/F/82Ik+FTXY+ziIS4qbZa3Bjz1qsDtoYFiMiccuEPpnp7JzY7Q9jdVaAGkd2yc1/vyjWgXfFy19Iz5gtqDVlHTm8O+0vP1KHF8dJhXrx9xzU3/fe6oDKxWVkBrqgq1TWx6BjRQ9eavrovvJeUfHZr5/AJ0zhLRwD6nJ1dXNzLJ6nDJDjuncPbR83GlWWhjkcCktigi3kAQhwHZbf4WiSO8lsOTHbxbmv1W7jY7s0E5ps0FHf5L+3p2jAiIdrenDPltbE7dyRozsBOwT/Wd4QtrDsJG2Zl7qLmXnGHe5zHxyUXbrG2kaql3jFUwRGrSMNgzvHlB+7iS0/TFQ+q3BPibNyBhOIk1lKPtbzWcTIzHXLdcQmsEvXu1bU+F6Drdjj0tHFMTcMXdai74pGSE8VHXOr8P6xfCYYcX0X5RxajWJN7LwkVYhCNSmulP7NwXY9GHrtvXwnQkut0deQW75NNP/c7tyTXql6rxNkC6CvVoOHUmX0L/aTmFg9mAb+OkQ6D8R9HcoQtsEKgIwIf9HuIAKn8p61A8qu/D3T2Hev9GqvJxZ0sbygPbOq5O3KrE7bpOIAmBXU5Xo7oCKGpJ/AS/kPb0GZzJBDwVwogRkoBmkgpgDU5BZAMmG4QA9b0NFxDh2mEZTjIKVjGXX7pPWNFnN4tTSJgfB6x1gwPbkDzeWhjU286rbZgfljNzq5zHUp4OJFcqT68mpONLxuPlTZ7L+l7g7fo0acLHPuR3KuRg6uDHxOROl3ZmeoBYjwpC12n2F1YVce2o3rP7TTnVpk+K6l+hAjibUNsyiAYsATGlkBV9xxCjyruljTjtrqNAjZ9MtooQdcW2EQP7ehegk9YPDF4l1Ecu2InVPNDemoxdxWFnLhu1V+KGbnturOyy3nO5xzU8pJCiJqkcVrWa8s8RU62sIlDGvRGB/0ndJ7iy36oeb+XmnG/9lh2fm4jD9dnhYqfUC9KNkOm1G8gWfnv3IDyWC1FdUVrUJ88h2CYGxvhP9ZTvujl78srufi6gRVzZUDq5Nvi5s+o9RwwfpsgxW+jouM0bJ7AosRq9IfP543zN2/1ZzqK3zN1IYXRrt/0H3do9bLgSlWfnWT2hYAu4QziI1rzx0XlkK/v1g03EOlT03JfZdURCtijukkKh1JWY/SBJ3EacufqLfwkP+iyC+0vyS/rYQAS7phxZ+ci8khHonlJP66komNBZP4rsCM5WklANO0gEfgRhUuMlcMPoTftrLq8YLgHbkHkEwFl9bwH2SEaXXd0BdeQBP2kt4QpBFbWfWwcieHqJdTwkh3sMV/UYBzdHuM4EveECJAqba9AvtknmH/V2R4w40SxQjkorkFqAT6N0G4KExnSaRm5ppwqsXcetDLWs0QABRpvtwS4MJNF63hjRdldx6BNiU3z9469x7Bx23f6Wneatyokn5VUPeb1Hx6Mh3aCdrP+Rr55T9W7oL4HF+chnTK3vq12YqA9NZRSgztVojeybDzY7lyb7fyw3rOhmJTcVSWF2avWcYVOYv2LX2JdfDQzJ8x8lpbg1WP5G0mHnx99VA7ZZF4sy2U3ZnF7XQsV/3oKN9S+wBcE5XWUZLjA+RLPOe/7Y/x2tZ9am88T+Cu50bCjbLH04nosvVzDTnyNPx7eszh/k9XsEp3b7G5cq7Lrl1rDAtcslsq3J89WL6c/6t19yIOfpL3kKLNaUJMVtKS3/qHl45vHFM+PZwZR9w7vTKiFv/MXfuU9qvj2vQl0b+5rvU+Me4HNDe3A0zYhygTa8xyq/c8Stkzn4HFIjcgeUWqgKxntUqdnH7Brm4+5XpQZHbWnK4XQhX9E240zwUo6+lLXb6RyKF/sD2Y+gSo0mnB2Hb/EbTc+89C3mjM56fvnw7p+qaeCAkNZgrkGYpOdeL0Gr4vvnT+He/J2a8rDIGVcrD5K0L4kNPEfZ5UAOVWQHqw86kAYIF3O/b5leNnxhePvAybyfVYGZRPaNNwBMEaLy0VUSxMeuGG+g6iVcJ0Afz5GPqEw14bHl31LaMc5g51ci4hAFRI0q1klZ4IO2+cTpMMe+B18+GocisAFWsfdNMRAltMmqrUq6p8ZZpR5zNqBe2zAIs/Z0YuBZlVvqMyrlkVEGR/ESHGyslE3sx2ccLx7cU16+HZJ1qzhgmrUuilBActMsWJH+IY3VjkJGhgGnp5qyGZ+aBFeZvn6K0G071YTwtf/xvRdwuiN9tkljFWbVyX3hSad0u/SG2pM9ZYvozcdUB1xV+nEHnr7ZgeqZNis5bbcOL7H2a78LeaN0KOfqbKzcRt5RKDe2mr5tqXQgpKybyC41AHrF1xmJL7IXFbuph0co5G/9aWe22Wek9VesC4R+/w0HOcpAILKslgr3lnmBeGS+squopoRm+SRlAvoO/WeW07F3aLcM2Ncqj6K9y73mH1wCnyZv1ODhlUb3eRveUwTUrEVpJDQ+6kuayFIzObOK+tXxqWluoFXffiWEjlN+L6c43kf1a/3HlYU1HnnfISNWdJcxQ6fa86baImjEXwulNOwYUV9DnVVw/cD9Hl2x14HX/KO2rwAiw2paOLKhQNp30v8VFWvn3aDV//03TrORSq6jZWJxEdnu/N8erDRIT6sE0wR2oktJVhgZo5M1M0HXCVIf+GPpFCu5u/Ge8GR/C063SaFXwtkvV2lMpxb+WX6PldMpFiZHJfw8l5OXnyO0f2RxoAfgWg6FPfNSUVDFS0v9npfU+JWetNyJbB/O1LeeKjpqkSlXVbYOtzn2JcEZMYiNCLocFuw+/3JG5kBqMf+uJt3vMIesZc1bsADbofxgFkHmzlL+e8fVPCWR14q445Ffyc8PcFA8cqPRtIk/J+XwE01+O+uqhAM1FMIU2isZOFMQCZBuwwT4hwCxznNBxSu0/MvPlKZ1MU9UXMnn6U5goESGgwwicClgyecQWN1/ndj/cv/bf3yfvmtATmZiWaO144/qj1bz7paMV3+NWfWLrn98bFBu1sxKZ5esUNzw3UXX0rapAo7jFbfuvNqa77GdFo1G+1i57UTpCCGHYMQgfLOYLcf6ltoyqg9bSIg2rt3BoxmzzQjfoAbosICkZcAhpFjUbhDCBf0T+ZdFz3ErA3okinBLPtINiFDGoPfRTRCtx+iE413XazRs9YIHBdiuwAxfwwxszNOOo0uv0q6jXuAkRPPCDrye+CUbfl/kWUhfHm2/ghafkwNd3KSMPaLKgqkSkuiab6nqaGLe2DmTEBH7b8iAr0rDYhhZsx5xglky9m1znokj2us4w2+EZHJzrEqCP7Lo6ebt/nPlqYGGr988U0FjvscpCM8oK/gzn8bruFdnHPMD0FbAcnB6Xf/dApP8iiDImQNmHG3IwIwBOgCt6+L1MBeBf7gwxMYt1YknAdnhKU6+VwrKf75RtSSRPZLD07refGqR9sDruoo7kYwXbCR2LJnatkzYs3aeYDr4oQeOWdYPcW3sNClWubgLrk0eqpyUu78hDz/63bKLQV2kXROxdI+qNPyuwCh0pK35ffuF01YmyBK0yC4wlWjc1a25QUdfiN7XSHhpx0TGLdeHyw/LcqqbotP2/JYkr4/wDHb0prbzFeAvdm2jfPeJVWQFmvlIre5g1Q6zBtbjV9kqr38ce2Nr0fUKcjIrUqjrx6LnE+hO83CQZwc4+qoZAND1ywioLub2dvYN5NV+2h3C/VMuftgOdPa2LC7ESc/d0+F8MW67A/RcRl6aJyZ9Azcv2E31bZfVB3MQrymr7HUXngHVRqY041Xc+FvH4BSl0/3qvPMrr1/dyXFfq4O13Yil4AZgcd5nRe0+pTr7HtE+h2ibabibpSkyo6KztTAZ75ZAxqHgJULhNbVmyWId+6t15vkCCMH8olA3CH71HORAa9vKNsjEiJur5tf323mXYNXDWLafGEHak8GWU1KKhp6jjn7j3la5UXfvhl4hYlyXtvzWnL/3abP72bLt2YZvz+O3kS27TrFjZ+vySvIO8xSkAlATl5mwDVHzog/rzj94Vu9x4fUuqtuklDBgYXc+P1fvfwV23j3cN/pwJsj6vDUhhQR5Cu3wuQ7RaL7fyGWoWqU5LBGEf8BQQ5rQNt0Xsd9XkTvzmJfqD/FUKrN8caRLvjcGcP77KeNXbiH+a+su8CgRhztpCq0yBypxQ/sF6pwhWtG/1bhnHdvU2B3lZW7t7sJmyBdH18BjSyzpz7z3reyfxSqYvABa9RZdPs/9Yon/0qmwYC6RCFr3Xa02QvS0l3zPupL4lRIRmJGziv7T65Do3v39OujLvS8Xlk6f7k6QkSL0AHobqAavRKFI1HKJ79Loqqw1obPxfxPDJxOK9R4/hNenvpyG0k1DD/6c3F5wGtTl9qYoFZaPwKmWFX5ZgjXEN2XcbHjIe2fBlG9Q5OpT1cptcEAWTLz47v0Yp06D6M3FIhJUoCcMvHKuf/kXEVt3Rga0dATfjsnYetKbgzuOpbB5Y3rywO3zehSbaxPuGQ/j7t8WuRNIp9+ntTr5yoSSJaFZysFC1bY8KxnNSkz17FlrHj3nVcKCjqJrm+ihWZEVkS6XPHJvizCA/LtHrUl33TQRoXIr8q7b043f38qvpDpituCP1EpxbhNBDaiOrts6ES5PwWZ9DwqA3VvV27x7fjQpy93+2qvKFHOW0FjA4PUorGVDuf9S292Tfs4pnedywq6qTyw5NzFo0yTiq18mzu35vyppuoRdbvjJ9qt17LsFgxyBdsxHss8Vn7q43YBRemPGH3pmfSEtPko7obCBOHhjuLKFcKmy9+6MjKK2O4vUHppA7ehS8IF+GdNlTzep/i3JwOZth7Jgs40jg1V9eOhtPpR37EhS0xZ56fjLnlIpbwPnSEvbtP2Qsv8I9pSxheQLKMorE6akcwV7+L8KSLQkIyYDEMrTZ7oSM1obJzjg+f33svtPC6XuTvbEHRigLYA9OOZZrX2HKSLNjDkVJcuC9pXaIoHH7R2Zv/qItAp+MBIU4NRz7EIsC8VODtE2NnMv+y8o2A6yMWz/7s30i+HOBj+zfbR/2H7qb9s37/NAyPyYmwP9O6zLShEJGK/UDtBBMCM8CP+/qpxMenK3/t74yu/r9qkBv9noc20KSvJE82nE8K+oN7GTK6z0SPef+SPWz/thWh2fj9TFNIQcI4aUmzGRb6XxAFG56QrgxYLGq+DLVY5zQnduz6uh2702HQIl4XQesft/eyzmqp1iNq2SczFzcF6N9VGmarzpYW6O4NKhsW30qOToYfKx5YQkIVKTX+VYRWBLd8jYFTJb2pfqQ3ahXoi1n7sdpc9b9+w+kle/IGQ712p6qH4Z5s9ScPLBR3N5X4lb7s5vMCV1IUjvT4LGVjf2nuLke5bamhb91arsZxGq6jlpYeFfbabyEnHP1vduFR1INLdhwF/RVAJDOwKR8ZHYV/lGLwqP4NutjMaKXkq6PZ3tEvJxkzgqtYFQsdubM7yjZJLtOU+hNWPca39Ek0TRnItV/sPf1fGjxA4lYt9fhbEvZZ7gbuyExbKF/pRE7jXSFPwalQkq+bwgNaEMfucs/baqfycSUZ3n2OGy+n15uS8gfKSoyc5b/hm7X2uZb6exvrISvQdc/ZPfvVXO/ZuaJUTgTFt944JN0K7ZEFv/1DwCryhVv52QVbwlUUv+MNN9UjRR2HtDFRBI3v6bhSTbZZ+et6Vfvc8N/0djQnKh9EWP2r4uyjmEXK4OFaZp/PWGwdO9rgvLATaXTh58fwCrwssOroBmhJ8Vb/tFe/Upi5SMq5KPlhd7cjZ3s0qOlkbjXgK2AO3ULu1BXikU4kxe3SKc3/ZUFPvVHRbkOfMuN87wiIce1qifxyM+BlI11hPtUqPvsdwoB1UZbIE0qjSHPSo0mjNWUg3SEHffm00KGpBjyG4U6FYhvxrPNJv866TfvZJjtfukeK18y9/xWtVv+I1PzjuVrAxywRagHzq2Sa3OkA69DRArB8deNdsTGBzxb4KQIPOXQR9RZV1ERqJXBfYRfwudxxHIvYPPPerHUoo3r6ALBHPMd7qXZsixAgUz/t0s/Y46QwiCPzzhHT3Jw6OSuVKpI+g/H3VVwu0bNIZFrC9MvTScijfncfw7eG2t6Zxvip2m1dwheNVMwc6dVIFg5N6MQvYkOPZSZ97EpnTJDbMvx4OPWZaxXKbtqQg/NWxrJpDknH3a7Vy+YRaeJJSNaFXqh9DNi0FoO+tVpQMvn8PF/fXw9Q8SDoHtcLx9tDErQ7onKlKmpa7fbw6fhmO87kMpsY3j4PZhGxKasJOCDmdYLrBmHKlzn3G+LyQ5d1U7T2D+bCxphq/F0XR0lJBTbDBh96wlVz4x/rJMJnR/plLi0/rNz6RnZviDqqX+ViFg4/w0ylOE95zVA/EoTrm/097bx0W1fc9Cs/QJV2iMCBSIjBDhzCkgCApoiiOdEuH1NAgqKCEiEpJCkiIIoIMKSAoKYioSLfSzcw9ZwD1E+/7/b7vvff3l/vxefDMib322iv3XmvtO1vBhtL5TfWXJK7qvJ/adtauisZBdJ5XV8hEjBxPpLlcAFGfcljQNmKJLMKrrMq0s4fdeYTHU2oz2pQZFCx2M8tjS30WnfVdUsJfndHddlii2yTamV2toW3ycyQI9W36uIjoGs8PnNTdRtiOYvl822NayG0YAgK9sfpYzwnXNyd6p836jb2XugIf155edpPv2uqfmCyP6NRbzbCf01IQ34jJf4RqZvsy7PS2XycqQJ+6aZcRcMp0YDMvT3hUcU+WMkzmDVQtnPhwrYbPjrhWAHr3264RazFW/kWlTyztwqbTxWKe9TLbnrV4fYVndlI2XzEsGMOhmzI6DKM2SCqJLmwjQMrHsgNIKdEt79M6lqwvYL61bMJeB77xIeAoD/qZaMoIGda8Rc0IvdZpLbaa70jBOvaB07yHFtxsUITuJ0mBy1Y0wTjIkkF5x7o1uLuGkm8ELn9tzWoHCC6ugevcMUNLZ1c7tkaQKxLF7pHIMTOt3jFAeVCot7LPrlnUK9RtAH7JMdJIzOxbkV0i45Hr63/fWlOnUASo+r0CswNqrRE9Zjs77XMWJRrZsSS9CIZNMW1tDgfv5cwq7q0TITwZ9RB2Mfmf/Nl7cZAy7LGpJTEzvvi5dz8mDj0GBK/gpnFMozS6cPz51QowmC5Xh/7y8/gfGatf5fpHHnBshOmJqs4qndx8MBobMQZjSLhExW5m7jEaNLluGWhPs0OBMR1+6JZq8rAGGAdh3ZuGpNz8ldfViE+fGpwgjfDTpZwrRqyw9OK3pUzsJmX5QmOD8tFw/WgNB89C6jBKRbEJmk8s56WwCn4SV81LQqRPy14zex3bP0mIJUQVu+TQ6bWNCpf1LrjGTzzZiUUU58ioMUJXUbUBqG3D4fEsHaWk+tPlzpnfirGyb5EUO7ExC2nG7Zf7ejSxsUuY9rUFw8mse040KsdqTCZNmwhTIEvOn1ROs9QwlPXGBS7VBwAmeikfKYAEcpRrnTTGJuoRaXki1na5dKFapootDeqY0jzc9EA00aFyvJITB3ldEhh1yNU1kOt8+2XjAc1ATL4PmUmalHvnpSL//CkuYkKxat0ntxgaUlKzNN4Vld/Nk/8o8AnJELzRn5Fohn12M1erCl4sfMYpjb6U57YmXx/G/czbls22GV/juQ30yAiAwCtlOMiZzRohwJC4vGs84XUVfWs9TT96J2hdR3BUCQeJsXiKg/SL4/f1VeoBGhP7FZAq1z9n0xHl2w2V62bdd6AhWQi7KJ8s0dW4dvXdmQgSb/fzLwBbe08S70cWENwG94bppTcSs/1ugFEFHYuiOEgYPpISDEQ598anuPn+95YxrAi6VaofPRsFCNy+1++PgmEo+LQKARj3evFALNE2zXBec5C/PDAMBHrqGIa+43k7SLxqKhv6K+paV5RKKIhc0thjd0y+oHankCtuxj0u93ZuZkyBEvkwGI2JeppKuxdpmAXFmxn4/W1yp9y7X30mg1+cPUJ6euWqG82kZjbP27Wr5d4KnxewjzmKMy7Yw3GQglfBvIQ9bqGxfRjS5uFUFgZZmrkXsdlhld333HbdGKXZlGVwEFoft6ELi7DI5wIJzD1W10nZfd5itZ84TC3tNA27GE2LlGPkaZBMSr0FJC90DTN8N2c//4guZSK+laQawZJ0npJNwNriI3XOvvF8dsA0jcEn1jDA5kqvhID7qxnvB6Ql1sdpaq8GMm2/oY9u6Arn6Tru/0HTXfOZeL/SsVBtGpfd+56Kr24/yxZDF94Qfoxa1+lDbmwFGi1Uu0dMZJx5tS08hN5BTFn1lD/0S1Nk22lfDXsnR/1GN8Yjq79aIs/uLrqtUc14IPIEGi7Y+xaRZtCkXGHxgEWzN5u/2cu0p/BbT/m2g5zVIHG1Fj2NFSvsbaWrT+SNItnigspstsD3FPI3tvsRJQnQcRykXCfPsZrsRfRHv+2EqNg1Y2HdiSdItm0Oyga/y5ZPMGUYsVD4o/yldQWzo/0zNtEAkW65LrJBZ51FlpiW/S8Bcqpyq7h9Fky88e/I9zMenax2RYLZDQ5p+PABg5rQcBxkP70BpJLjIIGS+XYSmMfVgtnzFPvRggt2VF09i2MV20Od5zSoalZtAfL9tWwJ2cv7wRA171x+xDct8peI6SCsqMKT2OzAUx2+6jyLfljNF1U4yGV1bMTz+YXJnZt2vg99wEXuo6t4+mQZ7ucgAHcRldGLdaioybQleCEOUo2DiE1NoQGXcGq2VYJRj5RwcQir6VWMXYEBNs/0hhb2tN4K+k7TTSyDgk5xPw0VYCcQUJAwBgkE4U1iMDh6WBF2zh/S+yZjYeYTs2OrhXjS/OzNH6gdz1pQlyMatk82dWR1o3On/HwOLxusyLOuFifIEYpTmb5JzRzXVrajruUncYOxrCLniiNle1s+3r0QXua3Gca1y5pWXxMaAcdcbOdMbUO9HGvqSIpXUJI/G9jicwzcHmOvqPtiuM03InlLUPJjbtwnDCaZohh76hyWadSV5MisjOcFoW7Ml/yu8DSecx1Pn6GiYUpm5W8AZ5uKmOAoMS+v/4/tszOBXpis6egB5r55MYtnGh/rdrhJscSofJcrRwbMeIx2czc5JBW8U2ItmsID7tf66s5hkSNjJoAcIkevsO0JK1PdC1jbA1Low8Dke6I3enCQ482ACee2F/uNALhcFoVsfbhRDGhaTrywsj0IGFbBB6oQm6iIfHyoCsZAgYEsKc9Lfm2Y7ZV34J9VZF+vo9kUMEFtP0NP5RSnjaA3mXsB8/EaaD4aseMpgW8RHRvxahoHyRHEQTKK/B7KgI7PlVxewQ0DhdMS2wJgHoIcADZlA2Z1mBQbJLh4clk7wHkR2b51AgbuJ59YOqvGbksYujEntlB1YQ2QLlNjxTnDUoCqhgO00AzSgnZxvy5AC8mA16ayFyCPJwYhCH8WaTn2HVtFfNHMK8OKNneK90ErnyNJOcZAD8Rh5OUQ5Ty8d7ZoZH4JvWA84ivjsTtJPdmZg0HIu9KYWIBRtG637chThbZ17K2F+NS64x6eFfv8EjZ3qAAYTcU4Cl370e9tkfdYrAg8qUvBV2JLYPyGIoVsJ9GCxkLLXdUmHuXDrJ5EHuIX5Vm554sI9WMvdM5JsLqOf6mNz2Ov4JfedVjwb6BaeJmSgEx8vpGmfsZ/weC7qUSLPZ4sIBqPBHi87lBtDI3cLtp9Prp7bUFyCtvZ+caPMXbMQCHDfaP/+0WdIzMvZT12MGKTBW2pTg+LfK1Js7Edo1jh46TdX1FjghMvK7Bq7qv4YF+p1jT9/OIWXZ+RGnHYxguTSfx6DUARIgcU8RGkCF6MuYKPCr6GSDiEBC8ccrhqzePaXqBm8BU8LImpJ/IdqfAliyDLGub4LE8oPrZpyJ8WH9uEg1RJYaPtN7F8+3EGXuP4OANEP34HFc2KHktxwKy2ovHmF2yHv3tVBoGqv7Okbr97E/CYsUfRew5zJA6iCDjMfgCEFKDDrIc9GkDXbXzXniBIWvd2LozSM7YQLx189qVDK0gRWsX9sWSHIDyceODx5ACm1AWVk80GMtk/1tgIzrz8zFzyoSI2Oc6xde1I8I5gWwd8yKTWKKvief+T/hVZeM+aJ4NC/TwqCqbIlW6uB40mkREQvbgsMs+eT4mB8WRynCzivhX5+AXAV6OFiVuTZGa7ty9nYXucV3ZpaI4I29dEJrJtuceBmXurM/yEM8iBdaNtdMNU0cVnwmmnkiblveJfo6kUkN8kNnXZzAKSkINCOfGbRbCxWBuogv35Od+LxXfk4j5ZgEGJ+ovE23aBHB8kyN5c6e67FCR/hst52vR6gIhTTLZu9b0Ji4tLdc+G11pljsfPOKx75kS+rxmhyNTV3k3DjGU0AFZANw7ChRJrGlo6mfYEbwnXaG9FGY+pV7uiDm9sWD1F4y2ZGJTST0um4wZoyTiscU+qpu8tNpADzpk3S9ERkm+ynbUu6ZReWZs2s4ac/OsSWlfN8EWChO3PECoeklANhxAE32a3pdsjhvh/EsN+0AlADO3rF1v9zaU37EBrigdvz9Qc6RfNnnEzx6+fhKKecZCv8TW44iCMoDH+BrYLMR65+MsYB6lhpDr0KkFM1DesnACS0jNEThwwJLmbUVr1gK86jLdpWHEQj454wdXlBtpOaLQiK1jnBkwkOdi+SKa5dZ9V3NGod/yCJ2lf0Mdt5wbfTIcrsJ7n0jXzveTCyFcaRLG1Y4FMGzpWET7apmdo5irWPXZosrKFffK9xR2iOgUg5kFM0W9ufq/TP60pD3kSZqrJr+6dITRoOIJmtn/3dCPe8APrQ9PPpwpSM8g31b+9hIUHLoY2FEqQ6aOsjvt/ASyTlhaJbo0EiCG0TZvGfjdFQpcP9cHjBZ/Th1fva4IfO8LaNXGQ2/2NrjVH0sh1ygD7BEAnMTdGJDFn9PMWGwYu75plyH8GosfP1IHcWCxEW/rLVt9ivfHjixADR9h3dIN5yY7DjA+Scn6ZWH+eGN119MLAUk+F+9jWruOikt1dX5u5XTBtkmZrbS+jGJgsS9D0/Ya8tWTTq4WK45hu3LEfHb6N376WEJzyQWFPe9Sg4+GAj0VxJbJV1R1VCpPlOSjDA7W77BejcVW2x/woP8F47tYLHMQ3R9Fm/cml/eIWKuAy3F5tpC3qKwlBP7CkN3c0egLuonaZPyx/1s+5hPwpOOhWipsHANs3EHFzRwywfe+ip5qKvSPQY1b4xHDAb2OdwFid4p5DRzzG8tNQA+QUhtyCFDe6TwJ3wdXm9AwwTyW76TpJOql4mMsQO4kCk0PaGsAe6s0o3Xq6ifbMbV7XUdT3+0sKCFQJBzwi+y97tuAfYG5OjyjkbxBeX8NErN353vo89YJuxTsMLD56J/4m//ap1o7Nu3vGxde7prFq7A7jt7t6w4T5CZM3svPQVv5y/d9VnCzsO/O/sylzEwUKCw4OVyP7xE7oTz3Czus4nqu0Exs9s5u3EAaY3SR2QZlBch0hn6Knh+jFI+NGZAaKOio9udR3V19UK3A3vNr0vFDUjfnsYWbVZgQz6R9prgarJZFCNdQ70OXYPJRxl0f2Nc7g75epxwftJ6foMLK7csEln1/aJw598trGDHfwwQRbhZujjD8fJYg2t8kJ7Bha0ufCQYrt0HHF98GsWd0PgTbWhBtDvAGqzzfJvz/UfVO8yWuyt9bZW5w+jN5PIN4nAL6iwBb/jYi98AmCbguwGhSBIe2iIsteIpl2mI23hJZZqV2UdidBp1w4Ab7YGyegORIifElre2JvsNmuaoJLre8XAQ84bADQaxUigGWZdxvDaVPJnbBRixwZmB3AQVIBJ3C07cokFbrlbVp+MxiAf0fsXWC7j3pPDenGjWF5wToTnqcZRUpM7ZJ3mo/7mUbHpdN6haISJnaQsY2jT3qzz7588cmmVItBBx7tnFGiIORzBBu6iIN8Ex/aUXPBQZ5Upu1s7+ijLmd/dtu5uIA45bCIxt/jq6/MBe7oBbjdc4/fqFwkrP802VBk0qD5YaSy+kHr0ghdS3apuGPgUnAnw4bx64aLHHLEt40c6rueyZRKR3sKLDXN+H8+Gxh3vd4A71v9nsOsTRAkf+8bzS2PYuqLDpK+u1sml6qaTx1pOFpKjAqiuZq46H8pwbj5lRG8qzqxZ0WuxHNUZ0Z7VWXRpvYbDtLii9whfYCDRBXH4SBG7sjN9Y3HVbMJVdEYZn9q3Z3IURyk1g6zEY38oN2BDcDyo0yzP5ekMVbTN8fSXsIiWpBrJq0L760x4z00Tw2+Xx9qjmW3/dQR5lQ+T6kfPZ9TafygrYMsfcFNrtQQB4EWFwxr36MLLZb9mOw2bbUsg/Aclc5m9mEKGJ68AYbEwBn1iAsoK08WO31Pl04iZz6ncDOXe5XpkYl91lGYkVnTUnlHIctIR4iqRsfTY6V6Z6J4zOVv0/aPGQxfbmpd6une7Zrbdbv7BSC0+i8LUrsk4KIOGnssbSv7PuDvbHcG+N5zVW8aIoRt3kaPPcRBdtRgM0k2OzE/lFZnVG8sOtS2K7IthQQ48cG2efjqL6YtBfIrVGlsto28ec0SVe33BPVJa+KT84V0s4eMapR3UhtD0Gy7Ujx1p6gpHpFfS6opPn/d6In7u9ajt3wjtI1yNKcxzxY6GjUws59Q078UaTvp4r32rShqwSWGL9Jpt1BL2p4N2Eb0FkJwShqQjQmAbJRZRAJWjdIsqgymwJWFXwhQzBw2s6NS0Va+nRDBg6BhDKqwwxZhvmZzMS625rw4QnvTiMxpv9LAV/yyVlt33HuAMn1wkJhfyvQ7/4FldRV5M/ZJZnFzlt9dGeTNx1ihCEzs5jf8wlaE6bODTHtFiW21WCILCqLGQcVQfJE8NnwtRyiYUv9LERITzHClW2iAmyDlkMw46ndw+v2k3ZSrkviqcyYQPcqj0HiVnvOknrk7xxY/7AZVVyysjNBXJVolST+MXT8cGmhe3WrDKt2W2LG881YvXuaQrs7rbpHxsg9CfOVVN4dH7lPAd2iWi08nahjFirN3Hbrk3oW0uZMWZTfvILJS/HAEB9kTPVdIN9omApT9+sf4XrnC2G4rsO57tPSvsSyohfxfDi3H822B5RE2RUZIZgxx0ztBRnZb2uT0k+z8ZiXU5RBQAEWAJS2ytYPSdXkB25UtOSIFv6axz30ydtApGCFmLNsO/f0dGCFbg45G7lUmeUkzyj2TVdxs6ec4HijivtDWeBgHSUPvJhs/b0AvgabKCDqce7TnK8b+FF1OUEkCMVi0M7pOsf73MLL7Pz0nRkhC7UEuiQZBMlj+Ahp99aBgHXtHvcOFN/lPZg0yZTrLNz1Z9d8Y5V4mezZ3OBRd6/D23cxZg3AydFsrf8WAPA5CZHfWfmyLu3tk46LziEMHpYNgkYOxc36Sk85wDkr08KnQEwlygfovoaGpZE0+eu/5lM5nzI1UKjA9fYXl/dqR8u5Z6iIditmfubJPhE8q5V6kp5gF+/by8bXxBOHRoV3ztIbPk531MmalMwlGjw2kKmx6b2Tz+x5Oe4bZSZAA9ARYc+O2CGgnvDaeOE+5UTARoOprDEzW7SOjFwBqNfst2Xc/9b0db+VrFn/sSKPtxuM/IojJDpGe7shPW6BIwwj1at7bjtYO6kD65jvSuNibs9niMx33U3eHNWzS/cGoqMQcdOW/sUJ8dqAc96CNwGIkcqHwOQ6ytc8LicsgL4Cep7zEtuYwucZeSU76COjv9UXAmiOZv8+ceTJYlYQf0gQHF3LLaxGKYFVVyEwgu4PXp9MVriQ58xyJTz5p5XzVeMzLPw65HuSbTzEU/FTbidQkxXUjs/feExxE9LEg0vDDSuyGprh0rimNycLr9w8/XS9xWH4ikiA5pq5AemKmKETmqOcp4/a+1MNaKc9lKq9M879YnQ5IkYzO+zRu35zmk3appHOHDha8g/R9FebkvvZaB4uIyom/Vdo0E2r/6Mvbm97FNoThBSiG1ZnF8e6umC/CPzpaortvGh83bRt61mYxctKir09/p+BezKh/WWDBsnitg/EPhax5VCzHdMOO4+hwYAV2TuXnYnz3vY4la9bivX0eBX8VAEmMBniVDrGFEkse55/VVgnnulcY+T12+4MoQfBM4HMN1h58hvjBYgKY6c4rVrMBA+xKMY2tswBjpdagb+Agv9X8mWpm2hiVrzya9kZkk1eBUyFpE7D3wv0e4lcp1PELBfLcKbu5LQthTYRUBrTmQSx7NSEvAP+ImiDC/KzmQVR6nE0QXnzhx8wGKj2CEXz9EGbW5Mx6FvyD+49n1jJeMFML0uOnfbmWTsjRC6FTPHTsUQQX4xxXuMwTfaZm4ieloP88CaOfa15PT0aPVhanAIYQU+8qKkV2QWS9ZSsTw6YQNKIghYO0Cvcjv8QA5iNPAA0FoH+78fn0IhuiCurFAzREKhogzSLUeBGHyBQBjCEoNciJCUU+LjLskfd7LPdqzgsSrif7S2yCNwWiwNwXavYTp72HCAEk5djBAGNIqz+4cWhvC6OaZfHOqqNN9I5r6lj0Vt8DhyI7Kdlr6TfX7gmUqZ0/obHSMmasQ8liSGoike+v8dajt19Qum4BXUf4NJ4bZugNwMyC0tiogjuMoFzbVtmUAeX6eEEaB0kWhBWNNwN39TaqEFirda5d5bihjXM15DhIughWRxcHaQI8yEtisEmUm8gMox/wO8W9OtQKKXKDBQm8pr41kIyDyG7HYR+rl6Qt5PsD3K7ojoMEG6IXPYRPtqPTFpRW2eTDAJdO6xtmiwi2QwkYKjG52BfWsPc1Y8i8rjmRnRPOJOhOgFJ4AYN9ZBpddD1yGUumAHwwclgqFDlFg4PEA4bHogdwJ3b/TsPCvbpIrBkRerB3CEzWfrYPfKQZZiGv+kjaJrEUlqgNgN4IXVQZuyxSSQkAT6FA7yOObueJ3X0NEGRTLw6yd49mWyHSbGghv/rwPvDuYG+Yvvbmzf7PocCLpDsndIkBF5ULsyDsjBVO2xrcG3RNBjjovGpm9AT90AYTiGXdXad29P2AFgXgVg8wAWkrVPE4CMEEWPAQQOQz2ATKjaWXf43Wn3PBFsC/ZST2aw5wc+rgJmwtgK5hmCVUbloXhAQNAvK5efPe59BthVgz9XokgCsBHGQfEBD7onuA3FqIBHOG4wwDWUDk4yB9n+sCste50DZd3AD6lb593bJM22ABgdTavYYHsnhuizuyHgZ+sWP3NaD9mrqwFdbI9poxkbkt+VAsEw2AfkYc5K9vIZ9NkQXSbIiv9FjB1taBO0zKI3P7EEYmh35bD/Wbfgbb9nuAT8f/+T3u5noaEprN8FZgWPH4YR28FPVj45wCwEfp2mkbh39RFTAuLDAucEJBqroHWLGVACyvkH+ZGBFii1uA57IgisYKx4J04LnOuRXO0aALYMqr+zJ68DNAICKrz0SBG1yFxBz1sLBAwEdMvwTYVeeAW5QxYni09/J7MQXSbUjVJByMVx0/zQAUAcqxZqPDfKGAYOIM/UUen0EowgHqBhAFCwH8Imr0gvAvKLjA12IX/Opie84mBt5zR58vuGx6X6QcQEae/hxgy1DY1GGWx12BDxqgbyFXMaIACYNkSs9XV0xC/YIhbdsXrGiQ74+6jxbdviMC1SotGP4R8fXIwsQz6vysSx2Hes+8FZOTjWsg5Zzse7lYrXnrTWcSxzMdkbYX2Qb1hrnCtkU6zRLf2G0OLTZgNa1fBmTgIF1d/V1/KQcWzj0G1lGp31O1cjEawoyNJMFBWbUmlyCrOcRtKlEdfaDvDpZSQbzrDtqvZl4oF44v4TiebyEHjOAxkqE8NgvQuDyztSPOe8vBVyg38rZK1QKlOxwvdxJYB39U0TbXg6cTidceBDpHQ7T1XT+TpRPlINS4KBXD0s3ALEQ2Eh5EEGMQWHUGEKOAeAcj1/QA43nkZboBRBy8IFhWpCa5w11mR6YnAG3ccYItOnh2+xLviWQYOSiS0wCRzIvATqcdN8eYn1Iq0laxPSjiRcwVE63CUU4GWN+Fu3YaFMjGwOdaV81T94qQC+CXNxkhcwas5VDMN2c6QFYKjDictZjDOEgON8dPXPer4Bb5Wodd8zVOu38VWQ7vbqh0G3o6Uf5kW8DdZDIbMw/1uTS2sPoSpeLRDJahSrpMqfypD+0mi4OU83Xz36hRmOHLibRVAMgkUSt44bW91gJAWdiuNEtxf78PYu9jwNoXHGlbseGAuXl3B9mCLM8doAhUsEeuEJXD1j7ko/NZnTc3RRp2InezDcto/f16kVPkYNVAk7StOxG/vQQQevg2GmAeOeftnaFhrV31BnRHayBsDPbJcC4UyzKPg+xC5tE/ttHhsBmFI9hArQWa+ROP4iJHJx6nimuhwJd0dzV+vmQkB3jf4euAJOuk78Fin8NmTuNfAsHvTlMFuq7fAcTqFKUNWL0jdpWbEgdB8myg49C2HWUMWJbvBQAsDiLb84C4M4CnLS+hIjfJJyTkuNDDgfZpKyRlOEjNp7+81jsXDoN5Cm8JpQ1z62OzzNCTYxiaJdjaLZ0W1AaqAgdZIQQMPcw7LCOm96bUzs69YazSbrZCC3I4cAiAknoQi4NIbYBvYoA3oTiInW4ZdHEJB8EGeWHWNzH1QG+H9nvDgBiDwZz9ps7jIOu7mPp7W7GRADbLdgi3TwfEpS1gRJ4BIwVwid1DCw4C4AUKdqeyuIaDvIh0AoY9uMMPDm4IPzjStUSdFucdkS/q2KCktPXVfBwknxWFn7vQ7TO5lvwbm3noTub+PVyy/MRl/gDpjshrFeAlPJD3fk0rGpg5ACUi21NeQ/8CP/BaG/YTe8UuDuK88Pi3qTOcC0PCJDg+8eTu7tqjf+urK38AAkCx3iVE033+9zeAaRkChrwIDhkFDllr/yZ09zFAdTv+va5vbtgBI760N2IMfsSU26dzLaWwLBO5e1O98QE1c5rht86oYRyrR69OJd1fS8TUR9b9xAbwGhcAx+gt5h7kKp7GUfs0DvQG0M5Efuwm4UX00BsAxvo9GEXm2R7FPR6dyB1SAygHc0t9607YT+q391LBDAfO8D2NAYnRJHYVdkBVJ9/86gqPeIV9ZAB6BCC4iLRY37RdaCHmx+gviqOZP7ymhINQ/jCafww4OEPOWHEcpNefD09xyuC4AMy/Q2GDttC7KzjIqPpW7AEoqE9MclwNoxMFQ+olO+zNq9nYx8NI/EdZ1sJ1Wh4pIO0Jf9iej5yWo5nWXJBkydbEo59JjlusaeiwzSJfhPOK3y1qfoNpgs0CN51uVrj0YAen99PqinD+8Y3kETP9iiNT3TOFatqXn6gnPm5dbgowaxE/qLEeR3lmtASMqHJJp0xCz8T2JYTpwXx6LhF+9oQfBuMhz4wTszCF5XCmkxqwcuyfwwCW3IOEZcHBtXIhQM7z4gv0C7OmC+9VQjQPepkA1l/fCw7YK1X/EpDnBMPairasYL2q5JC476w5LODPLFDF8HRikiDmuEa+6INEF8i+QyHbQzusAQI2uPtjWoVOw1NcKEIIztbbyMMrLhvXCH77UZOZGoSoB8pPu1+AkRcU0fvlvghBl4C4SfB2/X75e5IgBrC4stCBG8f6e6bC7wXiKRXnGCnqwNr8LJTEnBQZewmDemwQUhMiaT3iKtSqDT6AjvKqX4w2CZhYS3mm4aUB6AQpNj45jj/Ewyj0NYSHANwDwdek2nPyn/MQAw+T4QvaE4Ox1Nr4IzH2UnsOHCSBQ9AcKvA8DLxGqg8qKQ+Sfqx/QzEkmVgwHKzlQCROdiKIf29M/LMaFuGQ/aMpgvI/79peIqS4KpGP35hljAjPNrtxlhyvjyMYqUwkKG8oPv1LAWXwlABzIzJ+WvMDVNB2HoDy2ykD+6X0qUyMWRO44HsnfSSHM53MAhUxGxHTwakMjJ5ZbwAMtekCGDKozf68C1YKJUk+xAuu7atQWACPkRCEqDWxQPnZAM+5EUQJubaStnL03bBc1wv8Ly8g1Opr+a9GGkBz8lj3z9T4ecyA2D4a9Qj0ftXj52c1YK8P48w5OH/D5Dw7WB4tZL8CQxbCuAgCgDSIXFWfVWT0SyviKYFfS6h1OjjH4TtjkH7f7SCBdJLU8j3MgJOZgK+itI8mBkXycxoR+GUukD7xVTZJ+A9OXNgjINKr6ScZgwTCw5sEw4O6WROVFe04gdkHOKz88lVb2oRGxuSmLMQhcV48+iECiIz6uCbGRlTpYXwGam3H98Dyvtp1wu7kQzkHw2aMkGOEHDDewaEXJir0ecTvBClG9K++LI8gCaIHzz85AIPhVwkb258LeN4UROBRHeVBZzL2SmtnIWxLAKwrhgQxJ0bTB+8faYFQN4G4ZBFvE24n4c+qiCCmnpw99+IIfXJED60eWP2T4sRFDX5IbgmpvWwo/X2wHI3cUQNWc4AXIZ1hjU/2KJKxEP5zAH854eXX9O2fvCJwTT4ss84lhzPb9SN+39gMDN3An/iB/wL9XvwTZBUMkdrtwkF8E4NANAkFCQTto4R4jwSh4ASB1cBJ4hrEqc6Ae3k5YfV/KZZ+gL69M3X2g133iMl6/+STvQMnUmgR+8DgXwek3c9pJmfOstqmBQ+HkAtO2wHIiRjCBQgZ8UZWccjVToKRuMZmcSoTfGRfNDBeEwhCkTzam/ZlujldNG1YDjMFQf03wGolVIpWZM1hpmIjYt0zWYO/BhH2xTWKN+4TJBk/1AW/ArsPAyTdVv9MA8VJqBoY+kiUObJ33M7BwGwPAVjTE9O8RaOvcUgIuasFriUQOLaxa64/KbnsybUfcYivkms3q9hEEgPJjKMEIRSIOnMSYQd0J1AaTkUQwZlZK/T71oMiXrzXphMCUiHanIoNAnBTL+R+FuI5MMZ0A9qXjJCr4BIcYJqXQEdiqPhpH00BTFubfpJ14nYocyIwTwlk4AcIgghB90C5iFdULbNBBF9DN7NR/u07gvxvKY5Xjxl+7ma9Llh1tIc29czkYfEIvoSq0ncQ/hvuvZ3kt2nzHS07BSPjanKSLzvHVc7YsoixmV9eFb+v+YW83DKatvm4WVUKxCU84CwBrXKWp3iT65CN7vks8ijOK9dP6SGItGbsoMcGM773NrmeLYN+yKO2hg/mfB7Po49nvAT+ZW+kFfhuy5pD/FHnLASuXCVlORHE0nqZ+iyEhKfZUJEo7kmOkkw6SdQ9WxlxyPRVI0UlcUgX/ehrdkWPuCe3ydNJKS2lx/OggW9TizZ7eEdrWmEFgR6h9286eLAPLqczPkVk6H/uvDB87UGCVWW6Sk3L/TeXljNCzCWyrno6vw8jcqaIIOQNQ7DBWantuEiTTtVWjyRTLxl7idpCVSmrDotDfjzLGQEu6gfkTYIvK7SHlyZlEM9Jzc3O9BI3LrHIn4W/vEH/rGzsmwErxkZ7FRg+M8/xmykqRzkNv+RTqQVr0cU3kZEUnnHvjzaH0qdOBNEdM0w9S0VaSOGXAtHlcu3tJFQF/mv5Wf9aTZGGzH1xr9ab40+CNeMbMxiDe8QpJnEDEAg08y9n7Jk7u/3zjL1fB+WBR625gg/l2FpayHrYeTha2eNPyxP2tjJ3sQN+s3Z2czLzsDRWU9azt7vm7mF2zcJKU9XnpI+Ti6ydnaWspKSkmZWUuZmQJMLaTEhcQgwuZGYGtxKSkrRGwMXgohbm4nAnsFeUk9k1O2srd4/HFp5ujj4K7laO1twgrNbyIuB9kZ+nCVpbW5lLWkrChaQsxBBC4pIWkkIyYtLSQtaW1nC4taS5lKS5tYWZo421u62ZqISkpa2Zu+0FzlFtbKHSFwTudWfrmYdsPO086ndWT779SueT/P5WJGX0C0c3K0cz/MGCtnYuti5mbsDwda3tfh4fmIkHS+Y3sP52HqHI//txg/tgPCqTzt4Yt9NNfAiTrKWM/lB84UTqYHhg7iTShu9Z4dAogPGn+zPE//88Q+C3hC3NPMzAw/ACwWey7a18LBw93UFIgjMBNJq5eRx2sbV2tLpm42F7eEzN8pqZk9U1POScB6j+J5ZqQ9GXc6zPS1pNEB/rt24bG2R4W6URvZFeF9N4nb3RVtTCxczyzO/nSBJw7kN7fO/MRgvHf0Jr4Whm5wSS0goIad5/ICXw8l9JyUzc3NoKboEQsrCUkRISR4iJC0kD10Ki1jLWZmLSUhaS4mLO+L5QNlbXrNzMPJzdvFRszTzU9c5xgoAIubmLwIXFEMJiHn97DGV3zdp5zc7dzuaamYenm5XP4b/P889b9r9mPPR/iCb2ujnxn7r59fH97z71ZCDBbb3pJWXqtEXEHJ5u8iJzj603o6z0Hm5IElHe2PuuwH/67k9i2/9sXDp1YraUXp0yJMPs9jZ7D+djB4mq1obuTS66+82sj/l+oyoIRPLwX6hZ1OJfzvT8iVvgMYlpkEa6wy6SVmRCeVm5Qi4SCsFDCAXgIQR0gPqCEhAw6mgyOyxfq9kpG1f6yO7ZMTN1NoMafoiE/ESERsT6ISiUihgCPwOKYRJCIyJCKjpjK3MVcLoNgW4AHKkoIQ7BKcF7lFRE2lbX3BG0cGrwkoKK9Jybp5WLnQWCEk4O/kLCQGBkCOdgOSQqDkeIwRESYhJikibApQQcISqDv5QwgZ//y+MIGgAW/NdIdF2srilpHnyekop0nxgRx+HH9mA7st8hJwgHp4q2JqfdNc79p+AX4QwkpMCg3ssTQEnI8P8hhJISKkOIro27GQ53GYTpORAtzKiFNH/dQVQvSjrYvrnSX3FH7+v7Dsv5+Gz7o5tPC68cuiLPOdrFxod83y45yBMamjTzzgb3OLgJHlwPpwKAYGeAQnFEBHAIHAZecROxwpmDGE1gDtY9CZMlSqEBD6n8TJvctbSewc+SkAmSQImJSaFQIiU4Ei5/cA2HRiBsPTxcZEVEvABq3xuSsIWzk4iVvbmFmYiLp7mjnQXA1yIAU3t4uos4W7i7AIMD+uMhooJTHHyHkAjODv5ITcRMxJjyNIvKcvJL8ZUVUW23p4wUzrbu6XhEstOAEBMREhCn/23WCUOgUIhGpP+jT0WTaa4PClfeEillWeSev7t66vv0F/NSe/3FeIeHfJh67r7jqrOw9zpiUstGdC/uqmhuFGU9Oql/+d0wbjm0Z2NhyDh1daErdkR+Z6K0iinxZY9b6hg9VmI8D85Vckfj2LkbnPaWLJ2I5mVvxV7Tk33HJyUoOBDyj8lph5e6E8oXyo2eMjDYHjcQVhCdOz3nMslH6UEeS+SGk50msJFTUpAXJ386/0Hl+E0Gx2tHa+8LbQQ6WZ299oQ5jmRsqsKEOzePsuuE0uaMMIPfajAT+zZzjfxo97XSI8msjO7lD+48i+nQyGL4QX68hJnThywy7+X7isJXh5td1H21fPKOjzJcJAqEhxD5Avxivs8vdjtxje039EJkOfJQ3SE4/g+78XF/5xfkAdkSUpEYODt7/P9iEgRCFC4jCheTEccziSRwKY2/BJjk/yRDhkCP/Q4/FD/zNBDgdwoCkATqmOkbcvXqktvfO2zczlpsst9yS4r6SCy2HT0XsmQVNKn0MKVx+CpTM9EUv8Nq86evFNHHtppyH69R8GNJzeUo2sivW12nvpCScCpJRMT8A/OF9ui8e2814gguzpJJThaLZMtvo+N/eJfWTPlKbzByqLLo2Q5v2uSzaK5izr7dXqsOzkiz1Bi+QOZ7ucBXaTsiQhaa8T3H7Stn5pf6PH2JRzfvFbh5iG4yPHiwVXVxt/ejsXZL0Y8MV1i4I2zyI/vC6xNj4tZRNfcZSgJKh8yc3tVc61semhJjMTyBI/RMepwyOMl84g47a7PWC0K6c33L99+4xsTXuBhU0o+/CQ+wZa0jKHMmIIRCoI8t4GZwmp8cTgwnBP78hckvvFrMXzo0qUZCUSKQa3IPPsMnT/kbA/6rDPgLA0Ij/sGABFCIp3SELwud8oKxP0lJlfcXuVvhb+2axpRMxG5y+Ua4otXmY/wNO59MIl66I70NzdLN0nJ0wmeWF1rkB29OxhkzlaD870haxOfbnp9Wa9aV42OMfnjXAWoaIkiq3tZFdB5Z0KtyRFiceabbsDPzEMX4rXssqtSHq3ADZhEk9X5nL5mgqV0voqQ/4LyGbw89EhBTNJ/hefyJl8moddxfD56BPJPx8ssdXy1/yrzjLb2CI4k9SQTtTwg+0Dx/U1+2Xq8I4Xw20qbQ1dfaWqQcY2ZaWKMyuV6gR5pxuypkPt5ZacYx7+FN0qMrsKRGnmHT6uZD2YUE85XxRXYnNuYEJaUdkPWBUTecjtLqpXq38Waol48dGZA+U6MV+kL+WNkXIqRBeKZzOe2NYrkr2VMyHjskws7cTTzbd8UKWJ7lXKWlcx96rRDznHNeRjjPm0hHubGa+cVLIaVj5x6mcmjXXk6hRxt9Cct8qJhsGz1uhxsrq3oQX4k7o+Vp6n7yu+pb6zozPtc5vXzuHi59yeBbBedjc3zIj3wxWvIwFNtkmoTnajJoV+Zxl5U+wWb3Dr3tbZKqOHXjo8Kzp+81nbUdWzX8Zpf1bw/d7O/xh3TaJYtmJyCSkut4J7nI2dkmK0xcJL99EKBPy6p3jm5yGq0iF8CFRPsYPTW7caLKbzptVw+XelnV/MWXEL7prkxrQJ+fc/fIsPNw9zjn7AAwdHCGhZeZ40UWOXgIixQcIByAV1mEf5IOKUF6CAsM+OkIAZQQL4jIr0ZoQK0IiQgA3oYHh5JQ7j9JTgslSvcgcoO7EEChe09F7DqSQuGIv71ExGmqPNkQq63yIYJRGBl2QfGkdNNF6VKFMCtfCw/3RIXcSAI6yD0dG2FGT1sKM/mPHH3FNXKsNKJwUXEEHCEFl0KIS4ibEJBDRtfXG6/SHldPD2EghIeQVAOyNWtPrtJSPrWuNnmFTox8szlNNCpG9DszUAJw/1VqIVjgTHihxkCtamdjpwKYWCc5Na9ZCCPk4DJ4wcggenCDExB77h5Wlpzq4pwGhkricBlJTkMNJcCg4jxn52Rl6GHm5AIITk4VpX3jREZUEo5vgNwVkwDksISomISMhIwJXPmvQNDhRQIABNlBXwhOOMde9yy/ugc6cQc74QQRAqiSf8pbAlDeEgDyFpjMGnv3tLVEroIk+KtLThMXHz+f2r0DY22MkrO/P5pdt0sB51ShryFr9DjtjYmZLUKMX3fSvGAm+FQspjOVstM3Ud1YTEuuV+Wh2g8FMmW7bQ8vubf8PzKov992Ep7lafq0q1wsaZsrQNiD2Q2MY/h21E53sDU9JagEx/qK0TnQIMBseNT3Pcxr+qS2X3bqp9cXp/UvxtZoGy6+SxnkLL/w1j+s7VV3n34nv4lxza0In/U5BOtZtL5Pn39YaLJf1PiPrY3+zmK6cI3CwEKps6LNsZcytJ4mo8wHkIwvM3LXv74K4DCe0WCJ9ZW54KN+7sctEgFCOc1sA5jHIBGGbsqfZZXYjs2zIyFXdXhBIy1OidkzUJBwUfXDIcH8C/GOzy8ey3tVw3X8C73oGTYJFFcbJ+GNANfKU2fs3D0/+tBtNz1NPPtoVtr9yo0bHzevcH/wat1MM+V+Y5b/JvToDPdYRvpwTKYF+1dzp3W7ibmWK6k0PcRjQYMKZD/q7WrtDVV94n9wzZDweKUSk7UImnYn+b8/1D1fKa0oTFfU+pbP9VIsdy1bFG8mr/eXd+pHvnzIzdccvaKqVlvleI5Krdq+sElRkre4T0dyUlKUsT1GiktCeVrvDGT60qf518ZksOfFRwZPmM8ExLbv8hnNODLr8iW2JaF5tdqZ73e2PaTrD77hhn2kEhHGP765p29CoDGABo78q4ogDfqblcmMt/rAq98NPzI4J/g7J9FhOAucjITEJpgKCjxO+TuL/666XjEPOJ0NF3EX8EoR8bxpzxmb2uL8m+pKMz5J6E3NzxRnnW1x5bvuXZhX+iW4CXgbRmQI14frpp9N14rQ3LdZLdwcxYQtAdq3AGgfb7YeMMI+G6qL7zPhHg/+zoIqSsLA6/DguN9s4+BQeHAQ/Phv1jHrfk+g3fuXnuAXfj5FEKF9AI8ZeNv9fwskj78JI7xmli/igHndvzQqHUavPqByZ41u8IEOGXsXv25Hz2e/YC3eKwU+3TF37l232G48lnH+xFd+gfpnP0isTZ8aBTsr/ciXF3947l6IlSDVYwPljHiv5OaSnRqhnOyzTifOy/WSsJC2MwiXc0S+m77iWVLffrm3LZDJ/tlkdXhBvgmn4JmbSwRmkbgnVIpkHj/e3oksFDn+QTbE57psVQjyHCPBqkHVjRPnJsnP3xxQT9B33unw/hHLenaGxXC9yeHjeR5y4XanGlLMA7jcRBCKKeGBZz4pz3zwOUTUYUOjmzP+JYN+PdNE6XWBugV25U2HEqcM1KvaN4S8MUOvLccp3q2cg4aVtWgmv2idTurEHbba8Xm/kvTOaBqKsfzm65wj/ED/xzHB7LxHqomz3ONipAW1Sbo7DpeqXKITe/jSRibuM46d9VXjVPSY8RwoPMVFZka43eh4kSjKNOXakfAYJsKMFyaEamZ5lFRHp1N0PXvC497FJEq2u2UYvL921Pv0FBut/ffNE9yXItUVwgsMWOYl7yiPBXbS3W4Py3IrZKmqbM+6VJFCMR5cwrxxdOQOk97nomT2uqyovNoRspfSNGMd5wlKP2oQec6Qinvs3vNSIULeCy4NHEQvk0iFVBzFemB2JSx9kTb3Twsvu6g8byZld8t0bEO2ug4fcrdMX2J/62NEoFVlx6xTXyibBeivp4D+StrXX6SSUhXHz/l/VC/c5bc+ceXS3/WX+V9VBxPeYwNUB9VPPQGoLwTAsXjTnYHW29v7LzSL4MLzLKBZWP+h2EAfA9BuePUFuAiiYr/UlxRwKXqgvv5HdOh/0m9vIiRINJ/Vybtp6hs18xA2Lt2Ryr+nn9HXHdqVqp3plF7SHrppskaXocqkjMqKWrbdClh+eIMS/QiWSiMG02Og5HVPctowziMI2FUpD/tEt+he+uy7YFBY9DHWodlP8o0s6ILDggrKn21uz+jLL/Sd753kF5rtKX3uOQkjsbqVINAzMGc3NBAXeRriN6iqdOOzv72x74LU9TTTwrapMMtygyUv9XWz0MNfUOXnKLlsr0lxVSkWosq+ngl4vypDb/ODOtvCcSynif2d5KHLHyaO5NVZeijm1ro1vdKBlT6/cPY6tj/WPb7wpMxItkbfQgmCId9YIIlPeDUyJ1bHi8mI1yWZF53Ops6pMqpiEeTneY2PJy5ZVpru2dpa6oTcpbngr8cYB0JONN/FpH8dVch035qEmTgmLBkk0gle8FDkL3BXeT90JuOog3STwPLbJ0nuyrZpL04/eyT7+APhN8xC5qm3yp9ZNdCM4h3d2gU/HshjqV9antjy5D+uNK+MIX5orWmgt6K/LKl5Noaz+6SxxHXBvGW1q9Xcty6sfzb7Go+Vqd0sg2dr908nn7mg0EMYhX0W23NFy4teP771JpXcpehjeXW8ZJuMtPSEASjuKstRi285wwpr9R5lSA5yr7kC09OeI1cfXyCH8kOow859fz9t2nIFTv/6dOrzHq/KbmqH+1TdYuXvSg/0mymg3y7C6X/qMzI4CfAHtGZ/qZ5/1Uy/q665/tGQbldTS+0hYRvk5Kvkp0dpdP/hVv3L2ggZ3Ps3HeMAt/svNYzSbxpG4v+DhgE5VF0cr0pU9jTnKbgsXDpdMl08QvS/1Zw/P+L4Xyj4f9FYARdv18a/cE7OVz0GDbTu+8ilPFzCKkx7lqEDbvgew7rdrGc6oiWw7RJ96ImA3Y5dXQc76bTC1ZaPlOOXL/U7RW6FcfKII2zevaBPcm7U0zZnpyILyWN+nX++g8n9FvQYz/tEO6S697abB2M/rkA3+qRvQfg7FdT81RdPdO9Yp55M/RZdOL57s9qSN9Lx7utH/p0uFP4/8qo9dV+ZrOfTlplO4/jP3Vj4EO3qZfWpfcHtMfdWLV+I6tP7fEcKjnPw1lV8PTG7llp6/X7w4/MRBRRqrUONt9Ink7e3cx65FTc219XZuw68YQgib3yR9i4y8niV7mPNSm/rO4tuD6e1CAxypQLjDQvl2Mk0aRLeyfh+wfFY3Oc7KY90yF20blB6p/tC8QEXl2JnBcPxd5/ZfWTHUovGxV3v9vM6jEm7F+RAdV8j5XyKtIu2GxP95ilQYjKRSj6+0tMPh79w77Lz9zRvTi0mo7YFPwYunX7keZKD7yTvoDOTH8fhGMmX8b0TSyz3L751WZDCJEOGOAHTb/uqDXOG9asvRrWyAhElyemC84lKFbIfmJIR5ebkNBSvgwcYsJisrmXjgWqirZCvokNENxYg70zrNzu50RDKMS8C3oEFKy/lHIFIcnXBCTRbVjjNTnLSmtE5QVjQVu0SteB433a+iCrTmUkGavZBKWm2DMG1+T7/HXgI8S1AY3nuayzqB6y3NzuFJn8M6o2QKbKa/H0Vy+p/V2MdLMwyHPn5hpK7u6cboEY0VfeU1r7PJQqXBpzOn0oLgUAATti+0vqfUJz/SWdhJuLcbb9WjZmeOQU/BrcTm6vP5RFu5ZJfiv54sX5YIFf+QoFXyrunfkfCDjXCYctHsqSZZ8+/uefEXlB2fektXfcYqo/4lAGNAexNKlN2YE1avjHzRSO3Ytt4l/qyV5737d1FE7poVWmFh0KWScMmPOScXEeEqI585/zQysluISD0fu6KTkv8BpfZA/FZ4jdX5i6xVc+2drwrFFdElfpaf/du0cizNjZOO3fhNpVghW4ufOD897d+pqNFrbpXxiUmEW2f4q98vh0b9OnFnWTFuOsNPs0vShuf27NKE9Le+tgrlSVMHBC1GqJAe8elwChESbR/kMj9xLU7UH8u7d7qp0cIPU19rAdkEaopYooYsn4Tzaz6ifx0my9ZfNUZujLP6S6wrB+/fDrWcr3OLsor2Uv+oqmyV+SNe3a+GgvfMumPWKd4vP2qxTFJbfF0ovfH3buyqfKfIWNqPDdepKgeFgysTSjvNnOaFRtoGtIigrQHHE1siF3nKiujq6hCL3246XJS6eqTUgtW1UQ2L/PAtaCS7SnLHLGuG6TDrysmVLJYX+Z4Q4dpEqi42MvOCfDccBynNtBX96jhLXyh5PnVtxB1C9la3aNER39pnFZvFtH01o35GPmQv7Yn0mKOC9XIqe/gXFoQEaNb36eGesS5k8HRVBubWRpIwXt/dcxOJJldaHUgv4x9/MiBzpIFdJbkP9cBfymsf9VHvysstdnM4pW7bSEIIf2Y3FyuR8tOLTT/UFjXf9NNTnCH/1I3qfymm6T+G920z4yaqntr1HjtpLannRTggH5KB/RThPh/1E7//IwjnG5PP1HAAa1OQgT8F/Jvuwsu6RiVy0aT0qj0xx5H5F8w969jjElfpxRmRJ6cC7+Sz1Z1bCOSze7csfmsKG+n12yMKwxnfEWEKqR/rOCCKjcy1pfcvh6vNiBs0ek88XVL6HzH5sp6Idw3JabsSm9Hl4rqAxWu2SS3DI3y+22PdHNJCBm8+VR7J9FTF/MWMCKUOdNL4qfm1gmbI/O6tRUPS5y2tztX8jLj/O25rA/yU6Wfd49+XPE2uXzupvOPDD35HS9y27A057eDnLckrh4lIGzjLCm8kE6taNGUfKyu7OKqkUMHX4Gj13tnbqGVQFd7bodjOPqX54T4Aj/KDiy8iEzavdR1uZC14WyaewU0P834yRX+kcoERAihFzyE0I0ACoV7/49Y5/++zvbbUl96cBec7edMkRMiDv1luRB+9Nc9YgQNuFz22wofXPC3hwmoEEfhbHCA6okYB3vCv5sPdiv4ja25auhFHv8QcUkNLvLrU0SIY0ScSGFb0+vnP7bkNomoC788OaVqyFZ9pNKXJ3q+bmzGzkkcLvX710UQ/HBeOKBiiDi9vNLylixEYCqUstzwp33nPbH97oPEfVaVxPHJKrEpg38T7UQhBBDkUE3X547u9USHrUpzZmNSo7ZB+k/fsrxDlOgJbTvoY8z6KW7YEX96FE088/6QgvaxYJe+RMbzIhP9x25JbwsnXOAPJnVenH4SHEh5gtfp6cfzjUb8Y6pvjucOKEnEbdtiGVQnyUylax++yU97pGPM1x6OzqeuYDB57znj+eVi3buRy0ddxRosN3+cf/ZV1aAn8SknjXPCtfkryX2TK0JPSBQ6Wk/pFAQxWFz/SCz2SoTQcajB/FuvLCGa5uGgrMU5w2u4IbXo65sCk4tPYXdqz8GlGG5GHFVveBBB+UHD+mN8GpY6kY79lVSU+9L3m1/G9ZFfRHU7f7jpvvFoaEFxhi+u3Do+/02zX/r+RZq0cs2AMYdjNB4qoXqIO+no4AfSEbP8ifG3DDMkDpnsKEesHaK5H1ylbNbDqFPVKB5teRrXtCxXXa7x8Xyo5SeqQ53nomzflr99Kv0lIBBSY8p3teqquPEp4eRS0/fDYSYcl/kGxe/94CYdX1yZ6LRwTbJ7/f3Kp/h4RTYXLpv3iayctLGTLp/lHFZWLi8IRrwOmW6yWzeT8Corq4KMwa8rfF9ZP3uC4ej1DR7J1XgG1WvKpLwPJOMHpqIqa01ne3WyHt+kID7qwj3ufKdhFWKc+Ib0QevIsYdFa2/KlNTtRZwsb2l+f6+cYE6WcJr7IecjPpHygMKJJZkBrgVuFwsw8uIicxjkT/vT/rQ/7U/70/60P+1P+9P+tD/tT/vT/rQ/7U/70/60P+1P+9P+L7W1C4rvDqtDeGe03dQ0Y1YuntucOdLzrvdpgfPoyQztlm+Tg/qLSf0DfuUcdtJiQ5iq6Mk5e+6U6nMfrUc/oe/c8WFx+gH5X9a9lqg=",  # noqa: E501
 }
@@ -0,0 +1,281 @@
+import importlib
+import re
+from typing import List
+
+try:
+    import re._parser as sre_parse
+except ImportError:
+    import sre_parse
+
+from constants import REGEX_ENGINES
+
+_LINEAR_FLAGS: int = re.IGNORECASE | re.MULTILINE | re.DOTALL | re.UNICODE
+
+
+class RegexEngine:
+    """
+    Движок регулярных выражений с интерфейсом модуля re.
+
+    Модуль движка импортируется лениво при первом обращении,
+    поэтому отсутствующие необязательные пакеты не мешают запуску.
+    Скомпилированные выражения должны поддерживать `finditer(text,
+    pos)`, `findall` и объекты совпадений с `groups`, `group`,
+    `lastgroup` и `string`.
+
+    Атрибуты:
+    name (str): Имя движка.
+    module_name (str): Имя модуля движка.
+    linear (bool): Движок гарантирует линейное время поиска.
+
+    ************************************************
+
+    A regular expression engine with the interface of the re module.
+
+    The engine module is imported lazily on first use, so missing
+    optional packages do not get in the way of startup. Compiled
+    expressions must support `finditer(text, pos)`, `findall` and
+    match objects with `groups`, `group`, `lastgroup` and `string`.
+
+    Attributes:
+    name (str): The engine name.
+    module_name (str): The name of the engine module.
+    linear (bool): The engine guarantees a linear-time search.
+    """
+
+    name: str = "re"
+    module_name: str = "re"
+    linear: bool = False
+
+    def __init__(self) -> None:
+        """
+        Инициализация движка без импорта его модуля.
+
+        ************************************************
+
+        Initializing the engine without importing its module.
+        """
+
+        self._module = None
+        self._loaded = False
+
+    @property
+    def module(self):
+        """
+        Возвращает модуль движка или None, если он не установлен.
+
+        ************************************************
+
+        Returns the engine module or None if it is not installed.
+        """
+
+        if not self._loaded:
+            try:
+                self._module = importlib.import_module(self.module_name)
+            except ImportError:
+                self._module = None
+            self._loaded = True
+        return self._module
+
+    def available(self) -> bool:
+        """
+        Возвращает True, если модуль движка установлен.
+
+        ************************************************
+
+        Returns True if the engine module is installed.
+        """
+
+        return self.module is not None
+
+    def supports(self, pattern, flags: int = 0) -> bool:
+        """
+        Проверяет, что движок выполнит шаблон с той же семантикой,
+        что и модуль re.
+
+        ************************************************
+
+        Checks that the engine runs the pattern with the same
+        semantics as the re module.
+        """
+
+        return True
+
+    def compile(self, pattern, flags: int = 0):
+        """
+        Компилирует шаблон.
+
+        ************************************************
+
+        Compiles the pattern.
+        """
+
+        return self.module.compile(pattern, flags)
+
+
+class RE2Engine(RegexEngine):
+    """
+    Движок RE2 с линейным временем поиска (пакеты google-re2
+    или pyre2, модуль re2).
+
+    Принимаются только строковые шаблоны без флагов компиляции
+    и без конструкций, которые RE2 не поддерживает или понимает
+    иначе, чем re: обратных ссылок, опережающих и ретроспективных
+    проверок, атомарных групп, привязок и границ слова, а также
+    классов `\\w`, `\\d` и `\\s`, которые в RE2 относятся только
+    к ASCII. Остальные шаблоны выполняются следующим движком.
+
+    ************************************************
+
+    The RE2 engine with a linear-time search (the google-re2
+    or pyre2 packages, the re2 module).
+
+    Only string patterns without compile flags are accepted, and
+    only without constructs that RE2 lacks or reads differently
+    from re: backreferences, lookahead and lookbehind assertions,
+    atomic groups, anchors and word boundaries, and the `\\w`, `\\d`
+    and `\\s` classes, which are ASCII-only in RE2. Other patterns
+    are run by the next engine.
+    """
+
+    name: str = "re2"
+    module_name: str = "re2"
+    linear: bool = True
+
+    def supports(self, pattern, flags: int = 0) -> bool:
+        """
+        Проверяет шаблон по дереву разбора sre_parse.
+
+        ************************************************
+
+        Checks the pattern against the sre_parse tree.
+        """
+
+        if flags or not isinstance(pattern, str):
+            return False
+        try:
+            parsed = sre_parse.parse(pattern)
+        except (re.error, RecursionError):
+            return False
+        if parsed.state.flags & ~_LINEAR_FLAGS:
+            return False
+        return _linear_items(parsed)
+
+    def compile(self, pattern, flags: int = 0):
+        """
+        Компилирует шаблон без флагов: их интерфейсы различаются
+        в разных обёртках RE2.
+
+        ************************************************
+
+        Compiles the pattern without flags: their interfaces
+        differ between the RE2 wrappers.
+        """
+
+        return self.module.compile(pattern)
+
+
+class RegexPackageEngine(RegexEngine):
+    """
+    Движок пакета regex. Используется для шаблонов, которые модуль
+    re не может скомпилировать, например со свойствами `\\p{L}`.
+
+    ************************************************
+
+    The engine of the regex package. Used for patterns that the re
+    module cannot compile, for example with `\\p{L}` properties.
+    """
+
+    name: str = "regex"
+    module_name: str = "regex"
+
+
+ENGINES = {
+    engine.name: engine
+    for engine in (RE2Engine(), RegexEngine(), RegexPackageEngine())
+}
+
+
+def compile_with_engine(pattern, flags: int = 0):
+    """
+    Компилирует шаблон первым подходящим движком из REGEX_ENGINES.
+
+    Движки перебираются по порядку: сначала линейный RE2, если
+    он установлен и шаблон с ним совместим, затем стандартный re,
+    затем пакет regex. Если шаблон не компилируется ни одним
+    движком, выбрасывается ошибка модуля re.
+
+    Аргументы:
+    pattern (str): Регулярное выражение.
+    flags (int): Флаги модуля re.
+
+    Возвращает:
+    Скомпилированное выражение выбранного движка.
+
+    ************************************************
+
+    Compiles the pattern with the first suitable engine
+    of REGEX_ENGINES.
+
+    The engines are tried in order: the linear RE2 first if it is
+    installed and the pattern is compatible with it, then the
+    standard re, then the regex package. If no engine compiles the
+    pattern, the error of the re module is raised.
+
+    Arguments:
+    pattern (str): A regular expression.
+    flags (int): The flags of the re module.
+
+    Returns:
+    The compiled expression of the chosen engine.
+    """
+
+    errors: List[Exception] = []
+    for name in REGEX_ENGINES:
+        engine = ENGINES[name]
+        if not engine.available() or not engine.supports(pattern, flags):
+            continue
+        try:
+            return engine.compile(pattern, flags)
+        except Exception as error:
+            errors.append(error)
+    for error in errors:
+        if isinstance(error, re.error):
+            raise error
+    if errors:
+        raise re.error(str(errors[-1]))
+    raise re.error("No regular expression engine is available.")
+
+
+def _linear_items(items) -> bool:
+    """
+    Рекурсивно проверяет, что разобранный шаблон не содержит
+    конструкций, несовместимых с RE2.
+
+    ************************************************
+
+    Recursively checks that the parsed pattern contains no
+    constructs incompatible with RE2.
+    """
+
+    for op, av in items:
+        if op in (
+            sre_parse.LITERAL, sre_parse.NOT_LITERAL, sre_parse.ANY
+        ):
+            continue
+        elif op is sre_parse.IN:
+            if any(code is sre_parse.CATEGORY for code, _ in av):
+                return False
+        elif op is sre_parse.BRANCH:
+            if not all(_linear_items(item) for item in av[1]):
+                return False
+        elif op in (sre_parse.MAX_REPEAT, sre_parse.MIN_REPEAT):
+            if not _linear_items(av[2]):
+                return False
+        elif op is sre_parse.SUBPATTERN:
+            if (av[1] | av[2]) & ~_LINEAR_FLAGS:
+                return False
+            if not _linear_items(av[3]):
+                return False
+        else:
+            return False
+    return True
@@ -0,0 +1,579 @@
+import mmap
+import multiprocessing
+import os
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterator, List, Optional, Tuple
+
+from constants import (DECODE_ERRORS, GUARD_CHUNK_SIZE, GUARD_POLL_INTERVAL,
+                       GUARD_START_METHOD, PARALLEL_RANGE_SIZE,
+                       SEARCH_MEMORY_LIMIT, SEARCH_TIMEOUT, SEARCH_WORKERS,
+                       WORKER_BATCH_SIZE)
+from logic import (Match, SourceReader, _MappedRange, _range_encoding,
+                   _range_matches, _resolve, file_size, find_words_mmap,
+                   find_words_stream, iter_spans_stream, line_ranges)
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+MATCHES: str = "matches"
+POSITION: str = "position"
+DONE: str = "done"
+ERROR: str = "error"
+MEMORY: str = "memory"
+
+TIMED_OUT: str = "timed out"
+OUT_OF_MEMORY: str = "exceeded the memory limit"
+TERMINATED: str = "terminated"
+
+
+class GuardedSearch:
+    """
+    Поиск в отдельном процессе с ограничением времени и памяти.
+
+    Регулярное выражение выполняется в дочернем процессе, который
+    читает источник небольшими блоками и передаёт совпадения
+    пачками вместе с позицией в байтах. Если поиск не укладывается
+    в отведённое время или память, процесс завершается, а уже
+    найденные совпадения остаются у вызывающего. Так шаблон
+    с катастрофическим возвратом, например `(a+)+$`, не может
+    заблокировать приложение.
+
+    Ограничение памяти задаётся через RLIMIT_AS и действует только
+    там, где доступен модуль resource. Когда файл отображается
+    в память (use_mmap или byte_range), к пределу добавляется
+    размер файла: отображение занимает адресное пространство,
+    но не память процесса.
+
+    Атрибуты:
+    pattern (str): Регулярное выражение для поиска или набор
+    шаблонов MultiPatternMatcher.
+    filepath (str): Путь к файлу, если источник — файл.
+    text (str): Текст, если источник — строка.
+    encoding (str): Кодировка файла или текста; для файла None
+    означает определение по началу файла.
+    errors (str): Политика обработки ошибок декодирования файла.
+    timeout (float): Предел времени в секундах или None.
+    memory_limit (int): Предел памяти процесса в байтах или None.
+    spans (bool): Возвращать позиции совпадений с номерами строк
+    и столбцов вместо самих совпадений.
+    use_mmap (bool): Искать в файле, отображённом в память,
+    как find_words_mmap. Позицией тогда считается конец последнего
+    найденного совпадения.
+    byte_range (Tuple[int, int]): Искать только в диапазоне байтов
+    файла, выровненном по строкам, как find_words_parallel.
+    count (bool): Подсчитывать совпадения в дочернем процессе
+    и возвращать счётчики Counter вместо самих совпадений.
+    position (int): Позиция в байтах, до которой дошёл поиск.
+    stopped (str): Причина остановки или None, если поиск
+    завершился сам.
+    read_time (float): Время чтения файла в дочернем процессе.
+    decode_time (float): Время декодирования файла в дочернем
+    процессе.
+
+    ************************************************
+
+    A search in a separate process with a time and memory limit.
+
+    The regular expression runs in a child process that reads
+    the source in small chunks and hands matches over in batches
+    together with the byte position. If the search does not fit
+    into its time or memory budget, the process is terminated and
+    the matches found so far stay with the caller. This way a
+    catastrophically backtracking pattern such as `(a+)+$` cannot
+    lock up the application.
+
+    The memory limit is set through RLIMIT_AS and only applies
+    where the resource module is available. When the file is mapped
+    into memory (use_mmap or byte_range), the file size is added to
+    the limit: the mapping takes address space but not process
+    memory.
+
+    Attributes:
+    pattern (str): A regular expression for the search or a
+    MultiPatternMatcher set of patterns.
+    filepath (str): The file path if the source is a file.
+    text (str): The text if the source is a string.
+    encoding (str): The encoding of the file or the text; for a file
+    None means detecting it from the start of the file.
+    errors (str): The decoding error policy for the file.
+    timeout (float): The time limit in seconds or None.
+    memory_limit (int): The process memory limit in bytes or None.
+    spans (bool): Return match positions with line and column
+    numbers instead of the matches themselves.
+    use_mmap (bool): Search the file mapped into memory, like
+    find_words_mmap. The position is then the end of the last match
+    found.
+    byte_range (Tuple[int, int]): Search only a line-aligned byte
+    range of the file, like find_words_parallel.
+    count (bool): Count the matches in the child process and return
+    Counter objects instead of the matches themselves.
+    position (int): The byte position the search has reached.
+    stopped (str): The reason the search was stopped or None
+    if it finished on its own.
+    read_time (float): The file reading time in the child process.
+    decode_time (float): The file decoding time in the child process.
+    """
+
+    def __init__(
+            self, pattern,
+            filepath: Optional[str] = None,
+            text: Optional[str] = None,
+            encoding: Optional[str] = None,
+            timeout: Optional[float] = SEARCH_TIMEOUT,
+            memory_limit: Optional[int] = SEARCH_MEMORY_LIMIT,
+            spans: bool = False,
+            errors: str = DECODE_ERRORS,
+            use_mmap: bool = False,
+            byte_range: Optional[Tuple[int, int]] = None,
+            count: bool = False
+    ) -> None:
+        """
+        Инициализация поиска. Шаблон компилируется сразу, чтобы
+        ошибки в нём сообщались до запуска процесса.
+
+        ************************************************
+
+        Initializing the search. The pattern is compiled at once
+        so that its errors are reported before the process starts.
+        """
+
+        if (filepath is None) == (text is None):
+            raise ValueError("Either a file or a text must be given.")
+        _resolve(pattern)
+        self.pattern = pattern
+        self.filepath = filepath
+        self.text = text
+        self.encoding = encoding
+        self.errors = errors
+        self.timeout = timeout
+        self.memory_limit = memory_limit
+        self.spans = spans
+        self.use_mmap = use_mmap
+        self.byte_range = byte_range
+        self.count = count
+        self.position = byte_range[0] if byte_range else 0
+        self.stopped: Optional[str] = None
+        self.read_time = 0.0
+        self.decode_time = 0.0
+        self._process = None
+        self._receiver = None
+
+    def start(self) -> None:
+        """
+        Запускает дочерний процесс, если он ещё не запущен. Процесс
+        ищет, пока канал не заполнится, и ждёт, пока совпадения
+        не начнут забирать через matches.
+
+        ************************************************
+
+        Starts the child process unless it is already running. The
+        process searches until the pipe is full and waits for the
+        matches to be taken through matches.
+        """
+
+        if self._process is not None:
+            return
+        context = multiprocessing.get_context(GUARD_START_METHOD)
+        receiver, sender = context.Pipe(duplex=False)
+        self._process = context.Process(
+            target=_guarded_scan,
+            args=(
+                sender, self.pattern, self.filepath, self.text,
+                self.encoding, self.errors, self.memory_limit, self.spans,
+                self.use_mmap, self.byte_range, self.count
+            ),
+            daemon=True
+        )
+        self._process.start()
+        sender.close()
+        self._receiver = receiver
+
+    def close(self) -> None:
+        """
+        Завершает дочерний процесс и закрывает канал.
+
+        ************************************************
+
+        Terminates the child process and closes the pipe.
+        """
+
+        if self._process is None:
+            return
+        if self._process.is_alive():
+            self._process.terminate()
+        self._process.join()
+        self._receiver.close()
+        self._process = None
+        self._receiver = None
+
+    def matches(
+            self,
+            cancelled: Optional[Callable[[], bool]] = None,
+            progress: Optional[Callable[[int], None]] = None
+    ) -> Iterator:
+        """
+        Запускает дочерний процесс и возвращает совпадения по мере
+        их поступления. Предел времени отсчитывается от начала
+        чтения совпадений.
+
+        Аргументы:
+        cancelled (Callable): Функция, возвращающая True, если
+        поиск нужно прервать.
+        progress (Callable): Функция, получающая позицию в байтах.
+
+        Возвращает:
+        Iterator: Совпадения или их позиции в порядке появления.
+
+        ************************************************
+
+        Starts the child process and returns the matches as they
+        arrive. The time limit counts from when the matches start
+        being read.
+
+        Arguments:
+        cancelled (Callable): A function returning True if
+        the search should be interrupted.
+        progress (Callable): A function receiving the byte position.
+
+        Returns:
+        Iterator: The matches or their positions in order
+        of appearance.
+        """
+
+        self.start()
+        process = self._process
+        receiver = self._receiver
+        deadline: Optional[float] = None
+        if self.timeout is not None:
+            deadline = time.monotonic() + self.timeout
+        try:
+            while True:
+                if cancelled is not None and cancelled():
+                    return
+                wait: float = GUARD_POLL_INTERVAL
+                if deadline is not None:
+                    remaining: float = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self.stopped = TIMED_OUT
+                        return
+                    wait = min(wait, remaining)
+                if not receiver.poll(wait):
+                    if not process.is_alive() and not receiver.poll():
+                        self.stopped = TERMINATED
+                        return
+                    continue
+                try:
+                    kind, payload = receiver.recv()
+                except EOFError:
+                    self.stopped = TERMINATED
+                    return
+                if kind == MATCHES:
+                    yield from payload
+                elif kind == POSITION:
+                    self.position = payload
+                    if progress is not None:
+                        progress(payload)
+                elif kind == MEMORY:
+                    self.stopped = OUT_OF_MEMORY
+                    return
+                elif kind == ERROR:
+                    raise payload
+                elif kind == DONE:
+                    self.read_time, self.decode_time = payload
+                    return
+        finally:
+            self.close()
+
+    def report(self) -> Optional[str]:
+        """
+        Возвращает сообщение о причине остановки поиска или None,
+        если поиск завершился сам.
+
+        ************************************************
+
+        Returns a message about why the search was stopped or None
+        if it finished on its own.
+        """
+
+        if self.stopped is None:
+            return None
+        source: str = self.filepath or "text"
+        return f"{source}: search {self.stopped} at byte {self.position}"
+
+
+def guarded_search_files(
+        pattern, filepaths: List[str],
+        workers: Optional[int] = SEARCH_WORKERS,
+        encoding: Optional[str] = None,
+        timeout: Optional[float] = SEARCH_TIMEOUT,
+        memory_limit: Optional[int] = SEARCH_MEMORY_LIMIT,
+        cancelled: Optional[Callable[[], bool]] = None,
+        errors: str = DECODE_ERRORS,
+        count: bool = False
+) -> Iterator[Tuple[str, Iterator, GuardedSearch]]:
+    """
+    Ищет в нескольких файлах, запуская для каждого отдельный
+    процесс с ограничениями. Файлы ищутся и возвращаются от самого
+    большого к самому маленькому. Одновременно работает не более
+    workers процессов: пока читаются совпадения одного файла,
+    следующие уже ищутся и ждут, когда заполнится их канал,
+    поэтому совпадения не копятся в памяти. Совпадения каждого
+    файла нужно прочитать до перехода к следующему. Зависший
+    шаблон останавливает только свой файл. С count процессы
+    возвращают счётчики Counter вместо совпадений.
+
+    ************************************************
+
+    Searches several files, starting a separate limited process
+    for each one. The files are searched and returned from the
+    largest to the smallest. At most workers processes run at the
+    same time: while the matches of one file are read, the next ones
+    are already searching and wait once their pipe is full, so the
+    matches never pile up in memory. The matches of every file must
+    be read before moving on to the next one. A hanging pattern only
+    stops its own file. With count the processes return Counter
+    objects instead of the matches.
+    """
+
+    if workers is None:
+        workers = multiprocessing.cpu_count()
+    searches: List[GuardedSearch] = [
+        GuardedSearch(
+            pattern, filepath, encoding=encoding, timeout=timeout,
+            memory_limit=memory_limit, errors=errors, count=count
+        )
+        for filepath in sorted(filepaths, key=file_size, reverse=True)
+    ]
+    try:
+        for number, search in enumerate(searches):
+            for ahead in searches[number:number + max(workers, 1)]:
+                ahead.start()
+            yield search.filepath, search.matches(cancelled), search
+            search.close()
+    finally:
+        for search in searches:
+            search.close()
+
+
+def guarded_search_ranges(
+        pattern, filepath: str, encoding: str,
+        workers: Optional[int] = SEARCH_WORKERS,
+        range_size: int = PARALLEL_RANGE_SIZE,
+        timeout: Optional[float] = SEARCH_TIMEOUT,
+        memory_limit: Optional[int] = SEARCH_MEMORY_LIMIT,
+        cancelled: Optional[Callable[[], bool]] = None,
+        errors: str = DECODE_ERRORS
+) -> Iterator[Tuple[List[Match], GuardedSearch]]:
+    """
+    Ищет в одном большом файле параллельно по диапазонам строк,
+    как find_words_parallel, но каждый диапазон ищется в отдельном
+    процессе с ограничениями. Одновременно работает не более
+    workers процессов, а результаты возвращаются в порядке файла.
+    Предел времени общий для всего файла; после первой остановки
+    оставшиеся диапазоны не запускаются.
+
+    Подходит только для файлов, которые принимает parallel_encoding.
+
+    ************************************************
+
+    Searches one large file in parallel over ranges of lines, like
+    find_words_parallel, but every range is searched in a separate
+    limited process. At most workers processes run at the same time,
+    and the results are returned in file order. The time limit
+    covers the whole file; after the first stop the remaining ranges
+    are not started.
+
+    Only suitable for files accepted by parallel_encoding.
+    """
+
+    deadline: Optional[float] = None
+    if timeout is not None:
+        deadline = time.monotonic() + timeout
+    stopped_at: List[int] = []
+
+    def run(byte_range: Tuple[int, int]) -> Tuple[List[Match], GuardedSearch]:
+        def stop() -> bool:
+            if stopped_at and byte_range[0] > min(stopped_at):
+                return True
+            return cancelled is not None and cancelled()
+
+        remaining: Optional[float] = None
+        if deadline is not None:
+            remaining = deadline - time.monotonic()
+        search = GuardedSearch(
+            pattern, filepath,
+            encoding=(
+                encoding if not byte_range[0] else _range_encoding(encoding)
+            ),
+            timeout=remaining, memory_limit=memory_limit, errors=errors,
+            byte_range=byte_range
+        )
+        matches: List[Match] = []
+        if stop():
+            return matches, search
+        if remaining is not None and remaining <= 0:
+            search.stopped = TIMED_OUT
+        else:
+            matches = list(search.matches(stop))
+        if search.stopped is not None:
+            stopped_at.append(byte_range[0])
+        return matches, search
+
+    with open(filepath, "rb") as in_file:
+        size: int = os.fstat(in_file.fileno()).st_size
+        if not size:
+            return
+        with mmap.mmap(
+            in_file.fileno(), 0, access=mmap.ACCESS_READ
+        ) as mapped:
+            ranges: List[Tuple[int, int]] = line_ranges(
+                mapped, size, range_size
+            )
+    if workers is None:
+        workers = multiprocessing.cpu_count()
+    with ThreadPoolExecutor(max_workers=max(workers, 1)) as executor:
+        try:
+            yield from executor.map(run, ranges)
+        finally:
+            stopped_at.append(-1)
+
+
+def _guarded_scan(
+        sender, pattern,
+        filepath: Optional[str], text: Optional[str],
+        encoding: Optional[str], errors: str,
+        memory_limit: Optional[int], spans: bool = False,
+        use_mmap: bool = False,
+        byte_range: Optional[Tuple[int, int]] = None,
+        count: bool = False,
+        batch_size: int = WORKER_BATCH_SIZE
+) -> None:
+    """
+    Выполняет поиск в дочернем процессе и отправляет совпадения
+    и позицию через канал. Перед каждым блоком отправляются
+    накопленные совпадения и позиция его начала, поэтому при
+    остановке известно, где именно застрял поиск. В конце
+    отправляется время чтения и декодирования файла. Поиск
+    с use_mmap блоков не читает, и его позиция — конец последнего
+    совпадения. С count каждая пачка совпадений отправляется
+    как счётчик Counter.
+
+    ************************************************
+
+    Runs the search in the child process and sends the matches
+    and the position through the pipe. Before every chunk the
+    pending matches and the position of its start are sent, so
+    it is known where exactly the search got stuck when stopped.
+    The reading and decoding time of the file is sent at the end.
+    A use_mmap search reads no chunks, and its position is the end
+    of the last match. With count every batch of matches is sent
+    as a Counter.
+    """
+
+    batch: List = []
+    position: List[int] = [0]
+
+    def flush(offset: int) -> None:
+        if batch:
+            sender.send((MATCHES, [Counter(batch)] if count else list(batch)))
+            batch.clear()
+        position[0] = offset
+        sender.send((POSITION, offset))
+
+    def text_chunks() -> Iterator[str]:
+        offset: int = 0
+        for start in range(0, len(text), GUARD_CHUNK_SIZE):
+            chunk: str = text[start:start + GUARD_CHUNK_SIZE]
+            flush(offset)
+            yield chunk
+            offset += len(chunk.encode(encoding or "utf-8", "replace"))
+        flush(offset)
+
+    def file_chunks(reader: SourceReader, start: int = 0) -> Iterator[str]:
+        offset: int = start
+        for chunk in reader.chunks():
+            flush(offset)
+            yield chunk
+            offset = start + reader.tell()
+        flush(offset)
+
+    def reached(offset: int) -> None:
+        position[0] = offset
+
+    def search(chunks: Iterator[str]) -> Iterator:
+        if spans:
+            return iter_spans_stream(pattern, chunks, True)
+        return find_words_stream(pattern, chunks)
+
+    def scan(results: Iterator) -> None:
+        for result in results:
+            batch.append(result)
+            if len(batch) >= batch_size:
+                flush(position[0])
+        flush(position[0])
+
+    try:
+        if memory_limit is not None and (use_mmap or byte_range):
+            memory_limit += os.path.getsize(filepath)
+        _limit_memory(memory_limit)
+        times: Tuple[float, float] = (0.0, 0.0)
+        if text is not None:
+            scan(search(text_chunks()))
+        elif byte_range is not None:
+            start, end = byte_range
+            position[0] = start
+            with open(filepath, "rb") as in_file:
+                size: int = os.fstat(in_file.fileno()).st_size
+                with mmap.mmap(
+                    in_file.fileno(), 0, access=mmap.ACCESS_READ
+                ) as mapped:
+                    with SourceReader(
+                        _MappedRange(mapped, start, end), encoding,
+                        errors, GUARD_CHUNK_SIZE, decompress=False
+                    ) as reader:
+                        scan(_range_matches(
+                            pattern, file_chunks(reader, start), end == size
+                        ))
+            times = (reader.read_time, reader.decode_time)
+        elif use_mmap:
+            scan(find_words_mmap(pattern, filepath, progress=reached))
+        else:
+            with SourceReader(
+                filepath, encoding, errors, GUARD_CHUNK_SIZE
+            ) as reader:
+                scan(search(file_chunks(reader)))
+            times = (reader.read_time, reader.decode_time)
+        sender.send((DONE, times))
+    except MemoryError:
+        batch.clear()
+        sender.send((MEMORY, None))
+    except Exception as error:
+        try:
+            sender.send((ERROR, error))
+        except Exception:
+            sender.send((ERROR, RuntimeError(str(error))))
+    finally:
+        sender.close()
+
+
+def _limit_memory(memory_limit: Optional[int]) -> None:
+    """
+    Ограничивает адресное пространство текущего процесса,
+    если это поддерживается системой.
+
+    ************************************************
+
+    Limits the address space of the current process
+    if the system supports it.
+    """
+
+    if memory_limit is None or resource is None:
+        return
+    soft, hard = resource.getrlimit(resource.RLIMIT_AS)
+    if hard != resource.RLIM_INFINITY:
+        memory_limit = min(memory_limit, hard)
+    resource.setrlimit(resource.RLIMIT_AS, (memory_limit, hard))
@@ -1,14 +1,28 @@
-import os
 import platform
+import queue
+import re
 import shutil
+import threading
+import time
 import tkinter as tk
-from tkinter import filedialog, messagebox, ttk
-from typing import List
-
-from constants import (CHECK_OS, FILETYPES, ICON_FORMAT, ICON_NAMES, ICONS,
-                       MENU_MOUSE_NAME, TMP_DIR, TOOLTIP_DELAY)
-from logic import find_words_re
-from utils import delete_tmp, make_icon_app
+from tkinter import filedialog, messagebox, simpledialog, ttk
+from typing import TYPE_CHECKING, Callable, Iterator, List, Optional, Tuple
+
+from constants import (CHECK_OS, COUNT_TOP_K, FILETYPES,
+                       HIGHLIGHT_CURRENT_TAG, HIGHLIGHT_TAG, ICONS,
+                       LINE_CONTEXT, LIVE_CHUNK_SIZE, LIVE_PREVIEW_SIZE,
+                       LIVE_SAMPLE_SIZE, LIVE_SEARCH_DELAY,
+                       LIVE_TAG, MENU_MOUSE_NAME, RUN_LOG_PATH,
+                       SEARCH_POLL_INTERVAL, TOOLTIP_DELAY,
+                       VIEW_DIRECT_LIMIT)
+from logic import (FileLines, MultiPatternMatcher, ResultStore,
+                   SourceReader, SpanArray, collect_files, file_size,
+                   line_encoding, pattern_cache, read_text)
+from utils import PhaseTimer, append_run_log, make_icon_app
+from views import MatchHighlighter, VirtualTextView
+
+if TYPE_CHECKING:
+    from worker import SearchWorker
 
 
 class ToolTip:
@@ -115,12 +129,16 @@ class FindWordsAppClass(ttk.Frame):
 
     Атрибуты:
     master (tk.Tk): Главный объект Tkinter.
-    tmp_folder (str): Временная директория для хранения файлов.
+    timer (PhaseTimer): Таймер этапов запуска или None.
     filepath_open (str): Путь к открытому исходному файлу.
+    filepaths_open (List[str]): Пути к нескольким исходным файлам.
     filepath_save (str): Путь для сохранения обработанного файла.
+    filepath_export (str): Путь для экспорта результатов поиска.
     filepath_reg_exp_open (str): Путь к файлу с регулярными выражениями.
     filepath_reg_exp_save (str): Путь для сохранения файла с
     регулярными выражениями.
+    run_log_path (str): Путь к журналу запусков в формате JSON
+    Lines или None.
 
     ************************************************
 
@@ -128,14 +146,19 @@ class FindWordsAppClass(ttk.Frame):
 
     Attributes:
     master (tk.Tk ): The main object of Tkinter.
-    tmp_folder (str): Temporary directory for storing files.
+    timer (PhaseTimer): The startup phase timer or None.
     filepath_open (str): The path to the open source file.
+    filepaths_open (List[str]): The paths to several source files.
     filepath_save (str): The path to save the processed file.
+    filepath_export (str): The path to export the search results to.
     filepath_reg_exp_open (str): The path to the regular expression file.
     filepath_reg_exp_save (str): The path to save the regular expression file.
+    run_log_path (str): The path to the JSON Lines run log or None.
     """
 
-    def __init__(self, master=None) -> None:
+    def __init__(
+            self, master=None, timer: Optional[PhaseTimer] = None
+    ) -> None:
         """
         Инициализация основного окна приложения.
 
@@ -146,7 +169,7 @@ class FindWordsAppClass(ttk.Frame):
 
         super().__init__(master)
         self.master = master
-        self.tmp_folder = TMP_DIR
+        self.timer = timer
         self.master.protocol("WM_DELETE_WINDOW", self.on_closing)
         self.pack(fill="both", expand=True)
         self.create_main_window()
@@ -154,6 +177,7 @@ class FindWordsAppClass(ttk.Frame):
         self.init_data_for_OS()
         self.create_text_widgets()
         self.create_ok_and_exit_btns()
+        self.create_progress_bar()
         self.init_mouse_menu()
         self.init_bind_shortcuts()
 
@@ -168,17 +192,47 @@ class FindWordsAppClass(ttk.Frame):
 
         self.master.title("Find Words")
         self.master.geometry("600x700")
-        self.main_icon = make_icon_app(
-            ICONS.get("main_icon"),
-            ICON_NAMES.get("main_icon"),
-            ICON_FORMAT.get("ico"),
-            TMP_DIR
-        )
-        self.master.iconphoto(True, self.main_icon)
+        self.main_icon = None
+        self.after_idle(self.set_main_icon)
         self.filepath_open = None
+        self.filepaths_open = None
         self.filepath_save = None
+        self.filepath_export = None
         self.filepath_reg_exp_open = None
         self.filepath_reg_exp_save = None
+        self.search_worker = None
+        self.search_done = None
+        self.result_store = ResultStore()
+        self.result_view = None
+        self.file_lines = None
+        self.file_view = None
+        self.highlighter = None
+        self.live_worker = None
+        self.live_after_id = None
+        self.live_results = []
+        self.run_log_path = RUN_LOG_PATH
+        self.result_cache = None
+        self.run_record = {}
+        self.assemble_time = 0.0
+        self.render_time = 0.0
+
+    def set_main_icon(self) -> None:
+        """
+        Устанавливает иконку окна. Вызывается после первой
+        отрисовки, чтобы загрузка Pillow не задерживала появление
+        окна.
+
+        ************************************************
+
+        Sets the window icon. Called after the first drawing
+        so that loading Pillow does not delay the window
+        from appearing.
+        """
+
+        self.main_icon = make_icon_app(ICONS.get("main_icon"))
+        self.master.iconphoto(True, self.main_icon)
+        if self.timer is not None:
+            self.timer.mark("icon")
 
     def create_menu(self) -> None:
         """
@@ -203,6 +257,14 @@ class FindWordsAppClass(ttk.Frame):
             '<Control-o>',
             lambda event: self.open_source_file()
         )
+        self.file_menu.add_command(
+            label="Open several source files",
+            command=self.open_source_files
+        )
+        self.file_menu.add_command(
+            label="Open a source folder",
+            command=self.open_source_folder
+        )
         self.file_menu.add_command(
             label="Start processing",
             command=self.find_words,
@@ -211,14 +273,51 @@ class FindWordsAppClass(ttk.Frame):
         self.master.bind(
             '<Alt-s>', lambda event: self.find_words()
         )
+        self.mmap_mode = tk.BooleanVar(value=False)
+        self.file_menu.add_checkbutton(
+            label="Memory-mapped search (ASCII/UTF-8)",
+            variable=self.mmap_mode
+        )
+        self.file_menu.add_command(
+            label="Build word index for the source file",
+            command=self.build_word_index
+        )
+        self.index_mode = tk.BooleanVar(value=False)
+        self.file_menu.add_checkbutton(
+            label="Use word index when available",
+            variable=self.index_mode
+        )
+        self.count_mode = tk.BooleanVar(value=False)
+        self.file_menu.add_checkbutton(
+            label=f"Count matches only (top {COUNT_TOP_K})",
+            variable=self.count_mode
+        )
+        self.line_mode = tk.BooleanVar(value=False)
+        self.file_menu.add_checkbutton(
+            label=f"Matching lines with context ({LINE_CONTEXT} lines)",
+            variable=self.line_mode
+        )
+        self.guard_mode = tk.BooleanVar(value=True)
+        self.file_menu.add_checkbutton(
+            label="Limit search memory",
+            variable=self.guard_mode
+        )
         self.file_menu.add_command(
             label="Save the processed file",
             command=self.save_file,
             accelerator="Ctrl+S"
         )
+        self.file_menu.add_command(
+            label="Export results to file",
+            command=self.export_results_to_file
+        )
         self.master.bind(
             '<Control-s>', lambda event: self.save_file()
         )
+        self.file_menu.add_command(
+            label="Log run timings to a file",
+            command=self.set_run_log_file
+        )
 
         self.file_menu.add_separator()
 
@@ -256,6 +355,49 @@ class FindWordsAppClass(ttk.Frame):
 
         self.reg_exp_menu.add_separator()
 
+        self.multi_mode = tk.BooleanVar(value=False)
+        self.reg_exp_menu.add_checkbutton(
+            label="Multi-pattern mode (one pattern per line)",
+            variable=self.multi_mode
+        )
+        self.literal_mode = tk.BooleanVar(value=False)
+        self.reg_exp_menu.add_checkbutton(
+            label="Literal words in multi-pattern mode",
+            variable=self.literal_mode
+        )
+
+        self.live_mode = tk.BooleanVar(value=False)
+        self.reg_exp_menu.add_checkbutton(
+            label="Live search while typing",
+            variable=self.live_mode,
+            command=self.toggle_live_search
+        )
+        self.highlight_mode = tk.BooleanVar(value=False)
+        self.reg_exp_menu.add_checkbutton(
+            label="Highlight matches in the text",
+            variable=self.highlight_mode
+        )
+        self.reg_exp_menu.add_command(
+            label="Next match",
+            command=self.next_match,
+            accelerator="F3"
+        )
+        self.master.bind('<F3>', lambda event: self.next_match())
+        self.reg_exp_menu.add_command(
+            label="Previous match",
+            command=self.previous_match,
+            accelerator="Shift+F3"
+        )
+        self.master.bind('<Shift-F3>', lambda event: self.previous_match())
+        self.reg_exp_menu.add_command(
+            label="Go to line",
+            command=self.go_to_line,
+            accelerator="Ctrl+L"
+        )
+        self.master.bind('<Control-l>', lambda event: self.go_to_line())
+
+        self.reg_exp_menu.add_separator()
+
         self.reg_exp_menu.add_command(
             label="Select text",
             command=self.select_all,
@@ -329,16 +471,31 @@ class FindWordsAppClass(ttk.Frame):
             command=self.txt_widget.yview
         )
         self.txt_widget['yscrollcommand'] = self.scrollbar_txt.set
+        self.txt_widget.tag_configure(LIVE_TAG, background="yellow")
+        self.txt_widget.tag_configure(HIGHLIGHT_TAG, background="yellow")
+        self.txt_widget.tag_configure(
+            HIGHLIGHT_CURRENT_TAG, background="orange"
+        )
+        self.txt_widget.bind(
+            "<<Modified>>", self.on_text_modified, add="+"
+        )
+        self.ent_widget.bind(
+            "<KeyRelease>", self.schedule_live_search, add="+"
+        )
+        self.status_bar = ttk.Label(
+            master=self.frame_txt, text="", anchor="w"
+        )
+        self.status_bar.pack(side="bottom", fill="x")
         self.scrollbar_txt.pack(side="right", fill="y")
         self.txt_widget.pack(side="bottom", fill="both", expand=True)
 
     def create_ok_and_exit_btns(self) -> None:
         """
-        Создание кнопок 'OK' и 'Exit'.
+        Создание кнопок 'OK', 'Cancel' и 'Exit'.
 
         ************************************************
 
-        Creating the 'OK' and 'Exit' buttons.
+        Creating the 'OK', 'Cancel' and 'Exit' buttons.
         """
 
         self.frame_btn_all = ttk.Frame(self.master)
@@ -370,6 +527,21 @@ class FindWordsAppClass(ttk.Frame):
         self.btn_ok.pack()
         ToolTip(self.btn_ok, "Start processing")
 
+        self.frame_btn_cancel = ttk.Frame(master=self.frame_btn)
+        self.frame_btn_cancel.pack(
+            side="left", fill="both",
+            expand=True,
+            padx=10, pady=10
+        )
+        self.btn_cancel = ttk.Button(
+            master=self.frame_btn_cancel,
+            text="Cancel", width=10,
+            command=self.cancel_search,
+            state="disabled"
+        )
+        self.btn_cancel.pack()
+        ToolTip(self.btn_cancel, "Stop processing")
+
         self.btn_exit = ttk.Button(
             master=self.frame_btn_exit,
             text="Exit", width=10,
@@ -378,6 +550,26 @@ class FindWordsAppClass(ttk.Frame):
         self.btn_exit.pack()
         ToolTip(self.btn_exit, "Exit the program")
 
+    def create_progress_bar(self) -> None:
+        """
+        Создание индикатора прогресса поиска.
+
+        ************************************************
+
+        Creating the search progress indicator.
+        """
+
+        self.frame_progress = ttk.Frame(master=self.frame_btn_all)
+        self.frame_progress.pack(side="top", fill="x", padx=10)
+        self.progress_bar = ttk.Progressbar(
+            master=self.frame_progress,
+            orient="horizontal",
+            mode="determinate"
+        )
+        self.progress_bar.pack(side="top", fill="x")
+        self.progress_label = ttk.Label(master=self.frame_progress, text="")
+        self.progress_label.pack(side="top", fill="x")
+
     def init_bind_shortcuts(self) -> None:
         """
         Инициализация привязки клавиш и горячих клавиш.
@@ -665,6 +857,8 @@ class FindWordsAppClass(ttk.Frame):
         """
 
         widget = self.get_active_widget()
+        if widget is self.txt_widget:
+            self.reset_result_view()
         if isinstance(widget, tk.Text):
             widget.delete("1.0", "end")
         elif isinstance(widget, tk.Entry):
@@ -687,9 +881,8 @@ class FindWordsAppClass(ttk.Frame):
         )
         if self.filepath_reg_exp_open:
             self.ent_widget.delete(0, tk.END)
-            with open(self.filepath_reg_exp_open, "r") as out_reg_exp_file:
-                text_reg_exp: str = out_reg_exp_file.read()
-                self.filepath_reg_exp_open = None
+            text_reg_exp: str = read_text(self.filepath_reg_exp_open)
+            self.filepath_reg_exp_open = None
             self.ent_widget.insert(0, text_reg_exp)
 
     def save_regexp_file(self) -> None:
@@ -735,8 +928,174 @@ class FindWordsAppClass(ttk.Frame):
             )
         )
         if self.filepath_open:
-            self.txt_widget.delete("1.0", tk.END)
-            self.txt_widget.insert("1.0", (f"Open file: {self.filepath_open}"))
+            self.filepaths_open = None
+            self.reset_result_view()
+            self.show_source_file(self.filepath_open)
+
+    def show_source_file(self, filepath: str) -> None:
+        """
+        Показывает исходный файл в текстовом виджете постранично:
+        загружаются только строки вокруг видимой области, а индекс
+        строк строится в фоновом потоке. Сжатые файлы и файлы
+        в кодировках, несовместимых с ASCII, не показываются.
+
+        ************************************************
+
+        Shows the source file in the text widget page by page:
+        only the lines around the visible area are loaded, and the
+        line index is built on a background thread. Compressed files
+        and files in encodings incompatible with ASCII are not shown.
+        """
+
+        self.close_file_lines()
+        self.txt_widget.delete("1.0", tk.END)
+        encoding: Optional[str] = line_encoding(filepath)
+        try:
+            if encoding is None:
+                raise ValueError("the file cannot be previewed")
+            self.file_lines = FileLines(filepath, encoding)
+        except (OSError, ValueError):
+            self.txt_widget.insert("1.0", f"Open file: {filepath}")
+            return
+        self.file_view = VirtualTextView(
+            self.txt_widget, self.scrollbar_txt, self.file_lines
+        )
+        threading.Thread(target=self.file_lines.build, daemon=True).start()
+        self.after(SEARCH_POLL_INTERVAL, self.poll_file_lines, self.file_lines)
+
+    def poll_file_lines(self, file_lines: FileLines) -> None:
+        """
+        Следит за построением индекса строк: обновляет отображение
+        файла и строку состояния, пока индекс не будет построен.
+
+        ************************************************
+
+        Follows the line index build: updates the file display
+        and the status bar until the index is built.
+        """
+
+        if file_lines is not self.file_lines:
+            return
+        complete: bool = file_lines.complete
+        if self.file_view is not None:
+            self.file_view.grow()
+            status: str = f"{file_lines.filepath}: {len(file_lines)} lines"
+            if not complete and file_lines.size:
+                status += (
+                    f", indexed {file_lines.indexed / file_lines.size:.0%}"
+                )
+            self.status_bar.config(text=status)
+        if not complete:
+            self.after(SEARCH_POLL_INTERVAL, self.poll_file_lines, file_lines)
+
+    def close_file_lines(self) -> None:
+        """
+        Закрывает показанный исходный файл и прекращает
+        построение его индекса строк.
+
+        ************************************************
+
+        Closes the shown source file and stops building
+        its line index.
+        """
+
+        self.detach_file_view()
+        if self.file_lines is not None:
+            self.file_lines.close()
+            self.file_lines = None
+
+    def go_to_line(self) -> None:
+        """
+        Переходит к строке по номеру. Если был открыт исходный файл,
+        переход выполняется в нём, в том числе после поиска, когда
+        в виджете показаны результаты. Иначе переход выполняется
+        в результатах или в тексте виджета.
+
+        ************************************************
+
+        Moves to a line by its number. If a source file was opened,
+        the move happens in it, including after a search when the
+        widget shows the results. Otherwise the move happens in the
+        results or in the text of the widget.
+        """
+
+        if self.search_worker is not None:
+            return
+        if self.file_lines is not None:
+            total: int = len(self.file_lines)
+        elif self.result_view is not None:
+            total = len(self.result_store)
+        else:
+            total = int(self.txt_widget.index("end-1c").split(".")[0])
+        number: Optional[int] = simpledialog.askinteger(
+            "Go to line", f"Line number (1-{total}):",
+            minvalue=1, maxvalue=max(total, 1), parent=self.master
+        )
+        if number is None:
+            return
+        if self.file_lines is not None:
+            if self.file_view is None:
+                self.filepath_open = self.file_lines.filepath
+                self.filepaths_open = None
+                self.reset_result_view()
+                self.txt_widget.delete("1.0", tk.END)
+                self.file_view = VirtualTextView(
+                    self.txt_widget, self.scrollbar_txt, self.file_lines
+                )
+            self.file_view.load_window(number - 1)
+        elif self.result_view is not None:
+            self.result_view.load_window(number - 1)
+        else:
+            self.txt_widget.mark_set("insert", f"{number}.0")
+            self.txt_widget.see(f"{number}.0")
+
+    def open_source_files(self) -> None:
+        """
+        Открытие нескольких исходных файлов для обработки.
+
+        ************************************************
+
+        Opens several source files for processing.
+        """
+
+        filepaths = filedialog.askopenfilenames(
+            filetypes=FILETYPES,
+            defaultextension=''
+        )
+        if filepaths:
+            self.set_source_files(list(filepaths))
+
+    def open_source_folder(self) -> None:
+        """
+        Открытие каталога, все файлы которого будут обработаны.
+
+        ************************************************
+
+        Opens a folder whose files will all be processed.
+        """
+
+        folder: str = filedialog.askdirectory()
+        if folder:
+            self.set_source_files(collect_files([folder]))
+
+    def set_source_files(self, filepaths: List[str]) -> None:
+        """
+        Запоминает несколько исходных файлов и выводит их список.
+
+        ************************************************
+
+        Remembers several source files and shows their list.
+        """
+
+        self.filepath_open = None
+        self.filepaths_open = filepaths
+        self.reset_result_view()
+        self.close_file_lines()
+        self.txt_widget.delete("1.0", tk.END)
+        self.txt_widget.insert(
+            "1.0",
+            f"Open files ({len(filepaths)}):\n" + "\n".join(filepaths)
+        )
 
     def save_file(self) -> None:
         """
@@ -746,50 +1105,984 @@ class FindWordsAppClass(ttk.Frame):
 
         Saves the text to a file.
         """
-        if CHECK_OS.get("win"):
-            self.filepath_save = (
-                filedialog.asksaveasfilename(
-                    filetypes=FILETYPES,
-                    defaultextension='initialfile'
-                )
+        self.filepath_save = self.ask_save_filepath()
+        if self.filepath_save:
+            timer = PhaseTimer()
+            if self.file_view is not None:
+                shutil.copyfile(self.file_lines.filepath, self.filepath_save)
+            else:
+                with open(self.filepath_save, "w") as in_file:
+                    if self.result_view is not None:
+                        in_file.writelines(self.result_store.chunks())
+                    else:
+                        in_file.write(self.txt_widget.get("1.0", "end-1c"))
+            timer.mark("save")
+            size: int = file_size(self.filepath_save)
+            self.status_bar.config(
+                text=f"Saved {size / 1048576:.1f} MB | {timer.report()}"
             )
-        else:
-            self.filepath_save = (
-                filedialog.asksaveasfilename(
-                    filetypes=FILETYPES
-                )
+            self.log_run(
+                {
+                    "action": "save", "source": self.filepath_save,
+                    "bytes": size
+                },
+                timer
             )
-        if self.filepath_save:
-            with open(self.filepath_save, "w") as in_file:
-                in_file.write(self.txt_widget.get("1.0", "end-1c"))
 
             self.filepath_save = None
 
+    def ask_save_filepath(self) -> str:
+        """
+        Запрашивает путь для сохранения файла.
+
+        ************************************************
+
+        Asks for the path to save a file to.
+        """
+
+        if CHECK_OS.get("win"):
+            return filedialog.asksaveasfilename(
+                filetypes=FILETYPES,
+                defaultextension='initialfile'
+            )
+        return filedialog.asksaveasfilename(filetypes=FILETYPES)
+
+    def export_results_to_file(self) -> None:
+        """
+        Выполняет поиск и записывает результаты прямо в выбранный
+        файл, минуя текстовый виджет. В окне показываются только
+        сводка и начало результатов.
+
+        ************************************************
+
+        Runs the search and writes the results straight to the
+        chosen file, bypassing the text widget. Only a summary and
+        the start of the results are shown in the window.
+        """
+
+        if self.search_worker is not None:
+            return
+        self.filepath_export = self.ask_save_filepath()
+        if self.filepath_export:
+            self.find_words()
+        self.filepath_export = None
+
+    def show_export_summary(
+            self, worker: "SearchWorker", filepath: str
+    ) -> None:
+        """
+        Выводит сводку экспорта и начало записанных результатов.
+
+        ************************************************
+
+        Shows the export summary and the start of the written
+        results.
+        """
+
+        summary: str = (
+            f"Exported {worker.matches_found} matches to {filepath}"
+        )
+        if worker.cancelled:
+            summary += " (cancelled)"
+        self.detach_result_view()
+        started: float = time.perf_counter()
+        preview: str = "\n".join(self.result_store)
+        if worker.matches_found > len(self.result_store):
+            preview += "\n..."
+        rendering: float = time.perf_counter()
+        self.assemble_time += rendering - started
+        self.txt_widget.delete("1.0", tk.END)
+        self.txt_widget.insert("1.0", f"{summary}\n\n{preview}")
+        self.txt_widget.update_idletasks()
+        self.render_time += time.perf_counter() - rendering
+        self.progress_label.config(text=summary)
+        self.result_store = ResultStore()
+
     def find_words(self) -> None:
         """
         Поиск слов в тексте с использованием регулярных выражений.
 
+        Поиск выполняется в фоновом потоке, а интерфейс опрашивает
+        его результаты, поэтому окно не зависает.
+
         ************************************************
 
         Finds words in the text using regular expressions.
+
+        The search runs on a background thread whose results the
+        interface polls, so the window never freezes.
         """
 
-        pattern: str = self.ent_widget.get()
+        from cache import ResultCache
+        from index import WordIndex
+        from worker import (SearchWorker, count_paths, count_paths_guarded,
+                            count_results, export_results, search_cached,
+                            search_chunks, search_guarded, search_index,
+                            search_path, search_paths, search_paths_guarded,
+                            search_text, search_text_spans)
+        if self.search_worker is not None:
+            return
+        pattern = self.ent_widget.get()
         if not pattern:
             messagebox.showinfo(
                 "Error",
                 "The regular expression is not set."
             )
             return
-        if not self.filepath_open:
+        try:
+            pattern = self.build_pattern(pattern)
+        except (ValueError, re.error) as error:
+            messagebox.showerror("Error", str(error))
+            return
+        use_mmap: bool = self.mmap_mode.get()
+        guarded: bool = self.guard_mode.get()
+        line_mode: bool = self.line_mode.get()
+        count_mode: bool = self.count_mode.get() and not line_mode
+        count_results_of: bool = count_mode
+        highlight: bool = (
+            self.highlight_mode.get() and self.is_widget_source()
+            and not count_mode and not line_mode and not self.filepath_export
+        )
+        self.clear_highlights()
+        total: int = 0
+        source: str = "text"
+        if line_mode:
+            search, total, source = self.line_search(
+                pattern, not self.filepath_export
+            )
+        elif self.filepaths_open:
+            filepaths: List[str] = self.filepaths_open
+            source = f"{len(filepaths)} files"
+            total = sum(file_size(filepath) for filepath in filepaths)
+            if guarded and count_mode:
+                def search(worker):
+                    return count_paths_guarded(
+                        worker, pattern, filepaths, COUNT_TOP_K
+                    )
+                count_results_of = False
+            elif guarded:
+                def search(worker):
+                    return search_paths_guarded(worker, pattern, filepaths)
+            elif count_mode:
+                def search(worker):
+                    return count_paths(
+                        worker, pattern, filepaths, use_mmap, COUNT_TOP_K
+                    )
+                count_results_of = False
+            else:
+                def search(worker):
+                    return search_paths(worker, pattern, filepaths, use_mmap)
+            self.filepaths_open = None
+        elif self.result_view is not None:
+            store: ResultStore = self.result_store
+            total = store.nbytes
+            source = "results"
+            if guarded:
+                stored_text: str = "".join(store.chunks())
+
+                def search(worker):
+                    return search_guarded(worker, pattern, text=stored_text)
+            else:
+                def search(worker):
+                    return search_chunks(worker, pattern, store.chunks())
+        elif not self.filepath_open:
             all_text = self.txt_widget.get("1.0", "end-1c")
+            total = len(all_text)
+            if highlight and guarded:
+                def search(worker):
+                    return search_guarded(
+                        worker, pattern, text=all_text, spans=True
+                    )
+            elif highlight:
+                def search(worker):
+                    return search_text_spans(worker, pattern, all_text)
+            elif guarded:
+                def search(worker):
+                    return search_guarded(worker, pattern, text=all_text)
+            else:
+                def search(worker):
+                    return search_text(worker, pattern, all_text)
         else:
-            with open(self.filepath_open, "r") as out_file:
-                all_text = out_file.read()
-                self.filepath_open = None
-        result = "\n".join(find_words_re(pattern, all_text))
-        self.txt_widget.delete("1.0", tk.END)
-        self.txt_widget.insert("1.0", result)
+            filepath: str = self.filepath_open
+            source = filepath
+            mode: str = "mmap" if use_mmap else "search"
+            index: Optional[WordIndex] = None
+            if self.index_mode.get():
+                index = WordIndex(filepath)
+                if not (index.can_answer(pattern) and index.is_fresh()):
+                    index = None
+            if index is not None:
+                mode = "index"
+
+                def search(worker):
+                    return search_index(worker, index, pattern)
+            elif guarded:
+                total = file_size(filepath)
+
+                def search(worker):
+                    return search_guarded(
+                        worker, pattern, filepath, use_mmap=use_mmap
+                    )
+            else:
+                total = file_size(filepath)
+
+                def search(worker):
+                    return search_path(worker, pattern, filepath, use_mmap)
+            if not count_mode and not self.filepath_export:
+                cache_key: str = ResultCache.key(filepath, pattern, mode=mode)
+                if self.result_cache is None:
+                    self.result_cache = ResultCache()
+                find_in_file = search
+
+                def search(worker):
+                    return search_cached(
+                        worker, self.result_cache, cache_key, filepath,
+                        find_in_file
+                    )
+            self.filepath_open = None
+        if count_results_of:
+            find = search
+
+            def search(worker):
+                return count_results(worker, find(worker), COUNT_TOP_K)
+        export_path: Optional[str] = self.filepath_export
+        self.run_record = {
+            "action": "export" if export_path else "search",
+            "pattern": self.ent_widget.get(), "source": source
+        }
+        if export_path:
+            results = search
+
+            def search(worker):
+                return export_results(worker, results(worker), export_path)
+            worker = SearchWorker(search, total, tally=False)
+            self.result_store = ResultStore()
+            self.start_worker(
+                worker,
+                lambda: self.show_export_summary(worker, export_path)
+            )
+            return
+        worker = SearchWorker(
+            search, total, tally=not count_mode and not line_mode
+        )
+        if highlight:
+            self.result_store = SpanArray()
+            self.start_worker(worker, self.show_highlights)
+            return
+        self.result_store = ResultStore()
+        self.start_worker(worker, self.show_results)
+
+    def line_search(
+            self, pattern, count: bool
+    ) -> Tuple[Callable[["SearchWorker"], Iterator[str]], int, str]:
+        """
+        Готовит поиск совпавших строк с контекстом в текущем
+        источнике: файлах, результатах, тексте или файле.
+
+        Аргументы:
+        pattern: Регулярное выражение или набор шаблонов.
+        count (bool): Считать совпавшие строки в потоке поиска.
+
+        Возвращает:
+        Tuple: Функцию поиска, объём данных и имя источника.
+
+        ************************************************
+
+        Prepares a search for the matching lines with context
+        in the current source: the files, the results, the text
+        or the file.
+
+        Arguments:
+        pattern: A regular expression or a set of patterns.
+        count (bool): Count the matching lines on the search thread.
+
+        Returns:
+        Tuple: The search function, the amount of data and the
+        source name.
+        """
+
+        from worker import (search_lines, search_path_lines,
+                            search_paths_lines, split_text)
+        context: int = LINE_CONTEXT
+        if self.filepaths_open:
+            filepaths: List[str] = self.filepaths_open
+            self.filepaths_open = None
+            return (
+                lambda worker: search_paths_lines(
+                    worker, pattern, filepaths, context, context, count
+                ),
+                sum(file_size(filepath) for filepath in filepaths),
+                f"{len(filepaths)} files"
+            )
+        if self.result_view is not None:
+            store: ResultStore = self.result_store
+            return (
+                lambda worker: search_lines(
+                    worker, pattern, worker.track(store.chunks()),
+                    context, context, count=count
+                ),
+                store.nbytes, "results"
+            )
+        if not self.filepath_open:
+            all_text: str = self.txt_widget.get("1.0", "end-1c")
+            return (
+                lambda worker: search_lines(
+                    worker, pattern, worker.track(split_text(all_text)),
+                    context, context, count=count
+                ),
+                len(all_text), "text"
+            )
+        filepath: str = self.filepath_open
+        self.filepath_open = None
+        return (
+            lambda worker: search_path_lines(
+                worker, pattern, filepath, context, context, count
+            ),
+            file_size(filepath), filepath
+        )
+
+    def start_worker(
+            self, worker: "SearchWorker", on_done: Callable[[], None]
+    ) -> None:
+        """
+        Запускает фоновую задачу и опрос её очереди.
+
+        Аргументы:
+        worker (SearchWorker): Фоновая задача.
+        on_done (Callable): Вызывается после успешного завершения.
+
+        ************************************************
+
+        Starts a background task and the polling of its queue.
+
+        Arguments:
+        worker (SearchWorker): The background task.
+        on_done (Callable): Called after successful completion.
+        """
+
+        self.search_worker = worker
+        self.search_done = on_done
+        self.assemble_time = 0.0
+        self.render_time = 0.0
+        self.btn_ok.config(state="disabled")
+        self.btn_cancel.config(state="normal")
+        self.progress_bar.config(value=0)
+        worker.start()
+        self.after(SEARCH_POLL_INTERVAL, self.poll_search)
+
+    def build_word_index(self) -> None:
+        """
+        Строит в фоне индекс слов открытого исходного файла.
+
+        ************************************************
+
+        Builds the word index of the open source file
+        in the background.
+        """
+
+        if self.search_worker is not None:
+            return
+        if not self.filepath_open:
+            messagebox.showinfo("Error", "The source file is not open.")
+            return
+        from index import WordIndex
+        from worker import SearchWorker, build_index
+        index = WordIndex(self.filepath_open)
+        self.run_record = {"action": "index", "source": self.filepath_open}
+        self.start_worker(
+            SearchWorker(
+                lambda worker: build_index(worker, index),
+                file_size(self.filepath_open)
+            ),
+            self.show_index_built
+        )
+
+    def finish_run(
+            self, worker: "SearchWorker",
+            error: Optional[Exception] = None
+    ) -> None:
+        """
+        Дополняет замеры потока временем сборки и вывода
+        результатов, показывает их в строке состояния и записывает
+        запуск в журнал.
+
+        ************************************************
+
+        Completes the thread measurements with the time of
+        assembling and rendering the results, shows them in the
+        status bar and writes the run to the log.
+        """
+
+        timer: PhaseTimer = worker.timer
+        timer.add("assemble", self.assemble_time)
+        timer.add("render", self.render_time)
+        status: str = (
+            f"{worker.bytes_scanned / 1048576:.1f} MB, "
+            f"{worker.matches_found} matches | {timer.report()}"
+        )
+        if worker.cache_hit is not None:
+            source: str = "from cache" if worker.cache_hit else "searched"
+            status += f" | {source}, {self.result_cache.stats()}"
+        status += f" | {pattern_cache.report()}"
+        self.status_bar.config(text=status)
+        record: dict = dict(
+            self.run_record,
+            bytes=worker.bytes_scanned,
+            matches=worker.matches_found,
+            cancelled=worker.cancelled,
+            stopped=worker.report,
+            error=None if error is None else str(error),
+            cache_hit=worker.cache_hit,
+            pattern_cache=pattern_cache.stats()
+        )
+        self.run_record = {}
+        self.log_run(record, timer)
+
+    def log_run(self, record: dict, timer: PhaseTimer) -> None:
+        """
+        Дописывает запись о запуске с длительностью этапов
+        в журнал, если он включён. Ошибка записи журнала
+        показывается в строке состояния и не мешает работе.
+
+        ************************************************
+
+        Appends a run record with the phase durations to the log
+        if it is turned on. A log write error is shown in the
+        status bar and does not get in the way.
+        """
+
+        if not self.run_log_path:
+            return
+        record = dict(
+            record,
+            time=time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            phases_ms=timer.as_dict()
+        )
+        try:
+            append_run_log(self.run_log_path, record)
+        except OSError as error:
+            self.status_bar.config(
+                text=f"{self.status_bar.cget('text')} (run log: {error})"
+            )
+
+    def set_run_log_file(self) -> None:
+        """
+        Выбирает файл журнала запусков. Если выбор отменён,
+        журнал отключается.
+
+        ************************************************
+
+        Chooses the run log file. If the choice is cancelled,
+        the log is turned off.
+        """
+
+        self.run_log_path = filedialog.asksaveasfilename(
+            filetypes=(("JSON Lines", ".jsonl"), ("All files", ".*")),
+            defaultextension=".jsonl",
+            confirmoverwrite=False
+        ) or None
+        self.status_bar.config(
+            text=(
+                f"Run log: {self.run_log_path}" if self.run_log_path
+                else "Run log is off"
+            )
+        )
+
+    def show_index_built(self) -> None:
+        """
+        Сообщает о завершении построения индекса.
+
+        ************************************************
+
+        Reports that the index build has finished.
+        """
+
+        if not self.progress_label.cget("text").startswith("Cancelled"):
+            self.progress_label.config(text="The word index is built.")
+
+    def build_pattern(self, pattern: str):
+        """
+        Возвращает шаблон для поиска: строку или, в режиме
+        нескольких шаблонов, MultiPatternMatcher.
+
+        ************************************************
+
+        Returns the search pattern: a string or, in
+        multi-pattern mode, a MultiPatternMatcher.
+        """
+
+        if self.multi_mode.get():
+            return MultiPatternMatcher(
+                pattern.splitlines(), self.literal_mode.get()
+            )
+        return pattern
+
+    def poll_search(self) -> None:
+        """
+        Забирает результаты фонового поиска из очереди
+        и обновляет индикатор прогресса.
+
+        ************************************************
+
+        Collects background search results from the queue
+        and updates the progress indicator.
+        """
+
+        from worker import DONE, ERROR, MATCHES
+        worker = self.search_worker
+        finished: bool = False
+        error = None
+        try:
+            while True:
+                kind, payload = worker.queue.get_nowait()
+                if kind == MATCHES:
+                    started: float = time.perf_counter()
+                    self.result_store.extend(payload)
+                    self.assemble_time += time.perf_counter() - started
+                elif kind == ERROR:
+                    error = payload
+                    finished = True
+                elif kind == DONE:
+                    finished = True
+        except queue.Empty:
+            pass
+        self.update_progress(worker)
+        if not finished:
+            self.after(SEARCH_POLL_INTERVAL, self.poll_search)
+            return
+        self.search_worker = None
+        self.btn_ok.config(state="normal")
+        self.btn_cancel.config(state="disabled")
+        if error is not None:
+            self.progress_label.config(text="")
+            self.finish_run(worker, error)
+            messagebox.showerror("Error", str(error))
+            return
+        self.search_done()
+        self.finish_run(worker)
+        if worker.report is not None:
+            messagebox.showwarning(
+                "Search stopped",
+                f"{worker.report}\nPartial results are shown."
+            )
+
+    def show_results(self) -> None:
+        """
+        Выводит результаты поиска в текстовый виджет. Небольшие
+        результаты вставляются целиком, а большие отображаются
+        виртуально: в виджет загружается только видимая часть.
+
+        ************************************************
+
+        Shows the search results in the text widget. Small
+        results are inserted as a whole, while large ones are
+        displayed virtually: only the visible part is loaded
+        into the widget.
+        """
+
+        self.detach_result_view()
+        started: float = time.perf_counter()
+        if len(self.result_store) > VIEW_DIRECT_LIMIT:
+            self.result_view = VirtualTextView(
+                self.txt_widget, self.scrollbar_txt, self.result_store
+            )
+        else:
+            text: str = "\n".join(self.result_store)
+            rendering: float = time.perf_counter()
+            self.assemble_time += rendering - started
+            started = rendering
+            self.txt_widget.delete("1.0", tk.END)
+            self.txt_widget.insert("1.0", text)
+            self.result_store = ResultStore()
+        self.txt_widget.update_idletasks()
+        self.render_time += time.perf_counter() - started
+
+    def show_highlights(self) -> None:
+        """
+        Подсвечивает найденные совпадения прямо в тексте виджета,
+        не заменяя его. Позиции совпадений собраны в SpanArray
+        вместо хранилища строк.
+
+        ************************************************
+
+        Highlights the matches found right in the text of the
+        widget without replacing it. The match positions are
+        collected into a SpanArray instead of the line store.
+        """
+
+        spans: SpanArray = self.result_store
+        self.result_store = ResultStore()
+        started: float = time.perf_counter()
+        self.highlighter = MatchHighlighter(self.txt_widget, spans)
+        self.txt_widget.edit_modified(False)
+        self.txt_widget.update_idletasks()
+        self.render_time += time.perf_counter() - started
+
+    def clear_highlights(self) -> None:
+        """
+        Снимает подсветку совпадений, если она есть.
+
+        ************************************************
+
+        Removes the match highlighting if there is any.
+        """
+
+        if self.highlighter is not None:
+            self.highlighter.detach()
+            self.highlighter = None
+
+    def on_text_modified(self, event=None) -> None:
+        """
+        Снимает подсветку при изменении текста: позиции
+        совпадений после этого устаревают.
+
+        ************************************************
+
+        Removes the highlighting when the text changes:
+        the match positions become stale after that.
+        """
+
+        if self.txt_widget.edit_modified():
+            self.clear_highlights()
+            self.txt_widget.edit_modified(False)
+
+    def next_match(self) -> None:
+        """
+        Переходит к следующему подсвеченному совпадению.
+
+        ************************************************
+
+        Moves to the next highlighted match.
+        """
+
+        if self.highlighter is not None:
+            self.show_match_number(self.highlighter.next_match())
+
+    def previous_match(self) -> None:
+        """
+        Переходит к предыдущему подсвеченному совпадению.
+
+        ************************************************
+
+        Moves to the previous highlighted match.
+        """
+
+        if self.highlighter is not None:
+            self.show_match_number(self.highlighter.previous_match())
+
+    def show_match_number(self, number: Optional[int]) -> None:
+        """
+        Показывает номер текущего совпадения в строке прогресса.
+
+        ************************************************
+
+        Shows the number of the current match in the progress line.
+        """
+
+        if number is not None:
+            self.progress_label.config(
+                text=f"Match {number + 1} of {len(self.highlighter)}"
+            )
+
+    def detach_result_view(self) -> None:
+        """
+        Отключает виртуальное отображение результатов или
+        исходного файла, если оно активно. Сам файл остаётся
+        открытым для перехода к строке.
+
+        ************************************************
+
+        Detaches the virtual display of the results or of the
+        source file if it is active. The file itself stays open
+        for moving to a line.
+        """
+
+        if self.result_view is not None:
+            self.result_view.detach()
+            self.result_view = None
+        self.detach_file_view()
+
+    def detach_file_view(self) -> None:
+        """
+        Отключает постраничное отображение исходного файла,
+        если оно активно.
+
+        ************************************************
+
+        Detaches the paged display of the source file
+        if it is active.
+        """
+
+        if self.file_view is not None:
+            self.file_view.detach()
+            self.file_view = None
+
+    def reset_result_view(self) -> None:
+        """
+        Отключает виртуальное отображение результатов
+        и освобождает их хранилище.
+
+        ************************************************
+
+        Detaches the virtual result display
+        and releases the result store.
+        """
+
+        self.detach_result_view()
+        self.clear_highlights()
+        self.result_store = ResultStore()
+
+    def update_progress(self, worker: "SearchWorker") -> None:
+        """
+        Показывает объём просмотренных данных и число совпадений.
+
+        ************************************************
+
+        Shows the amount of data scanned and the number of matches.
+        """
+
+        if worker.bytes_total:
+            self.progress_bar.config(
+                value=100 * worker.bytes_scanned / worker.bytes_total
+            )
+        status: str = "Cancelled" if worker.cancelled else "Scanned"
+        self.progress_label.config(
+            text=(
+                f"{status}: {worker.bytes_scanned / 1048576:.1f} of "
+                f"{worker.bytes_total / 1048576:.1f} MB, "
+                f"matches: {worker.matches_found}"
+            )
+        )
+
+    def cancel_search(self) -> None:
+        """
+        Останавливает выполняющийся поиск.
+
+        ************************************************
+
+        Stops the running search.
+        """
+
+        if self.search_worker is not None:
+            self.search_worker.cancel()
+
+    def toggle_live_search(self) -> None:
+        """
+        Включение или выключение живого поиска.
+
+        ************************************************
+
+        Turns live search on or off.
+        """
+
+        if self.live_mode.get():
+            self.schedule_live_search()
+            return
+        self.stop_live_search()
+        self.txt_widget.tag_remove(LIVE_TAG, "1.0", tk.END)
+        self.progress_label.config(text="")
+
+    def schedule_live_search(self, event=None) -> None:
+        """
+        Планирует живой поиск после паузы в наборе шаблона.
+        Каждое новое нажатие клавиши переносит запуск.
+
+        ************************************************
+
+        Schedules a live search after a pause in typing the
+        pattern. Every new keystroke postpones the start.
+        """
+
+        if not self.live_mode.get():
+            return
+        if self.live_after_id is not None:
+            self.after_cancel(self.live_after_id)
+        self.live_after_id = self.after(
+            LIVE_SEARCH_DELAY, self.run_live_search
+        )
+
+    def stop_live_search(self) -> None:
+        """
+        Отменяет запланированный и выполняющийся живой поиск.
+
+        ************************************************
+
+        Cancels the scheduled and the running live search.
+        """
+
+        if self.live_after_id is not None:
+            self.after_cancel(self.live_after_id)
+            self.live_after_id = None
+        if self.live_worker is not None:
+            self.live_worker.cancel()
+            self.live_worker = None
+
+    def run_live_search(self) -> None:
+        """
+        Запускает поиск по начальному фрагменту источника,
+        отменяя устаревший поиск по предыдущему шаблону.
+
+        Если источник — текст в виджете, совпадения подсвечиваются
+        в нём; иначе в строке состояния выводятся их число
+        и первые совпадения. Поиск идёт в фоновом потоке без
+        отдельного процесса даже при включённом ограничении:
+        фрагмент невелик, а устаревший поиск отменяется.
+
+        ************************************************
+
+        Starts a search over the leading part of the source,
+        cancelling the stale search for the previous pattern.
+
+        If the source is the text in the widget, the matches are
+        highlighted there; otherwise their number and the first
+        matches are shown in the status line. The search runs on
+        a background thread without a separate process even with
+        the limit on: the part is small, and a stale search is
+        cancelled.
+        """
+
+        self.stop_live_search()
+        pattern = self.ent_widget.get()
+        if not pattern or self.search_worker is not None:
+            return
+        try:
+            pattern = self.build_pattern(pattern)
+        except (ValueError, re.error) as error:
+            self.progress_label.config(text=f"Live: {error}")
+            return
+        from worker import SearchWorker, search_text, search_text_spans
+        preview: str = self.read_preview()
+        highlight: bool = self.is_widget_source()
+        if highlight:
+            worker = SearchWorker(
+                lambda worker: search_text_spans(
+                    worker, pattern, preview, LIVE_CHUNK_SIZE
+                ),
+                len(preview)
+            )
+        else:
+            worker = SearchWorker(
+                lambda worker: search_text(
+                    worker, pattern, preview, LIVE_CHUNK_SIZE
+                ),
+                len(preview)
+            )
+        self.live_worker = worker
+        self.live_results = []
+        worker.start()
+        self.after(
+            SEARCH_POLL_INTERVAL, self.poll_live_search, worker, highlight
+        )
+
+    def is_widget_source(self) -> bool:
+        """
+        Возвращает True, если поиск ведётся по тексту в виджете.
+
+        ************************************************
+
+        Returns True if the search runs over the text in the widget.
+        """
+
+        return not (
+            self.filepath_open or self.filepaths_open
+            or self.result_view is not None
+        )
+
+    def read_preview(self) -> str:
+        """
+        Читает начальный фрагмент источника для живого поиска.
+
+        ************************************************
+
+        Reads the leading part of the source for live search.
+        """
+
+        filepath = self.filepath_open or (
+            self.filepaths_open[0] if self.filepaths_open else None
+        )
+        if filepath:
+            try:
+                with SourceReader(
+                    filepath, chunk_size=LIVE_PREVIEW_SIZE
+                ) as reader:
+                    return reader.read(LIVE_PREVIEW_SIZE)
+            except (OSError, UnicodeDecodeError):
+                return ""
+        if self.result_view is not None:
+            lines: List[str] = self.result_store.lines(0, LIVE_PREVIEW_SIZE)
+            return "\n".join(lines)[:LIVE_PREVIEW_SIZE]
+        return self.txt_widget.get(
+            "1.0", f"1.0 + {LIVE_PREVIEW_SIZE} chars"
+        )
+
+    def poll_live_search(
+            self, worker: "SearchWorker", highlight: bool
+    ) -> None:
+        """
+        Забирает результаты живого поиска. Результаты устаревшего
+        поиска отбрасываются.
+
+        ************************************************
+
+        Collects live search results. The results of a stale
+        search are discarded.
+        """
+
+        from worker import DONE, ERROR, MATCHES
+        if worker is not self.live_worker:
+            return
+        finished: bool = False
+        error = None
+        try:
+            while True:
+                kind, payload = worker.queue.get_nowait()
+                if kind == MATCHES:
+                    self.live_results.extend(payload)
+                elif kind == ERROR:
+                    error = payload
+                    finished = True
+                elif kind == DONE:
+                    finished = True
+        except queue.Empty:
+            pass
+        if not finished:
+            self.after(
+                SEARCH_POLL_INTERVAL, self.poll_live_search,
+                worker, highlight
+            )
+            return
+        self.live_worker = None
+        if error is not None:
+            self.progress_label.config(text=f"Live: {error}")
+            return
+        self.show_live_results(highlight)
+
+    def show_live_results(self, highlight: bool) -> None:
+        """
+        Выводит результаты живого поиска.
+
+        ************************************************
+
+        Shows the live search results.
+        """
+
+        count: int = len(self.live_results)
+        summary: str = (
+            f"Live: {count} matches in the first "
+            f"{LIVE_PREVIEW_SIZE // 1024} KB"
+        )
+        if highlight:
+            self.txt_widget.tag_remove(LIVE_TAG, "1.0", tk.END)
+            for start, end, line, column in self.live_results:
+                index: str = f"{line}.{column}"
+                self.txt_widget.tag_add(
+                    LIVE_TAG, index, f"{index} + {end - start} chars"
+                )
+        else:
+            sample: str = ", ".join(self.live_results[:LIVE_SAMPLE_SIZE])
+            summary += f": {sample}" if sample else ""
+        self.progress_label.config(text=summary)
+        self.live_results = []
 
     def exit_program(self) -> None:
         """
@@ -801,18 +2094,15 @@ class FindWordsAppClass(ttk.Frame):
         """
 
         self.master.title("Program is closing")
-        delete_tmp(TMP_DIR)
         self.master.destroy()
 
     def on_closing(self) -> None:
         """
-        Закрытие программы и удаление временных файлов.
+        Закрытие программы.
 
         ************************************************
 
-        Closes the program and deletes temporary files.
+        Closes the program.
         """
 
-        if self.tmp_folder and os.path.exists(self.tmp_folder):
-            shutil.rmtree(self.tmp_folder)
         self.master.destroy()
@@ -0,0 +1,478 @@
+import codecs
+import hashlib
+import os
+import re
+import sqlite3
+from array import array
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from constants import (DETECT_SIZE, INDEX_BATCH_TOKENS, INDEX_DIR,
+                       INDEX_MAX_POSTINGS, INDEX_MAX_RANGE, INDEX_VERSION,
+                       WORD_PATTERN)
+from logic import (Match, SourceReader, compile_pattern, detect_encoding,
+                   file_compression, find_words_stream, is_line_local,
+                   line_encoding, required_word, sre_parse)
+
+Posting = Tuple[int, int, str]
+
+
+class WordIndex:
+    """
+    Постоянный инвертированный индекс слов исходного файла.
+
+    Индекс хранится в базе SQLite в каталоге кэша и сопоставляет
+    каждому слову позиции его вхождений: смещение начала строки
+    в байтах и столбец в символах. Индекс считается устаревшим,
+    если изменились размер или время изменения файла.
+
+    Шаблоны, совпадения которых не выходят за пределы одного слова
+    (литеральные слова, префиксы, `\\w`-классы и `\\b`), решаются
+    только по индексу. Для остальных построчных шаблонов индекс
+    сужает поиск до строк, содержащих обязательное слово шаблона.
+
+    Файл разбивается на строки по байту перевода строки, поэтому
+    кодировка должна быть совместима с ASCII. Если кодировка
+    не задана, она определяется по началу файла так же, как
+    в SourceReader, и сохраняется в метаданных индекса.
+
+    Атрибуты:
+    filepath (str): Абсолютный путь к исходному файлу.
+    encoding (str): Кодировка исходного файла.
+    index_path (str): Путь к файлу индекса.
+
+    ************************************************
+
+    A persistent inverted word index of a source file.
+
+    The index is stored in an SQLite database in the cache
+    directory and maps every word to the positions of its
+    occurrences: the byte offset of the line start and the column
+    in characters. The index is stale if the size or modification
+    time of the file has changed.
+
+    Patterns whose matches never leave a single word (literal words,
+    prefixes, `\\w` classes and `\\b`) are answered from the index
+    alone. For other line-local patterns the index narrows the search
+    to the lines that contain the required word of the pattern.
+
+    The file is split into lines at the line feed byte, so the
+    encoding must be ASCII-compatible. If no encoding is given, it
+    is detected from the start of the file the same way as in
+    SourceReader and stored in the index metadata.
+
+    Attributes:
+    filepath (str): The absolute path to the source file.
+    encoding (str): The encoding of the source file.
+    index_path (str): The path to the index file.
+    """
+
+    def __init__(
+            self, filepath: str,
+            index_dir: str = INDEX_DIR,
+            encoding: Optional[str] = None
+    ) -> None:
+        """
+        Инициализация индекса для файла. Сам индекс не строится.
+
+        ************************************************
+
+        Initializing the index for a file. The index itself
+        is not built.
+        """
+
+        self.filepath = os.path.abspath(filepath)
+        self.encoding = codecs.lookup(
+            encoding or self._detect_encoding()
+        ).name
+        self.index_dir = index_dir
+        digest: str = hashlib.sha1(
+            self.filepath.encode("utf-8", "surrogatepass")
+        ).hexdigest()
+        self.index_path = os.path.join(index_dir, f"{digest}.sqlite")
+
+    def _detect_encoding(self) -> str:
+        """
+        Определяет кодировку по началу файла, как SourceReader.
+
+        ************************************************
+
+        Detects the encoding from the start of the file, like
+        SourceReader.
+        """
+
+        try:
+            with open(self.filepath, "rb") as source:
+                head: bytes = source.read(DETECT_SIZE)
+        except OSError:
+            head = b""
+        return detect_encoding(head)
+
+    def _fingerprint(self) -> Dict[str, str]:
+        """
+        Возвращает метаданные, по которым проверяется свежесть.
+
+        ************************************************
+
+        Returns the metadata used to check freshness.
+        """
+
+        stat = os.stat(self.filepath)
+        return {
+            "version": str(INDEX_VERSION),
+            "size": str(stat.st_size),
+            "mtime_ns": str(stat.st_mtime_ns),
+            "encoding": self.encoding,
+        }
+
+    def is_fresh(self) -> bool:
+        """
+        Возвращает True, если индекс построен и файл с тех пор
+        не изменялся.
+
+        ************************************************
+
+        Returns True if the index is built and the file has not
+        changed since.
+        """
+
+        if not os.path.isfile(self.index_path):
+            return False
+        try:
+            connection = sqlite3.connect(self.index_path)
+            try:
+                meta = dict(connection.execute("SELECT key, value FROM meta"))
+            finally:
+                connection.close()
+            fingerprint = self._fingerprint()
+        except (sqlite3.Error, OSError):
+            return False
+        return all(
+            meta.get(key) == value for key, value in fingerprint.items()
+        )
+
+    def build(
+            self, progress: Optional[Callable[[int], None]] = None,
+            cancelled: Optional[Callable[[], bool]] = None
+    ) -> bool:
+        """
+        Строит индекс, читая файл один раз. Вхождения сбрасываются
+        в базу пачками, поэтому память не растёт с размером файла.
+
+        Аргументы:
+        progress (Callable): Получает число прочитанных байт.
+        cancelled (Callable): Возвращает True, если построение
+        нужно прервать.
+
+        Возвращает:
+        bool: True, если индекс построен, False, если прерван.
+
+        Сжатые файлы не индексируются: позиции строк в них нельзя
+        прочитать выборочно, поэтому выбрасывается ValueError.
+        То же происходит для кодировки, несовместимой с ASCII.
+
+        ************************************************
+
+        Builds the index reading the file once. Occurrences are
+        flushed to the database in batches, so memory does not grow
+        with the file size.
+
+        Arguments:
+        progress (Callable): Receives the number of bytes read.
+        cancelled (Callable): Returns True if the build should stop.
+
+        Returns:
+        bool: True if the index was built, False if it was stopped.
+
+        Compressed files are not indexed: their line positions
+        cannot be read selectively, so ValueError is raised.
+        The same happens for an encoding incompatible with ASCII.
+        """
+
+        if file_compression(self.filepath) is not None:
+            raise ValueError("A compressed file cannot be indexed.")
+        if line_encoding(self.filepath, self.encoding) is None:
+            raise ValueError(
+                f"A file in {self.encoding} cannot be indexed."
+            )
+        os.makedirs(self.index_dir, exist_ok=True)
+        tmp_path: str = f"{self.index_path}.tmp"
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        fingerprint = self._fingerprint()
+        word_re = compile_pattern(WORD_PATTERN)
+        connection = sqlite3.connect(tmp_path)
+        completed: bool = False
+        try:
+            connection.executescript(
+                "CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT);"
+                "CREATE TABLE vocab (word TEXT PRIMARY KEY);"
+                "CREATE TABLE postings (word TEXT, data BLOB);"
+            )
+            postings: Dict[str, array] = {}
+            tokens: int = 0
+            offset: int = 0
+            with open(self.filepath, "rb") as source:
+                for raw in source:
+                    line: str = raw.decode(self.encoding, "replace")
+                    for match in word_re.finditer(line):
+                        entry = postings.get(match.group())
+                        if entry is None:
+                            entry = postings[match.group()] = array("q")
+                        entry.append(offset)
+                        entry.append(match.start())
+                        tokens += 1
+                    offset += len(raw)
+                    if tokens < INDEX_BATCH_TOKENS:
+                        continue
+                    self._flush(connection, postings)
+                    tokens = 0
+                    if progress is not None:
+                        progress(offset)
+                    if cancelled is not None and cancelled():
+                        return False
+            self._flush(connection, postings)
+            connection.executemany(
+                "INSERT INTO meta VALUES (?, ?)", fingerprint.items()
+            )
+            connection.execute("CREATE INDEX postings_word ON postings(word)")
+            connection.commit()
+            completed = True
+        finally:
+            connection.close()
+            if not completed:
+                os.remove(tmp_path)
+        os.replace(tmp_path, self.index_path)
+        if progress is not None:
+            progress(offset)
+        return True
+
+    @staticmethod
+    def _flush(connection, postings: Dict[str, array]) -> None:
+        """
+        Записывает накопленные вхождения в базу и очищает их.
+
+        ************************************************
+
+        Writes the accumulated occurrences to the database
+        and clears them.
+        """
+
+        connection.executemany(
+            "INSERT INTO postings VALUES (?, ?)",
+            ((word, entry.tobytes()) for word, entry in postings.items())
+        )
+        connection.executemany(
+            "INSERT OR IGNORE INTO vocab VALUES (?)",
+            ((word,) for word in postings)
+        )
+        postings.clear()
+
+    def can_answer(self, pattern) -> bool:
+        """
+        Возвращает True, если индекс ускоряет поиск по шаблону.
+
+        ************************************************
+
+        Returns True if the index speeds up the search
+        for the pattern.
+        """
+
+        if not isinstance(pattern, str):
+            return False
+        return is_token_local(pattern) or (
+            is_line_local(pattern) and required_word(pattern) is not None
+        )
+
+    def search(self, pattern: str) -> Iterator[Match]:
+        """
+        Ищет совпадения с помощью индекса. Совпадения возвращаются
+        в порядке следования в файле и в том же виде, что и у
+        re.findall. Если индекс не помогает для шаблона или
+        кандидатов больше INDEX_MAX_POSTINGS, файл просматривается
+        целиком.
+
+        ************************************************
+
+        Searches for matches with the help of the index. Matches
+        are returned in file order and in the same form as
+        re.findall. If the index does not help for the pattern or
+        there are more than INDEX_MAX_POSTINGS candidates, the whole
+        file is scanned.
+        """
+
+        if not self.can_answer(pattern):
+            yield from self._full_scan(pattern)
+            return
+        regexp = compile_pattern(pattern)
+        connection = sqlite3.connect(self.index_path)
+        try:
+            word: Optional[str] = required_word(pattern)
+            if word is None:
+                rows = connection.execute("SELECT word FROM vocab")
+            else:
+                rows = connection.execute(
+                    "SELECT word FROM vocab WHERE instr(word, ?) > 0", (word,)
+                )
+            token_local: bool = is_token_local(pattern)
+            words: List[str] = [
+                row[0] for row in rows
+                if not token_local or regexp.search(row[0])
+            ]
+            postings = self._postings(connection, words)
+        finally:
+            connection.close()
+        if postings is None:
+            yield from self._full_scan(pattern)
+        elif token_local:
+            found: Dict[str, list] = {}
+            for _, _, token in postings:
+                if token not in found:
+                    found[token] = regexp.findall(token)
+                yield from found[token]
+        else:
+            yield from self._scan_lines(
+                pattern, sorted({posting[0] for posting in postings})
+            )
+
+    def _postings(
+            self, connection, words: List[str]
+    ) -> Optional[List[Posting]]:
+        """
+        Возвращает отсортированные вхождения слов или None, если
+        их больше INDEX_MAX_POSTINGS.
+
+        ************************************************
+
+        Returns the sorted occurrences of the words, or None if
+        there are more than INDEX_MAX_POSTINGS of them.
+        """
+
+        postings: List[Posting] = []
+        for word in words:
+            for (data,) in connection.execute(
+                "SELECT data FROM postings WHERE word = ? ORDER BY rowid",
+                (word,)
+            ):
+                entry = array("q")
+                entry.frombytes(data)
+                postings.extend(
+                    (entry[index], entry[index + 1], word)
+                    for index in range(0, len(entry), 2)
+                )
+                if len(postings) > INDEX_MAX_POSTINGS:
+                    return None
+        postings.sort()
+        return postings
+
+    def _scan_lines(
+            self, pattern: str, offsets: List[int]
+    ) -> Iterator[Match]:
+        """
+        Ищет совпадения только в строках с заданными смещениями.
+
+        ************************************************
+
+        Searches for matches only in the lines at the given offsets.
+        """
+
+        with open(self.filepath, "rb") as source:
+            for offset in offsets:
+                source.seek(offset)
+                line: str = source.readline().decode(
+                    self.encoding, "replace"
+                ).rstrip("\r\n")
+                yield from compile_pattern(pattern).findall(line)
+
+    def _full_scan(self, pattern: str) -> Iterator[Match]:
+        """
+        Просматривает файл целиком без индекса.
+
+        ************************************************
+
+        Scans the whole file without the index.
+        """
+
+        with SourceReader(self.filepath, self.encoding) as reader:
+            yield from find_words_stream(pattern, reader.chunks())
+
+
+def is_token_local(pattern: str) -> bool:
+    """
+    Проверяет, что совпадения шаблона всегда лежат внутри одного
+    слова: шаблон состоит только из словесных символов, классов
+    `\\w` и `\\d`, границ слова `\\b` и `\\B`, групп, повторов
+    и альтернатив из них.
+
+    ************************************************
+
+    Checks that the matches of a pattern always lie inside a single
+    word: the pattern consists only of word characters, `\\w` and
+    `\\d` classes, `\\b` and `\\B` word boundaries, and groups,
+    repeats and alternatives of those.
+    """
+
+    try:
+        parsed = sre_parse.parse(pattern)
+    except (re.error, RecursionError):
+        return False
+    return parsed.getwidth()[0] > 0 and _token_local(parsed)
+
+
+def _token_local(items) -> bool:
+    """
+    Рекурсивная проверка для is_token_local.
+
+    ************************************************
+
+    The recursive check for is_token_local.
+    """
+
+    word_re = compile_pattern(WORD_PATTERN)
+    for op, av in items:
+        if op is sre_parse.LITERAL:
+            if not word_re.fullmatch(chr(av)):
+                return False
+        elif op is sre_parse.IN:
+            if not all(_word_set_item(*item) for item in av):
+                return False
+        elif op is sre_parse.AT:
+            if av not in (
+                sre_parse.AT_BOUNDARY, sre_parse.AT_NON_BOUNDARY
+            ):
+                return False
+        elif op in (sre_parse.MAX_REPEAT, sre_parse.MIN_REPEAT):
+            if not av[2] or not _token_local(av[2]):
+                return False
+        elif op is sre_parse.SUBPATTERN:
+            if av[1] or av[2] or not _token_local(av[3]):
+                return False
+        elif op is sre_parse.BRANCH:
+            if not all(_token_local(item) for item in av[1]):
+                return False
+        else:
+            return False
+    return bool(items)
+
+
+def _word_set_item(op, av) -> bool:
+    """
+    Проверяет, что элемент класса символов содержит только
+    словесные символы.
+
+    ************************************************
+
+    Checks that a character class item contains only
+    word characters.
+    """
+
+    word_re = compile_pattern(WORD_PATTERN)
+    if op is sre_parse.CATEGORY:
+        return av in (sre_parse.CATEGORY_WORD, sre_parse.CATEGORY_DIGIT)
+    if op is sre_parse.LITERAL:
+        return bool(word_re.fullmatch(chr(av)))
+    if op is sre_parse.RANGE:
+        low, high = av
+        return high - low <= INDEX_MAX_RANGE and bool(word_re.fullmatch(
+            "".join(chr(code) for code in range(low, high + 1))
+        ))
+    return False
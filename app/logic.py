@@ -1,5 +1,401 @@
+import bisect
+import bz2
+import codecs
+import copy
+import gzip
+import lzma
+import mmap
+import os
+import queue
 import re
-from typing import List
+import threading
+import time
+from array import array
+from collections import Counter, OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import (Callable, Dict, Iterable, Iterator, List, Optional,
+                    Tuple, Union)
+
+try:
+    import re._parser as sre_parse
+except ImportError:
+    import sre_parse
+
+from constants import (CHUNK_OVERLAP, CHUNK_SIZE, DECODE_ERRORS,
+                       DECOMPRESS_THREADED, DETECT_SIZE, FALLBACK_ENCODING,
+                       LINE_INDEX_STEP, MMAP_ENCODING, MULTI_GROUP_PREFIX,
+                       PARALLEL_MIN_SIZE, PARALLEL_RANGE_SIZE,
+                       PATTERN_CACHE_SIZE, PREFETCH_DEPTH,
+                       PREVIEW_LINE_LIMIT, SEARCH_WORKERS, STORE_BATCH_SIZE)
+from engines import compile_with_engine
+
+Match = Union[str, Tuple[str, ...]]
+
+Span = Tuple[int, ...]
+
+LineMatch = Tuple[int, str, bool]
+
+
+class PatternCache:
+    """
+    LRU-кэш скомпилированных регулярных выражений.
+
+    Ключом служит пара из шаблона и флагов. Кэш не зависит от
+    небольшого внутреннего кэша модуля re и ведёт счётчики
+    попаданий, промахов и вытеснений. Движок для каждого шаблона
+    выбирается функцией compile_with_engine.
+
+    Атрибуты:
+    maxsize (int): Максимальное число шаблонов в кэше.
+    hits (int): Число попаданий.
+    misses (int): Число промахов.
+    evictions (int): Число вытесненных шаблонов.
+
+    ************************************************
+
+    An LRU cache of compiled regular expressions.
+
+    The key is the pattern together with its flags. The cache does
+    not depend on the small internal cache of the re module and keeps
+    hit, miss and eviction counters. The engine for every pattern
+    is chosen by compile_with_engine.
+
+    Attributes:
+    maxsize (int): The maximum number of patterns in the cache.
+    hits (int): The number of hits.
+    misses (int): The number of misses.
+    evictions (int): The number of evicted patterns.
+    """
+
+    def __init__(self, maxsize: int = PATTERN_CACHE_SIZE) -> None:
+        """
+        Инициализация пустого кэша заданного размера.
+
+        ************************************************
+
+        Initializing an empty cache of the given size.
+        """
+
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._patterns: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def compile(self, pattern, flags: int = 0) -> re.Pattern:
+        """
+        Возвращает скомпилированный шаблон, компилируя его
+        только при промахе.
+
+        ************************************************
+
+        Returns the compiled pattern, compiling it
+        only on a miss.
+        """
+
+        if not isinstance(pattern, (str, bytes)):
+            return pattern
+        key = (pattern, flags)
+        with self._lock:
+            compiled = self._patterns.get(key)
+            if compiled is not None:
+                self._patterns.move_to_end(key)
+                self.hits += 1
+                return compiled
+            self.misses += 1
+        compiled = compile_with_engine(pattern, flags)
+        with self._lock:
+            self._patterns[key] = compiled
+            self._patterns.move_to_end(key)
+            self._evict()
+        return compiled
+
+    def resize(self, maxsize: int) -> None:
+        """
+        Изменяет размер кэша, вытесняя лишние шаблоны.
+
+        ************************************************
+
+        Changes the cache size, evicting surplus patterns.
+        """
+
+        with self._lock:
+            self.maxsize = maxsize
+            self._evict()
+
+    def clear(self) -> None:
+        """
+        Очищает кэш и сбрасывает счётчики.
+
+        ************************************************
+
+        Clears the cache and resets the counters.
+        """
+
+        with self._lock:
+            self._patterns.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Возвращает размер кэша и значения счётчиков.
+
+        ************************************************
+
+        Returns the cache size and the counter values.
+        """
+
+        with self._lock:
+            return {
+                "size": len(self._patterns),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+    def report(self) -> str:
+        """
+        Возвращает строку со статистикой кэша для строки
+        состояния и вывода командной строки.
+
+        ************************************************
+
+        Returns a line with the cache statistics for the status
+        bar and the command-line output.
+        """
+
+        stats: Dict[str, int] = self.stats()
+        return (
+            f"patterns: {stats['size']}/{stats['maxsize']} cached, "
+            f"{stats['hits']} hits, {stats['misses']} misses, "
+            f"{stats['evictions']} evicted"
+        )
+
+    def _evict(self) -> None:
+        """
+        Вытесняет самые давно использованные шаблоны.
+        Вызывается под блокировкой.
+
+        ************************************************
+
+        Evicts the least recently used patterns.
+        Called with the lock held.
+        """
+
+        while len(self._patterns) > max(self.maxsize, 0):
+            self._patterns.popitem(last=False)
+            self.evictions += 1
+
+
+pattern_cache = PatternCache()
+
+
+def compile_pattern(pattern, flags: int = 0) -> re.Pattern:
+    """
+    Компилирует шаблон через общий кэш pattern_cache.
+
+    ************************************************
+
+    Compiles the pattern through the shared pattern_cache.
+    """
+
+    return pattern_cache.compile(pattern, flags)
+
+
+class MultiPatternMatcher:
+    """
+    Набор шаблонов, объединённых в одно регулярное выражение,
+    которое просматривает текст за один проход.
+
+    Литеральные слова собираются в префиксное дерево и
+    превращаются в выражение вида `ab(?:c|d)?`, которое модуль re
+    выполняет как автомат, поэтому стоимость поиска не растёт
+    линейно с числом слов. Регулярные выражения объединяются в
+    альтернативу именованных групп. Для каждого совпадения
+    сообщается, какой шаблон его дал.
+
+    Шаблоны с нумерованными обратными ссылками объединить нельзя,
+    так как номера групп сдвигаются; для них выбрасывается ValueError.
+
+    Атрибуты:
+    patterns (List[str]): Шаблоны без пустых строк и повторов.
+    literal (bool): Шаблоны являются литеральными словами.
+    regexp (re.Pattern): Объединённое выражение.
+
+    ************************************************
+
+    A set of patterns combined into a single regular expression
+    that scans the text in one pass.
+
+    Literal words are collected into a prefix tree and turned into
+    an expression such as `ab(?:c|d)?`, which the re module runs as
+    an automaton, so the search cost does not grow linearly with the
+    number of words. Regular expressions are combined into an
+    alternation of named groups. For each match the pattern that
+    produced it is reported.
+
+    Patterns with numbered backreferences cannot be combined because
+    the group numbers shift; ValueError is raised for them.
+
+    Attributes:
+    patterns (List[str]): The patterns without blank lines and repeats.
+    literal (bool): The patterns are literal words.
+    regexp (re.Pattern): The combined expression.
+    """
+
+    def __init__(
+            self, patterns: Iterable[str], literal: bool = False
+    ) -> None:
+        """
+        Инициализация и компиляция набора шаблонов.
+
+        ************************************************
+
+        Initializing and compiling the set of patterns.
+        """
+
+        self.patterns: List[str] = list(dict.fromkeys(
+            pattern for pattern in patterns if pattern
+        ))
+        if not self.patterns:
+            raise ValueError("No patterns are set.")
+        self.literal = literal
+        if literal:
+            self.regexp = compile_pattern(_trie_regex(self.patterns))
+            return
+        for number, pattern in enumerate(self.patterns, 1):
+            if re.search(r"\\[1-9]|\(\?P=", pattern):
+                raise ValueError(
+                    f"Pattern {number} uses a backreference "
+                    "and cannot be combined with other patterns."
+                )
+        self.regexp = compile_pattern("|".join(
+            f"(?P<{MULTI_GROUP_PREFIX}{index}>{pattern})"
+            for index, pattern in enumerate(self.patterns)
+        ))
+
+    def __getstate__(self) -> Dict:
+        """
+        Возвращает состояние для pickle с исходным текстом выражения
+        вместо скомпилированного: выражения некоторых движков
+        не сериализуются.
+
+        ************************************************
+
+        Returns the pickle state with the source of the expression
+        instead of the compiled one: the expressions of some engines
+        cannot be serialized.
+        """
+
+        state = self.__dict__.copy()
+        state["regexp"] = self.regexp.pattern
+        return state
+
+    def __setstate__(self, state: Dict) -> None:
+        """
+        Восстанавливает состояние, заново компилируя выражение.
+
+        ************************************************
+
+        Restores the state, compiling the expression again.
+        """
+
+        self.__dict__.update(state)
+        self.regexp = compile_pattern(state["regexp"])
+
+    def encode(self, encoding: str) -> "MultiPatternMatcher":
+        """
+        Возвращает копию набора с шаблонами, закодированными
+        в байты, для поиска по mmap.
+
+        ************************************************
+
+        Returns a copy of the set with the patterns encoded
+        to bytes, for searching over mmap.
+        """
+
+        encoded = copy.copy(self)
+        encoded.patterns = [
+            pattern.encode(encoding) for pattern in self.patterns
+        ]
+        encoded.regexp = compile_pattern(
+            self.regexp.pattern.encode(encoding)
+        )
+        return encoded
+
+    def value(self, match) -> Tuple[str, str]:
+        """
+        Возвращает пару из шаблона и найденного текста.
+
+        ************************************************
+
+        Returns a pair of the pattern and the matched text.
+        """
+
+        if self.literal:
+            return match.group(0), match.group(0)
+        index = int(match.lastgroup[len(MULTI_GROUP_PREFIX):])
+        return self.patterns[index], match.group(0)
+
+
+def _trie_regex(words: Iterable[str]) -> str:
+    """
+    Строит регулярное выражение из префиксного дерева слов.
+    Более длинное слово побеждает более короткое с тем же началом.
+
+    ************************************************
+
+    Builds a regular expression from a prefix tree of words.
+    A longer word wins over a shorter one with the same start.
+    """
+
+    trie: Dict[str, dict] = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def build(node: Dict[str, dict]) -> str:
+        singles: List[str] = []
+        branches: List[str] = []
+        for char in sorted(node):
+            if not char:
+                continue
+            child = node[char]
+            if list(child) == [""]:
+                singles.append(re.escape(char))
+            else:
+                branches.append(re.escape(char) + build(child))
+        if len(singles) == 1:
+            branches.append(singles[0])
+        elif singles:
+            branches.append("[" + "".join(singles) + "]")
+        if "" in node:
+            return "(?:" + "|".join(branches) + ")?" if branches else ""
+        if len(branches) == 1:
+            return branches[0]
+        return "(?:" + "|".join(branches) + ")"
+
+    return build(trie)
+
+
+def _resolve(pattern) -> Tuple[re.Pattern, Callable]:
+    """
+    Возвращает скомпилированное выражение и функцию, которая
+    превращает совпадение в результат.
+
+    ************************************************
+
+    Returns the compiled expression and the function that
+    turns a match into a result.
+    """
+
+    if isinstance(pattern, MultiPatternMatcher):
+        return pattern.regexp, pattern.value
+    return compile_pattern(pattern), _match_value
 
 
 def find_words_re(pattern, text) -> List[str]:
@@ -7,7 +403,8 @@ def find_words_re(pattern, text) -> List[str]:
     Ищет все совпадения с регулярным выражением в тексте.
 
     Аргументы:
-    pattern (str): Регулярное выражение для поиска.
+    pattern (str): Регулярное выражение для поиска или набор
+    шаблонов MultiPatternMatcher.
     text (str): Текст, в котором нужно искать совпадения.
 
     Возвращает:
@@ -18,11 +415,2380 @@ def find_words_re(pattern, text) -> List[str]:
     Searches for all matches with the regular expression in the text.
 
     Arguments:
-    pattern (str): A regular expression for the search.
+    pattern (str): A regular expression for the search or a
+    MultiPatternMatcher set of patterns.
     text (str): The text in which to look for matches.
 
     Returns:
     List[str]: A list of strings matching the regular expression.
     """
 
-    return re.findall(pattern, text)
+    regexp, value = _resolve(pattern)
+    if value is _match_value:
+        return regexp.findall(text)
+    return [value(match) for match in regexp.finditer(text)]
+
+
+def read_chunks(file_obj, chunk_size: int = CHUNK_SIZE) -> Iterator[str]:
+    """
+    Читает открытый файл блоками фиксированного размера.
+
+    Аргументы:
+    file_obj: Открытый файловый объект.
+    chunk_size (int): Размер блока в символах.
+
+    Возвращает:
+    Iterator[str]: Итератор по блокам текста.
+
+    ************************************************
+
+    Reads an open file in fixed-size chunks.
+
+    Arguments:
+    file_obj: An open file object.
+    chunk_size (int): The chunk size in characters.
+
+    Returns:
+    Iterator[str]: An iterator over the text chunks.
+    """
+
+    while True:
+        chunk = file_obj.read(chunk_size)
+        if not chunk:
+            return
+        yield chunk
+
+
+_BOMS: Tuple[Tuple[bytes, str], ...] = (
+    (codecs.BOM_UTF32_LE, "utf-32"),
+    (codecs.BOM_UTF32_BE, "utf-32"),
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+
+
+def detect_encoding(head: bytes) -> str:
+    """
+    Определяет кодировку по началу файла.
+
+    Сначала проверяется метка порядка байтов, затем начало файла
+    декодируется как UTF-8 (обрезанный последний символ допустим).
+    Если верных символов UTF-8 за пределами ASCII больше, чем
+    неверных последовательностей, файл считается UTF-8 со
+    случайными повреждениями, иначе возвращается FALLBACK_ENCODING.
+
+    ************************************************
+
+    Detects the encoding from the start of a file.
+
+    The byte order mark is checked first, then the start of the
+    file is decoded as UTF-8 (a cut last character is allowed).
+    If there are more valid non-ASCII UTF-8 characters than invalid
+    sequences, the file is taken as UTF-8 with occasional damage,
+    otherwise FALLBACK_ENCODING is returned.
+    """
+
+    for bom, encoding in _BOMS:
+        if head.startswith(bom):
+            return encoding
+    text: str = codecs.getincrementaldecoder("utf-8")("replace").decode(head)
+    invalid: int = text.count("\ufffd")
+    if not invalid:
+        return "utf-8"
+    non_ascii: int = sum(1 for char in text if char > "\x7f") - invalid
+    return "utf-8" if non_ascii > invalid else FALLBACK_ENCODING
+
+
+_MAGIC: Tuple[Tuple[bytes, str], ...] = (
+    (b"\x1f\x8b", "gzip"),
+    (b"BZh", "bz2"),
+    (b"\xfd7zXZ\x00", "xz"),
+    (b"\x28\xb5\x2f\xfd", "zstd"),
+)
+
+
+def detect_compression(head: bytes) -> Optional[str]:
+    """
+    Определяет формат сжатия по сигнатуре в начале данных.
+
+    Возвращает:
+    str: "gzip", "bz2", "xz", "zstd" или None для несжатых данных.
+
+    ************************************************
+
+    Detects the compression format from the signature at the start
+    of the data.
+
+    Returns:
+    str: "gzip", "bz2", "xz", "zstd" or None for uncompressed data.
+    """
+
+    for magic, compression in _MAGIC:
+        if head.startswith(magic):
+            return compression
+    return None
+
+
+def file_compression(filepath: str) -> Optional[str]:
+    """
+    Определяет формат сжатия файла по его первым байтам.
+
+    ************************************************
+
+    Detects the compression format of a file from its first bytes.
+    """
+
+    with open(filepath, "rb") as in_file:
+        return detect_compression(in_file.read(8))
+
+
+def open_decompressed(
+        raw, threaded: bool = DECOMPRESS_THREADED
+) -> Tuple[object, Optional[str]]:
+    """
+    Возвращает поток, распаковывающий двоичный файл на лету,
+    если по сигнатуре он сжат, и формат сжатия.
+
+    Сигнатура читается через peek, поэтому данные из raw не
+    теряются. Zstandard поддерживается, если установлен пакет
+    zstandard. При threaded распаковка идёт в отдельном потоке
+    параллельно с поиском: модули zlib, bz2 и lzma освобождают
+    GIL во время работы.
+
+    ************************************************
+
+    Returns a stream that decompresses the binary file on the fly
+    if its signature says it is compressed, and the compression
+    format.
+
+    The signature is read through peek, so no data is lost from
+    raw. Zstandard is supported if the zstandard package is
+    installed. With threaded, decompression runs on a separate
+    thread alongside the search: the zlib, bz2 and lzma modules
+    release the GIL while they work.
+    """
+
+    peek = getattr(raw, "peek", None)
+    compression = detect_compression(peek(8)[:8]) if peek else None
+    if compression is None:
+        return raw, None
+    if compression == "gzip":
+        stream = gzip.GzipFile(fileobj=raw, mode="rb")
+    elif compression == "bz2":
+        stream = bz2.BZ2File(raw)
+    elif compression == "xz":
+        stream = lzma.LZMAFile(raw)
+    else:
+        try:
+            import zstandard
+        except ImportError:
+            raise ValueError(
+                "Zstandard input needs the zstandard package."
+            ) from None
+        stream = zstandard.ZstdDecompressor().stream_reader(
+            raw, read_across_frames=True
+        )
+    if threaded:
+        stream = PrefetchReader(stream)
+    return stream, compression
+
+
+class PrefetchReader:
+    """
+    Читает двоичный поток в фоновом потоке на несколько блоков
+    вперёд, чтобы чтение и распаковка шли параллельно с поиском.
+
+    Атрибуты:
+    chunk_size (int): Размер читаемого блока в байтах.
+
+    ************************************************
+
+    Reads a binary stream a few chunks ahead on a background
+    thread so that reading and decompression run alongside
+    the search.
+
+    Attributes:
+    chunk_size (int): The size of a read chunk in bytes.
+    """
+
+    def __init__(
+            self, stream, chunk_size: int = CHUNK_SIZE,
+            depth: int = PREFETCH_DEPTH
+    ) -> None:
+        """
+        Запускает фоновое чтение потока.
+
+        ************************************************
+
+        Starts reading the stream in the background.
+        """
+
+        self.chunk_size = chunk_size
+        self._stream = stream
+        self._queue: queue.Queue = queue.Queue(maxsize=depth)
+        self._buffer = bytearray()
+        self._eof = False
+        self._closed = threading.Event()
+        self._thread = threading.Thread(target=self._fill, daemon=True)
+        self._thread.start()
+
+    def _fill(self) -> None:
+        """
+        Читает блоки в очередь до конца потока или закрытия.
+
+        ************************************************
+
+        Reads chunks into the queue until the stream ends
+        or is closed.
+        """
+
+        try:
+            while not self._closed.is_set():
+                data: bytes = self._stream.read(self.chunk_size)
+                self._put(data)
+                if not data:
+                    return
+        except Exception as error:
+            self._put(error)
+
+    def _put(self, item) -> None:
+        """
+        Кладёт элемент в очередь, не зависая после закрытия.
+
+        ************************************************
+
+        Puts an item into the queue without hanging after close.
+        """
+
+        while not self._closed.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def read(self, size: int = -1) -> bytes:
+        """
+        Возвращает не более size байтов (все при отрицательном
+        size). Пустой результат означает конец потока.
+
+        Блоки собираются в bytearray, поэтому большое чтение
+        не копирует накопленные данные на каждом блоке.
+
+        ************************************************
+
+        Returns at most size bytes (all of them if size is
+        negative). An empty result means the end of the stream.
+
+        Chunks are gathered in a bytearray, so a large read
+        does not copy the accumulated data on every chunk.
+        """
+
+        while not self._eof and (size < 0 or len(self._buffer) < size):
+            item = self._queue.get()
+            if isinstance(item, Exception):
+                raise item
+            if not item:
+                self._eof = True
+            self._buffer += item
+        if size < 0:
+            size = len(self._buffer)
+        data: bytes = bytes(self._buffer[:size])
+        del self._buffer[:size]
+        return data
+
+    def close(self) -> None:
+        """
+        Останавливает фоновое чтение и закрывает поток.
+
+        ************************************************
+
+        Stops the background reading and closes the stream.
+        """
+
+        self._closed.set()
+        self._thread.join()
+        self._stream.close()
+
+
+class SourceReader:
+    """
+    Читает файл в двоичном режиме и декодирует его по частям.
+
+    Кодировка задаётся явно или определяется по началу файла.
+    Декодер инкрементальный, поэтому многобайтовые символы на
+    границах блоков не теряются, а политика ошибок (по умолчанию
+    "replace") не даёт поиску прерваться на середине большого
+    файла из-за одного неверного байта. Переводы строк `\\r\\n`
+    заменяются на `\\n`, как при чтении в текстовом режиме,
+    но без посимвольной обработки. Сжатые файлы (gzip, bz2, xz,
+    zstd) распознаются по сигнатуре и распаковываются на лету.
+
+    Атрибуты:
+    encoding (str): Кодировка файла.
+    errors (str): Политика обработки ошибок декодирования.
+    chunk_size (int): Размер читаемого блока в байтах.
+    compression (str): Формат сжатия файла или None.
+    read_time (float): Время чтения и распаковки в секундах.
+    decode_time (float): Время декодирования в секундах.
+
+    ************************************************
+
+    Reads a file in binary mode and decodes it piece by piece.
+
+    The encoding is either given or detected from the start of
+    the file. The decoder is incremental, so multibyte characters
+    on chunk boundaries are not lost, and the error policy
+    ("replace" by default) keeps the search from stopping halfway
+    through a large file because of a single bad byte. `\\r\\n`
+    line breaks are replaced with `\\n`, as in text mode, but
+    without per-character processing. Compressed files (gzip, bz2,
+    xz, zstd) are recognised by their signature and decompressed
+    on the fly.
+
+    Attributes:
+    encoding (str): The file encoding.
+    errors (str): The decoding error policy.
+    chunk_size (int): The size of a read chunk in bytes.
+    compression (str): The compression format of the file or None.
+    read_time (float): The reading and decompression time in seconds.
+    decode_time (float): The decoding time in seconds.
+    """
+
+    def __init__(
+            self, source, encoding: Optional[str] = None,
+            errors: str = DECODE_ERRORS,
+            chunk_size: int = CHUNK_SIZE,
+            decompress: bool = True
+    ) -> None:
+        """
+        Открывает файл по пути или принимает открытый двоичный
+        файловый объект и определяет кодировку. Без decompress
+        сжатие не распознаётся: так читаются фрагменты файла,
+        начало которых может случайно совпасть с сигнатурой.
+
+        ************************************************
+
+        Opens the file by path or takes an open binary file
+        object and detects the encoding. Without decompress,
+        compression is not detected: this is how pieces of a file
+        whose start may happen to look like a signature are read.
+        """
+
+        if isinstance(source, (str, bytes, os.PathLike)):
+            self._raw = open(source, "rb")
+            self._owned = True
+        else:
+            self._raw = source
+            self._owned = False
+        try:
+            if decompress:
+                self._file, self.compression = open_decompressed(self._raw)
+            else:
+                self._file, self.compression = self._raw, None
+        except Exception:
+            self.close()
+            raise
+        self.errors = errors
+        self.chunk_size = chunk_size
+        self._position = 0
+        self._head: bytes = b""
+        self.read_time: float = 0.0
+        self.decode_time: float = 0.0
+        if encoding is None:
+            started: float = time.perf_counter()
+            self._head = self._file.read(DETECT_SIZE)
+            self.read_time += time.perf_counter() - started
+            encoding = detect_encoding(self._head)
+        self.encoding = codecs.lookup(encoding).name
+        self._decoder = codecs.getincrementaldecoder(encoding)(errors)
+
+    def __enter__(self) -> "SourceReader":
+        """
+        Возвращает читателя для блока with.
+
+        ************************************************
+
+        Returns the reader for a with block.
+        """
+
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """
+        Закрывает файл при выходе из блока with.
+
+        ************************************************
+
+        Closes the file when leaving the with block.
+        """
+
+        self.close()
+
+    def close(self) -> None:
+        """
+        Закрывает поток распаковки и файл, если он был открыт
+        читателем.
+
+        ************************************************
+
+        Closes the decompression stream and the file if it was
+        opened by the reader.
+        """
+
+        stream = getattr(self, "_file", self._raw)
+        if stream is not self._raw:
+            stream.close()
+        if self._owned:
+            self._raw.close()
+
+    def tell(self) -> int:
+        """
+        Возвращает число уже прочитанных байтов файла. Для сжатого
+        файла это позиция в сжатых данных.
+
+        ************************************************
+
+        Returns the number of file bytes read so far. For
+        a compressed file this is the position in the compressed
+        data.
+        """
+
+        if self.compression is not None:
+            return self._raw.tell()
+        return self._position
+
+    def chunks(self) -> Iterator[str]:
+        """
+        Возвращает декодированный текст блоками. Время чтения
+        и декодирования добавляется к read_time и decode_time.
+
+        ************************************************
+
+        Returns the decoded text in chunks. The time spent reading
+        and decoding is added to read_time and decode_time.
+        """
+
+        pending: str = ""
+        while True:
+            started: float = time.perf_counter()
+            if self._head:
+                data, self._head = self._head, b""
+            else:
+                data = self._file.read(self.chunk_size)
+            decoding: float = time.perf_counter()
+            self.read_time += decoding - started
+            self._position += len(data)
+            final: bool = not data
+            text: str = pending + self._decoder.decode(data, final)
+            pending = ""
+            if not final and text.endswith("\r"):
+                text, pending = text[:-1], "\r"
+            text = text.replace("\r\n", "\n")
+            self.decode_time += time.perf_counter() - decoding
+            if text:
+                yield text
+            if final:
+                return
+
+    def read(self, size: int = -1) -> str:
+        """
+        Возвращает не менее size символов текста (или весь текст
+        при отрицательном size), читая блоками.
+
+        ************************************************
+
+        Returns at least size characters of text (or the whole
+        text if size is negative), reading in chunks.
+        """
+
+        parts: List[str] = []
+        length: int = 0
+        for chunk in self.chunks():
+            parts.append(chunk)
+            length += len(chunk)
+            if 0 <= size <= length:
+                break
+        text: str = "".join(parts)
+        return text if size < 0 else text[:size]
+
+
+def read_text(
+        filepath: str, encoding: Optional[str] = None,
+        errors: str = DECODE_ERRORS
+) -> str:
+    """
+    Читает весь текстовый файл через SourceReader.
+
+    ************************************************
+
+    Reads a whole text file through SourceReader.
+    """
+
+    with SourceReader(filepath, encoding, errors) as reader:
+        return reader.read()
+
+
+def _match_value(match) -> Match:
+    """
+    Преобразует объект совпадения в значение, как в re.findall.
+
+    ************************************************
+
+    Converts a match object into a value the way re.findall does.
+    """
+
+    groups = match.groups(match.string[:0])
+    if not groups:
+        return match.group(0)
+    if len(groups) == 1:
+        return groups[0]
+    return groups
+
+
+def format_match(match: Match) -> str:
+    """
+    Преобразует совпадение в строку вывода. Группы
+    разделяются табуляцией.
+
+    ************************************************
+
+    Converts a match into an output line. Groups
+    are separated by tabs.
+    """
+
+    if isinstance(match, tuple):
+        return "\t".join(match)
+    return match
+
+
+def find_words_stream(
+        pattern, chunks: Iterable[str],
+        overlap: int = CHUNK_OVERLAP
+) -> Iterator[Match]:
+    """
+    Потоково ищет совпадения в тексте, поступающем блоками.
+
+    Совпадение, которое заканчивается в последних `overlap` символах
+    буфера, откладывается до прихода следующего блока, поэтому
+    совпадения на границах блоков не теряются и не дублируются.
+    Те же `overlap` символов сохраняются перед точкой продолжения
+    как контекст для `\\b` и ретроспективных проверок. Потребление
+    памяти ограничено размером блока, окном перекрытия и длиной
+    самого длинного совпадения. Окно должно быть длиннее любого
+    совпадения вместе с его опережающими проверками.
+
+    Аргументы:
+    pattern (str): Регулярное выражение для поиска.
+    chunks (Iterable[str]): Блоки текста по порядку.
+    overlap (int): Размер окна перекрытия в символах.
+
+    Возвращает:
+    Iterator[Match]: Совпадения в том же виде, что и у re.findall.
+
+    ************************************************
+
+    Searches for matches in text that arrives in chunks.
+
+    A match that ends within the last `overlap` characters of the
+    buffer is deferred until the next chunk arrives, so matches on
+    chunk boundaries are neither lost nor duplicated. The same
+    `overlap` characters are kept before the resume point as context
+    for `\\b` and lookbehind assertions. Memory use is bounded by the
+    chunk size, the overlap window and the longest match. The window
+    must be longer than any match together with its lookahead.
+
+    Arguments:
+    pattern (str): A regular expression for the search.
+    chunks (Iterable[str]): The text chunks in order.
+    overlap (int): The overlap window size in characters.
+
+    Returns:
+    Iterator[Match]: Matches in the same form as re.findall.
+    """
+
+    regexp, value = _resolve(pattern)
+    for match, _ in _stream_matches(regexp, chunks, overlap):
+        yield value(match)
+
+
+def _stream_matches(
+        regexp: re.Pattern, chunks: Iterable[str], overlap: int
+) -> Iterator[Tuple[re.Match, int]]:
+    """
+    Общий цикл потокового поиска для find_words_stream и
+    iter_spans_stream. Возвращает совпадения вместе со смещением
+    начала буфера, в котором они найдены, от начала текста.
+
+    ************************************************
+
+    The shared streaming loop of find_words_stream and
+    iter_spans_stream. Returns matches together with the offset
+    from the start of the text of the buffer they were found in.
+    """
+
+    chunks = iter(chunks)
+    buffer: str = ""
+    base: int = 0
+    pos: int = 0
+    while True:
+        chunk = next(chunks, None)
+        eof: bool = chunk is None
+        if not eof:
+            buffer += chunk
+        boundary: int = len(buffer) if eof else len(buffer) - overlap
+        resume: int = max(pos, boundary)
+        for match in regexp.finditer(buffer, pos):
+            if not eof and (
+                match.end() > boundary or match.start() >= boundary
+            ):
+                resume = max(pos, min(match.start(), boundary))
+                break
+            yield match, base
+        if eof:
+            return
+        keep_from: int = max(0, resume - overlap)
+        buffer = buffer[keep_from:]
+        base += keep_from
+        pos = resume - keep_from
+
+
+def _decode_value(value, encoding: str) -> Match:
+    """
+    Декодирует байтовое совпадение (или кортеж групп) в строку.
+
+    ************************************************
+
+    Decodes a bytes match (or a tuple of groups) into a string.
+    """
+
+    if isinstance(value, tuple):
+        return tuple(item.decode(encoding, "replace") for item in value)
+    return value.decode(encoding, "replace")
+
+
+def find_words_mmap(
+        pattern, filepath: str,
+        encoding: str = MMAP_ENCODING,
+        progress: Optional[Callable[[int], None]] = None
+) -> Iterator[Match]:
+    """
+    Ищет совпадения в файле, отображённом в память через mmap.
+
+    Шаблон кодируется в байты и применяется прямо к отображению
+    файла, поэтому файл не копируется и не декодируется целиком,
+    а ядро подгружает страницы по мере необходимости. Подходит
+    для ASCII и UTF-8 текстов: классы символов вроде `\\w` в
+    байтовом режиме распознают только ASCII. Сжатый файл нельзя
+    отобразить в память, поэтому он читается через SourceReader.
+
+    Аргументы:
+    pattern (str): Регулярное выражение для поиска.
+    filepath (str): Путь к исходному файлу.
+    encoding (str): Кодировка файла и шаблона.
+    progress (Callable): Получает позицию конца каждого совпадения
+    в байтах перед тем, как оно возвращается; для сжатого файла
+    не вызывается.
+
+    Возвращает:
+    Iterator[Match]: Совпадения в том же виде, что и у re.findall.
+
+    ************************************************
+
+    Searches for matches in a file mapped into memory with mmap.
+
+    The pattern is encoded to bytes and run directly over the file
+    mapping, so the file is neither copied nor decoded as a whole,
+    and the kernel pages data in on demand. Suitable for ASCII and
+    UTF-8 text: character classes such as `\\w` only recognise ASCII
+    in bytes mode. A compressed file cannot be mapped, so it is
+    streamed through SourceReader instead.
+
+    Arguments:
+    pattern (str): A regular expression for the search.
+    filepath (str): The path to the source file.
+    encoding (str): The encoding of the file and the pattern.
+    progress (Callable): Receives the byte position of the end of
+    every match before it is returned; not called for a compressed
+    file.
+
+    Returns:
+    Iterator[Match]: Matches in the same form as re.findall.
+    """
+
+    if file_compression(filepath) is not None:
+        with SourceReader(filepath, encoding) as reader:
+            yield from find_words_stream(pattern, reader.chunks())
+        return
+    regexp, value = _resolve(pattern.encode(encoding))
+    with open(filepath, "rb") as in_file:
+        if not os.fstat(in_file.fileno()).st_size:
+            return
+        with mmap.mmap(
+            in_file.fileno(), 0, access=mmap.ACCESS_READ
+        ) as mapped:
+            for match in regexp.finditer(mapped):
+                if progress is not None:
+                    progress(match.end())
+                yield _decode_value(value(match), encoding)
+
+
+def collect_files(paths: Iterable[str]) -> List[str]:
+    """
+    Раскрывает каталоги в список файлов.
+
+    Каталоги обходятся рекурсивно в отсортированном порядке,
+    повторяющиеся пути отбрасываются, поэтому порядок
+    результата детерминирован.
+
+    Аргументы:
+    paths (Iterable[str]): Пути к файлам и каталогам.
+
+    Возвращает:
+    List[str]: Пути к файлам.
+
+    ************************************************
+
+    Expands directories into a list of files.
+
+    Directories are walked recursively in sorted order and
+    duplicate paths are dropped, so the order of the result
+    is deterministic.
+
+    Arguments:
+    paths (Iterable[str]): The paths to files and directories.
+
+    Returns:
+    List[str]: The paths to the files.
+    """
+
+    filepaths: Dict[str, None] = {}
+    for path in paths:
+        if not os.path.isdir(path):
+            filepaths[path] = None
+            continue
+        for dirpath, dirnames, filenames in os.walk(path):
+            dirnames.sort()
+            for filename in sorted(filenames):
+                filepaths[os.path.join(dirpath, filename)] = None
+    return list(filepaths)
+
+
+def search_file(
+        pattern, filepath: str,
+        encoding: Optional[str] = None,
+        use_mmap: bool = False,
+        errors: str = DECODE_ERRORS
+) -> List[Match]:
+    """
+    Ищет все совпадения в одном файле.
+
+    Аргументы:
+    pattern (str): Регулярное выражение для поиска.
+    filepath (str): Путь к файлу.
+    encoding (str): Кодировка файла или None для определения
+    по началу файла.
+    use_mmap (bool): Искать по отображению файла в память.
+    errors (str): Политика обработки ошибок декодирования.
+
+    Возвращает:
+    List[Match]: Совпадения в том же виде, что и у re.findall.
+
+    ************************************************
+
+    Searches a single file for all matches.
+
+    Arguments:
+    pattern (str): A regular expression for the search.
+    filepath (str): The path to the file.
+    encoding (str): The file encoding or None to detect it
+    from the start of the file.
+    use_mmap (bool): Search the memory-mapped file.
+    errors (str): The decoding error policy.
+
+    Returns:
+    List[Match]: Matches in the same form as re.findall.
+    """
+
+    if use_mmap:
+        return list(
+            find_words_mmap(pattern, filepath, encoding or MMAP_ENCODING)
+        )
+    with SourceReader(filepath, encoding, errors) as reader:
+        return list(find_words_stream(pattern, reader.chunks()))
+
+
+def find_words_in_files(
+        pattern, filepaths: Iterable[str],
+        workers: Optional[int] = SEARCH_WORKERS,
+        encoding: Optional[str] = None,
+        use_mmap: bool = False,
+        task: Callable = search_file,
+        errors: str = DECODE_ERRORS
+) -> Iterator[Tuple[str, List[Match]]]:
+    """
+    Ищет совпадения в нескольких файлах в пуле процессов.
+
+    Файлы отправляются в пул от самого большого к самому
+    маленькому, чтобы крупные файлы не задерживали завершение,
+    а результаты возвращаются в исходном порядке файлов.
+
+    Аргументы:
+    pattern (str): Регулярное выражение для поиска.
+    filepaths (Iterable[str]): Пути к файлам.
+    workers (int): Число процессов, по умолчанию число ядер.
+    encoding (str): Кодировка файлов.
+    use_mmap (bool): Искать по отображению файлов в память.
+    task (Callable): Функция, выполняемая для каждого файла,
+    по умолчанию search_file.
+    errors (str): Политика обработки ошибок декодирования.
+
+    Возвращает:
+    Iterator[Tuple[str, List[Match]]]: Пары из пути к файлу
+    и его совпадений (результата task).
+
+    ************************************************
+
+    Searches several files for matches on a process pool.
+
+    Files are submitted to the pool from the largest to the
+    smallest so that big files do not hold up completion, and
+    the results are returned in the original file order.
+
+    Arguments:
+    pattern (str): A regular expression for the search.
+    filepaths (Iterable[str]): The paths to the files.
+    workers (int): The number of processes, the core count by default.
+    encoding (str): The file encoding.
+    use_mmap (bool): Search the memory-mapped files.
+    task (Callable): The function run for every file,
+    search_file by default.
+    errors (str): The decoding error policy.
+
+    Returns:
+    Iterator[Tuple[str, List[Match]]]: Pairs of a file path
+    and its matches (the result of task).
+    """
+
+    filepaths = list(filepaths)
+    if workers == 1 or len(filepaths) < 2:
+        for filepath in filepaths:
+            yield filepath, task(
+                pattern, filepath, encoding, use_mmap, errors
+            )
+        return
+    by_size = sorted(filepaths, key=file_size, reverse=True)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            filepath: executor.submit(
+                task, pattern, filepath, encoding, use_mmap, errors
+            )
+            for filepath in by_size
+        }
+        try:
+            for filepath in filepaths:
+                yield filepath, futures[filepath].result()
+        finally:
+            for future in futures.values():
+                future.cancel()
+
+
+def parallel_encoding(
+        pattern, filepath: str, encoding: Optional[str] = None,
+        min_size: int = PARALLEL_MIN_SIZE
+) -> Optional[str]:
+    """
+    Проверяет, можно ли искать в файле параллельно по диапазонам
+    строк, и возвращает кодировку файла или None.
+
+    Параллельный поиск возможен, если совпадения шаблона не
+    выходят за пределы строки, файл не сжат, не меньше min_size
+    байт и записан в кодировке, совместимой с ASCII, где перевод
+    строки — это один байт `\\n`.
+
+    Аргументы:
+    pattern (str): Регулярное выражение или MultiPatternMatcher.
+    filepath (str): Путь к файлу.
+    encoding (str): Кодировка файла или None для определения
+    по началу файла.
+    min_size (int): Наименьший размер файла для параллельного
+    поиска.
+
+    Возвращает:
+    str: Кодировка файла или None, если искать нужно
+    последовательно.
+
+    ************************************************
+
+    Checks whether the file can be searched in parallel over
+    ranges of lines and returns the file encoding or None.
+
+    A parallel search is possible if the matches of the pattern
+    never leave a line, and the file is not compressed, is at
+    least min_size bytes and uses an ASCII-compatible encoding
+    where a line break is the single byte `\\n`.
+
+    Arguments:
+    pattern (str): A regular expression or a MultiPatternMatcher.
+    filepath (str): The path to the file.
+    encoding (str): The file encoding or None to detect it
+    from the start of the file.
+    min_size (int): The smallest file size for a parallel search.
+
+    Returns:
+    str: The file encoding or None if the file must be searched
+    serially.
+    """
+
+    if file_size(filepath) < min_size or not is_line_local(pattern):
+        return None
+    return line_encoding(filepath, encoding)
+
+
+def line_encoding(
+        filepath: str, encoding: Optional[str] = None
+) -> Optional[str]:
+    """
+    Возвращает кодировку файла, если его можно делить на строки
+    прямо в байтах: файл не сжат, а кодировка совместима с ASCII,
+    и перевод строки в ней — один байт `\\n`. Иначе возвращает None.
+
+    ************************************************
+
+    Returns the file encoding if the file can be split into lines
+    right in its bytes: the file is not compressed and the encoding
+    is ASCII-compatible, with a line break being the single byte
+    `\\n`. Otherwise returns None.
+    """
+
+    try:
+        with open(filepath, "rb") as in_file:
+            head: bytes = in_file.read(DETECT_SIZE)
+    except OSError:
+        return None
+    if detect_compression(head[:8]) is not None:
+        return None
+    try:
+        name: str = codecs.lookup(encoding or detect_encoding(head)).name
+    except LookupError:
+        return None
+    if "\r\n".encode(_range_encoding(name)) != b"\r\n":
+        return None
+    return name
+
+
+def find_words_parallel(
+        pattern, filepath: str, encoding: str,
+        errors: str = DECODE_ERRORS,
+        workers: Optional[int] = SEARCH_WORKERS,
+        range_size: int = PARALLEL_RANGE_SIZE,
+        progress: Optional[Callable[[int], None]] = None,
+        cancelled: Optional[Callable[[], bool]] = None
+) -> Iterator[Match]:
+    """
+    Ищет совпадения в одном большом файле на нескольких ядрах.
+
+    Файл делится на диапазоны примерно по range_size байт,
+    выровненные по переводам строк, и каждый диапазон ищется
+    в процессе пула. Процессы не получают копий данных: каждый
+    отображает файл в память через mmap и читает только свой
+    диапазон, а страницы файла общие в кэше ядра. Одновременно
+    в работе не больше двух диапазонов на процесс, а результаты
+    возвращаются в порядке файла.
+
+    Подходит только для построчных шаблонов и кодировок,
+    совместимых с ASCII; это проверяет parallel_encoding.
+
+    Аргументы:
+    pattern (str): Регулярное выражение или MultiPatternMatcher.
+    filepath (str): Путь к файлу.
+    encoding (str): Кодировка файла.
+    errors (str): Политика обработки ошибок декодирования.
+    workers (int): Число процессов, по умолчанию число ядер.
+    range_size (int): Примерный размер диапазона в байтах.
+    progress (Callable): Получает позицию конца обработанного
+    диапазона в байтах.
+    cancelled (Callable): Возвращает True, если поиск нужно
+    прервать.
+
+    Возвращает:
+    Iterator[Match]: Совпадения в том же виде, что и у re.findall.
+
+    ************************************************
+
+    Searches a single large file for matches on several cores.
+
+    The file is split into ranges of about range_size bytes
+    aligned to line breaks, and every range is searched in a pool
+    process. The processes get no copies of the data: each maps
+    the file into memory with mmap and reads only its own range,
+    while the file pages are shared in the kernel cache. At most
+    two ranges per process are in flight at a time, and the
+    results are returned in file order.
+
+    Only suitable for line-local patterns and ASCII-compatible
+    encodings; parallel_encoding checks this.
+
+    Arguments:
+    pattern (str): A regular expression or a MultiPatternMatcher.
+    filepath (str): The path to the file.
+    encoding (str): The file encoding.
+    errors (str): The decoding error policy.
+    workers (int): The number of processes, the core count by default.
+    range_size (int): The approximate range size in bytes.
+    progress (Callable): Receives the byte position of the end
+    of the range just processed.
+    cancelled (Callable): Returns True if the search should
+    be interrupted.
+
+    Returns:
+    Iterator[Match]: Matches in the same form as re.findall.
+    """
+
+    with open(filepath, "rb") as in_file:
+        size: int = os.fstat(in_file.fileno()).st_size
+        if not size:
+            return
+        with mmap.mmap(
+            in_file.fileno(), 0, access=mmap.ACCESS_READ
+        ) as mapped:
+            ranges: List[Tuple[int, int]] = line_ranges(
+                mapped, size, range_size
+            )
+    tasks: List[Tuple[int, int, str, bool]] = [
+        (
+            start, end,
+            encoding if not start else _range_encoding(encoding),
+            end == size
+        )
+        for start, end in ranges
+    ]
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(tasks) < 2:
+        for start, end, range_encoding, last in tasks:
+            if cancelled is not None and cancelled():
+                return
+            yield from _scan_range(
+                pattern, filepath, start, end, range_encoding, errors, last
+            )
+            if progress is not None:
+                progress(end)
+        return
+    queued: Iterator[Tuple[int, int, str, bool]] = iter(tasks)
+    pending: deque = deque()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+
+        def submit() -> None:
+            task = next(queued, None)
+            if task is not None:
+                start, end, range_encoding, last = task
+                pending.append((end, executor.submit(
+                    _scan_range, pattern, filepath, start, end,
+                    range_encoding, errors, last
+                )))
+
+        try:
+            for _ in range(2 * workers):
+                submit()
+            while pending:
+                end, future = pending.popleft()
+                matches: List[Match] = future.result()
+                if cancelled is not None and cancelled():
+                    return
+                submit()
+                yield from matches
+                if progress is not None:
+                    progress(end)
+        finally:
+            for _, future in pending:
+                future.cancel()
+
+
+def line_ranges(
+        mapped, size: int, range_size: int = PARALLEL_RANGE_SIZE
+) -> List[Tuple[int, int]]:
+    """
+    Делит данные на диапазоны примерно по range_size байт,
+    каждый из которых заканчивается переводом строки или концом
+    данных. Очень длинная строка целиком попадает в один диапазон.
+
+    ************************************************
+
+    Splits the data into ranges of about range_size bytes, each
+    ending with a line break or the end of the data. A very long
+    line falls into a single range as a whole.
+    """
+
+    ranges: List[Tuple[int, int]] = []
+    start: int = 0
+    while start < size:
+        end: int = min(start + max(range_size, 1), size)
+        if end < size:
+            newline: int = mapped.find(b"\n", end - 1)
+            end = size if newline < 0 else newline + 1
+        ranges.append((start, end))
+        start = end
+    return ranges
+
+
+def _range_encoding(encoding: str) -> str:
+    """
+    Возвращает кодировку для диапазона, который начинается
+    не с начала файла: метка порядка байтов бывает только
+    в начале.
+
+    ************************************************
+
+    Returns the encoding for a range that does not start at
+    the beginning of the file: a byte order mark only appears
+    at the start.
+    """
+
+    name: str = codecs.lookup(encoding).name
+    return "utf-8" if name == "utf-8-sig" else name
+
+
+def _scan_range(
+        pattern, filepath: str, start: int, end: int,
+        encoding: str, errors: str = DECODE_ERRORS, last: bool = True
+) -> List[Match]:
+    """
+    Ищет совпадения в диапазоне байтов файла, отображённого
+    в память. Выполняется в процессе пула.
+
+    Конец диапазона, кроме последнего, — это начало следующего,
+    а не конец текста. Пустое совпадение в этой точке (например,
+    у `(?m)$` или `\\w*`) отбрасывается: всё, что начинается там,
+    найдёт поиск в следующем диапазоне.
+
+    ************************************************
+
+    Searches a byte range of the file mapped into memory.
+    Runs in a pool process.
+
+    The end of a range other than the last one is the start of
+    the next range, not the end of the text. An empty match at that
+    point (for example of `(?m)$` or `\\w*`) is dropped: whatever
+    starts there is found by the search in the next range.
+    """
+
+    with open(filepath, "rb") as in_file:
+        with mmap.mmap(
+            in_file.fileno(), 0, access=mmap.ACCESS_READ
+        ) as mapped:
+            with SourceReader(
+                _MappedRange(mapped, start, end), encoding, errors,
+                decompress=False
+            ) as reader:
+                return list(_range_matches(pattern, reader.chunks(), last))
+
+
+def _range_matches(
+        pattern, chunks: Iterable[str], last: bool = True
+) -> Iterator[Match]:
+    """
+    Потоково ищет совпадения в тексте диапазона строк. Если
+    диапазон не последний, пустое совпадение в конце его текста
+    отбрасывается.
+
+    ************************************************
+
+    Streams the matches in the text of a range of lines. If the
+    range is not the last one, an empty match at the end of its
+    text is dropped.
+    """
+
+    regexp, value = _resolve(pattern)
+    for match, _ in _stream_matches(regexp, chunks, CHUNK_OVERLAP):
+        if last or match.start() < len(match.string):
+            yield value(match)
+
+
+class _MappedRange:
+    """
+    Двоичный файловый объект только для чтения над диапазоном
+    байтов отображения в память. Данные копируются только при
+    чтении очередного блока.
+
+    ************************************************
+
+    A read-only binary file object over a byte range of a memory
+    mapping. Data is copied only when the next chunk is read.
+    """
+
+    def __init__(self, mapped, start: int, end: int) -> None:
+        """
+        Инициализация диапазона.
+
+        ************************************************
+
+        Initializing the range.
+        """
+
+        self._mapped = mapped
+        self._position = start
+        self._end = end
+
+    def read(self, size: int = -1) -> bytes:
+        """
+        Читает не больше size байт до конца диапазона.
+
+        ************************************************
+
+        Reads at most size bytes up to the end of the range.
+        """
+
+        end: int = self._end
+        if size >= 0:
+            end = min(self._position + size, end)
+        data: bytes = self._mapped[self._position:end]
+        self._position = end
+        return data
+
+    def tell(self) -> int:
+        """
+        Возвращает текущую позицию в отображении.
+
+        ************************************************
+
+        Returns the current position in the mapping.
+        """
+
+        return self._position
+
+    def close(self) -> None:
+        """
+        Ничего не делает: отображение закрывает его владелец.
+
+        ************************************************
+
+        Does nothing: the mapping is closed by its owner.
+        """
+
+
+def count_words_re(
+        pattern, chunks: Iterable[str],
+        overlap: int = CHUNK_OVERLAP
+) -> Counter:
+    """
+    Подсчитывает, сколько раз встречается каждое совпадение.
+
+    Совпадения потоково поступают в счётчик, и полный список
+    никогда не строится, поэтому память зависит от числа разных
+    совпадений, а не от их общего числа.
+
+    Аргументы:
+    pattern (str): Регулярное выражение для поиска или набор
+    шаблонов MultiPatternMatcher.
+    chunks (Iterable[str]): Блоки текста по порядку.
+    overlap (int): Размер окна перекрытия в символах.
+
+    Возвращает:
+    Counter: Число вхождений каждого совпадения.
+
+    ************************************************
+
+    Counts how many times every match occurs.
+
+    Matches are streamed into the counter and the full list is
+    never built, so memory depends on the number of distinct
+    matches rather than their total number.
+
+    Arguments:
+    pattern (str): A regular expression for the search or a
+    MultiPatternMatcher set of patterns.
+    chunks (Iterable[str]): The text chunks in order.
+    overlap (int): The overlap window size in characters.
+
+    Returns:
+    Counter: The number of occurrences of every match.
+    """
+
+    return Counter(find_words_stream(pattern, chunks, overlap))
+
+
+def count_file(
+        pattern, filepath: str,
+        encoding: Optional[str] = None,
+        use_mmap: bool = False,
+        errors: str = DECODE_ERRORS
+) -> Counter:
+    """
+    Подсчитывает совпадения в одном файле. Используется как
+    задача для find_words_in_files.
+
+    ************************************************
+
+    Counts the matches in a single file. Used as a task
+    for find_words_in_files.
+    """
+
+    if use_mmap:
+        return Counter(
+            find_words_mmap(pattern, filepath, encoding or MMAP_ENCODING)
+        )
+    with SourceReader(filepath, encoding, errors) as reader:
+        return count_words_re(pattern, reader.chunks())
+
+
+def format_counts(counter: Counter, top_k: int) -> Iterator[str]:
+    """
+    Возвращает строки сводки: общее число совпадений, число
+    разных совпадений и top_k самых частых с их количеством.
+
+    ************************************************
+
+    Returns the summary lines: the total number of matches,
+    the number of distinct matches and the top_k most frequent
+    ones with their counts.
+    """
+
+    yield f"Total: {sum(counter.values())}"
+    yield f"Distinct: {len(counter)}"
+    for match, count in counter.most_common(top_k):
+        yield f"{count}\t{format_match(match)}"
+
+
+def grep_lines(
+        pattern, chunks: Iterable[str],
+        before: int = 0, after: int = 0
+) -> Iterator[LineMatch]:
+    """
+    Построчный поиск, как у grep: возвращает совпавшие строки
+    с номерами и по before и after строк контекста вокруг них.
+
+    Шаблон применяется к каждой строке отдельно, поэтому `^` и `$`
+    означают её начало и конец. Текст читается блоками, выровненными
+    по переводам строк, а для контекста перед совпадением хранится
+    только кольцевой буфер из before строк, поэтому память не
+    зависит от размера файла, а первые результаты появляются
+    сразу. Для построчных шаблонов (is_line_local) строки без
+    совпадений пропускаются одним поиском по блоку, и шаблон
+    проверяется только на строках-кандидатах.
+
+    Аргументы:
+    pattern (str): Регулярное выражение или MultiPatternMatcher.
+    chunks (Iterable[str]): Блоки текста.
+    before (int): Число строк контекста перед совпадением.
+    after (int): Число строк контекста после совпадения.
+
+    Возвращает:
+    Iterator[LineMatch]: Кортежи (номер строки с 1, текст строки,
+    строка совпала) в порядке текста.
+
+    ************************************************
+
+    A line-oriented search like grep: returns the matching lines
+    with their numbers and before and after lines of context
+    around them.
+
+    The pattern is applied to every line separately, so `^` and
+    `$` mean its start and end. The text is read in blocks aligned
+    to line breaks, and only a ring buffer of before lines is kept
+    for the context ahead of a match, so memory does not depend on
+    the file size and the first results show up at once. For
+    line-local patterns (is_line_local) lines without matches are
+    skipped with a single search over the block, and the pattern
+    is checked only on candidate lines.
+
+    Arguments:
+    pattern (str): A regular expression or a MultiPatternMatcher.
+    chunks (Iterable[str]): The text chunks.
+    before (int): The number of context lines before a match.
+    after (int): The number of context lines after a match.
+
+    Returns:
+    Iterator[LineMatch]: Tuples (line number from 1, line text,
+    the line matched) in text order.
+    """
+
+    regexp, _ = _resolve(pattern)
+    skip: bool = is_line_local(pattern)
+    recent: deque = deque(maxlen=max(before, 0))
+    number: int = 0
+    after_left: int = 0
+    for block in _line_blocks(chunks):
+        position: int = 0
+        while position < len(block):
+            if skip and not after_left:
+                match = regexp.search(block, position)
+                stop: int = len(block)
+                if match is not None:
+                    stop = block.rfind("\n", position, match.start()) + 1
+                    stop = max(stop, position)
+                if stop > position:
+                    skipped: int = block.count("\n", position, stop)
+                    if before:
+                        tail: List[str] = block[position:stop - 1].rsplit(
+                            "\n", before
+                        )[-before:]
+                        first: int = number + skipped - len(tail) + 1
+                        recent.extend(
+                            zip(range(first, first + len(tail)), tail)
+                        )
+                    number += skipped
+                    position = stop
+                    if match is None:
+                        break
+            end: int = block.find("\n", position)
+            text: str = block[position:end]
+            position = end + 1
+            number += 1
+            if regexp.search(text) is not None:
+                for line, context in recent:
+                    yield line, context, False
+                recent.clear()
+                yield number, text, True
+                after_left = after
+            elif after_left:
+                yield number, text, False
+                after_left -= 1
+            elif before:
+                recent.append((number, text))
+
+
+def _line_blocks(chunks: Iterable[str]) -> Iterator[str]:
+    """
+    Собирает блоки текста в блоки из целых строк, каждый из
+    которых заканчивается переводом строки. К последней строке
+    без перевода строки он добавляется.
+
+    ************************************************
+
+    Gathers text chunks into blocks of whole lines, each ending
+    with a line break. One is added to a last line that has none.
+    """
+
+    pending: List[str] = []
+    for chunk in chunks:
+        cut: int = chunk.rfind("\n") + 1
+        if not cut:
+            pending.append(chunk)
+            continue
+        pending.append(chunk[:cut])
+        yield "".join(pending)
+        pending = [chunk[cut:]] if cut < len(chunk) else []
+    tail: str = "".join(pending)
+    if tail:
+        yield tail + "\n"
+
+
+def format_lines(
+        lines: Iterable[LineMatch], context: bool = False,
+        prefix: str = ""
+) -> Iterator[str]:
+    """
+    Форматирует строки grep_lines как grep -n: совпавшая строка
+    выводится как `номер:текст`, строка контекста — как
+    `номер-текст`. С context между несмежными группами строк
+    выводится разделитель `--`.
+
+    ************************************************
+
+    Formats the lines of grep_lines like grep -n: a matching line
+    is written as `number:text`, a context line as `number-text`.
+    With context a `--` separator is written between groups
+    of lines that are not adjacent.
+    """
+
+    last: Optional[int] = None
+    for number, text, matched in lines:
+        if context and last is not None and number > last + 1:
+            yield "--"
+        last = number
+        yield f"{prefix}{number}{':' if matched else '-'}{text}"
+
+
+def file_size(filepath: str) -> int:
+    """
+    Возвращает размер файла или 0, если он недоступен.
+
+    ************************************************
+
+    Returns the file size, or 0 if it is unavailable.
+    """
+
+    try:
+        return os.path.getsize(filepath)
+    except OSError:
+        return 0
+
+
+class ResultStore:
+    """
+    Компактное хранилище строк результата.
+
+    Строки хранятся подряд в одном bytearray в кодировке UTF-8,
+    а границы строк — в массиве array('q'), поэтому на каждую
+    строку не создаётся отдельный объект str. Добавляемый текст
+    с переводами строк разбивается на несколько строк, так что
+    содержимое хранилища совпадает со строками текста
+    "\\n".join(результаты).
+
+    ************************************************
+
+    A compact store of result lines.
+
+    Lines are kept back to back in a single UTF-8 bytearray and
+    the line boundaries in an array('q'), so no separate str object
+    is created per line. Appended text containing line breaks is
+    split into several lines, so the contents of the store match
+    the lines of the text "\\n".join(results).
+    """
+
+    def __init__(self) -> None:
+        """
+        Инициализация пустого хранилища.
+
+        ************************************************
+
+        Initializing an empty store.
+        """
+
+        self._data = bytearray()
+        self._offsets = array("q", [0])
+
+    def __len__(self) -> int:
+        """
+        Возвращает число строк.
+
+        ************************************************
+
+        Returns the number of lines.
+        """
+
+        return len(self._offsets) - 1
+
+    def __getitem__(self, index: int) -> str:
+        """
+        Возвращает строку по номеру.
+
+        ************************************************
+
+        Returns the line with the given number.
+        """
+
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("ResultStore index out of range")
+        return self._data[
+            self._offsets[index]:self._offsets[index + 1]
+        ].decode("utf-8", "surrogatepass")
+
+    def __iter__(self) -> Iterator[str]:
+        """
+        Перебирает строки по порядку.
+
+        ************************************************
+
+        Iterates over the lines in order.
+        """
+
+        for start in range(0, len(self), STORE_BATCH_SIZE):
+            yield from self.lines(start, start + STORE_BATCH_SIZE)
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Возвращает объём хранимого текста в байтах.
+
+        ************************************************
+
+        Returns the size of the stored text in bytes.
+        """
+
+        return len(self._data)
+
+    def append(self, text: str) -> None:
+        """
+        Добавляет текст, разбивая его на строки.
+
+        ************************************************
+
+        Appends text, splitting it into lines.
+        """
+
+        for line in text.split("\n"):
+            self._data += line.encode("utf-8", "surrogatepass")
+            self._offsets.append(len(self._data))
+
+    def extend(self, texts: Iterable[str]) -> None:
+        """
+        Добавляет несколько текстов.
+
+        ************************************************
+
+        Appends several texts.
+        """
+
+        for text in texts:
+            self.append(text)
+
+    def lines(self, start: int, stop: int) -> List[str]:
+        """
+        Возвращает строки с номерами от start до stop.
+
+        ************************************************
+
+        Returns the lines numbered from start to stop.
+        """
+
+        start = max(start, 0)
+        stop = min(stop, len(self))
+        offsets = self._offsets
+        return [
+            self._data[offsets[index]:offsets[index + 1]].decode(
+                "utf-8", "surrogatepass"
+            )
+            for index in range(start, stop)
+        ]
+
+    def chunks(self) -> Iterator[str]:
+        """
+        Возвращает содержимое как текст, разбитый на блоки,
+        строки в котором разделены переводом строки.
+
+        ************************************************
+
+        Returns the contents as text split into chunks,
+        with lines separated by a line break.
+        """
+
+        for start in range(0, len(self), STORE_BATCH_SIZE):
+            text = "\n".join(self.lines(start, start + STORE_BATCH_SIZE))
+            yield text if not start else "\n" + text
+
+    def clear(self) -> None:
+        """
+        Удаляет все строки.
+
+        ************************************************
+
+        Removes all lines.
+        """
+
+        self._data = bytearray()
+        self._offsets = array("q", [0])
+
+
+class FileLines:
+    """
+    Источник строк файла для VirtualTextView, читающий только
+    запрошенные строки.
+
+    Файл отображается в память, а разреженный индекс хранит номер
+    строки и смещение её начала примерно через каждые step байт.
+    Строка находится переходом к ближайшей предыдущей отметке
+    и поиском переводов строки от неё, поэтому память индекса
+    мала даже для файлов в несколько гигабайт. Индекс строится
+    методом build, обычно в фоновом потоке; пока он строится,
+    len() возвращает число уже учтённых строк.
+
+    Файл должен подходить для line_encoding: несжатый и в кодировке,
+    совместимой с ASCII. Строки длиннее PREVIEW_LINE_LIMIT байт
+    обрезаются.
+
+    Атрибуты:
+    filepath (str): Путь к файлу.
+    encoding (str): Кодировка файла.
+    errors (str): Политика обработки ошибок декодирования.
+    size (int): Размер файла в байтах.
+    indexed (int): Смещение, до которого построен индекс.
+    complete (bool): Индекс построен до конца файла.
+
+    ************************************************
+
+    A line source of a file for VirtualTextView that reads only
+    the requested lines.
+
+    The file is mapped into memory, and a sparse index keeps the
+    line number and the offset of its start about every step bytes.
+    A line is found by going to the nearest previous mark and
+    looking for line breaks from there, so the index memory is
+    small even for files of several gigabytes. The index is built
+    by the build method, usually on a background thread; while it
+    is being built, len() returns the number of lines counted so
+    far.
+
+    The file must suit line_encoding: not compressed and in an
+    ASCII-compatible encoding. Lines longer than PREVIEW_LINE_LIMIT
+    bytes are cut.
+
+    Attributes:
+    filepath (str): The path to the file.
+    encoding (str): The file encoding.
+    errors (str): The decoding error policy.
+    size (int): The file size in bytes.
+    indexed (int): The offset up to which the index is built.
+    complete (bool): The index is built up to the end of the file.
+    """
+
+    def __init__(
+            self, filepath: str, encoding: str,
+            errors: str = DECODE_ERRORS, step: int = LINE_INDEX_STEP,
+            line_limit: int = PREVIEW_LINE_LIMIT
+    ) -> None:
+        """
+        Инициализация источника: файл отображается в память,
+        метка порядка байтов UTF-8 пропускается.
+
+        ************************************************
+
+        Initializing the source: the file is mapped into memory,
+        a UTF-8 byte order mark is skipped.
+        """
+
+        self.filepath = filepath
+        self.encoding = _range_encoding(encoding)
+        self.errors = errors
+        self.step = max(step, 1)
+        self.line_limit = line_limit
+        self._file = open(filepath, "rb")
+        self.size: int = os.fstat(self._file.fileno()).st_size
+        self._mapped = (
+            mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            if self.size else b""
+        )
+        start: int = 0
+        if self._mapped[:3] == codecs.BOM_UTF8 and self.encoding == "utf-8":
+            start = 3
+        self._lines = array("q", [0])
+        self._offsets = array("q", [start])
+        self._count = 0
+        self._lock = threading.Lock()
+        self.indexed = start
+        self.complete = False
+        self._closed = False
+
+    def __enter__(self) -> "FileLines":
+        """
+        Возвращает сам источник для оператора with.
+
+        ************************************************
+
+        Returns the source itself for the with statement.
+        """
+
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """
+        Закрывает источник при выходе из блока with.
+
+        ************************************************
+
+        Closes the source on leaving the with block.
+        """
+
+        self.close()
+
+    def __len__(self) -> int:
+        """
+        Возвращает число строк, учтённых индексом. Последняя
+        строка без перевода строки учитывается, когда индекс
+        построен.
+
+        ************************************************
+
+        Returns the number of lines counted by the index. The last
+        line without a line break is counted once the index is
+        built.
+        """
+
+        if self.complete and self.indexed < self.size:
+            return self._count + 1
+        return self._count
+
+    def build(
+            self, progress: Optional[Callable[[int], None]] = None,
+            cancelled: Optional[Callable[[], bool]] = None
+    ) -> bool:
+        """
+        Строит индекс, считая переводы строк блоками по step
+        байт. После каждого блока отмечается начало первой строки
+        за последним переводом строки в нём.
+
+        Аргументы:
+        progress (Callable): Получает число просмотренных байт.
+        cancelled (Callable): Возвращает True, если построение
+        нужно прервать.
+
+        Возвращает:
+        bool: True, если индекс построен, False, если прерван.
+
+        ************************************************
+
+        Builds the index counting line breaks in blocks of step
+        bytes. After every block the start of the first line after
+        its last line break is marked.
+
+        Arguments:
+        progress (Callable): Receives the number of bytes scanned.
+        cancelled (Callable): Returns True if the build should stop.
+
+        Returns:
+        bool: True if the index was built, False if it was stopped.
+        """
+
+        position: int = self.indexed
+        while position < self.size:
+            if self._closed or (cancelled is not None and cancelled()):
+                return False
+            end: int = min(position + self.step, self.size)
+            try:
+                block: bytes = self._mapped[position:end]
+            except ValueError:
+                return False
+            last: int = block.rfind(b"\n")
+            with self._lock:
+                if last >= 0:
+                    self._count += block.count(b"\n")
+                    self._lines.append(self._count)
+                    self._offsets.append(position + last + 1)
+                    self.indexed = position + last + 1
+            position = end
+            if progress is not None:
+                progress(position)
+        self.complete = True
+        return True
+
+    def lines(self, start: int, stop: int) -> List[str]:
+        """
+        Возвращает строки с номерами от start до stop без
+        переводов строки.
+
+        ************************************************
+
+        Returns the lines numbered from start to stop without
+        line breaks.
+        """
+
+        start = max(start, 0)
+        stop = min(stop, len(self))
+        if start >= stop:
+            return []
+        mapped = self._mapped
+        with self._lock:
+            mark: int = bisect.bisect_right(self._lines, start) - 1
+            number: int = self._lines[mark]
+            position: int = self._offsets[mark]
+        while number < start:
+            position = mapped.find(b"\n", position) + 1
+            number += 1
+        result: List[str] = []
+        for _ in range(start, stop):
+            newline: int = mapped.find(b"\n", position)
+            end: int = self.size if newline < 0 else newline
+            line: bytes = mapped[position:min(end, position + self.line_limit)]
+            if line.endswith(b"\r") and end - position <= self.line_limit:
+                line = line[:-1]
+            result.append(line.decode(self.encoding, self.errors))
+            position = end + 1
+        return result
+
+    def close(self) -> None:
+        """
+        Закрывает отображение и файл. Построение индекса в другом
+        потоке прекращается.
+
+        ************************************************
+
+        Closes the mapping and the file. An index build on another
+        thread stops.
+        """
+
+        self._closed = True
+        if self.size:
+            self._mapped.close()
+        self._file.close()
+
+
+class _LineCounter:
+    """
+    Переводит смещения в тексте, поступающем блоками, в номера
+    строк и столбцов. Смещения должны запрашиваться по
+    возрастанию; каждый символ просматривается один раз.
+
+    ************************************************
+
+    Converts offsets in text that arrives in chunks into line
+    and column numbers. Offsets must be requested in ascending
+    order; every character is looked at once.
+    """
+
+    def __init__(self) -> None:
+        """
+        Инициализация счётчика с первой строки.
+
+        ************************************************
+
+        Initializing the counter at the first line.
+        """
+
+        self._pending: deque = deque()
+        self._chunk_start = 0
+        self._pos = 0
+        self._line = 1
+        self._line_start = 0
+
+    def feed(self, chunks: Iterable[str]) -> Iterator[str]:
+        """
+        Передаёт блоки дальше, запоминая их для подсчёта строк.
+
+        ************************************************
+
+        Passes the chunks on, remembering them for line counting.
+        """
+
+        for chunk in chunks:
+            self.add(chunk)
+            yield chunk
+
+    def add(self, chunk: str) -> None:
+        """
+        Запоминает очередной блок текста.
+
+        ************************************************
+
+        Remembers the next chunk of text.
+        """
+
+        self._pending.append(chunk)
+
+    def position(self, offset: int) -> Tuple[int, int]:
+        """
+        Возвращает номер строки (с 1) и столбца (с 0) смещения.
+
+        ************************************************
+
+        Returns the line (from 1) and column (from 0) of the offset.
+        """
+
+        while (
+            len(self._pending) > 1
+            and offset >= self._chunk_start + len(self._pending[0])
+        ):
+            chunk = self._pending.popleft()
+            self._count(chunk, len(chunk))
+            self._chunk_start += len(chunk)
+        if self._pending:
+            self._count(self._pending[0], offset - self._chunk_start)
+        return self._line, offset - self._line_start
+
+    def _count(self, chunk: str, stop: int) -> None:
+        """
+        Считает переводы строк в блоке от текущей позиции до stop.
+
+        ************************************************
+
+        Counts the line breaks in the chunk from the current
+        position up to stop.
+        """
+
+        start: int = self._pos - self._chunk_start
+        if stop <= start:
+            return
+        newlines: int = chunk.count("\n", start, stop)
+        if newlines:
+            self._line += newlines
+            self._line_start = (
+                self._chunk_start + chunk.rindex("\n", start, stop) + 1
+            )
+        self._pos = self._chunk_start + stop
+
+
+def iter_spans(
+        pattern, text: str, with_lines: bool = False
+) -> Iterator[Span]:
+    """
+    Возвращает позиции совпадений в тексте вместо их копий.
+
+    Аргументы:
+    pattern (str): Регулярное выражение для поиска или набор
+    шаблонов MultiPatternMatcher.
+    text (str): Текст, в котором нужно искать совпадения.
+    with_lines (bool): Добавлять номер строки и столбца начала.
+
+    Возвращает:
+    Iterator[Span]: Кортежи (начало, конец) или
+    (начало, конец, строка, столбец).
+
+    ************************************************
+
+    Returns the positions of matches in the text instead of copies.
+
+    Arguments:
+    pattern (str): A regular expression for the search or a
+    MultiPatternMatcher set of patterns.
+    text (str): The text in which to look for matches.
+    with_lines (bool): Add the line and column of the start.
+
+    Returns:
+    Iterator[Span]: Tuples (start, end) or
+    (start, end, line, column).
+    """
+
+    regexp, _ = _resolve(pattern)
+    if not with_lines:
+        for match in regexp.finditer(text):
+            yield match.span()
+        return
+    counter = _LineCounter()
+    counter.add(text)
+    for match in regexp.finditer(text):
+        yield match.span() + counter.position(match.start())
+
+
+def iter_spans_stream(
+        pattern, chunks: Iterable[str], with_lines: bool = False,
+        overlap: int = CHUNK_OVERLAP
+) -> Iterator[Span]:
+    """
+    Потоково возвращает позиции совпадений в тексте, поступающем
+    блоками. Позиции отсчитываются от начала всего текста.
+
+    Аргументы:
+    pattern (str): Регулярное выражение для поиска или набор
+    шаблонов MultiPatternMatcher.
+    chunks (Iterable[str]): Блоки текста по порядку.
+    with_lines (bool): Добавлять номер строки и столбца начала.
+    overlap (int): Размер окна перекрытия в символах.
+
+    Возвращает:
+    Iterator[Span]: Кортежи (начало, конец) или
+    (начало, конец, строка, столбец).
+
+    ************************************************
+
+    Streams the positions of matches in text that arrives in
+    chunks. Positions are counted from the start of the whole text.
+
+    Arguments:
+    pattern (str): A regular expression for the search or a
+    MultiPatternMatcher set of patterns.
+    chunks (Iterable[str]): The text chunks in order.
+    with_lines (bool): Add the line and column of the start.
+    overlap (int): The overlap window size in characters.
+
+    Returns:
+    Iterator[Span]: Tuples (start, end) or
+    (start, end, line, column).
+    """
+
+    regexp, _ = _resolve(pattern)
+    counter = _LineCounter()
+    if with_lines:
+        chunks = counter.feed(chunks)
+    for match, base in _stream_matches(regexp, chunks, overlap):
+        span = (base + match.start(), base + match.end())
+        if with_lines:
+            span += counter.position(span[0])
+        yield span
+
+
+class SpanArray:
+    """
+    Компактный контейнер позиций совпадений.
+
+    Начала и концы хранятся парами в array('q'), а номера строк и
+    столбцов, если они есть, — в отдельном массиве, поэтому на
+    каждое совпадение уходит 16 или 32 байта вместо объекта str.
+
+    ************************************************
+
+    A compact container of match positions.
+
+    Starts and ends are stored in pairs in an array('q'), and the
+    line and column numbers, if any, in a separate array, so each
+    match takes 16 or 32 bytes instead of a str object.
+    """
+
+    def __init__(self, spans: Iterable[Span] = ()) -> None:
+        """
+        Инициализация контейнера, при необходимости заполненного.
+
+        ************************************************
+
+        Initializing the container, filled if spans are given.
+        """
+
+        self._bounds = array("q")
+        self._lines = array("q")
+        self.extend(spans)
+
+    def __len__(self) -> int:
+        """
+        Возвращает число совпадений.
+
+        ************************************************
+
+        Returns the number of matches.
+        """
+
+        return len(self._bounds) // 2
+
+    def __getitem__(self, index: int) -> Span:
+        """
+        Возвращает позицию совпадения по номеру.
+
+        ************************************************
+
+        Returns the position of the match with the given number.
+        """
+
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("SpanArray index out of range")
+        span = tuple(self._bounds[2 * index:2 * index + 2])
+        if self._lines:
+            span += tuple(self._lines[2 * index:2 * index + 2])
+        return span
+
+    def __iter__(self) -> Iterator[Span]:
+        """
+        Перебирает позиции по порядку.
+
+        ************************************************
+
+        Iterates over the positions in order.
+        """
+
+        for index in range(len(self)):
+            yield self[index]
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Возвращает объём памяти, занятый позициями, в байтах.
+
+        ************************************************
+
+        Returns the memory taken by the positions, in bytes.
+        """
+
+        return (
+            len(self._bounds) * self._bounds.itemsize
+            + len(self._lines) * self._lines.itemsize
+        )
+
+    def append(self, span: Span) -> None:
+        """
+        Добавляет позицию (начало, конец) или
+        (начало, конец, строка, столбец).
+
+        ************************************************
+
+        Appends a position (start, end) or
+        (start, end, line, column).
+        """
+
+        if len(span) > 2:
+            if len(self._lines) != len(self._bounds):
+                raise ValueError("All spans must have line numbers or none.")
+            self._lines.extend(span[2:4])
+        elif self._lines:
+            raise ValueError("All spans must have line numbers or none.")
+        self._bounds.extend(span[:2])
+
+    def extend(self, spans: Iterable[Span]) -> None:
+        """
+        Добавляет несколько позиций.
+
+        ************************************************
+
+        Appends several positions.
+        """
+
+        for span in spans:
+            self.append(span)
+
+
+def is_line_local(pattern) -> bool:
+    """
+    Проверяет, что совпадения шаблона не выходят за пределы строки.
+
+    Такой шаблон не может совпасть с переводом строки (в том числе
+    внутри опережающих и ретроспективных проверок) и не использует
+    привязки к началу и концу всего текста, поэтому текст можно
+    искать построчно или частями, разрезанными по границам строк,
+    с тем же результатом. Проверка консервативна: при сомнении
+    возвращается False.
+
+    Аргументы:
+    pattern (str): Регулярное выражение.
+
+    Возвращает:
+    bool: True, если шаблон не выходит за пределы строки.
+
+    ************************************************
+
+    Checks that the matches of a pattern never leave a line.
+
+    Such a pattern cannot match a line break (including inside
+    lookahead and lookbehind assertions) and does not use anchors
+    to the start and end of the whole text, so the text can be
+    searched line by line or in parts cut at line boundaries with
+    the same result. The check is conservative: when in doubt,
+    False is returned.
+
+    Arguments:
+    pattern (str): A regular expression.
+
+    Returns:
+    bool: True if the pattern never leaves a line.
+    """
+
+    if isinstance(pattern, MultiPatternMatcher):
+        pattern = pattern.regexp
+    if not isinstance(pattern, (str, bytes)):
+        pattern = pattern.pattern
+    try:
+        parsed = sre_parse.parse(pattern)
+    except (re.error, RecursionError):
+        return False
+    return not _crosses_lines(parsed, parsed.state.flags)
+
+
+def _crosses_lines(items, flags: int) -> bool:
+    """
+    Возвращает True, если разобранный шаблон может совпасть
+    с переводом строки или привязан к границам всего текста.
+
+    ************************************************
+
+    Returns True if the parsed pattern can match a line break
+    or is anchored to the bounds of the whole text.
+    """
+
+    for op, av in items:
+        if op is sre_parse.LITERAL:
+            if av == 10:
+                return True
+        elif op is sre_parse.NOT_LITERAL:
+            if av != 10:
+                return True
+        elif op is sre_parse.ANY:
+            if flags & sre_parse.SRE_FLAG_DOTALL:
+                return True
+        elif op is sre_parse.IN:
+            if _set_has_newline(av):
+                return True
+        elif op is sre_parse.AT:
+            if av in (
+                sre_parse.AT_BEGINNING_STRING, sre_parse.AT_END_STRING
+            ) or (
+                av in (sre_parse.AT_BEGINNING, sre_parse.AT_END)
+                and not flags & sre_parse.SRE_FLAG_MULTILINE
+            ):
+                return True
+        elif op is sre_parse.BRANCH:
+            if any(_crosses_lines(item, flags) for item in av[1]):
+                return True
+        elif op in (sre_parse.MAX_REPEAT, sre_parse.MIN_REPEAT) or (
+            op is getattr(sre_parse, "POSSESSIVE_REPEAT", None)
+        ):
+            if _crosses_lines(av[2], flags):
+                return True
+        elif op is sre_parse.SUBPATTERN:
+            group_flags: int = (flags | av[1]) & ~av[2]
+            if _crosses_lines(av[3], group_flags):
+                return True
+        elif op in (sre_parse.ASSERT, sre_parse.ASSERT_NOT):
+            if _crosses_lines(av[1], flags):
+                return True
+        elif op is getattr(sre_parse, "ATOMIC_GROUP", None):
+            if _crosses_lines(av, flags):
+                return True
+        elif op is sre_parse.GROUPREF_EXISTS:
+            if _crosses_lines(av[1], flags) or (
+                av[2] is not None and _crosses_lines(av[2], flags)
+            ):
+                return True
+        elif op is not sre_parse.GROUPREF:
+            return True
+    return False
+
+
+def _set_has_newline(items) -> bool:
+    """
+    Возвращает True, если класс символов может содержать
+    перевод строки.
+
+    ************************************************
+
+    Returns True if the character class may contain
+    a line break.
+    """
+
+    if items and items[0][0] is sre_parse.NEGATE:
+        return (sre_parse.LITERAL, 10) not in items
+    for op, av in items:
+        if op is sre_parse.LITERAL:
+            if av == 10:
+                return True
+        elif op is sre_parse.RANGE:
+            if av[0] <= 10 <= av[1]:
+                return True
+        elif op is sre_parse.CATEGORY:
+            if av not in (
+                sre_parse.CATEGORY_DIGIT, sre_parse.CATEGORY_WORD,
+                sre_parse.CATEGORY_NOT_SPACE,
+                sre_parse.CATEGORY_NOT_LINEBREAK,
+            ):
+                return True
+        else:
+            return True
+    return False
+
+
+def required_word(pattern) -> Optional[str]:
+    """
+    Возвращает самую длинную последовательность словесных символов,
+    которая обязательно входит в каждое совпадение шаблона.
+
+    Учитываются только литералы на верхнем уровне шаблона и в его
+    простых группах. Если шаблон чувствителен к регистру не так,
+    как обычно, или такой последовательности нет, возвращается None.
+
+    ************************************************
+
+    Returns the longest run of word characters that is
+    necessarily part of every match of the pattern.
+
+    Only literals at the top level of the pattern and in its
+    plain groups are considered. If the pattern changes case
+    sensitivity or there is no such run, None is returned.
+    """
+
+    try:
+        parsed = sre_parse.parse(pattern)
+    except (re.error, RecursionError):
+        return None
+    if parsed.state.flags & sre_parse.SRE_FLAG_IGNORECASE:
+        return None
+    words: List[str] = []
+    current: List[str] = []
+
+    def walk(items) -> bool:
+        for op, av in items:
+            if op is sre_parse.LITERAL and re.match(r"\w", chr(av)):
+                current.append(chr(av))
+                continue
+            if current:
+                words.append("".join(current))
+                current.clear()
+            if op is sre_parse.SUBPATTERN and not av[1] and not av[2]:
+                if not walk(av[3]):
+                    return False
+            elif op is sre_parse.SUBPATTERN:
+                return False
+        return True
+
+    if not walk(parsed):
+        return None
+    if current:
+        words.append("".join(current))
+    return max(words, key=len) if words else None
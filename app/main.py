@@ -1,9 +1,54 @@
+import multiprocessing
 import platform
-import tkinter as tk
+import sys
 
-from constants import CHECK_OS, THEMES_APP
-from gui import FindWordsAppClass
-from ttkthemes import ThemedTk
+from constants import CHECK_OS, NO_GUI_FLAG, THEMES_APP, TIMINGS_FLAG
+from utils import PhaseTimer
+
+
+def run_gui(show_timings: bool = False) -> None:
+    """
+    Создаёт главное окно с темой, подходящей для ОС,
+    и запускает графический интерфейс.
+
+    Tkinter, ttkthemes и модуль gui импортируются здесь,
+    чтобы режим командной строки их не загружал. Длительность
+    этапов запуска замеряется и при show_timings выводится
+    в stderr, когда окно впервые простаивает.
+
+    ************************************************
+
+    Creates the main window with a theme suited to the OS
+    and starts the graphical interface.
+
+    Tkinter, ttkthemes and the gui module are imported here
+    so that the command-line mode never loads them. The startup
+    phases are timed and, with show_timings, written to stderr
+    once the window first becomes idle.
+    """
+
+    timer = PhaseTimer()
+    import tkinter as tk
+
+    from gui import FindWordsAppClass
+    from ttkthemes import ThemedTk
+    timer.mark("imports")
+
+    os_name = platform.system()
+    if os_name == CHECK_OS.get("win"):
+        root = ThemedTk(theme=THEMES_APP.get("win"))
+    elif os_name == CHECK_OS.get("lin"):
+        root = ThemedTk(theme=THEMES_APP.get("lin"))
+    else:
+        root = tk.Tk()
+    timer.mark("root window")
+    app = FindWordsAppClass(master=root, timer=timer)
+    timer.mark("widgets")
+    if show_timings:
+        root.after_idle(
+            lambda: print(f"Startup: {timer.report()}", file=sys.stderr)
+        )
+    app.mainloop()
 
 
 def main() -> None:
@@ -13,6 +58,10 @@ def main() -> None:
     от операционной системы.
 
     Эта функция:
+    - Если передан флаг `--no-gui`, запускает поиск из
+    командной строки без загрузки графических библиотек.
+    - Если передан флаг `--startup-timings`, выводит длительность
+    этапов запуска.
     - Определяет операционную систему пользователя.
     - В зависимости от ОС, задает тему для окна приложения.
     - Создает и запускает экземпляр класса `FindWordsAppClass`,
@@ -28,6 +77,10 @@ def main() -> None:
     on the operating system.
 
     This function:
+    - If the `--no-gui` flag is passed, runs the search from
+    the command line without loading the graphical libraries.
+    - If the `--startup-timings` flag is passed, prints the duration
+    of the startup phases.
     - Defines the user's operating system.
     - Depending on the OS, sets the theme for the application window.
     - Creates and launches an instance of the `FindWordsAppClass` class,
@@ -37,15 +90,11 @@ def main() -> None:
     None
     """
 
-    os_name = platform.system()
-    if os_name == CHECK_OS.get("win"):
-        root = ThemedTk(theme=THEMES_APP.get("win"))
-    elif os_name == CHECK_OS.get("lin"):
-        root = ThemedTk(theme=THEMES_APP.get("lin"))
-    else:
-        root = tk.Tk()
-    app = FindWordsAppClass(master=root)
-    app.mainloop()
+    multiprocessing.freeze_support()
+    if NO_GUI_FLAG in sys.argv[1:]:
+        from cli import run_cli
+        sys.exit(run_cli(sys.argv[1:]))
+    run_gui(TIMINGS_FLAG in sys.argv[1:])
 
 
 if __name__ == "__main__":
@@ -1,75 +1,45 @@
 import base64
-import os
-import shutil
-import tempfile
+import io
+import json
+import time
 import zlib
+from typing import Dict, List, Tuple
 
-from PIL import Image, ImageTk
 
-
-def check_tmp_directory_and_file(
-        tmp_dir: str,
-        make_or_del: bool,
-        filename: str = "main_icon.ico",
-) -> bool:
+def decode_icon(icon: str) -> bytes:
     """
-    Проверяет существование временной папки и файла внутри неё.
+    Раскодирует встроенную иконку из base64 и zlib.
 
     Аргументы:
-    tmp_dir (str): Путь к временной директории.
-    make_or_del (bool): Флаг, указывающий, нужно ли создавать
-    директорию и проверять файл (True) или просто
-    проверять наличие файла (False).
-    filename (str, по умолчанию "main_icon.ico"):
-    Имя файла, который нужно проверить в директории.
+    icon (str): Закодированная строка иконки в base64.
 
     Возвращает:
-    bool: True, если директория существует и файл найден,
-    иначе False.
+    bytes: Данные файла иконки.
 
     ************************************************
 
-    Checks the existence of a temporary folder and a file inside it.
+    Decodes the embedded icon from base64 and zlib.
 
     Arguments:
-    tmp_dir (str): The path to the temporary directory.
-    make_or_del (bool): A flag indicating whether to create
-    a directory and check the file (True) or
-    just check for the file (False).
-    filename (str, by default "main_icon.ico"):
-    The name of the file to be checked in the directory.
+    icon (str): The encoded string of the icon in base64.
 
     Returns:
-    bool: True if the directory exists and the file is found,
-    otherwise False.
+    bytes: The data of the icon file.
     """
 
-    check_ico_file: bool = False
-    if make_or_del:
-        if not (os.path.exists(tmp_dir) and os.path.isdir(tmp_dir)):
-            os.mkdir(tmp_dir)
-        else:
-            file_path: str = os.path.join(tmp_dir, filename)
-            if os.path.isfile(file_path):
-                check_ico_file = True
-    else:
-        if (os.path.exists(tmp_dir) and os.path.isdir(tmp_dir)):
-            check_ico_file = True
-    return check_ico_file
-
-
-def make_icon_app(
-        icon: str, icon_name: str,
-        icon_format: str, tmp_dir: str
-) -> ImageTk.PhotoImage:
+    return zlib.decompress(base64.b64decode(icon))
+
+
+def make_icon_app(icon: str):
     """
     Создает и возвращает объект PhotoImage для иконки приложения.
 
+    Изображение открывается прямо из памяти, без записи во
+    временную директорию. Pillow импортируется только здесь,
+    чтобы не замедлять импорт модуля при запуске.
+
     Аргументы:
     icon (str): Закодированная строка иконки в base64.
-    icon_name (str): Имя иконки.
-    icon_format (str): Формат иконки (например, ".ico").
-    tmp_dir (str): Путь к временной директории.
 
     Возвращает:
     ImageTk.PhotoImage: Объект иконки для приложения.
@@ -78,47 +48,160 @@ def make_icon_app(
 
     Creates and returns a PhotoImage object for the application icon.
 
+    The image is opened straight from memory without writing to
+    a temporary directory. Pillow is imported only here so that
+    it does not slow down the module import at startup.
+
     Arguments:
     icon (str): The encoded string of the icon in base64.
-    icon_name (str): The name of the icon.
-    icon_format (str): The icon format (for example, ".ico").
-    tmp_dir (str): The path to the temporary directory.
 
     Returns:
     ImageTk.PhotoImage: An icon object for the application.
     """
 
-    icon_name_with_format: str = f"{icon_name}{icon_format}"
-    for_check_tmp: bool = True
-    check_img_file: bool = check_tmp_directory_and_file(
-        tmp_dir, for_check_tmp,
-        icon_name_with_format
-    )
-    if not check_img_file:
-        fd, icon_path_app = tempfile.mkstemp(suffix=icon_format, dir=tmp_dir)
-        with open(fd, "wb") as icon_file:
-            icon_file.write(zlib.decompress(base64.b64decode(icon)))
-        os.rename(icon_path_app, os.path.join(tmp_dir, icon_name_with_format))
-    return ImageTk.PhotoImage(
-        Image.open(os.path.join(tmp_dir, icon_name_with_format))
-    )
-
-
-def delete_tmp(tmp_dir: str) -> None:
+    from PIL import Image, ImageTk
+
+    return ImageTk.PhotoImage(Image.open(io.BytesIO(decode_icon(icon))))
+
+
+class PhaseTimer:
+    """
+    Замеряет длительность последовательных этапов работы.
+
+    Каждая отметка фиксирует время, прошедшее с предыдущей
+    отметки (или с создания таймера), под именем этапа.
+
+    Атрибуты:
+    started (float): Момент создания таймера по perf_counter.
+    phases (List[Tuple[str, float]]): Имена этапов и их
+    длительность в секундах.
+
+    ************************************************
+
+    Measures the duration of consecutive work phases.
+
+    Every mark records the time elapsed since the previous
+    mark (or since the timer was created) under the phase name.
+
+    Attributes:
+    started (float): The perf_counter moment the timer was created.
+    phases (List[Tuple[str, float]]): The phase names and their
+    duration in seconds.
+    """
+
+    def __init__(self) -> None:
+        """
+        Инициализация таймера с текущим моментом.
+
+        ************************************************
+
+        Initializing the timer with the current moment.
+        """
+
+        self.started: float = time.perf_counter()
+        self.phases: List[Tuple[str, float]] = []
+        self._last: float = self.started
+
+    def mark(self, name: str) -> float:
+        """
+        Завершает этап и возвращает его длительность в секундах.
+
+        ************************************************
+
+        Finishes a phase and returns its duration in seconds.
+        """
+
+        now: float = time.perf_counter()
+        duration: float = now - self._last
+        self._last = now
+        self.phases.append((name, duration))
+        return duration
+
+    def add(self, name: str, duration: float) -> None:
+        """
+        Добавляет длительность к этапу, который может повторяться
+        или выполняться в другом потоке, и переносит последнюю
+        отметку на текущий момент.
+
+        ************************************************
+
+        Adds a duration to a phase that may repeat or run on
+        another thread and moves the last mark to the current
+        moment.
+        """
+
+        for position, (phase, spent) in enumerate(self.phases):
+            if phase == name:
+                self.phases[position] = (name, spent + duration)
+                break
+        else:
+            self.phases.append((name, duration))
+        self._last = time.perf_counter()
+
+    def total(self) -> float:
+        """
+        Возвращает время от создания таймера до последней отметки.
+
+        ************************************************
+
+        Returns the time from the timer creation to the last mark.
+        """
+
+        return self._last - self.started
+
+    def report(self) -> str:
+        """
+        Возвращает строку с длительностью этапов в миллисекундах.
+
+        ************************************************
+
+        Returns a line with the phase durations in milliseconds.
+        """
+
+        parts: List[str] = [
+            f"{name} {duration * 1000:.1f} ms"
+            for name, duration in self.phases
+        ]
+        parts.append(f"total {self.total() * 1000:.1f} ms")
+        return ", ".join(parts)
+
+    def as_dict(self) -> Dict[str, float]:
+        """
+        Возвращает длительность этапов и общее время
+        в миллисекундах.
+
+        ************************************************
+
+        Returns the phase durations and the total time
+        in milliseconds.
+        """
+
+        durations: Dict[str, float] = {
+            name: round(duration * 1000, 3)
+            for name, duration in self.phases
+        }
+        durations["total"] = round(self.total() * 1000, 3)
+        return durations
+
+
+def append_run_log(filepath: str, record: dict) -> None:
     """
-    Удаляет временную директорию.
+    Дописывает запись о запуске в журнал одной строкой JSON,
+    чтобы журнал можно было разбирать построчно.
 
     Аргументы:
-    tmp_dir (str): Путь к временной директории.
+    filepath (str): Путь к файлу журнала.
+    record (dict): Данные запуска.
 
     ************************************************
 
-    Deletes the temporary directory.
+    Appends a run record to the log as a single JSON line
+    so that the log can be parsed line by line.
 
     Arguments:
-    tmp_dir (str): The path to the temporary directory.
+    filepath (str): The path to the log file.
+    record (dict): The run data.
     """
 
-    for_check_tmp: bool = False
-    if check_tmp_directory_and_file(tmp_dir, for_check_tmp):
-        shutil.rmtree(tmp_dir)
+    with open(filepath, "a", encoding="utf-8") as log_file:
+        log_file.write(json.dumps(record, ensure_ascii=False) + "\n")
@@ -0,0 +1,505 @@
+import tkinter as tk
+from typing import List, Optional, Tuple
+
+from constants import (HIGHLIGHT_BATCH_DELAY, HIGHLIGHT_BATCH_SIZE,
+                       HIGHLIGHT_CURRENT_TAG, HIGHLIGHT_TAG, VIEW_MARGIN)
+
+
+class VirtualTextView:
+    """
+    Виртуализированное отображение большого набора строк
+    в текстовом виджете.
+
+    В виджет загружаются только видимые строки и небольшой запас
+    вокруг них. Полоса прокрутки отражает положение во всём наборе
+    строк, а при приближении к краю загруженного окна оно
+    подгружается заново вокруг текущей позиции.
+
+    Источник строк должен поддерживать len() и метод
+    lines(start, stop), как у logic.ResultStore и logic.FileLines.
+    Источник может расти; после этого вызывается grow.
+
+    Атрибуты:
+    text_widget (tk.Text): Текстовый виджет.
+    scrollbar (ttk.Scrollbar): Вертикальная полоса прокрутки.
+    source: Источник строк.
+    margin (int): Число строк запаса выше и ниже видимой области.
+    window_start (int): Номер первой загруженной строки.
+    window_stop (int): Номер строки после последней загруженной.
+
+    ************************************************
+
+    A virtualized display of a large set of lines
+    in a text widget.
+
+    Only the visible lines and a small margin around them are
+    loaded into the widget. The scrollbar reflects the position
+    within the whole set of lines, and when the view approaches the
+    edge of the loaded window, the window is reloaded around the
+    current position.
+
+    The line source must support len() and a lines(start, stop)
+    method, like logic.ResultStore and logic.FileLines. The source
+    may grow; grow is called after that.
+
+    Attributes:
+    text_widget (tk.Text): The text widget.
+    scrollbar (ttk.Scrollbar): The vertical scrollbar.
+    source: The line source.
+    margin (int): The number of spare lines above and below the view.
+    window_start (int): The number of the first loaded line.
+    window_stop (int): The number after the last loaded line.
+    """
+
+    def __init__(
+            self, text_widget: tk.Text, scrollbar, source,
+            margin: int = VIEW_MARGIN
+    ) -> None:
+        """
+        Инициализация отображения и подключение к виджету.
+
+        ************************************************
+
+        Initializing the view and attaching it to the widget.
+        """
+
+        self.text_widget = text_widget
+        self.scrollbar = scrollbar
+        self.source = source
+        self.margin = margin
+        self.window_start = 0
+        self.window_stop = 0
+        self.visible_lines = 1
+        self._pending_load = None
+        self._wrap = text_widget.cget("wrap")
+        self._state = text_widget.cget("state")
+        self.text_widget.config(
+            wrap="none", state="normal",
+            yscrollcommand=self.on_text_scroll
+        )
+        self.scrollbar.config(command=self.yview)
+        self.load_window(0)
+
+    def detach(self) -> None:
+        """
+        Отключение от виджета и восстановление обычной прокрутки.
+        Загруженное окно строк остаётся в виджете.
+
+        ************************************************
+
+        Detaching from the widget and restoring normal scrolling.
+        The loaded window of lines stays in the widget.
+        """
+
+        if self._pending_load is not None:
+            self.text_widget.after_cancel(self._pending_load)
+            self._pending_load = None
+        self.text_widget.config(
+            wrap=self._wrap, state=self._state,
+            yscrollcommand=self.scrollbar.set
+        )
+        self.scrollbar.config(command=self.text_widget.yview)
+
+    def load_window(self, first: int) -> None:
+        """
+        Загружает в виджет строки вокруг строки first
+        и прокручивает виджет так, чтобы она была вверху.
+
+        ************************************************
+
+        Loads the lines around line first into the widget
+        and scrolls the widget so that it is at the top.
+        """
+
+        self._pending_load = None
+        total: int = len(self.source)
+        first = max(0, min(first, total - self.visible_lines))
+        self.window_start = max(0, first - self.margin)
+        self.window_stop = min(
+            total, first + self.visible_lines + self.margin
+        )
+        self.text_widget.config(state="normal")
+        self.text_widget.delete("1.0", tk.END)
+        self.text_widget.insert(
+            "1.0",
+            "\n".join(self.source.lines(self.window_start, self.window_stop))
+        )
+        self.text_widget.config(state="disabled")
+        self.text_widget.yview(f"{first - self.window_start + 1}.0")
+
+    def refresh(self) -> None:
+        """
+        Обновляет окно после того, как источник изменился.
+
+        ************************************************
+
+        Updates the window after the source has changed.
+        """
+
+        self.load_window(self.first_line())
+
+    def grow(self) -> None:
+        """
+        Учитывает строки, добавленные в источник: догружает окно,
+        если оно короче, чем нужно для текущей позиции, а иначе
+        только обновляет полосу прокрутки.
+
+        ************************************************
+
+        Takes the lines added to the source into account: reloads
+        the window if it is shorter than the current position needs,
+        otherwise only updates the scrollbar.
+        """
+
+        if self.window_stop < min(
+            len(self.source),
+            self.first_line() + self.visible_lines + self.margin
+        ):
+            self.refresh()
+        else:
+            self.on_text_scroll(*self.text_widget.yview())
+
+    def first_line(self) -> int:
+        """
+        Возвращает номер первой видимой строки во всём наборе.
+
+        ************************************************
+
+        Returns the number of the first visible line in the whole set.
+        """
+
+        top: str = self.text_widget.index("@0,0")
+        return self.window_start + int(top.split(".")[0]) - 1
+
+    def on_text_scroll(self, low: str, high: str) -> None:
+        """
+        Обрабатывает прокрутку виджета: обновляет полосу прокрутки
+        и при необходимости подгружает строки.
+
+        ************************************************
+
+        Handles widget scrolling: updates the scrollbar
+        and loads more lines when needed.
+        """
+
+        loaded: int = self.window_stop - self.window_start
+        total: int = len(self.source)
+        if not loaded or not total:
+            self.scrollbar.set(0.0, 1.0)
+            return
+        self.visible_lines = max(
+            1, round((float(high) - float(low)) * loaded)
+        )
+        first: int = self.window_start + int(float(low) * loaded)
+        self.scrollbar.set(
+            first / total, min(1.0, (first + self.visible_lines) / total)
+        )
+        threshold: int = self.margin // 2
+        if (
+            self.window_start > 0
+            and first - self.window_start < threshold
+        ) or (
+            self.window_stop < total
+            and self.window_stop - first - self.visible_lines < threshold
+        ):
+            if self._pending_load is None:
+                self._pending_load = self.text_widget.after_idle(
+                    self.load_window, first
+                )
+
+    def yview(self, *args) -> Optional[tuple]:
+        """
+        Обрабатывает команды полосы прокрутки в координатах
+        всего набора строк.
+
+        ************************************************
+
+        Handles scrollbar commands in the coordinates
+        of the whole set of lines.
+        """
+
+        total: int = len(self.source)
+        if not args or not total:
+            return None
+        if args[0] == "moveto":
+            self.load_window(int(float(args[1]) * total))
+            return None
+        amount: int = int(args[1])
+        if args[2] == "pages":
+            amount *= self.visible_lines
+        first: int = self.first_line() + amount
+        if self.window_start <= first and (
+            first + self.visible_lines <= self.window_stop
+        ):
+            self.text_widget.yview_scroll(int(args[1]), args[2])
+        else:
+            self.load_window(first)
+        return None
+
+
+class MatchHighlighter:
+    """
+    Подсветка совпадений прямо в тексте виджета.
+
+    Текст остаётся на месте, а на каждое совпадение ставится тег.
+    Сначала размечаются совпадения в видимой области, остальные —
+    небольшими пачками через `after()`, поэтому окно отзывчиво
+    с первого мгновения. Каждая пачка ставится одним вызовом
+    tag_add. Переход к следующему и предыдущему совпадению ищет
+    его двоичным поиском по заранее вычисленным позициям.
+
+    Позиции должны содержать номера строк и столбцов, как
+    у logic.iter_spans с with_lines, и идти по возрастанию.
+
+    Атрибуты:
+    text_widget (tk.Text): Текстовый виджет.
+    spans: Позиции совпадений, например logic.SpanArray.
+    tag (str): Тег совпадений.
+    current_tag (str): Тег текущего совпадения.
+    batch_size (int): Число совпадений в одной пачке.
+    tagged (int): Число уже размеченных совпадений.
+    current (int): Номер текущего совпадения или None.
+
+    ************************************************
+
+    Highlighting of matches right in the text of the widget.
+
+    The text stays in place and a tag is put on every match.
+    The matches in the visible region are tagged first, the rest
+    in small batches through `after()`, so the window is
+    responsive from the first moment. Every batch is tagged with a
+    single tag_add call. Moving to the next and the previous match
+    finds it with a binary search over the precomputed positions.
+
+    The positions must carry line and column numbers, as from
+    logic.iter_spans with with_lines, and go in ascending order.
+
+    Attributes:
+    text_widget (tk.Text): The text widget.
+    spans: The match positions, for example logic.SpanArray.
+    tag (str): The match tag.
+    current_tag (str): The tag of the current match.
+    batch_size (int): The number of matches in a batch.
+    tagged (int): The number of matches tagged so far.
+    current (int): The number of the current match or None.
+    """
+
+    def __init__(
+            self, text_widget: tk.Text, spans,
+            tag: str = HIGHLIGHT_TAG,
+            current_tag: str = HIGHLIGHT_CURRENT_TAG,
+            batch_size: int = HIGHLIGHT_BATCH_SIZE
+    ) -> None:
+        """
+        Инициализация подсветки: размечает видимую область
+        и планирует разметку остальных совпадений.
+
+        ************************************************
+
+        Initializing the highlighting: tags the visible region
+        and schedules tagging of the other matches.
+        """
+
+        self.text_widget = text_widget
+        self.spans = spans
+        self.tag = tag
+        self.current_tag = current_tag
+        self.batch_size = batch_size
+        self.tagged = 0
+        self.current: Optional[int] = None
+        self._pending = None
+        self.text_widget.tag_remove(tag, "1.0", tk.END)
+        self.text_widget.tag_remove(current_tag, "1.0", tk.END)
+        self.text_widget.tag_raise(current_tag, tag)
+        top: int = int(self.text_widget.index("@0,0").split(".")[0])
+        bottom: int = int(self.text_widget.index(
+            f"@0,{self.text_widget.winfo_height()}"
+        ).split(".")[0])
+        first: int = self.find(top, 0)
+        stop: int = self.find(bottom + 1, 0)
+        self.tag_range(first, stop)
+        self._queue: List[Tuple[int, int]] = [
+            (stop, len(spans)), (0, first)
+        ]
+        self.schedule()
+
+    def __len__(self) -> int:
+        """
+        Возвращает число совпадений.
+
+        ************************************************
+
+        Returns the number of matches.
+        """
+
+        return len(self.spans)
+
+    def index(self, number: int) -> Tuple[str, str]:
+        """
+        Возвращает индексы Tk начала и конца совпадения.
+
+        ************************************************
+
+        Returns the Tk indices of the start and the end
+        of a match.
+        """
+
+        start, end, line, column = self.spans[number]
+        first: str = f"{line}.{column}"
+        return first, f"{first} + {end - start} chars"
+
+    def find(self, line: int, column: int) -> int:
+        """
+        Возвращает номер первого совпадения, которое начинается
+        в позиции line.column или после неё.
+
+        ************************************************
+
+        Returns the number of the first match that starts
+        at the position line.column or after it.
+        """
+
+        low: int = 0
+        high: int = len(self.spans)
+        while low < high:
+            middle: int = (low + high) // 2
+            if tuple(self.spans[middle][2:4]) < (line, column):
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def tag_range(self, start: int, stop: int) -> None:
+        """
+        Размечает совпадения с номерами от start до stop
+        одним вызовом tag_add.
+
+        ************************************************
+
+        Tags the matches numbered from start to stop
+        with a single tag_add call.
+        """
+
+        indices: List[str] = []
+        for number in range(start, stop):
+            indices.extend(self.index(number))
+        if indices:
+            self.text_widget.tag_add(self.tag, *indices)
+        self.tagged += stop - start
+
+    def schedule(self) -> None:
+        """
+        Планирует разметку следующей пачки, если она осталась.
+
+        ************************************************
+
+        Schedules tagging of the next batch if any is left.
+        """
+
+        while self._queue and self._queue[0][0] >= self._queue[0][1]:
+            self._queue.pop(0)
+        self._pending = None
+        if self._queue:
+            self._pending = self.text_widget.after(
+                HIGHLIGHT_BATCH_DELAY, self.tag_batch
+            )
+
+    def tag_batch(self) -> None:
+        """
+        Размечает очередную пачку совпадений.
+
+        ************************************************
+
+        Tags the next batch of matches.
+        """
+
+        start, stop = self._queue[0]
+        end: int = min(start + self.batch_size, stop)
+        self.tag_range(start, end)
+        self._queue[0] = (end, stop)
+        self.schedule()
+
+    def next_match(self) -> Optional[int]:
+        """
+        Переходит к первому совпадению после курсора (при первом
+        переходе — начиная с курсора), с переходом в начало после
+        последнего.
+
+        ************************************************
+
+        Moves to the first match after the cursor (starting at the
+        cursor on the first move), wrapping around to the start
+        after the last one.
+        """
+
+        if not len(self.spans):
+            return None
+        line, column = self._cursor()
+        if self.current is not None:
+            column += 1
+        number: int = self.find(line, column)
+        return self.select(number % len(self.spans))
+
+    def previous_match(self) -> Optional[int]:
+        """
+        Переходит к последнему совпадению перед курсором,
+        с переходом в конец перед первым.
+
+        ************************************************
+
+        Moves to the last match before the cursor, wrapping
+        around to the end before the first one.
+        """
+
+        if not len(self.spans):
+            return None
+        line, column = self._cursor()
+        number: int = self.find(line, column) - 1
+        return self.select(number % len(self.spans))
+
+    def select(self, number: int) -> int:
+        """
+        Делает совпадение текущим: выделяет его, ставит курсор
+        в его начало и прокручивает к нему виджет.
+
+        ************************************************
+
+        Makes a match the current one: marks it, puts the cursor
+        at its start and scrolls the widget to it.
+        """
+
+        first, last = self.index(number)
+        self.text_widget.tag_remove(self.current_tag, "1.0", tk.END)
+        self.text_widget.tag_add(self.current_tag, first, last)
+        self.text_widget.mark_set("insert", first)
+        self.text_widget.see(first)
+        self.current = number
+        return number
+
+    def detach(self) -> None:
+        """
+        Отменяет запланированную разметку и снимает теги.
+
+        ************************************************
+
+        Cancels the scheduled tagging and removes the tags.
+        """
+
+        if self._pending is not None:
+            self.text_widget.after_cancel(self._pending)
+            self._pending = None
+        self._queue = []
+        self.text_widget.tag_remove(self.tag, "1.0", tk.END)
+        self.text_widget.tag_remove(self.current_tag, "1.0", tk.END)
+
+    def _cursor(self) -> Tuple[int, int]:
+        """
+        Возвращает строку и столбец курсора.
+
+        ************************************************
+
+        Returns the line and the column of the cursor.
+        """
+
+        line, column = self.text_widget.index("insert").split(".")
+        return int(line), int(column)
@@ -0,0 +1,793 @@
+import queue
+import threading
+import time
+from collections import Counter
+from typing import Callable, Iterable, Iterator, List, Optional
+
+from cache import ResultCache, file_fingerprint
+from constants import (CHUNK_SIZE, EXPORT_BUFFER_SIZE, EXPORT_ENCODING,
+                       EXPORT_PREVIEW_LINES, SEARCH_TIMEOUT,
+                       WORKER_BATCH_SIZE)
+from guard import GuardedSearch, guarded_search_files, guarded_search_ranges
+from index import WordIndex
+from logic import (LineMatch, SourceReader, Span, count_file, file_size,
+                   find_words_in_files, find_words_mmap, find_words_parallel,
+                   find_words_stream, format_counts, format_lines,
+                   format_match, grep_lines, iter_spans_stream,
+                   parallel_encoding)
+from utils import PhaseTimer
+
+MATCHES: str = "matches"
+DONE: str = "done"
+ERROR: str = "error"
+
+
+class SearchWorker(threading.Thread):
+    """
+    Фоновый поток, выполняющий поиск вне главного цикла Tk.
+
+    Совпадения передаются пачками через очередь, которую
+    графический интерфейс опрашивает через `after()`.
+
+    Атрибуты:
+    search (Callable): Функция поиска, принимающая поток и
+    возвращающая итератор результатов: строк или позиций.
+    queue (queue.Queue): Очередь сообщений для интерфейса.
+    cancel_event (threading.Event): Флаг отмены поиска.
+    bytes_total (int): Общий объём данных для поиска.
+    bytes_scanned (int): Объём уже просмотренных данных.
+    matches_found (int): Число найденных совпадений.
+    tally (bool): Считать каждый результат совпадением. Отключается,
+    когда функция поиска сама ведёт счёт.
+    report (str): Сообщение о преждевременной остановке поиска
+    по ограничению времени или памяти.
+    timer (PhaseTimer): Длительность этапов запуска: чтения,
+    декодирования, поиска совпадений и записи в файл.
+    source_time (float): Время получения блоков из источника.
+    read_time (float): Время чтения файлов.
+    decode_time (float): Время декодирования файлов.
+    save_time (float): Время записи результатов в файл.
+    cache_hit (bool): Результаты взяты из кэша; None, если кэш
+    не использовался.
+
+    ************************************************
+
+    A background thread that runs a search outside the Tk main loop.
+
+    Matches are handed over in batches through a queue
+    that the graphical interface polls with `after()`.
+
+    Attributes:
+    search (Callable): The search function that takes the thread
+    and returns an iterator of results: lines or positions.
+    queue (queue.Queue): The message queue for the interface.
+    cancel_event (threading.Event): The search cancellation flag.
+    bytes_total (int): The total amount of data to search.
+    bytes_scanned (int): The amount of data scanned so far.
+    matches_found (int): The number of matches found.
+    tally (bool): Count every result as a match. Turned off when
+    the search function keeps count itself.
+    report (str): A message about the search being stopped early
+    by the time or memory limit.
+    timer (PhaseTimer): The durations of the run phases: reading,
+    decoding, matching and writing to a file.
+    source_time (float): The time spent getting chunks from the source.
+    read_time (float): The time spent reading files.
+    decode_time (float): The time spent decoding files.
+    save_time (float): The time spent writing results to a file.
+    cache_hit (bool): The results were taken from the cache; None
+    if the cache was not used.
+    """
+
+    def __init__(
+            self, search: Callable[["SearchWorker"], Iterator],
+            bytes_total: int = 0,
+            batch_size: int = WORKER_BATCH_SIZE,
+            tally: bool = True
+    ) -> None:
+        """
+        Инициализация потока с функцией поиска.
+
+        ************************************************
+
+        Initializing the thread with a search function.
+        """
+
+        super().__init__(daemon=True)
+        self.search = search
+        self.batch_size = batch_size
+        self.queue: queue.Queue = queue.Queue()
+        self.cancel_event = threading.Event()
+        self.bytes_total = bytes_total
+        self.bytes_scanned = 0
+        self.matches_found = 0
+        self.tally = tally
+        self.report: Optional[str] = None
+        self.timer = PhaseTimer()
+        self.source_time = 0.0
+        self.read_time = 0.0
+        self.decode_time = 0.0
+        self.save_time = 0.0
+        self.cache_hit: Optional[bool] = None
+
+    def run(self) -> None:
+        """
+        Выполняет поиск и отправляет совпадения пачками.
+
+        ************************************************
+
+        Runs the search and sends the matches in batches.
+        """
+
+        batch: List = []
+        started: float = time.perf_counter()
+        try:
+            for line in self.search(self):
+                if self.cancelled:
+                    break
+                batch.append(line)
+                if self.tally:
+                    self.matches_found += 1
+                if len(batch) >= self.batch_size:
+                    self.queue.put((MATCHES, batch))
+                    batch = []
+        except Exception as error:
+            self.queue.put((ERROR, error))
+            return
+        if batch:
+            self.queue.put((MATCHES, batch))
+        self.record_phases(time.perf_counter() - started)
+        self.queue.put((DONE, self.cancelled))
+
+    def record_phases(self, elapsed: float) -> None:
+        """
+        Раскладывает время работы потока по этапам. Поиск
+        совпадений — это всё время, не ушедшее на чтение,
+        декодирование и запись; сюда же входит форматирование
+        результатов.
+
+        ************************************************
+
+        Splits the running time of the thread into phases.
+        Matching is all the time not spent on reading, decoding
+        and writing; formatting the results is included in it.
+        """
+
+        read: float = max(self.source_time - self.decode_time, self.read_time)
+        self.timer.add("read", read)
+        self.timer.add("decode", self.decode_time)
+        self.timer.add(
+            "match",
+            max(elapsed - read - self.decode_time - self.save_time, 0.0)
+        )
+        if self.save_time:
+            self.timer.add("save", self.save_time)
+
+    def cancel(self) -> None:
+        """
+        Запрашивает остановку поиска.
+
+        ************************************************
+
+        Requests the search to stop.
+        """
+
+        self.cancel_event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        """
+        Возвращает True, если поиск был отменён.
+
+        ************************************************
+
+        Returns True if the search has been cancelled.
+        """
+
+        return self.cancel_event.is_set()
+
+    def set_progress(self, bytes_scanned: int) -> None:
+        """
+        Запоминает объём уже просмотренных данных.
+
+        ************************************************
+
+        Records the amount of data scanned so far.
+        """
+
+        self.bytes_scanned = bytes_scanned
+
+    def track(
+            self, chunks: Iterable[str],
+            position: Optional[Callable[[], int]] = None
+    ) -> Iterator[str]:
+        """
+        Передаёт блоки дальше, обновляя прогресс и прерываясь
+        при отмене. Время получения блоков добавляется
+        к source_time.
+
+        Аргументы:
+        chunks (Iterable[str]): Блоки текста.
+        position (Callable): Функция, возвращающая текущую позицию
+        в байтах. Если не задана, считается длина блоков.
+
+        ************************************************
+
+        Passes chunks on, updating the progress and stopping
+        on cancellation. The time spent getting the chunks
+        is added to source_time.
+
+        Arguments:
+        chunks (Iterable[str]): The text chunks.
+        position (Callable): A function returning the current position
+        in bytes. If not set, the chunk lengths are counted.
+        """
+
+        iterator: Iterator[str] = iter(chunks)
+        while True:
+            started: float = time.perf_counter()
+            chunk: Optional[str] = next(iterator, None)
+            self.source_time += time.perf_counter() - started
+            if chunk is None or self.cancelled:
+                return
+            if position is None:
+                self.bytes_scanned += len(chunk)
+            else:
+                self.bytes_scanned = position()
+            yield chunk
+
+    def read(
+            self, reader: SourceReader, offset: int = 0
+    ) -> Iterator[str]:
+        """
+        Передаёт блоки читателя через track и учитывает его
+        время чтения и декодирования. offset — объём уже
+        просмотренных до этого файла данных.
+
+        ************************************************
+
+        Passes the reader chunks through track and accounts
+        for its reading and decoding time. offset is the amount
+        of data scanned before this file.
+        """
+
+        try:
+            yield from self.track(
+                reader.chunks(), lambda: offset + reader.tell()
+            )
+        finally:
+            self.read_time += reader.read_time
+            self.decode_time += reader.decode_time
+
+    def add_search_times(self, search: GuardedSearch) -> None:
+        """
+        Учитывает время чтения и декодирования, замеренное
+        в дочернем процессе поиска.
+
+        ************************************************
+
+        Accounts for the reading and decoding time measured
+        in the child search process.
+        """
+
+        self.read_time += search.read_time
+        self.decode_time += search.decode_time
+
+
+def search_text(
+        worker: SearchWorker, pattern: str, text: str,
+        chunk_size: int = CHUNK_SIZE
+) -> Iterator[str]:
+    """
+    Ищет совпадения в тексте, уже прочитанном из виджета.
+
+    ************************************************
+
+    Searches text that has already been read from the widget.
+    """
+
+    return search_chunks(worker, pattern, split_text(text, chunk_size))
+
+
+def search_text_spans(
+        worker: SearchWorker, pattern: str, text: str,
+        chunk_size: int = CHUNK_SIZE
+) -> Iterator[Span]:
+    """
+    Ищет в тексте позиции совпадений с номерами строк и столбцов.
+
+    ************************************************
+
+    Searches the text for match positions with line
+    and column numbers.
+    """
+
+    return iter_spans_stream(
+        pattern, worker.track(split_text(text, chunk_size)), True
+    )
+
+
+def split_text(text: str, chunk_size: int = CHUNK_SIZE) -> Iterator[str]:
+    """
+    Разбивает текст на блоки заданного размера.
+
+    ************************************************
+
+    Splits the text into chunks of the given size.
+    """
+
+    for start in range(0, len(text), chunk_size):
+        yield text[start:start + chunk_size]
+
+
+def search_chunks(
+        worker: SearchWorker, pattern: str, chunks: Iterable[str]
+) -> Iterator[str]:
+    """
+    Ищет совпадения в тексте, поступающем блоками.
+
+    ************************************************
+
+    Searches text that arrives in chunks.
+    """
+
+    for match in find_words_stream(pattern, worker.track(chunks)):
+        yield format_match(match)
+
+
+def search_path(
+        worker: SearchWorker, pattern: str,
+        filepath: str, use_mmap: bool = False
+) -> Iterator[str]:
+    """
+    Ищет совпадения в одном файле. Большой файл с построчным
+    шаблоном ищется параллельно по диапазонам строк.
+
+    ************************************************
+
+    Searches a single file. A large file with a line-local
+    pattern is searched in parallel over ranges of lines.
+    """
+
+    if use_mmap:
+        for match in find_words_mmap(pattern, filepath):
+            yield format_match(match)
+        worker.bytes_scanned = worker.bytes_total
+        return
+    encoding: Optional[str] = parallel_encoding(pattern, filepath)
+    if encoding is not None:
+        for match in find_words_parallel(
+            pattern, filepath, encoding,
+            progress=worker.set_progress,
+            cancelled=lambda: worker.cancelled
+        ):
+            yield format_match(match)
+        return
+    with SourceReader(filepath) as reader:
+        for match in find_words_stream(pattern, worker.read(reader)):
+            yield format_match(match)
+
+
+def search_lines(
+        worker: SearchWorker, pattern, chunks: Iterable[str],
+        before: int = 0, after: int = 0, prefix: str = "",
+        count: bool = True
+) -> Iterator[str]:
+    """
+    Возвращает совпавшие строки текста с номерами и контекстом,
+    как grep. С count совпавшие строки, но не строки контекста,
+    добавляются к matches_found.
+
+    ************************************************
+
+    Returns the matching lines of the text with their numbers
+    and context, like grep. With count the matching lines, but
+    not the context lines, are added to matches_found.
+    """
+
+    def tally(lines: Iterable[LineMatch]) -> Iterator[LineMatch]:
+        for line in lines:
+            if count and line[2]:
+                worker.matches_found += 1
+            yield line
+
+    return format_lines(
+        tally(grep_lines(pattern, chunks, before, after)),
+        bool(before or after), prefix
+    )
+
+
+def search_path_lines(
+        worker: SearchWorker, pattern, filepath: str,
+        before: int = 0, after: int = 0, count: bool = True
+) -> Iterator[str]:
+    """
+    Потоково возвращает совпавшие строки одного файла.
+
+    ************************************************
+
+    Streams the matching lines of a single file.
+    """
+
+    with SourceReader(filepath) as reader:
+        yield from search_lines(
+            worker, pattern, worker.read(reader), before, after,
+            count=count
+        )
+
+
+def search_paths_lines(
+        worker: SearchWorker, pattern, filepaths: List[str],
+        before: int = 0, after: int = 0, count: bool = True
+) -> Iterator[str]:
+    """
+    Потоково возвращает совпавшие строки нескольких файлов
+    по очереди, начиная строки с пути к файлу. С контекстом
+    вывод разных файлов разделяется строкой `--`.
+
+    ************************************************
+
+    Streams the matching lines of several files in turn,
+    starting the lines with the file path. With context the
+    output of different files is separated by a `--` line.
+    """
+
+    offset: int = 0
+    found: bool = False
+    for filepath in filepaths:
+        if worker.cancelled:
+            return
+        separate: bool = bool(before or after) and found
+        with SourceReader(filepath) as reader:
+            for line in search_lines(
+                worker, pattern, worker.read(reader, offset),
+                before, after, f"{filepath}:", count
+            ):
+                if separate:
+                    yield "--"
+                    separate = False
+                found = True
+                yield line
+        offset += file_size(filepath)
+
+
+def search_paths(
+        worker: SearchWorker, pattern: str,
+        filepaths: List[str], use_mmap: bool = False
+) -> Iterator[str]:
+    """
+    Ищет совпадения в нескольких файлах в пуле процессов.
+
+    ************************************************
+
+    Searches several files on a process pool.
+    """
+
+    for filepath, matches in find_words_in_files(
+        pattern, filepaths, use_mmap=use_mmap
+    ):
+        if worker.cancelled:
+            return
+        for match in matches:
+            yield f"{filepath}:{format_match(match)}"
+        worker.bytes_scanned += file_size(filepath)
+
+
+def search_guarded(
+        worker: SearchWorker, pattern: str,
+        filepath: Optional[str] = None, text: Optional[str] = None,
+        timeout: Optional[float] = SEARCH_TIMEOUT, spans: bool = False,
+        use_mmap: bool = False
+) -> Iterator:
+    """
+    Ищет совпадения в файле или тексте в отдельном процессе
+    с ограничением времени и памяти. При остановке найденные
+    совпадения сохраняются, а причина записывается в отчёт.
+    С spans возвращаются позиции совпадений, как в search_text_spans.
+    Файл ищется так же, как в search_path: с use_mmap — через
+    отображение в память, а большой файл с построчным шаблоном —
+    параллельно по диапазонам строк, каждый в своём процессе.
+
+    ************************************************
+
+    Searches a file or a text in a separate process with a time
+    and memory limit. When stopped, the matches found are kept
+    and the reason is written to the report. With spans the match
+    positions are returned, as in search_text_spans. A file is
+    searched the same way as in search_path: with use_mmap through
+    a memory mapping, and a large file with a line-local pattern in
+    parallel over ranges of lines, each in its own process.
+    """
+
+    encoding: Optional[str] = None
+    if filepath is not None and not spans and not use_mmap:
+        encoding = parallel_encoding(pattern, filepath)
+    if encoding is not None:
+        yield from search_ranges_guarded(worker, pattern, filepath, encoding)
+        return
+    search = GuardedSearch(
+        pattern, filepath, text, timeout=timeout, spans=spans,
+        use_mmap=use_mmap
+    )
+    for result in search.matches(
+        lambda: worker.cancelled, worker.set_progress
+    ):
+        yield result if spans else format_match(result)
+    worker.add_search_times(search)
+    worker.report = search.report()
+
+
+def search_ranges_guarded(
+        worker: SearchWorker, pattern: str, filepath: str, encoding: str
+) -> Iterator[str]:
+    """
+    Ищет в большом файле параллельно по диапазонам строк, каждый
+    в своём процессе с ограничением. Совпадения после первого
+    остановленного диапазона не возвращаются.
+
+    ************************************************
+
+    Searches a large file in parallel over ranges of lines, each
+    in its own limited process. No matches after the first stopped
+    range are returned.
+    """
+
+    for matches, search in guarded_search_ranges(
+        pattern, filepath, encoding, cancelled=lambda: worker.cancelled
+    ):
+        if worker.cancelled:
+            return
+        for match in matches:
+            yield format_match(match)
+        worker.add_search_times(search)
+        if search.stopped is not None:
+            worker.set_progress(search.position)
+            worker.report = search.report()
+            return
+        worker.set_progress(search.byte_range[1])
+
+
+def search_paths_guarded(
+        worker: SearchWorker, pattern: str, filepaths: List[str]
+) -> Iterator[str]:
+    """
+    Ищет совпадения в нескольких файлах, каждый в своём процессе
+    с ограничением времени и памяти. Файлы ищутся от самого
+    большого к самому маленькому, а совпадения передаются по мере
+    поиска.
+
+    ************************************************
+
+    Searches several files, each in its own process with a time
+    and memory limit. The files are searched from the largest to
+    the smallest, and the matches are passed on as they are found.
+    """
+
+    reports: List[str] = []
+    for filepath, matches, search in guarded_search_files(
+        pattern, filepaths, cancelled=lambda: worker.cancelled
+    ):
+        if worker.cancelled:
+            return
+        for match in matches:
+            yield f"{filepath}:{format_match(match)}"
+        worker.bytes_scanned += file_size(filepath)
+        worker.add_search_times(search)
+        if search.stopped is not None:
+            reports.append(search.report())
+    worker.report = "\n".join(reports) or None
+
+
+def count_paths_guarded(
+        worker: SearchWorker, pattern: str,
+        filepaths: List[str], top_k: int
+) -> Iterator[str]:
+    """
+    Подсчитывает совпадения в нескольких файлах, каждый в своём
+    процессе с ограничением времени и памяти. Процессы возвращают
+    только счётчики, а не списки совпадений.
+
+    ************************************************
+
+    Counts the matches in several files, each in its own process
+    with a time and memory limit. The processes return only
+    counters, not lists of matches.
+    """
+
+    counter: Counter = Counter()
+    reports: List[str] = []
+    for filepath, counts, search in guarded_search_files(
+        pattern, filepaths, cancelled=lambda: worker.cancelled, count=True
+    ):
+        if worker.cancelled:
+            break
+        for batch in counts:
+            counter.update(batch)
+            worker.matches_found += sum(batch.values())
+        worker.bytes_scanned += file_size(filepath)
+        worker.add_search_times(search)
+        if search.stopped is not None:
+            reports.append(search.report())
+    worker.report = "\n".join(reports) or None
+    yield from format_counts(counter, top_k)
+
+
+def search_cached(
+        worker: SearchWorker, cache: ResultCache, key: str,
+        filepath: str, search: Callable[[SearchWorker], Iterator[str]]
+) -> Iterator[str]:
+    """
+    Возвращает результаты поиска в файле из кэша, если файл
+    не изменился, иначе выполняет поиск и сохраняет результаты
+    в кэш. Отменённый или остановленный по ограничению поиск,
+    а также поиск в файле, изменившемся за время поиска,
+    не сохраняется. Результаты копятся для кэша, только пока их
+    объём не превышает cache.maxsize, поэтому большой результат
+    не держится в памяти целиком и не сохраняется.
+
+    ************************************************
+
+    Returns the results of a file search from the cache if the
+    file has not changed, otherwise runs the search and stores
+    the results in the cache. A search that was cancelled or
+    stopped by a limit, or that ran while the file changed, is not
+    stored. The results are gathered for the cache only while their
+    size stays within cache.maxsize, so a large result is never held
+    in memory as a whole and is not stored.
+    """
+
+    fingerprint = file_fingerprint(filepath)
+    cached: Optional[List[str]] = cache.get(key, fingerprint)
+    worker.cache_hit = cached is not None
+    if cached is not None:
+        yield from cached
+        worker.bytes_scanned = worker.bytes_total
+        return
+    limit: int = cache.maxsize
+    lines: Optional[List[str]] = []
+    size: int = 0
+    for line in search(worker):
+        if lines is not None:
+            lines.append(line)
+            size += len(line) + 1
+            if size > limit:
+                lines = None
+        yield line
+    if lines is None or worker.cancelled or worker.report is not None:
+        return
+    try:
+        unchanged: bool = file_fingerprint(filepath) == fingerprint
+    except OSError:
+        return
+    if unchanged:
+        cache.put(key, fingerprint, lines)
+
+
+def search_index(
+        worker: SearchWorker, index: WordIndex, pattern: str
+) -> Iterator[str]:
+    """
+    Ищет совпадения с помощью индекса слов.
+
+    ************************************************
+
+    Searches for matches with the help of the word index.
+    """
+
+    for match in index.search(pattern):
+        if worker.cancelled:
+            return
+        yield format_match(match)
+
+
+def build_index(worker: SearchWorker, index: WordIndex) -> Iterator[str]:
+    """
+    Строит индекс слов, сообщая прогресс и учитывая отмену.
+    Результатов не возвращает.
+
+    ************************************************
+
+    Builds the word index, reporting progress and honouring
+    cancellation. Returns no results.
+    """
+
+    index.build(worker.set_progress, lambda: worker.cancelled)
+    yield from ()
+
+
+def count_results(
+        worker: SearchWorker, results: Iterable[str], top_k: int
+) -> Iterator[str]:
+    """
+    Подсчитывает результаты другой функции поиска и возвращает
+    только сводку с top_k самыми частыми совпадениями.
+
+    ************************************************
+
+    Counts the results of another search function and returns
+    only the summary with the top_k most frequent matches.
+    """
+
+    counter: Counter = Counter()
+    for result in results:
+        if worker.cancelled:
+            break
+        counter[result] += 1
+        worker.matches_found += 1
+    yield from format_counts(counter, top_k)
+
+
+def count_paths(
+        worker: SearchWorker, pattern: str,
+        filepaths: List[str], use_mmap: bool, top_k: int
+) -> Iterator[str]:
+    """
+    Подсчитывает совпадения в нескольких файлах в пуле процессов.
+    Процессы возвращают только счётчики, а не списки совпадений.
+
+    ************************************************
+
+    Counts the matches in several files on a process pool.
+    The processes return only counters, not lists of matches.
+    """
+
+    counter: Counter = Counter()
+    for filepath, counts in find_words_in_files(
+        pattern, filepaths, use_mmap=use_mmap, task=count_file
+    ):
+        if worker.cancelled:
+            break
+        counter.update(counts)
+        worker.matches_found += sum(counts.values())
+        worker.bytes_scanned += file_size(filepath)
+    yield from format_counts(counter, top_k)
+
+
+def export_results(
+        worker: SearchWorker, results: Iterable[str], filepath: str,
+        preview_lines: int = EXPORT_PREVIEW_LINES
+) -> Iterator[str]:
+    """
+    Записывает результаты другой функции поиска прямо в файл
+    и возвращает только первые preview_lines строк для просмотра.
+
+    Строки собираются пачками и пишутся через большой буфер,
+    поэтому ни полный список совпадений, ни текстовый виджет
+    не нужны, а память не зависит от числа совпадений. Время
+    записи добавляется к save_time.
+
+    ************************************************
+
+    Writes the results of another search function straight
+    to a file and returns only the first preview_lines lines
+    for viewing.
+
+    Lines are gathered in batches and written through a large
+    buffer, so neither the full list of matches nor the text
+    widget is needed, and memory does not depend on the number
+    of matches. The writing time is added to save_time.
+    """
+
+    def write(lines: List[str]) -> None:
+        started: float = time.perf_counter()
+        lines.append("")
+        in_file.write("\n".join(lines))
+        worker.save_time += time.perf_counter() - started
+
+    batch: List[str] = []
+    with open(
+        filepath, "w", encoding=EXPORT_ENCODING,
+        buffering=EXPORT_BUFFER_SIZE
+    ) as in_file:
+        for line in results:
+            if worker.cancelled:
+                break
+            worker.matches_found += 1
+            if worker.matches_found <= preview_lines:
+                yield line
+            batch.append(line)
+            if len(batch) >= worker.batch_size:
+                write(batch)
+                batch = []
+        if batch:
+            write(batch)
@@ -0,0 +1,473 @@
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+from typing import Dict, List, Optional
+
+APP_DIR: str = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app"
+)
+sys.path.insert(0, APP_DIR)
+
+from logic import (find_words_parallel, find_words_re,  # noqa: E402
+                   find_words_stream, is_line_local, read_chunks)
+
+ALPHABETS: Dict[str, str] = {
+    "latin": "abcdefghijklmnopqrstuvwxyz",
+    "cyrillic": "абвгдеёжзийклмнопрстуфхцчшщъыьэюя",
+    "dna": "ACGT",
+    "digits": "0123456789",
+}
+
+PATTERNS: Dict[str, str] = {
+    "literal": "abc",
+    "class": r"[A-Za-zА-Яа-я]{6,}",
+    "word_suffix": r"\b\w+ing\b",
+    "backtracking": r"(\w+)\s+\1\b",
+    "line": r"(?m)^.*\d.*$",
+}
+
+EMPTY_PATTERNS: Dict[str, str] = {
+    "line_end": r"(?m)$",
+    "word_star": r"\w*",
+    "x_star": r"x*",
+}
+
+PARALLEL_CHECK_RANGE: int = 64 * 1024
+
+SIZES_MB: List[int] = [1, 10]
+
+STAGES: List[str] = ["match", "pipeline", "stream"]
+
+REGRESSION_THRESHOLD: float = 1.2
+
+
+def make_corpus(
+        path: str, size_bytes: int, alphabet: str, seed: int = 0
+) -> None:
+    """
+    Создаёт синтетический текстовый файл заданного размера из
+    слов случайной длины в указанном алфавите.
+
+    ************************************************
+
+    Creates a synthetic text file of the given size made of
+    words of random length in the given alphabet.
+    """
+
+    rnd = random.Random(seed)
+    words: List[str] = [
+        "".join(rnd.choice(alphabet) for _ in range(rnd.randint(1, 12)))
+        for _ in range(5000)
+    ]
+    words += ["testing", "abc", "2024", "abc abc"]
+    written: int = 0
+    with open(path, "w", encoding="utf-8") as corpus:
+        while written < size_bytes:
+            line: str = " ".join(rnd.choices(words, k=rnd.randint(5, 15)))
+            corpus.write(line + "\n")
+            written += len(line.encode("utf-8")) + 1
+
+
+def check_parallel(
+        path: str, patterns: Dict[str, str],
+        range_size: int = PARALLEL_CHECK_RANGE
+) -> List[str]:
+    """
+    Сравнивает параллельный поиск по диапазонам строк с re.findall
+    по всему тексту для построчных шаблонов, включая шаблоны,
+    совпадающие с пустой строкой. Возвращает описания расхождений.
+
+    ************************************************
+
+    Compares the parallel search over ranges of lines with
+    re.findall over the whole text for line-local patterns,
+    including patterns that match the empty string. Returns
+    descriptions of the mismatches.
+    """
+
+    with open(path, "r", encoding="utf-8", newline="") as corpus:
+        text: str = corpus.read()
+    mismatches: List[str] = []
+    for name, pattern in patterns.items():
+        if not is_line_local(pattern):
+            continue
+        expected: List = find_words_re(pattern, text)
+        found: List = list(find_words_parallel(
+            pattern, path, "utf-8", workers=1, range_size=range_size
+        ))
+        if found != expected:
+            mismatches.append(
+                f"{os.path.basename(path)}/{name}: parallel found "
+                f"{len(found)} matches, re.findall {len(expected)}"
+            )
+    return mismatches
+
+
+def peak_rss_kb() -> Optional[int]:
+    """
+    Возвращает пиковый объём резидентной памяти процесса в КБ
+    или None, если модуль resource недоступен.
+
+    ************************************************
+
+    Returns the peak resident memory of the process in KB,
+    or None if the resource module is unavailable.
+    """
+
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak: int = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == "darwin":
+        peak //= 1024
+    return peak
+
+
+def run_stage(
+        stage: str, path: str, pattern: str, render: bool
+) -> Dict[str, object]:
+    """
+    Выполняет один этап поиска и возвращает время, число
+    совпадений и пиковую память.
+
+    Этапы:
+    - match: только logic.find_words_re по уже прочитанному тексту.
+    - pipeline: чтение, поиск, "\\n".join и, если нужно, вставка
+    в текстовый виджет, как раньше делал find_words.
+    - stream: потоковый поиск logic.find_words_stream по файлу.
+
+    ************************************************
+
+    Runs one search stage and returns the time, the number
+    of matches and the peak memory.
+
+    Stages:
+    - match: logic.find_words_re only, over text already read.
+    - pipeline: read, match, "\\n".join and, if requested, insertion
+    into a text widget, as find_words used to do.
+    - stream: streaming logic.find_words_stream over the file.
+    """
+
+    rendered: Optional[bool] = None
+    if stage == "match":
+        with open(path, "r", encoding="utf-8") as corpus:
+            text: str = corpus.read()
+        start: float = time.perf_counter()
+        matches: int = len(find_words_re(pattern, text))
+    elif stage == "pipeline":
+        start = time.perf_counter()
+        with open(path, "r", encoding="utf-8") as corpus:
+            text = corpus.read()
+        found: List[str] = find_words_re(pattern, text)
+        result: str = "\n".join(found)
+        matches = len(found)
+        if render:
+            rendered = render_text(result)
+    else:
+        start = time.perf_counter()
+        with open(path, "r", encoding="utf-8") as corpus:
+            matches = sum(
+                1 for _ in find_words_stream(pattern, read_chunks(corpus))
+            )
+    return {
+        "seconds": time.perf_counter() - start,
+        "matches": matches,
+        "rendered": rendered,
+        "peak_rss_kb": peak_rss_kb(),
+    }
+
+
+def render_text(text: str) -> bool:
+    """
+    Вставляет текст в скрытый текстовый виджет Tk. Возвращает
+    False, если графический дисплей недоступен.
+
+    ************************************************
+
+    Inserts the text into a hidden Tk text widget. Returns
+    False if no graphical display is available.
+    """
+
+    try:
+        import tkinter as tk
+        root = tk.Tk()
+    except Exception:
+        return False
+    root.withdraw()
+    widget = tk.Text(root)
+    widget.insert("1.0", text)
+    root.update_idletasks()
+    root.destroy()
+    return True
+
+
+def _stage_in_child(connection, *args) -> None:
+    """
+    Выполняет этап в дочернем процессе и отправляет результат.
+
+    ************************************************
+
+    Runs a stage in a child process and sends the result back.
+    """
+
+    try:
+        connection.send(run_stage(*args))
+    except Exception as error:
+        connection.send({"error": repr(error)})
+    finally:
+        connection.close()
+
+
+def run_isolated(
+        stage: str, path: str, pattern: str, render: bool
+) -> Dict[str, object]:
+    """
+    Запускает этап в отдельном процессе, чтобы пиковая память
+    каждого замера не зависела от предыдущих.
+
+    ************************************************
+
+    Runs a stage in a separate process so that the peak memory
+    of each measurement does not depend on the previous ones.
+    """
+
+    context = multiprocessing.get_context("spawn")
+    receiver, sender = context.Pipe(duplex=False)
+    process = context.Process(
+        target=_stage_in_child,
+        args=(sender, stage, path, pattern, render)
+    )
+    process.start()
+    sender.close()
+    result: Dict[str, object] = receiver.recv()
+    process.join()
+    return result
+
+
+def run_benchmarks(options: argparse.Namespace) -> Dict[str, object]:
+    """
+    Выполняет все сочетания корпусов, шаблонов и этапов.
+
+    ************************************************
+
+    Runs every combination of corpora, patterns and stages.
+    """
+
+    results: List[Dict[str, object]] = []
+    mismatches: List[str] = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for alphabet in options.alphabets:
+            for size_mb in options.sizes:
+                path: str = os.path.join(tmp_dir, f"{alphabet}_{size_mb}.txt")
+                make_corpus(path, size_mb * 1048576, ALPHABETS[alphabet])
+                size_bytes: int = os.path.getsize(path)
+                mismatches += check_parallel(
+                    path, dict(PATTERNS, **EMPTY_PATTERNS)
+                )
+                for name in options.patterns:
+                    for stage in options.stages:
+                        runs = [
+                            run_isolated(
+                                stage, path, PATTERNS[name], options.render
+                            )
+                            for _ in range(options.repeat)
+                        ]
+                        results.append(summarize(
+                            runs, alphabet, size_bytes, name, stage
+                        ))
+                        print(
+                            f"{alphabet:>8} {size_mb:>4} MB "
+                            f"{name:>12} {stage:>8}: "
+                            f"{results[-1].get('mb_per_s')} MB/s",
+                            file=sys.stderr
+                        )
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "results": results,
+        "parallel_mismatches": mismatches,
+    }
+
+
+def summarize(
+        runs: List[Dict[str, object]], alphabet: str,
+        size_bytes: int, name: str, stage: str
+) -> Dict[str, object]:
+    """
+    Сводит повторные замеры к лучшему времени и считает
+    пропускную способность.
+
+    ************************************************
+
+    Reduces repeated measurements to the best time and
+    computes the throughput.
+    """
+
+    entry: Dict[str, object] = {
+        "corpus": alphabet,
+        "size_bytes": size_bytes,
+        "pattern_name": name,
+        "pattern": PATTERNS[name],
+        "stage": stage,
+    }
+    errors = [run["error"] for run in runs if "error" in run]
+    if errors:
+        entry["error"] = errors[0]
+        return entry
+    best = min(runs, key=lambda run: run["seconds"])
+    seconds: float = max(best["seconds"], 1e-9)
+    entry.update({
+        "seconds": round(seconds, 6),
+        "mb_per_s": round(size_bytes / 1048576 / seconds, 3),
+        "matches": best["matches"],
+        "matches_per_s": round(best["matches"] / seconds, 1),
+        "peak_rss_kb": max(
+            (run["peak_rss_kb"] or 0 for run in runs), default=None
+        ),
+        "rendered": best["rendered"],
+    })
+    return entry
+
+
+def compare(
+        report: Dict[str, object], baseline_path: str,
+        threshold: float = REGRESSION_THRESHOLD
+) -> List[str]:
+    """
+    Сравнивает отчёт с сохранённым и возвращает описания
+    замеров, которые стали медленнее порога.
+
+    ************************************************
+
+    Compares the report with a saved one and returns descriptions
+    of the measurements that became slower than the threshold.
+    """
+
+    with open(baseline_path, "r", encoding="utf-8") as baseline_file:
+        baseline = json.load(baseline_file)
+
+    def key(entry):
+        return (
+            entry["corpus"], entry["size_bytes"],
+            entry["pattern_name"], entry["stage"]
+        )
+
+    previous = {key(entry): entry for entry in baseline["results"]}
+    regressions: List[str] = []
+    for entry in report["results"]:
+        old = previous.get(key(entry))
+        if not old or "seconds" not in old or "seconds" not in entry:
+            continue
+        ratio: float = entry["seconds"] / max(old["seconds"], 1e-9)
+        if ratio > threshold:
+            regressions.append(
+                f"{'/'.join(map(str, key(entry)))}: "
+                f"{old['seconds']}s -> {entry['seconds']}s (x{ratio:.2f})"
+            )
+    return regressions
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """
+    Создаёт разборщик аргументов командной строки.
+
+    ************************************************
+
+    Creates the command-line argument parser.
+    """
+
+    parser = argparse.ArgumentParser(
+        description="Benchmark the FindWords search core and file pipeline."
+    )
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=SIZES_MB, metavar="MB",
+        help="corpus sizes in megabytes"
+    )
+    parser.add_argument(
+        "--alphabets", nargs="+", default=list(ALPHABETS),
+        choices=list(ALPHABETS)
+    )
+    parser.add_argument(
+        "--patterns", nargs="+", default=list(PATTERNS),
+        choices=list(PATTERNS)
+    )
+    parser.add_argument(
+        "--stages", nargs="+", default=STAGES, choices=STAGES
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=3,
+        help="runs per measurement, the best one is reported"
+    )
+    parser.add_argument(
+        "--render", action="store_true",
+        help="also insert pipeline results into a Tk text widget"
+    )
+    parser.add_argument(
+        "-o", "--output", metavar="FILE",
+        help="write the JSON report to FILE instead of stdout"
+    )
+    parser.add_argument(
+        "--compare", metavar="FILE",
+        help="compare with a previous JSON report and fail on regressions"
+    )
+    parser.add_argument(
+        "--threshold", type=float, default=REGRESSION_THRESHOLD,
+        help="slowdown ratio treated as a regression"
+    )
+    return parser
+
+
+def main() -> int:
+    """
+    Запускает замеры, выводит отчёт JSON и при необходимости
+    сравнивает его с предыдущим. Завершается с ошибкой, если
+    параллельный поиск разошёлся с re.findall или какой-либо
+    шаблон не нашёл ни одного совпадения: такой замер ничего
+    не говорит о скорости.
+
+    ************************************************
+
+    Runs the benchmarks, writes the JSON report and compares it
+    with a previous one if requested. Fails if the parallel
+    search disagrees with re.findall or any pattern finds no
+    matches: such a measurement says nothing about speed.
+    """
+
+    options = build_parser().parse_args()
+    report = run_benchmarks(options)
+    text: str = json.dumps(report, indent=2, ensure_ascii=False)
+    if options.output:
+        with open(options.output, "w", encoding="utf-8") as output:
+            output.write(text + "\n")
+    else:
+        print(text)
+    failed: bool = False
+    for mismatch in report["parallel_mismatches"]:
+        print(f"PARALLEL MISMATCH {mismatch}", file=sys.stderr)
+        failed = True
+    for entry in report["results"]:
+        if entry.get("matches") == 0:
+            print(
+                f"NO MATCHES {entry['corpus']}/{entry['size_bytes']}/"
+                f"{entry['pattern_name']}/{entry['stage']}",
+                file=sys.stderr
+            )
+            failed = True
+    if options.compare:
+        regressions = compare(report, options.compare, options.threshold)
+        for regression in regressions:
+            print(f"REGRESSION {regression}", file=sys.stderr)
+        failed = failed or bool(regressions)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())